@@ -0,0 +1,544 @@
+"""Incremental rolling-window aggregates over minute equity and fill logs.
+
+``RollingAggregates`` folds rows into fixed time buckets (15 minutes by
+default) as they are appended, instead of re-reading the full
+``minute.csv`` / ``fills.csv`` history on every report run.  Each bucket
+keeps:
+
+- equity first/last/min/max plus its internal max drawdown, which is
+  enough to compose the exact max drawdown of any run of buckets;
+- running moments (count, mean, M2) and downside square sum of the
+  per-sample simple returns, merged across buckets with Chan's parallel
+  update;
+- additive fill counters, notional/fee/realized sums and edge-vs-mid /
+  expected-spread sums (TCA).
+
+Trailing windows (1h/24h/7d/30d, ...) are answered by merging the buckets
+whose start lies inside the window, so a window is resolved to bucket
+granularity.  Sharpe/Sortino follow ``performance_metrics`` (CAGR over
+annualized volatility / downside deviation of the window's samples).
+
+State, including per-file byte cursors for :meth:`RollingAggregates.ingest_csv`,
+round-trips through :meth:`save` / :meth:`load`, so each run only parses
+rows appended since the previous one.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+import os
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any
+
+from controllers.analytics.performance_metrics import MetricsError
+
+_ZERO = Decimal("0")
+_TEN_K = Decimal("10000")
+_SECONDS_PER_YEAR = 365.25 * 24 * 60 * 60
+_STATE_VERSION = 1
+_WINDOW_RE = re.compile(r"^\s*(\d+)\s*([smhd])\s*$")
+_UNIT_S = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+DEFAULT_WINDOWS: tuple[str, ...] = ("1h", "24h", "7d", "30d")
+
+
+def parse_window(spec: str) -> int:
+    """``"15m"`` / ``"24h"`` / ``"7d"`` -> seconds."""
+    match = _WINDOW_RE.match(str(spec))
+    if match is None:
+        raise MetricsError(f"Unsupported window spec: {spec!r}")
+    return int(match.group(1)) * _UNIT_S[match.group(2)]
+
+
+def _ts_ms(value: object) -> int | None:
+    if isinstance(value, datetime):
+        dt = value if value.tzinfo else value.replace(tzinfo=UTC)
+        return int(dt.timestamp() * 1000)
+    if isinstance(value, (int, float)):
+        return int(float(value) * 1000)
+    text = str(value or "").strip()
+    if not text:
+        return None
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return int((dt if dt.tzinfo else dt.replace(tzinfo=UTC)).timestamp() * 1000)
+
+
+def _dec(value: object, default: Decimal | None = _ZERO) -> Decimal | None:
+    if value is None:
+        return default
+    if isinstance(value, Decimal):
+        return value if value.is_finite() else default
+    text = str(value).strip()
+    if not text:
+        return default
+    try:
+        out = Decimal(text)
+    except (InvalidOperation, ValueError):
+        return default
+    return out if out.is_finite() else default
+
+
+def _iso(ms: int | None) -> str | None:
+    return None if ms is None else datetime.fromtimestamp(ms / 1000, tz=UTC).isoformat()
+
+
+# ---------------------------------------------------------------------------
+# Buckets
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Moments:
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    down_sq: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if x < 0:
+            self.down_sq += x * x
+
+    def merge(self, other: _Moments) -> None:
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.m2, self.down_sq = other.n, other.mean, other.m2, other.down_sq
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.down_sq += other.down_sq
+        self.n = n
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 and self.m2 > 0 else 0.0
+
+
+@dataclass
+class AggregateBucket:
+    start_ms: int
+    samples: int = 0
+    first_ts_ms: int | None = None
+    last_ts_ms: int | None = None
+    first_equity: Decimal | None = None
+    last_equity: Decimal | None = None
+    min_equity: Decimal | None = None
+    max_equity: Decimal | None = None
+    max_drawdown_pct: Decimal = _ZERO
+    max_drawdown_quote: Decimal = _ZERO
+    # Return from the previous bucket's last sample into this bucket's first.
+    entry_return: float | None = None
+    returns: _Moments = field(default_factory=_Moments)
+    fills: int = 0
+    buys: int = 0
+    sells: int = 0
+    maker: int = 0
+    taker: int = 0
+    notional: Decimal = _ZERO
+    fees: Decimal = _ZERO
+    realized: Decimal = _ZERO
+    edge_sum: Decimal = _ZERO
+    edge_abs_sum: Decimal = _ZERO
+    edge_pos: int = 0
+    edge_n: int = 0
+    spread_sum: Decimal = _ZERO
+    spread_n: int = 0
+
+    def add_equity(self, ts_ms: int, equity: Decimal, ret: float | None) -> None:
+        if self.samples == 0:
+            self.entry_return = ret
+            self.first_ts_ms = ts_ms
+            self.first_equity = self.min_equity = self.max_equity = equity
+        else:
+            if ret is not None:
+                self.returns.add(ret)
+            self.min_equity = min(self.min_equity, equity)  # type: ignore[type-var]
+            self.max_equity = max(self.max_equity, equity)  # type: ignore[type-var]
+        peak = self.max_equity or _ZERO
+        self.max_drawdown_quote = max(self.max_drawdown_quote, peak - equity)
+        if peak > _ZERO:
+            self.max_drawdown_pct = max(self.max_drawdown_pct, (peak - equity) / peak)
+        self.samples += 1
+        self.last_ts_ms = ts_ms
+        self.last_equity = equity
+
+    def add_fill(self, row: Mapping[str, object]) -> None:
+        self.fills += 1
+        side = str(row.get("side", "") or "").strip().lower()
+        if side == "buy":
+            self.buys += 1
+        elif side == "sell":
+            self.sells += 1
+        if str(row.get("is_maker", "") or "").strip().lower() == "true":
+            self.maker += 1
+        else:
+            self.taker += 1
+        self.notional += _dec(row.get("notional_quote"))  # type: ignore[operator]
+        self.fees += _dec(row.get("fee_quote"))  # type: ignore[operator]
+        self.realized += _dec(row.get("realized_pnl_quote"))  # type: ignore[operator]
+        price = _dec(row.get("price"), None)
+        mid_ref = _dec(row.get("mid_ref"), None)
+        if price is not None and mid_ref is not None and mid_ref > _ZERO and side in ("buy", "sell"):
+            edge = (mid_ref - price) / mid_ref if side == "buy" else (price - mid_ref) / mid_ref
+            self.edge_sum += edge
+            self.edge_abs_sum += abs(edge)
+            self.edge_n += 1
+            if edge > _ZERO:
+                self.edge_pos += 1
+        spread = _dec(row.get("expected_spread_pct"), None)
+        if spread is not None:
+            self.spread_sum += spread
+            self.spread_n += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for name, value in self.__dict__.items():
+            if isinstance(value, _Moments):
+                out[name] = [value.n, value.mean, value.m2, value.down_sq]
+            elif isinstance(value, Decimal):
+                out[name] = str(value)
+            else:
+                out[name] = value
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> AggregateBucket:
+        bucket = cls(start_ms=int(data["start_ms"]))
+        for name, default in list(bucket.__dict__.items()):
+            if name not in data or name == "start_ms":
+                continue
+            raw = data[name]
+            if isinstance(default, _Moments):
+                n, mean, m2, down_sq = raw
+                setattr(bucket, name, _Moments(int(n), float(mean), float(m2), float(down_sq)))
+            elif isinstance(default, Decimal) or name.endswith("_equity"):
+                setattr(bucket, name, None if raw is None else Decimal(str(raw)))
+            else:
+                setattr(bucket, name, raw)
+        return bucket
+
+
+# ---------------------------------------------------------------------------
+# Window results
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class WindowSummary:
+    start_ms: int | None
+    end_ms: int | None
+    samples: int
+    first_equity: Decimal | None
+    last_equity: Decimal | None
+    return_pct: Decimal
+    max_drawdown_pct: Decimal
+    max_drawdown_quote: Decimal
+    return_mean: float
+    return_std: float
+    sharpe: Decimal
+    sortino: Decimal
+    fills: int
+    buys: int
+    sells: int
+    maker: int
+    taker: int
+    notional_quote: Decimal
+    fees_quote: Decimal
+    realized_pnl_quote: Decimal
+    avg_edge_vs_mid_bps: Decimal
+    avg_abs_edge_vs_mid_bps: Decimal
+    pos_edge_frac: float
+    avg_expected_spread_bps: Decimal
+
+    def to_dict(self) -> dict[str, Any]:
+        fee_bps = self.fees_quote / self.notional_quote * _TEN_K if self.notional_quote > _ZERO else _ZERO
+        net = self.realized_pnl_quote - self.fees_quote
+        out: dict[str, Any] = {}
+        for name, value in self.__dict__.items():
+            if name in ("start_ms", "end_ms"):
+                out[name.replace("_ms", "_ts")] = _iso(value)
+            elif isinstance(value, Decimal):
+                out[name] = str(value)
+            else:
+                out[name] = value
+        out["maker_pct"] = self.maker / self.fills if self.fills else 0.0
+        out["fee_bps"] = str(fee_bps)
+        out["net_pnl_after_fees_quote"] = str(net)
+        return out
+
+
+def _summarize(buckets: list[AggregateBucket]) -> WindowSummary:
+    eq = [b for b in buckets if b.samples]
+    moments = _Moments()
+    peak: Decimal | None = None
+    mdd_pct = _ZERO
+    mdd_quote = _ZERO
+    for idx, b in enumerate(eq):
+        if idx > 0 and b.entry_return is not None:
+            moments.add(b.entry_return)
+        moments.merge(b.returns)
+        if peak is None:
+            mdd_pct, mdd_quote = b.max_drawdown_pct, b.max_drawdown_quote
+        else:
+            mdd_quote = max(mdd_quote, b.max_drawdown_quote, peak - b.min_equity)  # type: ignore[operator]
+            from_peak = (peak - b.min_equity) / peak if peak > _ZERO else _ZERO  # type: ignore[operator]
+            mdd_pct = max(mdd_pct, b.max_drawdown_pct, from_peak)
+        peak = b.max_equity if peak is None else max(peak, b.max_equity)  # type: ignore[type-var]
+
+    samples = sum(b.samples for b in eq)
+    first_eq = eq[0].first_equity if eq else None
+    last_eq = eq[-1].last_equity if eq else None
+    ret_pct = last_eq / first_eq - 1 if first_eq and last_eq is not None and first_eq > _ZERO else _ZERO
+    sharpe = sortino = _ZERO
+    if samples >= 3 and first_eq and last_eq and first_eq > _ZERO and last_eq > _ZERO:
+        years = max(0.0, (eq[-1].last_ts_ms - eq[0].first_ts_ms) / 1000 / _SECONDS_PER_YEAR)  # type: ignore[operator]
+        if years > 0:
+            epy = (samples - 1) / years
+            cagr = float(last_eq / first_eq) ** (1.0 / years) - 1.0
+            vol = moments.std * math.sqrt(epy)
+            if vol > 0:
+                sharpe = Decimal(str(cagr / vol))
+            downside = math.sqrt(moments.down_sq / max(1, moments.n - 1)) * math.sqrt(epy)
+            if downside > 0:
+                sortino = Decimal(str(cagr / downside))
+
+    fills = sum(b.fills for b in buckets)
+    notional = sum((b.notional for b in buckets), _ZERO)
+    edge_n = sum(b.edge_n for b in buckets)
+    spread_n = sum(b.spread_n for b in buckets)
+    edge_sum = sum((b.edge_sum for b in buckets), _ZERO)
+    edge_abs = sum((b.edge_abs_sum for b in buckets), _ZERO)
+    spread_sum = sum((b.spread_sum for b in buckets), _ZERO)
+    return WindowSummary(
+        start_ms=buckets[0].start_ms if buckets else None,
+        end_ms=max((b.last_ts_ms or b.start_ms for b in buckets), default=None),
+        samples=samples,
+        first_equity=first_eq,
+        last_equity=last_eq,
+        return_pct=ret_pct,
+        max_drawdown_pct=mdd_pct,
+        max_drawdown_quote=mdd_quote,
+        return_mean=moments.mean,
+        return_std=moments.std,
+        sharpe=sharpe,
+        sortino=sortino,
+        fills=fills,
+        buys=sum(b.buys for b in buckets),
+        sells=sum(b.sells for b in buckets),
+        maker=sum(b.maker for b in buckets),
+        taker=sum(b.taker for b in buckets),
+        notional_quote=notional,
+        fees_quote=sum((b.fees for b in buckets), _ZERO),
+        realized_pnl_quote=sum((b.realized for b in buckets), _ZERO),
+        avg_edge_vs_mid_bps=edge_sum / edge_n * _TEN_K if edge_n else _ZERO,
+        avg_abs_edge_vs_mid_bps=edge_abs / edge_n * _TEN_K if edge_n else _ZERO,
+        pos_edge_frac=sum(b.edge_pos for b in buckets) / edge_n if edge_n else 0.0,
+        avg_expected_spread_bps=spread_sum / spread_n * _TEN_K if spread_n else _ZERO,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Aggregator
+# ---------------------------------------------------------------------------
+
+class RollingAggregates:
+    """Bucketed pre-aggregates of one bot's equity curve and fills."""
+
+    def __init__(self, *, bucket_s: int = 900, retention_s: int = 35 * 86400) -> None:
+        if bucket_s <= 0 or 86400 % bucket_s:
+            raise MetricsError("bucket_s must be a positive divisor of one day")
+        self.bucket_s = int(bucket_s)
+        self.retention_s = max(int(retention_s), self.bucket_s)
+        self._buckets: dict[int, AggregateBucket] = {}
+        self._last_ts_ms: int | None = None
+        self._last_equity: Decimal | None = None
+        self._cursors: dict[str, dict[str, Any]] = {}
+        self.peak_equity: Decimal | None = None
+        self.max_drawdown_pct: Decimal = _ZERO
+        self.skipped_rows: int = 0
+
+    def _bucket(self, ts_ms: int) -> AggregateBucket:
+        start = ts_ms - ts_ms % (self.bucket_s * 1000)
+        bucket = self._buckets.get(start)
+        if bucket is None:
+            bucket = self._buckets[start] = AggregateBucket(start_ms=start)
+        return bucket
+
+    # -- ingestion ------------------------------------------------------
+
+    def add_equity(self, ts: object, equity: object) -> bool:
+        """Fold one equity sample; out-of-order or unparseable samples are skipped."""
+        ts_ms = _ts_ms(ts)
+        value = _dec(equity, None)
+        if ts_ms is None or value is None or (self._last_ts_ms is not None and ts_ms <= self._last_ts_ms):
+            self.skipped_rows += 1
+            return False
+        ret: float | None = None
+        if self._last_equity is not None:
+            ret = float(value / self._last_equity - 1) if self._last_equity > _ZERO else 0.0
+        self._bucket(ts_ms).add_equity(ts_ms, value, ret)
+        self._last_ts_ms, self._last_equity = ts_ms, value
+        if self.peak_equity is None or value > self.peak_equity:
+            self.peak_equity = value
+        if self.peak_equity > _ZERO:
+            self.max_drawdown_pct = max(self.max_drawdown_pct, (self.peak_equity - value) / self.peak_equity)
+        return True
+
+    def add_fill(self, row: Mapping[str, object]) -> bool:
+        ts_ms = _ts_ms(row.get("ts"))
+        if ts_ms is None:
+            self.skipped_rows += 1
+            return False
+        self._bucket(ts_ms).add_fill(row)
+        return True
+
+    def add_minute_row(self, row: Mapping[str, object]) -> bool:
+        return self.add_equity(row.get("ts"), row.get("equity_quote"))
+
+    def ingest_csv(self, path: str | Path, kind: str) -> int:
+        """Fold rows appended to a ``minute`` / ``fills`` CSV since the last call.
+
+        Only complete lines are consumed.  A replaced file (new inode,
+        different header or shorter than the cursor) is read from the top.
+        """
+        if kind not in ("minute", "fills"):
+            raise MetricsError(f"Unsupported log kind: {kind}")
+        path = Path(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return 0
+        cursor = self._cursors.get(kind, {})
+        with path.open("rb") as fh:
+            header_line = fh.readline()
+            header = header_line.decode("utf-8").strip()
+            offset = int(cursor.get("offset", 0))
+            if (
+                cursor.get("header") != header
+                or cursor.get("inode") != st.st_ino
+                or not len(header_line) <= offset <= st.st_size
+            ):
+                offset = len(header_line)
+            fh.seek(offset)
+            data = fh.read()
+        end = data.rfind(b"\n") + 1
+        rows = 0
+        if end > 0 and header:
+            fieldnames = next(csv.reader([header]))
+            add = self.add_minute_row if kind == "minute" else self.add_fill
+            for row in csv.DictReader(io.StringIO(data[:end].decode("utf-8"), newline=""), fieldnames=fieldnames):
+                add(row)
+                rows += 1
+        self._cursors[kind] = {"header": header, "inode": st.st_ino, "offset": offset + end}
+        self._prune()
+        return rows
+
+    def _prune(self) -> None:
+        newest = max(self._buckets, default=None)
+        if newest is None:
+            return
+        cutoff = newest - self.retention_s * 1000
+        for start in [s for s in self._buckets if s < cutoff]:
+            del self._buckets[start]
+
+    # -- queries --------------------------------------------------------
+
+    def window(self, seconds: int, now: object = None) -> WindowSummary:
+        """Aggregate buckets starting within ``seconds`` of *now* (default: newest data)."""
+        end_ms = _ts_ms(now) if now is not None else self._newest_ms()
+        starts = sorted(self._buckets)
+        if end_ms is None:
+            return _summarize([])
+        lo = end_ms - int(seconds) * 1000
+        return _summarize([self._buckets[s] for s in starts if lo <= s <= end_ms])
+
+    def trailing(self, windows: Iterable[str] = DEFAULT_WINDOWS, now: object = None) -> dict[str, WindowSummary]:
+        return {spec: self.window(parse_window(spec), now=now) for spec in windows}
+
+    def daily(self) -> dict[str, WindowSummary]:
+        """One summary per UTC day present in the buckets."""
+        days: dict[str, list[AggregateBucket]] = {}
+        for start in sorted(self._buckets):
+            day = datetime.fromtimestamp(start / 1000, tz=UTC).date().isoformat()
+            days.setdefault(day, []).append(self._buckets[start])
+        return {day: _summarize(buckets) for day, buckets in days.items()}
+
+    def _newest_ms(self) -> int | None:
+        newest = max(self._buckets, default=None)
+        if newest is None:
+            return None
+        bucket = self._buckets[newest]
+        return bucket.last_ts_ms or newest
+
+    # -- persistence ----------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _STATE_VERSION,
+            "bucket_s": self.bucket_s,
+            "retention_s": self.retention_s,
+            "last_ts_ms": self._last_ts_ms,
+            "last_equity": None if self._last_equity is None else str(self._last_equity),
+            "peak_equity": None if self.peak_equity is None else str(self.peak_equity),
+            "max_drawdown_pct": str(self.max_drawdown_pct),
+            "skipped_rows": self.skipped_rows,
+            "cursors": self._cursors,
+            "buckets": [self._buckets[s].to_dict() for s in sorted(self._buckets)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RollingAggregates:
+        if int(data.get("version", 0)) != _STATE_VERSION:
+            raise MetricsError(f"Unsupported aggregate state version: {data.get('version')}")
+        agg = cls(bucket_s=int(data["bucket_s"]), retention_s=int(data["retention_s"]))
+        agg._last_ts_ms = data.get("last_ts_ms")
+        agg._last_equity = _dec(data.get("last_equity"), None)
+        agg.peak_equity = _dec(data.get("peak_equity"), None)
+        agg.max_drawdown_pct = _dec(data.get("max_drawdown_pct")) or _ZERO
+        agg.skipped_rows = int(data.get("skipped_rows", 0))
+        agg._cursors = {str(k): dict(v) for k, v in (data.get("cursors") or {}).items()}
+        for raw in data.get("buckets") or []:
+            bucket = AggregateBucket.from_dict(raw)
+            agg._buckets[bucket.start_ms] = bucket
+        return agg
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path, **defaults: Any) -> RollingAggregates:
+        """State saved at *path*, or a fresh instance built with *defaults* when absent."""
+        path = Path(path)
+        if not path.exists():
+            return cls(**defaults)
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+__all__ = [
+    "DEFAULT_WINDOWS",
+    "AggregateBucket",
+    "RollingAggregates",
+    "WindowSummary",
+    "parse_window",
+]
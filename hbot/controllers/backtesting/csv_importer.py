@@ -12,6 +12,13 @@ Handles two source types:
 
 Column detection is case-insensitive and falls back gracefully with a
 descriptive error list rather than crashing.
+
+For exchange dumps too large to hold as ``CandleRow``/``TradeRow`` objects
+(a month of Binance aggTrades is hundreds of millions of rows),
+:func:`stream_csv_to_parquet` reads the CSV in blocks with pyarrow's
+streaming reader, normalises columns vectorised and writes Parquet row
+groups directly, so peak memory is bounded by the block and row-group size
+rather than the file size.
 """
 from __future__ import annotations
 
@@ -21,6 +28,7 @@ from dataclasses import dataclass, field
 from datetime import UTC
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
+from typing import Any
 
 from controllers.backtesting.types import CandleRow
 
@@ -77,24 +85,52 @@ _ASK_ALIASES: list[str] = ["best_ask_price", "ask_price", "ask", "AskPrice"]
 # Columns required for a standard OHLCV import.
 _REQUIRED_OHLCV = ("timestamp", "open", "high", "low", "close")
 
+# Trade-dump columns (streaming import only).
+_TRADE_TIMESTAMP_ALIASES: list[str] = [*_TIMESTAMP_ALIASES, "transact_time", "trade_time"]
+_TRADE_PRICE_ALIASES: list[str] = ["price", "p", "trade_price"]
+_TRADE_SIZE_ALIASES: list[str] = ["size", "qty", "quantity", "amount", "q", "base_qty"]
+_TRADE_SIDE_ALIASES: list[str] = ["side", "taker_side"]
+_TRADE_BUYER_MAKER_ALIASES: list[str] = ["is_buyer_maker", "isbuyermaker", "buyer_maker", "m"]
+_TRADE_ID_ALIASES: list[str] = ["trade_id", "agg_trade_id", "id", "tradeid", "a"]
+
+# Column layouts of headerless Binance public-data dumps
+# (https://data.binance.vision).  Pass as ``column_names`` to
+# :func:`stream_csv_to_parquet`; a header row, if present, is skipped.
+BINANCE_KLINE_COLUMNS: list[str] = [
+    "open_time", "open", "high", "low", "close", "volume", "close_time",
+    "quote_volume", "count", "taker_buy_volume", "taker_buy_quote_volume", "ignore",
+]
+BINANCE_AGGTRADE_COLUMNS: list[str] = [
+    "agg_trade_id", "price", "quantity", "first_trade_id", "last_trade_id",
+    "transact_time", "is_buyer_maker", "is_best_match",
+]
+
+# Streaming defaults: ~16 MiB CSV blocks, row groups matching data_store.
+_STREAM_BLOCK_SIZE = 16 << 20
+_STREAM_ROW_GROUP_SIZE = 100_000
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _find_alias(headers: list[str], aliases: list[str]) -> str | None:
+    """Return the first header matching *aliases* (case-insensitive), or ``None``."""
+    lower_to_actual: dict[str, str] = {h.strip().lower(): h for h in headers}
+    for alias in aliases:
+        actual = lower_to_actual.get(alias.lower())
+        if actual is not None:
+            return actual
+    return None
+
+
 def _build_col_index(headers: list[str]) -> dict[str, str]:
     """Return a mapping from canonical field name to actual CSV header name.
 
     Matching is case-insensitive.  The first alias that matches wins.
     """
-    lower_to_actual: dict[str, str] = {h.strip().lower(): h for h in headers}
-
     def _find(aliases: list[str]) -> str | None:
-        for alias in aliases:
-            actual = lower_to_actual.get(alias.lower())
-            if actual is not None:
-                return actual
-        return None
+        return _find_alias(headers, aliases)
 
     mapping: dict[str, str] = {}
     ts_col = _find(_TIMESTAMP_ALIASES)
@@ -129,6 +165,7 @@ def _parse_timestamp_ms(value: str, col_name: str) -> int:
     """Parse a timestamp value to Unix milliseconds (int).
 
     Handles:
+    * Integer microseconds (16-digit Unix ts): divided by 1000.
     * Integer milliseconds (13-digit Unix ts): returned as-is.
     * Integer seconds (10-digit Unix ts): multiplied by 1000.
     * ISO 8601 strings via ``datetime.fromisoformat``.
@@ -141,6 +178,9 @@ def _parse_timestamp_ms(value: str, col_name: str) -> int:
     # Try numeric first (covers 99 % of cases and is fast).
     try:
         numeric = float(value)
+        if numeric > 1e15:
+            # Microseconds (Binance spot dumps since 2025).
+            return int(numeric // 1000)
         if numeric > 1e12:
             # Already in milliseconds.
             return int(numeric)
@@ -451,3 +491,399 @@ def import_and_register(
         len(result.candles), csv_path, parquet_path, catalog_dir,
     )
     return result
+
+
+# ---------------------------------------------------------------------------
+# Streaming (bounded-memory) import
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CsvStreamImportResult:
+    """Structured result from :func:`stream_csv_to_parquet`.
+
+    ``rows_dropped`` counts rows removed during normalisation: missing
+    required values, duplicate candle timestamps, and rows older than data
+    already written (the streaming path expects chronologically ordered
+    input, as exchange dumps are).
+    """
+
+    path: Path | None = None
+    rows_written: int = 0
+    rows_dropped: int = 0
+    start_ms: int | None = None
+    end_ms: int | None = None
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return len(self.errors) == 0 and self.rows_written > 0
+
+
+def _sniff_header(path: Path) -> tuple[str, list[str]]:
+    """Return ``(delimiter, first_row)`` using the same sniffing as :func:`import_csv`."""
+    with path.open(newline="", encoding="utf-8-sig") as fh:
+        sample = fh.read(4096)
+        try:
+            dialect: Any = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        fh.seek(0)
+        first_row = next(csv.reader(fh, dialect=dialect), [])
+    return dialect.delimiter, [h.strip() for h in first_row]
+
+
+def _looks_numeric(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _stream_timestamps_ms(column: Any) -> Any:
+    """Vectorised counterpart of :func:`_parse_timestamp_ms` for one column.
+
+    Numeric columns are scaled by magnitude (µs / ms / s); timestamp
+    columns parsed by pyarrow are cast to epoch milliseconds.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if column.null_count:
+        column = pc.fill_null(column, pa.scalar(0, type=column.type))
+    if pa.types.is_timestamp(column.type):
+        values = column.cast(pa.timestamp("ms", tz=column.type.tz)).cast(pa.int64())
+        return values.to_numpy(zero_copy_only=False).astype("int64")
+    raw = column.to_numpy(zero_copy_only=False).astype("float64")
+    return np.where(raw > 1e15, raw // 1000, np.where(raw > 1e12, raw, raw * 1000)).astype("int64")
+
+
+def _normalise_candle_batch(batch: Any, col_map: dict[str, str], is_tick: bool) -> tuple[dict[str, Any], int]:
+    """Map a raw CSV record batch to candle columns; return ``(columns, dropped)``."""
+    import numpy as np
+
+    def _col(name: str) -> Any:
+        return batch.column(col_map[name]).to_numpy(zero_copy_only=False).astype("float64")
+
+    ts = _stream_timestamps_ms(batch.column(col_map["timestamp"]))
+    ts_valid = batch.column(col_map["timestamp"]).is_valid().to_numpy(zero_copy_only=False)
+    if is_tick:
+        mid = _col("mid")
+        bid = _col("bid") if "bid" in col_map else mid
+        ask = _col("ask") if "ask" in col_map else mid
+        bid = np.where(np.isnan(bid), mid, bid)
+        ask = np.where(np.isnan(ask), mid, ask)
+        cols = {
+            "timestamp_ms": ts,
+            "open": mid,
+            "high": np.maximum(ask, mid),
+            "low": np.minimum(bid, mid),
+            "close": mid,
+            "volume": np.zeros(len(ts), dtype="float64"),
+        }
+        required = [mid]
+    else:
+        volume = _col("volume") if "volume" in col_map else np.zeros(len(ts), dtype="float64")
+        cols = {
+            "timestamp_ms": ts,
+            "open": _col("open"),
+            "high": _col("high"),
+            "low": _col("low"),
+            "close": _col("close"),
+            "volume": np.where(np.isnan(volume), 0.0, volume),
+        }
+        required = [cols["open"], cols["high"], cols["low"], cols["close"]]
+    keep = ts_valid.copy()
+    for arr in required:
+        keep &= ~np.isnan(arr)
+    dropped = int(len(keep) - keep.sum())
+    return {k: v[keep] for k, v in cols.items()}, dropped
+
+
+def _normalise_trade_batch(batch: Any, col_map: dict[str, str]) -> tuple[dict[str, Any], int]:
+    """Map a raw CSV record batch to trade columns; return ``(columns, dropped)``."""
+    import numpy as np
+    import pyarrow.compute as pc
+
+    ts = _stream_timestamps_ms(batch.column(col_map["timestamp"]))
+    price = batch.column(col_map["price"]).to_numpy(zero_copy_only=False).astype("float64")
+    size = batch.column(col_map["size"]).to_numpy(zero_copy_only=False).astype("float64")
+    n = len(ts)
+    if "side" in col_map:
+        side = np.asarray(
+            pc.fill_null(pc.utf8_lower(batch.column(col_map["side"])), "").to_numpy(zero_copy_only=False),
+            dtype=object,
+        )
+    elif "buyer_maker" in col_map:
+        # Buyer is maker → the aggressor sold.
+        maker = pc.fill_null(batch.column(col_map["buyer_maker"]), False).to_numpy(zero_copy_only=False)
+        side = np.where(maker.astype(bool), "sell", "buy").astype(object)
+    else:
+        side = np.full(n, "", dtype=object)
+    if "trade_id" in col_map:
+        trade_id = np.asarray(
+            pc.fill_null(batch.column(col_map["trade_id"]), "").to_numpy(zero_copy_only=False),
+            dtype=object,
+        )
+    else:
+        trade_id = np.full(n, "", dtype=object)
+
+    keep = batch.column(col_map["timestamp"]).is_valid().to_numpy(zero_copy_only=False)
+    keep &= ~np.isnan(price) & ~np.isnan(size)
+    dropped = int(n - keep.sum())
+    cols = {
+        "timestamp_ms": ts[keep],
+        "side": side[keep],
+        "price": price[keep],
+        "size": size[keep],
+        "trade_id": trade_id[keep],
+    }
+    return cols, dropped
+
+
+def stream_csv_to_parquet(
+    csv_path: Path,
+    out_path: Path,
+    *,
+    kind: str = "candles",
+    column_names: list[str] | None = None,
+    block_size: int = _STREAM_BLOCK_SIZE,
+    row_group_size: int = _STREAM_ROW_GROUP_SIZE,
+) -> CsvStreamImportResult:
+    """Convert a (possibly huge) CSV dump straight into a Parquet file.
+
+    Reads *csv_path* in ``block_size`` chunks with pyarrow's streaming CSV
+    reader, normalises each chunk vectorised, and writes ``row_group_size``
+    row groups with Zstd compression.  The output schema matches
+    :func:`~controllers.backtesting.data_store.save_candles` /
+    :func:`~controllers.backtesting.data_store.save_trades`, so the result
+    loads with the regular ``data_store`` readers.  The file is written to a
+    temporary sibling and renamed on success.
+
+    Parameters
+    ----------
+    kind:
+        ``"candles"`` (OHLCV or tick_emitter layout) or ``"trades"``.
+    column_names:
+        Column layout for headerless dumps, e.g.
+        :data:`BINANCE_AGGTRADE_COLUMNS`.  When the file does start with a
+        header row it is skipped.  Extra columns in the file are ignored.
+
+    Unlike :func:`import_csv` this does not sort the whole file: input is
+    expected in chronological order.  Each block is sorted, candle
+    timestamps are de-duplicated (keep first), and rows older than data
+    already written are dropped and counted in ``rows_dropped``.
+    """
+    if kind not in ("candles", "trades"):
+        raise ValueError(f"kind must be 'candles' or 'trades'; got {kind!r}")
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+
+    csv_path = Path(csv_path)
+    out_path = Path(out_path)
+    if not csv_path.exists():
+        return CsvStreamImportResult(errors=[f"File not found: {csv_path}"])
+
+    delimiter, first_row = _sniff_header(csv_path)
+    if not first_row:
+        return CsvStreamImportResult(errors=["CSV file has no header row or is empty"])
+    if column_names:
+        headers = list(column_names)
+        headers += [f"extra_{i}" for i in range(len(headers), len(first_row))]
+        skip_rows = 0 if _looks_numeric(first_row[0]) else 1
+    else:
+        headers = first_row
+        skip_rows = 1
+    first_data: list[str] = []
+    with csv_path.open(newline="", encoding="utf-8-sig") as fh:
+        rows_iter = csv.reader(fh, delimiter=delimiter)
+        for _ in range(skip_rows + 1):
+            first_data = next(rows_iter, [])
+
+    # --- Column mapping and validation ---
+    column_types: dict[str, Any] = {}
+    if kind == "candles":
+        col_map = _build_col_index(headers)
+        is_tick = _is_tick_emitter_format(col_map)
+        required = ("timestamp", "mid") if is_tick else _REQUIRED_OHLCV
+        numeric = ("mid", "bid", "ask") if is_tick else ("open", "high", "low", "close", "volume")
+        schema = pa.schema([
+            ("timestamp_ms", pa.int64()), ("open", pa.float64()), ("high", pa.float64()),
+            ("low", pa.float64()), ("close", pa.float64()), ("volume", pa.float64()),
+        ])
+    else:
+        is_tick = False
+        col_map = {}
+        for canonical, aliases in (
+            ("timestamp", _TRADE_TIMESTAMP_ALIASES),
+            ("price", _TRADE_PRICE_ALIASES),
+            ("size", _TRADE_SIZE_ALIASES),
+            ("side", _TRADE_SIDE_ALIASES),
+            ("buyer_maker", _TRADE_BUYER_MAKER_ALIASES),
+            ("trade_id", _TRADE_ID_ALIASES),
+        ):
+            col = _find_alias(headers, aliases)
+            if col:
+                col_map[canonical] = col
+        required = ("timestamp", "price", "size")
+        numeric = ("price", "size")
+        if "side" in col_map:
+            column_types[col_map["side"]] = pa.string()
+        elif "buyer_maker" in col_map:
+            column_types[col_map["buyer_maker"]] = pa.bool_()
+        if "trade_id" in col_map:
+            column_types[col_map["trade_id"]] = pa.string()
+        schema = pa.schema([
+            ("timestamp_ms", pa.int64()), ("side", pa.string()), ("price", pa.float64()),
+            ("size", pa.float64()), ("trade_id", pa.string()),
+        ])
+
+    missing = [name for name in required if name not in col_map]
+    if missing:
+        return CsvStreamImportResult(errors=[
+            f"{kind} CSV stream import failed — cannot map required columns:",
+            *[f"  missing: {m}" for m in missing],
+            f"  available columns: {headers}",
+        ])
+    for name in numeric:
+        if name in col_map:
+            column_types[col_map[name]] = pa.float64()
+    ts_col = col_map["timestamp"]
+    ts_index = headers.index(ts_col)
+    if ts_index < len(first_data) and not _looks_numeric(first_data[ts_index]):
+        column_types[ts_col] = pa.timestamp("ms")
+    else:
+        column_types[ts_col] = pa.float64()
+
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(
+            column_names=headers, skip_rows=skip_rows, block_size=block_size,
+        ),
+        parse_options=pacsv.ParseOptions(
+            delimiter=delimiter,
+            invalid_row_handler=lambda _row: "skip",
+        ),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=sorted(set(col_map.values())),
+            column_types=column_types,
+            timestamp_parsers=[
+                pacsv.ISO8601, "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%SZ", "%Y/%m/%d %H:%M:%S",
+            ],
+            strings_can_be_null=True,
+        ),
+    )
+
+    # --- Stream blocks → normalised row groups ---
+    result = CsvStreamImportResult(path=out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_suffix(".parquet.tmp")
+    pending: list[pa.Table] = []
+    pending_rows = 0
+    last_ts: int | None = None
+    writer = pq.ParquetWriter(tmp_path, schema, compression="zstd")
+
+    def _flush(force: bool) -> None:
+        nonlocal pending, pending_rows
+        while pending and (force or pending_rows >= row_group_size):
+            table = pa.concat_tables(pending)
+            head = table if force else table.slice(0, row_group_size)
+            writer.write_table(head, row_group_size=row_group_size)
+            rest = table.slice(head.num_rows)
+            pending = [rest] if rest.num_rows else []
+            pending_rows = rest.num_rows
+            if force:
+                break
+
+    try:
+        for batch in reader:
+            if kind == "candles":
+                cols, dropped = _normalise_candle_batch(batch, col_map, is_tick)
+            else:
+                cols, dropped = _normalise_trade_batch(batch, col_map)
+            ts = cols["timestamp_ms"]
+            order = np.argsort(ts, kind="stable")
+            ts = ts[order]
+            if kind == "candles":
+                keep = np.ones(len(ts), dtype=bool)
+                keep[1:] = ts[1:] != ts[:-1]
+                if last_ts is not None:
+                    keep &= ts > last_ts
+            else:
+                keep = ts >= last_ts if last_ts is not None else np.ones(len(ts), dtype=bool)
+            dropped += int(len(keep) - keep.sum())
+            idx = order[keep]
+            result.rows_dropped += dropped
+            if len(idx) == 0:
+                continue
+            table = pa.table({name: cols[name][idx] for name in schema.names}, schema=schema)
+            if result.start_ms is None:
+                result.start_ms = int(table.column("timestamp_ms")[0].as_py())
+            last_ts = int(table.column("timestamp_ms")[-1].as_py())
+            result.end_ms = last_ts
+            result.rows_written += table.num_rows
+            pending.append(table)
+            pending_rows += table.num_rows
+            _flush(force=False)
+        _flush(force=True)
+    except (pa.ArrowInvalid, ValueError) as exc:
+        writer.close()
+        tmp_path.unlink(missing_ok=True)
+        return CsvStreamImportResult(errors=[f"CSV stream import failed: {exc}"])
+    writer.close()
+
+    if result.rows_written == 0:
+        tmp_path.unlink(missing_ok=True)
+        result.path = None
+        result.errors.append(f"No valid rows in {csv_path}")
+        return result
+    tmp_path.replace(out_path)
+    logger.info(
+        "Streamed %d %s rows (%d dropped) from %s → %s",
+        result.rows_written, kind, result.rows_dropped, csv_path, out_path,
+    )
+    return result
+
+
+def stream_import_and_register(
+    csv_path: Path,
+    exchange: str,
+    pair: str,
+    resolution: str,
+    catalog_dir: str = "data/historical",
+    *,
+    kind: str = "candles",
+    column_names: list[str] | None = None,
+) -> CsvStreamImportResult:
+    """Streaming counterpart of :func:`import_and_register`.
+
+    Writes to the canonical :func:`~controllers.backtesting.data_store.resolve_data_path`
+    location (``resolution`` is forced to ``"trades"`` for trade dumps, as
+    in ``DataDownloader``) and registers the dataset in the catalog.
+    """
+    from controllers.backtesting.data_catalog import DataCatalog
+    from controllers.backtesting.data_store import resolve_data_path
+
+    pair_key = pair.replace("/", "-").replace(":", "-")
+    if kind == "trades":
+        resolution = "trades"
+    parquet_path = resolve_data_path(exchange, pair_key, resolution, catalog_dir)
+    result = stream_csv_to_parquet(csv_path, parquet_path, kind=kind, column_names=column_names)
+    if not result.ok or result.start_ms is None or result.end_ms is None:
+        return result
+
+    catalog = DataCatalog(base_dir=Path(catalog_dir))
+    catalog.register(
+        exchange=exchange,
+        pair=pair_key,
+        resolution=resolution,
+        file_path=str(parquet_path),
+        row_count=result.rows_written,
+        start_ms=result.start_ms,
+        end_ms=result.end_ms,
+        file_size_bytes=parquet_path.stat().st_size,
+    )
+    return result
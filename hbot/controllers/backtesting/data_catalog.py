@@ -1,4 +1,10 @@
-"""Data catalog: JSON manifest tracking available historical datasets."""
+"""Data catalog: JSON manifest tracking available historical datasets.
+
+An entry's ``file_path`` is either a single Parquet file or a time-partitioned
+dataset directory (see ``data_store.append_partitioned``).  For directories
+the SHA-256 is taken over the partition manifest, and size / row-count checks
+are summed over the partition files it lists.
+"""
 from __future__ import annotations
 
 import hashlib
@@ -7,6 +13,8 @@ import logging
 from datetime import UTC, datetime
 from pathlib import Path
 
+from controllers.backtesting.data_store import MANIFEST_FILENAME, partitions_for_window
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +27,13 @@ def _file_sha256(path: Path) -> str:
     return h.hexdigest()
 
 
+def dataset_sha256(path: Path) -> str:
+    """SHA-256 of a single-file dataset, or of a partitioned dataset's manifest."""
+    if path.is_dir():
+        return _file_sha256(path / MANIFEST_FILENAME)
+    return _file_sha256(path)
+
+
 class DataCatalog:
     """JSON-file-backed catalog of available historical datasets.
 
@@ -72,7 +87,7 @@ class DataCatalog:
             resolved = self._base_dir / file_path
         if resolved.exists():
             try:
-                sha256 = _file_sha256(resolved)
+                sha256 = dataset_sha256(resolved)
             except OSError:
                 logger.warning("Could not compute SHA-256 for %s", resolved)
 
@@ -199,7 +214,20 @@ class DataCatalog:
             warnings.append(f"File missing: {fp}")
             return warnings
 
-        actual_size = fp.stat().st_size
+        if fp.is_dir():
+            try:
+                files = partitions_for_window(fp)
+            except (OSError, ValueError) as exc:
+                warnings.append(f"Could not read partition manifest: {exc}")
+                return warnings
+            missing = [str(f) for f in files if not f.exists()]
+            if missing:
+                warnings.append(f"Partition files missing: {', '.join(missing)}")
+                return warnings
+        else:
+            files = [fp]
+
+        actual_size = sum(f.stat().st_size for f in files)
         expected_size = entry.get("file_size_bytes")
         if expected_size is not None and actual_size != expected_size:
             warnings.append(
@@ -208,7 +236,7 @@ class DataCatalog:
 
         expected_hash = entry.get("sha256", "")
         if expected_hash:
-            actual_hash = _file_sha256(fp)
+            actual_hash = dataset_sha256(fp)
             if actual_hash != expected_hash:
                 warnings.append(
                     f"SHA-256 mismatch: expected {expected_hash[:16]}…, "
@@ -224,8 +252,7 @@ class DataCatalog:
         if expected_rows is not None:
             try:
                 import pyarrow.parquet as pq
-                pf = pq.ParquetFile(fp)
-                actual_rows = pf.metadata.num_rows
+                actual_rows = sum(pq.ParquetFile(f).metadata.num_rows for f in files)
                 if actual_rows != expected_rows:
                     warnings.append(
                         f"Row count mismatch: expected {expected_rows}, got {actual_rows}"
@@ -251,7 +278,8 @@ class DataCatalog:
         """Compare catalog entries with actual parquet files on disk.
 
         Returns ``{"orphans": [...], "stale": [...]}``:
-        - *orphans*: ``data.parquet`` files on disk with no catalog entry.
+        - *orphans*: ``data.parquet`` files (or partitioned dataset
+          directories) on disk with no catalog entry.
         - *stale*: catalog entries whose ``file_path`` does not exist.
         """
         scan_dir = base_dir or self._base_dir
@@ -269,6 +297,9 @@ class DataCatalog:
         for pq in scan_dir.rglob("data.parquet"):
             if str(pq.resolve()) not in catalog_paths:
                 orphans.append(str(pq))
+        for manifest in scan_dir.rglob(MANIFEST_FILENAME):
+            if str(manifest.parent.resolve()) not in catalog_paths:
+                orphans.append(str(manifest.parent))
 
         return {"orphans": orphans, "stale": stale}
 
@@ -26,10 +26,14 @@ from typing import Any
 
 from controllers.backtesting.data_catalog import DataCatalog
 from controllers.backtesting.data_store import (
+    append_candles_partitioned,
+    append_trades_partitioned,
     load_funding_rates,
     load_long_short_ratio,
     load_trades,
+    partition_summary,
     resolve_data_path,
+    resolve_dataset_dir,
     save_candles,
     save_funding_rates,
     save_long_short_ratio,
@@ -501,12 +505,17 @@ class DataDownloader:
         pair: str,
         resume: bool = True,
         progress_cb: Callable[[int, int, int], None] | None = None,
+        partitioned: bool = False,
     ) -> list[CandleRow]:
         """Download OHLCV candles, persist to parquet, and register in catalog.
 
         Uses the same resume-aware merge pattern as the mark/index/funding
         equivalents: checks the catalog for an existing end timestamp and
         resumes from there, then merges old + new data before saving.
+
+        With ``partitioned=True`` the dataset is stored as monthly partitions
+        under :func:`resolve_dataset_dir`; only the partitions that receive
+        new bars are rewritten, and only the downloaded rows are returned.
         """
         from controllers.backtesting.data_store import load_candles as _load_candles
         base_dir = Path(base_dir)
@@ -524,9 +533,12 @@ class DataDownloader:
         )
 
         combined: list[CandleRow] = []
-        out_path = resolve_data_path(self._exchange_id, pair, timeframe, base_dir)
-        if resume_from_ms and out_path.exists():
-            combined.extend(_load_candles(out_path))
+        if partitioned:
+            out_path = resolve_dataset_dir(self._exchange_id, pair, timeframe, base_dir)
+        else:
+            out_path = resolve_data_path(self._exchange_id, pair, timeframe, base_dir)
+            if resume_from_ms and out_path.exists():
+                combined.extend(_load_candles(out_path))
         combined.extend(downloaded)
 
         deduped: dict[int, CandleRow] = {c.timestamp_ms: c for c in combined}
@@ -546,6 +558,11 @@ class DataDownloader:
         for w in warnings:
             logger.warning("Candle validation: %s", w)
 
+        if partitioned:
+            append_candles_partitioned(rows, out_path)
+            self._register_partitioned(catalog, pair, timeframe, out_path)
+            return rows
+
         save_candles(rows, out_path)
         catalog.register(
             exchange=self._exchange_id,
@@ -569,8 +586,13 @@ class DataDownloader:
         pair: str,
         resume: bool = True,
         progress_cb: Callable[[int, int, int], None] | None = None,
+        partitioned: bool = False,
     ) -> list[TradeRow]:
-        """Download raw trades, persist to parquet, and register in catalog."""
+        """Download raw trades, persist to parquet, and register in catalog.
+
+        With ``partitioned=True`` trades are stored as daily partitions under
+        :func:`resolve_dataset_dir`; only the downloaded rows are returned.
+        """
         base_dir = Path(base_dir)
         catalog = DataCatalog(base_dir=base_dir)
         existing = catalog.find(self._exchange_id, pair, "trades")
@@ -585,9 +607,12 @@ class DataDownloader:
         )
 
         combined: list[TradeRow] = []
-        out_path = resolve_data_path(self._exchange_id, pair, "trades", base_dir)
-        if resume_from_ms and out_path.exists():
-            combined.extend(load_trades(out_path))
+        if partitioned:
+            out_path = resolve_dataset_dir(self._exchange_id, pair, "trades", base_dir)
+        else:
+            out_path = resolve_data_path(self._exchange_id, pair, "trades", base_dir)
+            if resume_from_ms and out_path.exists():
+                combined.extend(load_trades(out_path))
         combined.extend(downloaded)
 
         deduped: dict[tuple[str, int, str, str, str], TradeRow] = {}
@@ -606,6 +631,11 @@ class DataDownloader:
         if not rows:
             return rows
 
+        if partitioned:
+            append_trades_partitioned(rows, out_path)
+            self._register_partitioned(catalog, pair, "trades", out_path)
+            return rows
+
         save_trades(rows, out_path)
         catalog.register(
             exchange=self._exchange_id,
@@ -619,6 +649,20 @@ class DataDownloader:
         )
         return rows
 
+    def _register_partitioned(self, catalog: DataCatalog, pair: str, resolution: str, dataset_dir: Path) -> None:
+        """Register a partitioned dataset directory using its manifest totals."""
+        summary = partition_summary(dataset_dir)
+        catalog.register(
+            exchange=self._exchange_id,
+            pair=pair,
+            resolution=resolution,
+            start_ms=summary["start_ms"],
+            end_ms=summary["end_ms"],
+            row_count=summary["row_count"],
+            file_path=str(dataset_dir),
+            file_size_bytes=summary["file_size_bytes"],
+        )
+
     def download_and_register_funding(
         self,
         symbol: str,
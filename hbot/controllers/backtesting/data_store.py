@@ -3,18 +3,32 @@
 Handles read/write, validation, and canonical path resolution for the
 backtesting data pipeline.  pandas and pyarrow are imported lazily so that
 the module can be imported without those dependencies being installed.
+
+Candles have a columnar API alongside the ``CandleRow`` list API:
+:func:`load_candle_arrays` returns a :class:`CandleArrays` (NumPy columns,
+memory-mapped read) that behaves as a lazy ``Sequence[CandleRow]`` — the
+``Decimal`` conversion is paid only for rows that are actually accessed.
+:func:`save_candle_arrays` writes columns straight to Parquet.
+
+Large datasets can instead be stored time-partitioned (one Parquet file per
+month or day plus a ``_manifest.json``, see :func:`append_partitioned`).
+The window loaders accept either layout and prune partitions by time.
 """
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import Iterator, Sequence
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, overload
 
 from controllers.backtesting.types import CandleRow, FundingRow, LongShortRatioRow, TradeRow
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
@@ -42,88 +56,284 @@ def _require_pandas() -> tuple:
     return pd, pyarrow  # type: ignore[return-value]
 
 
+def _read_table_window(
+    path: Path,
+    columns: list[str],
+    start_ms: int | None,
+    end_ms: int | None,
+    *,
+    memory_map: bool = False,
+) -> pa.Table:
+    """Read ``columns`` for rows in ``[start_ms, end_ms]`` from a file or partitioned dataset.
+
+    For a single Parquet file, row-group statistics prune the read.  For a
+    partitioned dataset directory (see :func:`append_partitioned`), the
+    manifest selects only the partitions overlapping the window before any
+    file is opened.  The caller is responsible for the existence check.
+    """
+    import pyarrow.parquet as pq
+
+    filters: list[tuple] = []
+    if start_ms is not None:
+        filters.append(("timestamp_ms", ">=", start_ms))
+    if end_ms is not None:
+        filters.append(("timestamp_ms", "<=", end_ms))
+
+    if is_partitioned_dataset(path):
+        files = partitions_for_window(path, start_ms, end_ms)
+        tables = [
+            pq.read_table(f, columns=columns, filters=filters or None, memory_map=memory_map)
+            for f in files
+        ]
+        if not tables:
+            return _empty_table(columns)
+        import pyarrow
+
+        return pyarrow.concat_tables(tables)
+    return pq.read_table(path, columns=columns, filters=filters or None, memory_map=memory_map)
+
+
+def _empty_table(columns: list[str]) -> pa.Table:
+    """Return a zero-row table with the canonical Arrow type for each column."""
+    import pyarrow
+
+    string_cols = {"side", "trade_id"}
+    return pyarrow.table({
+        name: pyarrow.array(
+            [],
+            type=pyarrow.int64() if name == "timestamp_ms"
+            else pyarrow.string() if name in string_cols
+            else pyarrow.float64(),
+        )
+        for name in columns
+    })
+
+
 # ---------------------------------------------------------------------------
-# Candle persistence
+# Columnar candle API
 # ---------------------------------------------------------------------------
 
-def save_candles(candles: list[CandleRow], path: Path) -> None:
-    """Write *candles* to a Parquet file at *path* using Zstd compression.
+def _to_decimal(value: float) -> Decimal:
+    """Float → Decimal with the 10-significant-digit rounding used on load."""
+    return Decimal(f"{value:.10g}")
 
-    The file is written atomically: data is first written to a temporary
-    sibling file and then renamed to *path* to avoid leaving a half-written
-    file on crash.
 
-    Schema:
-        timestamp_ms  int64
-        open          float64
-        high          float64
-        low           float64
-        close         float64
-        volume        float64
+class CandleArrays(Sequence[CandleRow]):
+    """Column-oriented candle series: one NumPy array per field.
+
+    Acts as a read-only ``Sequence[CandleRow]``: integer indexing builds a
+    ``CandleRow`` (with ``Decimal`` prices) on demand and memoises the last
+    row, since backtest feeds resolve the same bar several times per step.
+    Slicing returns another ``CandleArrays`` sharing the underlying arrays,
+    so window splits cost no copies.  Numeric consumers should read the
+    ``timestamp_ms`` / ``open`` / ... arrays or :meth:`to_frame` directly.
     """
-    pd, _ = _require_pandas()
+
+    __slots__ = ("_memo_index", "_memo_row", "close", "high", "low", "open", "timestamp_ms", "volume")
+
+    def __init__(
+        self,
+        timestamp_ms: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> None:
+        self.timestamp_ms = timestamp_ms
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self._memo_index = -1
+        self._memo_row: CandleRow | None = None
+
+    @classmethod
+    def from_rows(cls, candles: Sequence[CandleRow]) -> CandleArrays:
+        """Build column arrays from ``CandleRow`` objects (or return *candles* as-is)."""
+        if isinstance(candles, CandleArrays):
+            return candles
+        import numpy as np
+
+        n = len(candles)
+        ts = np.fromiter((c.timestamp_ms for c in candles), dtype="int64", count=n)
+        cols = [
+            np.fromiter((float(getattr(c, name)) for c in candles), dtype="float64", count=n)
+            for name in ("open", "high", "low", "close", "volume")
+        ]
+        return cls(ts, *cols)
+
+    def __len__(self) -> int:
+        return len(self.timestamp_ms)
+
+    @overload
+    def __getitem__(self, index: int) -> CandleRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CandleArrays: ...
+
+    def __getitem__(self, index: int | slice) -> CandleRow | CandleArrays:
+        if isinstance(index, slice):
+            return CandleArrays(
+                self.timestamp_ms[index], self.open[index], self.high[index],
+                self.low[index], self.close[index], self.volume[index],
+            )
+        n = len(self.timestamp_ms)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("CandleArrays index out of range")
+        if index == self._memo_index and self._memo_row is not None:
+            return self._memo_row
+        row = CandleRow(
+            timestamp_ms=int(self.timestamp_ms[index]),
+            open=_to_decimal(self.open[index]),
+            high=_to_decimal(self.high[index]),
+            low=_to_decimal(self.low[index]),
+            close=_to_decimal(self.close[index]),
+            volume=_to_decimal(self.volume[index]),
+        )
+        self._memo_index = index
+        self._memo_row = row
+        return row
+
+    def __iter__(self) -> Iterator[CandleRow]:
+        for i in range(len(self.timestamp_ms)):
+            yield self[i]
+
+    def to_rows(self) -> list[CandleRow]:
+        """Materialise every row as a ``CandleRow`` (pays the Decimal cost once)."""
+        ts = self.timestamp_ms.tolist()
+        o = self.open.tolist()
+        h = self.high.tolist()
+        lo = self.low.tolist()
+        c = self.close.tolist()
+        v = self.volume.tolist()
+        return [
+            CandleRow(
+                timestamp_ms=int(ts[i]),
+                open=_to_decimal(o[i]),
+                high=_to_decimal(h[i]),
+                low=_to_decimal(lo[i]),
+                close=_to_decimal(c[i]),
+                volume=_to_decimal(v[i]),
+            )
+            for i in range(len(ts))
+        ]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return a float64 DataFrame with the canonical candle columns."""
+        pd, _ = _require_pandas()
+        return pd.DataFrame({name: getattr(self, name) for name in _CANDLE_COLUMNS})
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "CandleArrays(len=0)"
+        return (
+            f"CandleArrays(len={len(self)}, "
+            f"start_ms={int(self.timestamp_ms[0])}, end_ms={int(self.timestamp_ms[-1])})"
+        )
+
+
+def save_candle_arrays(arrays: CandleArrays, path: Path) -> None:
+    """Write candle columns to a Parquet file at *path* using Zstd compression.
+
+    Same schema and atomic temp-file-then-rename behaviour as
+    :func:`save_candles`, without materialising any per-row objects.
+    """
+    _require_pandas()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    rows = [
-        {
-            "timestamp_ms": c.timestamp_ms,
-            "open": float(c.open),
-            "high": float(c.high),
-            "low": float(c.low),
-            "close": float(c.close),
-            "volume": float(c.volume),
-        }
-        for c in candles
-    ]
-    df = pd.DataFrame(rows, columns=_CANDLE_COLUMNS)
-    df = df.astype({
-        "timestamp_ms": "int64",
-        "open": "float64",
-        "high": "float64",
-        "low": "float64",
-        "close": "float64",
-        "volume": "float64",
+    table = pa.table({
+        "timestamp_ms": pa.array(arrays.timestamp_ms, type=pa.int64()),
+        "open": pa.array(arrays.open, type=pa.float64()),
+        "high": pa.array(arrays.high, type=pa.float64()),
+        "low": pa.array(arrays.low, type=pa.float64()),
+        "close": pa.array(arrays.close, type=pa.float64()),
+        "volume": pa.array(arrays.volume, type=pa.float64()),
     })
 
     tmp_path = path.with_suffix(".parquet.tmp")
-    df.to_parquet(tmp_path, index=False, compression="zstd", engine="pyarrow",
-                  row_group_size=100_000)
+    pq.write_table(table, tmp_path, compression="zstd", row_group_size=100_000)
     tmp_path.replace(path)
-    logger.debug("Saved %d candles → %s", len(candles), path)
+    logger.debug("Saved %d candles → %s", len(arrays), path)
 
 
-def load_candles(path: Path) -> list[CandleRow]:
-    """Read a Parquet file written by :func:`save_candles` and return a list
-    of :class:`~controllers.backtesting.types.CandleRow`.
+def load_candle_arrays(
+    path: Path,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    *,
+    memory_map: bool = True,
+) -> CandleArrays:
+    """Read a candle Parquet file (or partitioned dataset) into :class:`CandleArrays`.
+
+    Rows are filtered to ``[start_ms, end_ms]`` with row-group predicate
+    pushdown when either bound is given, and returned in chronological
+    order.  With ``memory_map=True`` (default) the file is memory-mapped
+    rather than read into a heap buffer.  No ``Decimal`` objects are built.
 
     Raises :class:`FileNotFoundError` if *path* does not exist.
     """
-    pd, _ = _require_pandas()
+    _require_pandas()
+    import numpy as np
 
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Candle Parquet file not found: {path}")
 
-    df = pd.read_parquet(path, engine="pyarrow", columns=_CANDLE_COLUMNS)
-    ts = df["timestamp_ms"].values
-    o = df["open"].values
-    h = df["high"].values
-    lo = df["low"].values
-    c = df["close"].values
-    v = df["volume"].values
-    candles: list[CandleRow] = [
-        CandleRow(
-            timestamp_ms=int(ts[i]),
-            open=Decimal(f"{o[i]:.10g}"),
-            high=Decimal(f"{h[i]:.10g}"),
-            low=Decimal(f"{lo[i]:.10g}"),
-            close=Decimal(f"{c[i]:.10g}"),
-            volume=Decimal(f"{v[i]:.10g}"),
-        )
-        for i in range(len(ts))
-    ]
+    table = _read_table_window(path, _CANDLE_COLUMNS, start_ms, end_ms, memory_map=memory_map)
+    cols = {
+        name: table.column(name).to_numpy().astype("int64" if name == "timestamp_ms" else "float64", copy=False)
+        for name in _CANDLE_COLUMNS
+    }
+    ts = cols["timestamp_ms"]
+    if len(ts) > 1 and bool(np.any(ts[1:] < ts[:-1])):
+        order = np.argsort(ts, kind="stable")
+        cols = {name: arr[order] for name, arr in cols.items()}
+    arrays = CandleArrays(**cols)
+    logger.debug(
+        "Loaded %d candle rows as arrays (window [%s, %s]) ← %s",
+        len(arrays), start_ms, end_ms, path,
+    )
+    return arrays
+
+
+# ---------------------------------------------------------------------------
+# Candle persistence
+# ---------------------------------------------------------------------------
+
+def save_candles(candles: Sequence[CandleRow], path: Path) -> None:
+    """Write *candles* to a Parquet file at *path* using Zstd compression.
+
+    The file is written atomically: data is first written to a temporary
+    sibling file and then renamed to *path* to avoid leaving a half-written
+    file on crash.  Accepts a :class:`CandleArrays` as well as a list.
+
+    Schema:
+        timestamp_ms  int64
+        open          float64
+        high          float64
+        low           float64
+        close         float64
+        volume        float64
+    """
+    save_candle_arrays(CandleArrays.from_rows(candles), path)
+
+
+def load_candles(path: Path) -> list[CandleRow]:
+    """Read a Parquet file written by :func:`save_candles` and return a list
+    of :class:`~controllers.backtesting.types.CandleRow`.
+
+    Raises :class:`FileNotFoundError` if *path* does not exist.  Prefer
+    :func:`load_candle_arrays` when every row's ``Decimal`` form is not needed.
+    """
+    candles = load_candle_arrays(path).to_rows()
     logger.debug("Loaded %d candles ← %s", len(candles), path)
     return candles
 
@@ -317,45 +527,10 @@ def load_candles_window(
     objects in chronological order.
 
     When both *start_ms* and *end_ms* are ``None``, behaves identically
-    to :func:`load_candles` (full file read).
+    to :func:`load_candles` (full file read).  See :func:`load_candle_arrays`
+    for the columnar equivalent.
     """
-    pd, _ = _require_pandas()
-    import pyarrow.parquet as pq
-
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Candle Parquet file not found: {path}")
-
-    filters: list[tuple] = []
-    if start_ms is not None:
-        filters.append(("timestamp_ms", ">=", start_ms))
-    if end_ms is not None:
-        filters.append(("timestamp_ms", "<=", end_ms))
-
-    table = pq.read_table(
-        path,
-        columns=_CANDLE_COLUMNS,
-        filters=filters or None,
-    )
-    ts = table.column("timestamp_ms").to_pylist()
-    o = table.column("open").to_pylist()
-    h = table.column("high").to_pylist()
-    lo = table.column("low").to_pylist()
-    c = table.column("close").to_pylist()
-    v = table.column("volume").to_pylist()
-
-    candles: list[CandleRow] = [
-        CandleRow(
-            timestamp_ms=int(ts[i]),
-            open=Decimal(f"{o[i]:.10g}"),
-            high=Decimal(f"{h[i]:.10g}"),
-            low=Decimal(f"{lo[i]:.10g}"),
-            close=Decimal(f"{c[i]:.10g}"),
-            volume=Decimal(f"{v[i]:.10g}"),
-        )
-        for i in range(len(ts))
-    ]
-    candles.sort(key=lambda r: r.timestamp_ms)
+    candles = load_candle_arrays(path, start_ms=start_ms, end_ms=end_ms).to_rows()
     logger.debug(
         "Loaded %d candles (window [%s, %s]) ← %s",
         len(candles), start_ms, end_ms, path,
@@ -370,36 +545,32 @@ def load_trades_window(
 ) -> list[TradeRow]:
     """Read a trade Parquet file, returning only rows within ``[start_ms, end_ms]``.
 
-    Uses pyarrow predicate pushdown.  Returns ``TradeRow`` objects in
+    Uses pyarrow predicate pushdown (and partition pruning for partitioned
+    datasets).  Returns ``TradeRow`` objects in
     chronological order.
     """
-    pd, _ = _require_pandas()
-    import pyarrow.parquet as pq
+    _require_pandas()
 
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Trade Parquet file not found: {path}")
 
-    filters: list[tuple] = []
-    if start_ms is not None:
-        filters.append(("timestamp_ms", ">=", start_ms))
-    if end_ms is not None:
-        filters.append(("timestamp_ms", "<=", end_ms))
-
-    table = pq.read_table(
-        path,
-        columns=_TRADE_COLUMNS,
-        filters=filters or None,
-    )
-    trades: list[TradeRow] = []
-    for i in range(table.num_rows):
-        trades.append(TradeRow(
-            timestamp_ms=int(table.column("timestamp_ms")[i].as_py()),
-            side=str(table.column("side")[i].as_py()),
-            price=Decimal(str(table.column("price")[i].as_py())),
-            size=Decimal(str(table.column("size")[i].as_py())),
-            trade_id=str(table.column("trade_id")[i].as_py() or ""),
-        ))
+    table = _read_table_window(path, _TRADE_COLUMNS, start_ms, end_ms)
+    ts = table.column("timestamp_ms").to_pylist()
+    side = table.column("side").to_pylist()
+    price = table.column("price").to_pylist()
+    size = table.column("size").to_pylist()
+    trade_id = table.column("trade_id").to_pylist()
+    trades: list[TradeRow] = [
+        TradeRow(
+            timestamp_ms=int(ts[i]),
+            side=str(side[i]),
+            price=Decimal(str(price[i])),
+            size=Decimal(str(size[i])),
+            trade_id=str(trade_id[i] or ""),
+        )
+        for i in range(len(ts))
+    ]
     trades.sort(key=lambda r: r.timestamp_ms)
     logger.debug(
         "Loaded %d trades (window [%s, %s]) ← %s",
@@ -415,33 +586,23 @@ def load_funding_window(
 ) -> list[FundingRow]:
     """Read a funding-rate Parquet file, returning only rows within ``[start_ms, end_ms]``.
 
-    Uses pyarrow predicate pushdown.  Returns ``FundingRow`` objects in
+    Uses pyarrow predicate pushdown (and partition pruning for partitioned
+    datasets).  Returns ``FundingRow`` objects in
     chronological order.
     """
-    pd, _ = _require_pandas()
-    import pyarrow.parquet as pq
+    _require_pandas()
 
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Funding-rate Parquet file not found: {path}")
 
-    filters: list[tuple] = []
-    if start_ms is not None:
-        filters.append(("timestamp_ms", ">=", start_ms))
-    if end_ms is not None:
-        filters.append(("timestamp_ms", "<=", end_ms))
-
-    table = pq.read_table(
-        path,
-        columns=_FUNDING_COLUMNS,
-        filters=filters or None,
-    )
-    rates: list[FundingRow] = []
-    for i in range(table.num_rows):
-        rates.append(FundingRow(
-            timestamp_ms=int(table.column("timestamp_ms")[i].as_py()),
-            rate=Decimal(str(table.column("rate")[i].as_py())),
-        ))
+    table = _read_table_window(path, _FUNDING_COLUMNS, start_ms, end_ms)
+    ts = table.column("timestamp_ms").to_pylist()
+    rate = table.column("rate").to_pylist()
+    rates: list[FundingRow] = [
+        FundingRow(timestamp_ms=int(ts[i]), rate=Decimal(str(rate[i])))
+        for i in range(len(ts))
+    ]
     rates.sort(key=lambda r: r.timestamp_ms)
     logger.debug(
         "Loaded %d funding rows (window [%s, %s]) ← %s",
@@ -455,7 +616,7 @@ def load_funding_window(
 # ---------------------------------------------------------------------------
 
 def load_candles_df(path: Path) -> pd.DataFrame:
-    """Read a candle Parquet file directly into a float64 DataFrame.
+    """Read a candle Parquet file (or partitioned dataset) directly into a float64 DataFrame.
 
     Bypasses the CandleRow / Decimal conversion round-trip used by
     :func:`load_candles`.  Intended for the ML feature pipeline where
@@ -467,7 +628,10 @@ def load_candles_df(path: Path) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Candle Parquet file not found: {path}")
 
-    df = pd.read_parquet(path, engine="pyarrow", columns=_CANDLE_COLUMNS)
+    if is_partitioned_dataset(path):
+        df = _read_table_window(path, _CANDLE_COLUMNS, None, None).to_pandas()
+    else:
+        df = pd.read_parquet(path, engine="pyarrow", columns=_CANDLE_COLUMNS)
     df = df.astype({
         "timestamp_ms": "int64",
         "open": "float64",
@@ -480,12 +644,274 @@ def load_candles_df(path: Path) -> pd.DataFrame:
     return df
 
 
+# ---------------------------------------------------------------------------
+# Time-partitioned datasets
+# ---------------------------------------------------------------------------
+#
+# A partitioned dataset is a directory of per-period Parquet files plus a
+# ``_manifest.json`` recording each partition's time bounds:
+#
+#     {dataset_dir}/_manifest.json
+#     {dataset_dir}/2025-01.parquet
+#     {dataset_dir}/2025-02.parquet
+#
+# Window reads consult the manifest and open only overlapping partitions, and
+# incremental appends rewrite only the partitions that received new rows —
+# the single-file layout has to reload, merge and rewrite the whole file.
+# The underscore prefix keeps the manifest (and in-flight temp files) out of
+# pyarrow's directory discovery, so ``pd.read_parquet(dataset_dir)`` also
+# works.
+
+MANIFEST_FILENAME = "_manifest.json"
+_MANIFEST_VERSION = 1
+_PARTITION_GRANULARITIES = {"month": "%Y-%m", "day": "%Y-%m-%d"}
+_KIND_COLUMNS = {
+    "candles": _CANDLE_COLUMNS,
+    "trades": _TRADE_COLUMNS,
+    "funding": _FUNDING_COLUMNS,
+}
+
+
+def is_partitioned_dataset(path: Path) -> bool:
+    """Return True if *path* is a directory holding a partition manifest."""
+    path = Path(path)
+    return path.is_dir() and (path / MANIFEST_FILENAME).exists()
+
+
+def read_manifest(dataset_dir: Path) -> dict:
+    """Load the partition manifest of *dataset_dir*.
+
+    Raises :class:`FileNotFoundError` if the directory has no manifest.
+    """
+    manifest_path = Path(dataset_dir) / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Partition manifest not found: {manifest_path}")
+    with manifest_path.open("r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _write_manifest(dataset_dir: Path, manifest: dict) -> None:
+    manifest_path = Path(dataset_dir) / MANIFEST_FILENAME
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+    tmp_path.replace(manifest_path)
+
+
+def partitions_for_window(
+    dataset_dir: Path,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> list[Path]:
+    """Return the partition files of *dataset_dir* overlapping ``[start_ms, end_ms]``.
+
+    Files are returned in chronological order.  Pruning uses only the
+    manifest, so no Parquet footer is read for skipped partitions.
+    """
+    dataset_dir = Path(dataset_dir)
+    manifest = read_manifest(dataset_dir)
+    files: list[Path] = []
+    for part in sorted(manifest.get("partitions", []), key=lambda p: p["key"]):
+        if start_ms is not None and int(part["end_ms"]) < start_ms:
+            continue
+        if end_ms is not None and int(part["start_ms"]) > end_ms:
+            continue
+        files.append(dataset_dir / part["file"])
+    return files
+
+
+def partition_summary(dataset_dir: Path) -> dict:
+    """Aggregate ``start_ms``, ``end_ms``, ``row_count`` and ``file_size_bytes`` over all partitions."""
+    parts = read_manifest(dataset_dir).get("partitions", [])
+    if not parts:
+        return {"start_ms": 0, "end_ms": 0, "row_count": 0, "file_size_bytes": 0}
+    return {
+        "start_ms": min(int(p["start_ms"]) for p in parts),
+        "end_ms": max(int(p["end_ms"]) for p in parts),
+        "row_count": sum(int(p["row_count"]) for p in parts),
+        "file_size_bytes": sum(int(p["file_size_bytes"]) for p in parts),
+    }
+
+
+def append_partitioned(
+    df: pd.DataFrame,
+    dataset_dir: Path,
+    *,
+    kind: str,
+    granularity: str = "month",
+) -> list[str]:
+    """Merge *df* into the partitioned dataset at *dataset_dir*.
+
+    Rows are bucketed by UTC calendar period (``granularity`` is ``"month"``
+    or ``"day"``).  Only partitions that receive rows are read, merged,
+    de-duplicated and rewritten; every other partition is left untouched.
+    Candles and funding rows keep the last row per ``timestamp_ms``; trades
+    drop exact duplicate rows.  Each partition file and the manifest are
+    written atomically.
+
+    Returns the keys of the partitions that were rewritten.
+    """
+    pd, pyarrow = _require_pandas()
+    import pyarrow.parquet as pq
+
+    if kind not in _KIND_COLUMNS:
+        raise ValueError(f"Unknown dataset kind {kind!r}; expected one of {sorted(_KIND_COLUMNS)}")
+    if granularity not in _PARTITION_GRANULARITIES:
+        raise ValueError(
+            f"Unknown partition granularity {granularity!r}; expected one of {sorted(_PARTITION_GRANULARITIES)}"
+        )
+    columns = _KIND_COLUMNS[kind]
+
+    dataset_dir = Path(dataset_dir)
+    dataset_dir.mkdir(parents=True, exist_ok=True)
+    if is_partitioned_dataset(dataset_dir):
+        manifest = read_manifest(dataset_dir)
+        if manifest.get("kind") != kind or manifest.get("granularity") != granularity:
+            raise ValueError(
+                f"Dataset {dataset_dir} is {manifest.get('kind')!r}/{manifest.get('granularity')!r}, "
+                f"cannot append {kind!r}/{granularity!r}"
+            )
+    else:
+        manifest = {"version": _MANIFEST_VERSION, "kind": kind, "granularity": granularity, "partitions": []}
+
+    if df.empty:
+        _write_manifest(dataset_dir, manifest)
+        return []
+
+    df = df[columns]
+    keys = pd.to_datetime(df["timestamp_ms"], unit="ms", utc=True).dt.strftime(
+        _PARTITION_GRANULARITIES[granularity]
+    )
+    entries = {p["key"]: p for p in manifest["partitions"]}
+    touched: list[str] = []
+    for key, new_rows in df.groupby(keys, sort=True):
+        file_name = f"{key}.parquet"
+        part_path = dataset_dir / file_name
+        merged = new_rows
+        if part_path.exists():
+            existing = pd.read_parquet(part_path, engine="pyarrow", columns=columns)
+            merged = pd.concat([existing, new_rows], ignore_index=True)
+        if kind == "trades":
+            merged = merged.drop_duplicates(keep="last")
+        else:
+            merged = merged.drop_duplicates(subset="timestamp_ms", keep="last")
+        merged = merged.sort_values("timestamp_ms", kind="stable").reset_index(drop=True)
+
+        table = pyarrow.Table.from_pandas(merged, schema=_empty_table(columns).schema, preserve_index=False)
+        tmp_path = dataset_dir / f"_{file_name}.tmp"
+        pq.write_table(table, tmp_path, compression="zstd", row_group_size=100_000)
+        tmp_path.replace(part_path)
+
+        entries[key] = {
+            "key": key,
+            "file": file_name,
+            "start_ms": int(merged["timestamp_ms"].iloc[0]),
+            "end_ms": int(merged["timestamp_ms"].iloc[-1]),
+            "row_count": len(merged),
+            "file_size_bytes": part_path.stat().st_size,
+        }
+        touched.append(key)
+
+    manifest["partitions"] = [entries[k] for k in sorted(entries)]
+    _write_manifest(dataset_dir, manifest)
+    logger.debug("Rewrote %d partition(s) %s ← %d new %s rows", len(touched), dataset_dir, len(df), kind)
+    return touched
+
+
+def append_candles_partitioned(
+    candles: Sequence[CandleRow],
+    dataset_dir: Path,
+    *,
+    granularity: str = "month",
+) -> list[str]:
+    """Append *candles* to a partitioned candle dataset; see :func:`append_partitioned`."""
+    return append_partitioned(
+        CandleArrays.from_rows(candles).to_frame(), dataset_dir, kind="candles", granularity=granularity,
+    )
+
+
+def append_trades_partitioned(
+    trades: Sequence[TradeRow],
+    dataset_dir: Path,
+    *,
+    granularity: str = "day",
+) -> list[str]:
+    """Append *trades* to a partitioned trade dataset; see :func:`append_partitioned`."""
+    pd, _ = _require_pandas()
+    df = pd.DataFrame(
+        {
+            "timestamp_ms": [t.timestamp_ms for t in trades],
+            "side": [t.side for t in trades],
+            "price": [float(t.price) for t in trades],
+            "size": [float(t.size) for t in trades],
+            "trade_id": [t.trade_id for t in trades],
+        },
+        columns=_TRADE_COLUMNS,
+    ).astype({"timestamp_ms": "int64", "price": "float64", "size": "float64"})
+    return append_partitioned(df, dataset_dir, kind="trades", granularity=granularity)
+
+
+def partition_existing_file(
+    path: Path,
+    dataset_dir: Path,
+    *,
+    kind: str,
+    granularity: str = "month",
+) -> list[str]:
+    """Split a single-file dataset written by ``save_*`` into a partitioned dataset.
+
+    The source file is left in place; callers re-point the catalog and
+    remove it once satisfied.
+    """
+    pd, _ = _require_pandas()
+    if kind not in _KIND_COLUMNS:
+        raise ValueError(f"Unknown dataset kind {kind!r}; expected one of {sorted(_KIND_COLUMNS)}")
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Parquet file not found: {path}")
+    df = pd.read_parquet(path, engine="pyarrow", columns=_KIND_COLUMNS[kind])
+    return append_partitioned(df, dataset_dir, kind=kind, granularity=granularity)
+
+
 # ---------------------------------------------------------------------------
 # Validation
 # ---------------------------------------------------------------------------
 
+def _candle_arrays_suspects(
+    candles: CandleArrays,
+    gap_threshold_ms: int,
+    max_return_pct: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(indices, dup_mask)`` of rows that may fail a validation check.
+
+    The float comparisons form a superset of the Decimal checks in
+    :func:`validate_candles` (10-significant-digit rounding is monotonic;
+    the spike threshold is loosened slightly to absorb rounding).
+    """
+    import numpy as np
+
+    ts = candles.timestamp_ms
+    o, h, lo, c, v = candles.open, candles.high, candles.low, candles.close, candles.volume
+    n = len(ts)
+
+    _, first_idx = np.unique(ts, return_index=True)
+    dup_mask = np.ones(n, dtype=bool)
+    dup_mask[first_idx] = False
+
+    suspect = dup_mask.copy()
+    if n > 1:
+        delta = np.diff(ts)
+        suspect[1:] |= (delta <= 0) | (delta > gap_threshold_ms)
+    suspect |= (o <= 0) | (h <= 0) | (lo <= 0) | (c <= 0) | (v <= 0)
+    suspect |= (h < np.maximum(o, c)) | (lo > np.minimum(o, c))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ret_pct = np.abs((c - o) / o) * 100
+    suspect |= ret_pct > max_return_pct * (1 - 1e-6)
+    return np.flatnonzero(suspect), dup_mask
+
+
 def validate_candles(
-    candles: list[CandleRow],
+    candles: Sequence[CandleRow],
     *,
     expected_interval_ms: int = 60_000,
     max_gap_multiple: int = 3,
@@ -504,7 +930,8 @@ def validate_candles(
     * Spike detection: warns when single-bar return exceeds ``max_return_pct``.
 
     An empty *return* list means the data passed all checks. An empty *input*
-    list is treated as valid (nothing to validate).
+    list is treated as valid (nothing to validate).  :class:`CandleArrays`
+    input is pre-screened vectorised, so clean rows never become Decimals.
     """
     warnings: list[str] = []
     if not candles:
@@ -517,13 +944,28 @@ def validate_candles(
     gap_count = 0
     _MAX_GAP_WARNINGS = 10
 
-    for idx, c in enumerate(candles):
+    if isinstance(candles, CandleArrays):
+        # Columnar input: find candidate rows vectorised and only build
+        # Decimal rows for those; the per-row checks below stay authoritative.
+        indices, dup_mask = _candle_arrays_suspects(candles, gap_threshold_ms, max_return_pct)
+        ts_all = candles.timestamp_ms
+    else:
+        indices, dup_mask, ts_all = range(len(candles)), None, None
+
+    for idx in indices:
+        c = candles[idx]
+        if ts_all is not None:
+            prev_ts = int(ts_all[idx - 1]) if idx > 0 else None
+            is_dup = bool(dup_mask[idx])
+        else:
+            is_dup = c.timestamp_ms in seen_ts
+            seen_ts.add(c.timestamp_ms)
+
         # Duplicate timestamps
-        if c.timestamp_ms in seen_ts:
+        if is_dup:
             warnings.append(
                 f"Duplicate timestamp_ms={c.timestamp_ms} at index {idx}"
             )
-        seen_ts.add(c.timestamp_ms)
 
         # Monotonically increasing
         if prev_ts is not None and c.timestamp_ms <= prev_ts:
@@ -646,3 +1088,37 @@ def resolve_data_path(
     """
     safe_pair = pair.replace("/", "-").replace(":", "-")
     return Path(base_dir) / exchange / safe_pair / resolution / "data.parquet"
+
+
+def resolve_dataset_dir(
+    exchange: str,
+    pair: str,
+    resolution: str,
+    base_dir: str | Path,
+) -> Path:
+    """Return the canonical directory for a time-partitioned dataset.
+
+    Sits next to the single-file path from :func:`resolve_data_path`::
+
+        {base_dir}/{exchange}/{pair}/{resolution}/parts/
+    """
+    return resolve_data_path(exchange, pair, resolution, base_dir).parent / "parts"
+
+
+def resolve_existing_dataset(
+    exchange: str,
+    pair: str,
+    resolution: str,
+    base_dir: str | Path,
+) -> Path | None:
+    """Return the dataset on disk for (exchange, pair, resolution), or None.
+
+    The partitioned directory from :func:`resolve_dataset_dir` wins over the
+    single file from :func:`resolve_data_path`: incremental downloads append
+    there, and :func:`partition_existing_file` leaves the source file behind.
+    """
+    dataset_dir = resolve_dataset_dir(exchange, pair, resolution, base_dir)
+    if is_partitioned_dataset(dataset_dir):
+        return dataset_dir
+    path = resolve_data_path(exchange, pair, resolution, base_dir)
+    return path if path.exists() else None
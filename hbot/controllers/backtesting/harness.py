@@ -10,6 +10,10 @@ The harness owns the simulation clock.  Each step:
 
 The harness is intentionally stateless between runs; create a new instance for
 each backtest (sweep workers, walk-forward windows).
+
+``run_variants`` advances several configs (fill preset, seed, strategy
+parameters) over the same window in lock-step: steps 1-2 happen once per
+tick and steps 3-5 once per variant, each with its own desk and adapter.
 """
 from __future__ import annotations
 
@@ -18,13 +22,14 @@ import json
 import logging
 import time
 import uuid
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import Any, ClassVar
 
 from controllers.backtesting.book_synthesizer import CandleBookSynthesizer
-from controllers.backtesting.data_store import load_candles, load_candles_window
+from controllers.backtesting.data_store import load_candle_arrays
 from controllers.backtesting.historical_feed import HistoricalDataFeed
 from controllers.backtesting.types import (
     BacktestConfig,
@@ -181,6 +186,321 @@ def _load_strategy(class_path: str, config: dict[str, Any]) -> Any:
     return cls(**config) if config else cls()
 
 
+# ---------------------------------------------------------------------------
+# Per-variant run state
+# ---------------------------------------------------------------------------
+
+def _variant_feed_key(config: BacktestConfig) -> tuple[Any, ...]:
+    """Fields that determine the candle window and synthetic book stream.
+
+    Variants sharing one data feed must agree on all of these; everything
+    else (fill preset, seed, leverage, strategy config, ...) may differ.
+    """
+    return (
+        config.data_source,
+        config.synthesis,
+        config.step_interval_s,
+        config.warmup_bars,
+    )
+
+
+class _VariantRun:
+    """Mutable per-variant state for one pass over the shared data feed.
+
+    Owns the variant's ``PaperDesk`` and adapter plus every accumulator the
+    time-stepping loop needs (fills, equity snapshots, regime counters).
+    The harness drives all variants in lock-step via :meth:`step`.
+    """
+
+    def __init__(
+        self,
+        config: BacktestConfig,
+        desk: PaperDesk,
+        adapter: Any,
+        instrument_id: InstrumentId,
+        start_ns: int,
+    ) -> None:
+        self.config = config
+        self.desk = desk
+        self.adapter = adapter
+        self._instrument_id = instrument_id
+
+        self.fills: list[FillRecord] = []
+        self.equity_snapshots: list[EquitySnapshot] = []
+        self.regime_ticks: dict[str, int] = {}
+        self.position_series: list[float] = []
+        self.fills_by_regime: dict[str, list[FillRecord]] = {}
+        self.order_count = 0
+        self.last_equity_day = -1
+        self.prev_day_equity = Decimal("0")
+        self.fill_cursor_for_day = 0
+        self.funding_paid = Decimal("0")
+        self.funding_received = Decimal("0")
+        self.regime_ticks_this_day: dict[str, int] = {}
+        self.snapshot_regimes: list[str] = []
+
+        self.initial_equity = config.initial_equity
+        self.current_equity = self.initial_equity
+        self.peak_equity = self.initial_equity
+        self.position_base = Decimal("0")
+        self.mid_price = Decimal("0")
+
+        # Initial equity snapshot — anchors day-0 return correctly
+        init_ts = datetime.fromtimestamp(start_ns / 1_000_000_000, tz=UTC)
+        self.equity_snapshots.append(EquitySnapshot(
+            date=init_ts.strftime("%Y-%m-%d"),
+            equity=self.initial_equity,
+            drawdown_pct=Decimal("0"),
+            daily_return_pct=Decimal("0"),
+            cumulative_return_pct=Decimal("0"),
+            position_notional=_ZERO,
+            num_fills=0,
+        ))
+        self.snapshot_regimes.append("initial")
+
+    def step(
+        self,
+        now_ns: int,
+        feed: HistoricalDataFeed,
+        raw_candle: CandleRow | None,
+    ) -> None:
+        """Advance this variant by one engine tick at ``now_ns``.
+
+        The shared feed has already been positioned at ``now_ns``; its book
+        is synthesised once and cached, so every variant's desk and adapter
+        observe the same snapshot.
+        """
+        config = self.config
+        adapter = self.adapter
+        instrument_id = self._instrument_id
+        now_s = now_ns / 1_000_000_000
+
+        # 2. Desk tick: match orders against current book
+        events = self.desk.tick(now_ns)
+
+        # 3. Process fill and funding events
+        regime = adapter.regime_name
+        for event in events:
+            if isinstance(event, OrderFilled):
+                fill_qty = event.fill_quantity
+                fill_price = event.fill_price
+                fee = event.fee
+                is_buy = event.side == "buy"
+
+                if is_buy:
+                    self.position_base += fill_qty
+                else:
+                    self.position_base -= fill_qty
+
+                fill_notional = fill_price * fill_qty
+                adapter.record_fill_notional(fill_notional)
+
+                mid = feed.get_mid_price(instrument_id) or fill_price
+                slippage_bps = _ZERO
+                if mid > _ZERO:
+                    slippage_bps = abs(fill_price - mid) / mid * Decimal("10000")
+
+                fill_rec = FillRecord(
+                    timestamp_ns=now_ns,
+                    order_id=event.order_id,
+                    side="buy" if is_buy else "sell",
+                    fill_price=fill_price,
+                    fill_quantity=fill_qty,
+                    fee=fee,
+                    is_maker=event.is_maker,
+                    slippage_bps=slippage_bps,
+                    mid_slippage_bps=slippage_bps,
+                    source_bot="backtest",
+                )
+                self.fills.append(fill_rec)
+                self.fills_by_regime.setdefault(regime, []).append(fill_rec)
+
+            elif isinstance(event, FundingApplied):
+                if event.charge_quote > _ZERO:
+                    self.funding_paid += event.charge_quote
+                else:
+                    self.funding_received += abs(event.charge_quote)
+
+        # 4. Get book once (cached by feed after desk.tick synthesis)
+        book = feed.get_book(instrument_id)
+        mid_price = book.mid_price if book is not None else Decimal("0")
+        self.mid_price = mid_price
+        if mid_price > _ZERO:
+            self.current_equity = self.desk.portfolio.equity_quote(
+                mark_prices={instrument_id.key: mid_price},
+            )
+        self.peak_equity = max(self.peak_equity, self.current_equity)
+
+        # 4b. Record position for inventory half-life
+        self.position_series.append(float(self.position_base))
+
+        # 5. Runtime adapter tick
+        if raw_candle is not None and not config.allow_full_candle:
+            candle_for_adapter: CandleRow | VisibleCandleRow = VisibleCandleRow(
+                raw_candle,
+                step_index=feed.current_step_index,
+                max_step=feed.steps_per_bar - 1,
+            )
+        else:
+            candle_for_adapter = raw_candle  # type: ignore[assignment]
+        plan = adapter.tick(
+            now_s=now_s,
+            mid=mid_price,
+            book=book,
+            equity_quote=self.current_equity,
+            position_base=self.position_base,
+            candle=candle_for_adapter,
+        )
+        if plan is not None:
+            self.order_count += adapter.last_submitted_count
+
+        # 6. Track regime
+        self.regime_ticks[regime] = self.regime_ticks.get(regime, 0) + 1
+        self.regime_ticks_this_day[regime] = self.regime_ticks_this_day.get(regime, 0) + 1
+
+        # 7. Daily equity snapshot
+        day = int(now_s // 86400)
+        if day != self.last_equity_day:
+            if self.last_equity_day >= 0:
+                day_ts = datetime.fromtimestamp(now_s, tz=UTC)
+                self._append_snapshot(day_ts, num_fills=len(self.fills) - self.fill_cursor_for_day)
+                self.fill_cursor_for_day = len(self.fills)
+                dominant = (
+                    max(self.regime_ticks_this_day, key=self.regime_ticks_this_day.get)  # type: ignore[arg-type]
+                    if self.regime_ticks_this_day else regime
+                )
+                self.snapshot_regimes.append(dominant)
+            self.regime_ticks_this_day = {}
+            self.prev_day_equity = self.current_equity
+            self.last_equity_day = day
+
+    def _append_snapshot(self, ts: datetime, num_fills: int) -> None:
+        peak_equity = self.peak_equity
+        current_equity = self.current_equity
+        initial_equity = self.initial_equity
+        mid_price = self.mid_price
+        dd_pct = float((peak_equity - current_equity) / peak_equity) if peak_equity > _ZERO else 0.0
+        ref_equity = self.prev_day_equity if self.prev_day_equity > _ZERO else initial_equity
+        daily_ret = float((current_equity - ref_equity) / ref_equity) if ref_equity > _ZERO else 0.0
+        cum_ret = float((current_equity - initial_equity) / initial_equity) if initial_equity > _ZERO else 0.0
+        self.equity_snapshots.append(EquitySnapshot(
+            date=ts.strftime("%Y-%m-%d"),
+            equity=current_equity,
+            drawdown_pct=Decimal(str(dd_pct)),
+            daily_return_pct=Decimal(str(daily_ret)),
+            cumulative_return_pct=Decimal(str(cum_ret)),
+            position_notional=self.position_base * mid_price if mid_price > _ZERO else _ZERO,
+            num_fills=num_fills,
+        ))
+
+    def finalize(
+        self,
+        backtest_candles: Sequence[CandleRow],
+        end_ns: int,
+        total_ticks: int,
+        run_duration: float,
+    ) -> BacktestResult:
+        """Append the closing snapshot and compute the variant's metrics."""
+        config = self.config
+        fills = self.fills
+        mid_price = self.mid_price
+        position_base = self.position_base
+
+        # --- Final equity snapshot ---
+        if backtest_candles:
+            final_ts = datetime.fromtimestamp(end_ns / 1_000_000_000, tz=UTC)
+            self._append_snapshot(final_ts, num_fills=len(fills) - self.fill_cursor_for_day)
+            dominant = (
+                max(self.regime_ticks_this_day, key=self.regime_ticks_this_day.get)  # type: ignore[arg-type]
+                if self.regime_ticks_this_day else (self.adapter.regime_name or "unknown")
+            )
+            self.snapshot_regimes.append(dominant)
+
+        # --- Build regime return series from per-day dominant regime ---
+        # Skip the initial anchor snapshot (regime="initial", return=0) so it
+        # doesn't create a phantom regime or dilute real regime statistics.
+        returns_by_regime: dict[str, list[float]] = {}
+        for snap, rname in zip(self.equity_snapshots, self.snapshot_regimes, strict=True):
+            if rname == "initial":
+                continue
+            returns_by_regime.setdefault(rname, []).append(float(snap.daily_return_pct))
+
+        # --- Compute metrics ---
+        from controllers.backtesting.metrics import compute_all_metrics
+
+        total_fees = sum((f.fee for f in fills), Decimal("0"))
+        actual_pnl = self.current_equity - self.initial_equity
+        result = compute_all_metrics(
+            equity_curve=self.equity_snapshots,
+            fills=fills,
+            order_count=self.order_count,
+            actual_pnl=actual_pnl,
+            total_fees=total_fees,
+            funding_paid=self.funding_paid,
+            funding_received=self.funding_received,
+            position_series=self.position_series,
+            returns_by_regime=returns_by_regime if returns_by_regime else None,
+            fills_by_regime=self.fills_by_regime if self.fills_by_regime else None,
+        )
+        from controllers.backtesting.metrics import compute_round_trips
+
+        rt = compute_round_trips(fills)
+        result.closed_trade_count = rt.total_count
+        result.winning_trade_count = rt.win_count
+        result.losing_trade_count = rt.loss_count
+        result.gross_profit_quote = rt.gross_profit
+        result.gross_loss_quote = rt.gross_loss
+        result.avg_win_quote = rt.avg_win
+        result.avg_loss_quote = rt.avg_loss
+        result.expectancy_quote = rt.expectancy
+        result.realized_net_pnl_quote = rt.realized_net
+        result.residual_pnl_quote = actual_pnl - rt.realized_net
+        result.terminal_position_base = position_base
+        result.terminal_mark_price = mid_price if mid_price > _ZERO else _ZERO
+        result.terminal_position_notional = (
+            position_base * result.terminal_mark_price
+            if result.terminal_mark_price > _ZERO else _ZERO
+        )
+        result.config = {
+            "strategy_class": config.strategy_class,
+            "exchange": config.data_source.exchange,
+            "pair": config.data_source.pair,
+            "resolution": config.data_source.resolution,
+            "initial_equity": str(config.initial_equity),
+            "fill_model": config.fill_model,
+            "step_interval_s": config.step_interval_s,
+            "warmup_bars": config.warmup_bars,
+            "seed": config.seed,
+        }
+        result.run_duration_s = run_duration
+        result.order_count = self.order_count
+        result.total_ticks = total_ticks
+        result.strategy_name = config.strategy_class.rsplit(".", 1)[-1] if config.strategy_class else ""
+        if backtest_candles:
+            result.data_start = datetime.fromtimestamp(
+                backtest_candles[0].timestamp_ms / 1000, tz=UTC,
+            ).strftime("%Y-%m-%dT%H:%M:%SZ")
+            result.data_end = datetime.fromtimestamp(
+                backtest_candles[-1].timestamp_ms / 1000, tz=UTC,
+            ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        else:
+            result.data_start = ""
+            result.data_end = ""
+        result.equity_curve = self.equity_snapshots
+        result.fills = fills
+        result.fill_disclaimer = (
+            "Fills are approximate: synthetic order books from OHLCV candles. "
+            "Use LatencyAwareFillModel for conservative estimates."
+        )
+
+        logger.info(
+            "Backtest complete: %d ticks, %d fills, Sharpe=%.2f, return=%.2f%% in %.1fs",
+            total_ticks, len(fills), result.sharpe_ratio,
+            result.total_return_pct, run_duration,
+        )
+        return result
+
+
 # ---------------------------------------------------------------------------
 # BacktestHarness
 # ---------------------------------------------------------------------------
@@ -192,6 +512,15 @@ class BacktestHarness:
 
         harness = BacktestHarness(config)
         result = harness.run()
+
+    Several variants of the same window (fill preset, seed, strategy
+    parameters) can share one data pass::
+
+        results = BacktestHarness(config).run_variants([cfg_a, cfg_b, cfg_c])
+
+    Candle loading, decoding and book synthesis are then paid once per
+    step instead of once per variant; each variant still gets its own
+    ``PaperDesk`` and adapter.
     """
 
     def __init__(self, config: BacktestConfig) -> None:
@@ -200,17 +529,38 @@ class BacktestHarness:
 
     def run(self) -> BacktestResult:
         """Execute the full backtest and return results."""
+        return self.run_variants([self._config])[0]
+
+    def run_variants(self, variants: list[BacktestConfig]) -> list[BacktestResult]:
+        """Run several configs in lock-step over one shared data feed.
+
+        The harness's own config defines the shared window: data source,
+        book synthesis, step interval, warmup and the synthesis RNG seed.
+        Each variant must agree on the window fields (``ValueError``
+        otherwise); its ``seed`` only drives its own desk's fill model.
+        Results are returned in the same order as ``variants``.
+        """
+        if not variants:
+            return []
+        base_key = _variant_feed_key(self._config)
+        for i, variant in enumerate(variants):
+            if _variant_feed_key(variant) != base_key:
+                raise ValueError(
+                    f"Variant {i} does not share the harness data window "
+                    f"(data_source/synthesis/step_interval_s/warmup_bars must match)"
+                )
+
         import simulation.desk as _desk_mod
         prev_trace = _desk_mod._PAPER_DESK_TRACE_ENABLED
         _desk_mod._PAPER_DESK_TRACE_ENABLED = False
         enable_backtest_ids()
         try:
-            return self._run_impl()
+            return self._run_impl(variants)
         finally:
             disable_backtest_ids()
             _desk_mod._PAPER_DESK_TRACE_ENABLED = prev_trace
 
-    def _run_impl(self) -> BacktestResult:
+    def _run_impl(self, variants: list[BacktestConfig]) -> list[BacktestResult]:
         t0 = time.monotonic()
         config = self._config
 
@@ -236,7 +586,7 @@ class BacktestHarness:
         )
         instrument_spec = _default_instrument_spec(instrument_id)
 
-        # --- Build synthesizer and data feed ---
+        # --- Build synthesizer and data feed (shared by all variants) ---
         synthesis = config.synthesis
         synthesizer = CandleBookSynthesizer(synthesis)
 
@@ -249,181 +599,45 @@ class BacktestHarness:
             seed=config.seed,
         )
 
-        # --- Create PaperDesk ---
-        desk = DeskFactory.create(config, instrument_id, instrument_spec, feed)
-
-        # --- Build adapter ---
-        adapter = self._build_adapter(config, desk, instrument_id, instrument_spec)
-
-        # --- Pre-compute features for ML adapters (if supported) ---
-        if callable(getattr(adapter, "set_all_candles", None)):
-            adapter.set_all_candles(candles)
-
-        # --- Warmup: feed candles to PriceBuffer ---
         warmup_candles = candles[:config.warmup_bars]
-        adapter.warmup(warmup_candles)
-
-        # --- Time-stepping loop ---
         backtest_candles = candles[config.warmup_bars:]
-        fills: list[FillRecord] = []
-        equity_snapshots: list[EquitySnapshot] = []
-        regime_ticks: dict[str, int] = {}
-        position_series: list[float] = []
-        fills_by_regime: dict[str, list[FillRecord]] = {}
-        order_count = 0
-        total_ticks = 0
-        last_equity_day = -1
-        prev_day_equity = Decimal("0")
-        fill_cursor_for_day = 0
-        funding_paid = Decimal("0")
-        funding_received = Decimal("0")
-        regime_ticks_this_day: dict[str, int] = {}
-        snapshot_regimes: list[str] = []
-
-        initial_equity = config.initial_equity
-        current_equity = initial_equity
-        peak_equity = initial_equity
-        position_base = Decimal("0")
-
         start_ns = backtest_candles[0].timestamp_ns
         end_ns = backtest_candles[-1].timestamp_ns
         expected_total_ticks = max(1, (end_ns - start_ns) // step_interval_ns + 1)
 
+        # --- Per-variant desk + adapter ---
+        runs: list[_VariantRun] = []
+        for variant in variants:
+            desk = DeskFactory.create(variant, instrument_id, instrument_spec, feed)
+            adapter = self._build_adapter(variant, desk, instrument_id, instrument_spec)
+
+            # Pre-compute features for ML adapters (if supported)
+            if callable(getattr(adapter, "set_all_candles", None)):
+                adapter.set_all_candles(candles)
+
+            # Warmup: feed candles to PriceBuffer
+            adapter.warmup(warmup_candles)
+            runs.append(_VariantRun(variant, desk, adapter, instrument_id, start_ns))
+
         progress_dir = Path(config.progress_dir) if config.progress_dir else None
         progress_interval = 1000
         if progress_dir:
             progress_dir.mkdir(parents=True, exist_ok=True)
 
+        # --- Time-stepping loop ---
+        total_ticks = 0
         now_ns = start_ns
-
-        # Initial equity snapshot — anchors day-0 return correctly
-        init_ts = datetime.fromtimestamp(start_ns / 1_000_000_000, tz=UTC)
-        equity_snapshots.append(EquitySnapshot(
-            date=init_ts.strftime("%Y-%m-%d"),
-            equity=initial_equity,
-            drawdown_pct=Decimal("0"),
-            daily_return_pct=Decimal("0"),
-            cumulative_return_pct=Decimal("0"),
-            position_notional=_ZERO,
-            num_fills=0,
-        ))
-        snapshot_regimes.append("initial")
-
         while now_ns <= end_ns:
             total_ticks += 1
-            now_s = now_ns / 1_000_000_000
 
-            # 1. Set feed time
+            # 1. Set feed time; the book is synthesised on first access and
+            #    cached for every variant's desk and adapter at this instant.
             feed.set_time(now_ns)
-
-            # 2. Desk tick: match orders against current book
-            events = desk.tick(now_ns)
-
-            # 3. Process fill and funding events
-            regime = adapter.regime_name
-            for event in events:
-                if isinstance(event, OrderFilled):
-                    fill_qty = event.fill_quantity
-                    fill_price = event.fill_price
-                    fee = event.fee
-                    is_buy = event.side == "buy"
-
-                    if is_buy:
-                        position_base += fill_qty
-                    else:
-                        position_base -= fill_qty
-
-                    fill_notional = fill_price * fill_qty
-                    adapter.record_fill_notional(fill_notional)
-
-                    mid = feed.get_mid_price(instrument_id) or fill_price
-                    slippage_bps = _ZERO
-                    if mid > _ZERO:
-                        slippage_bps = abs(fill_price - mid) / mid * Decimal("10000")
-
-                    fill_rec = FillRecord(
-                        timestamp_ns=now_ns,
-                        order_id=event.order_id,
-                        side="buy" if is_buy else "sell",
-                        fill_price=fill_price,
-                        fill_quantity=fill_qty,
-                        fee=fee,
-                        is_maker=event.is_maker,
-                        slippage_bps=slippage_bps,
-                        mid_slippage_bps=slippage_bps,
-                        source_bot="backtest",
-                    )
-                    fills.append(fill_rec)
-                    fills_by_regime.setdefault(regime, []).append(fill_rec)
-
-                elif isinstance(event, FundingApplied):
-                    if event.charge_quote > _ZERO:
-                        funding_paid += event.charge_quote
-                    else:
-                        funding_received += abs(event.charge_quote)
-
-            # 4. Get book once (cached by feed after desk.tick synthesis)
-            book = feed.get_book(instrument_id)
-            mid_price = book.mid_price if book is not None else Decimal("0")
-            if mid_price > _ZERO:
-                current_equity = desk.portfolio.equity_quote(
-                    mark_prices={instrument_id.key: mid_price},
-                )
-            peak_equity = max(peak_equity, current_equity)
-
-            # 4b. Record position for inventory half-life
-            position_series.append(float(position_base))
-
-            # 5. Runtime adapter tick
             raw_candle = feed.get_current_candle()
-            if raw_candle is not None and not config.allow_full_candle:
-                candle_for_adapter: CandleRow | VisibleCandleRow = VisibleCandleRow(
-                    raw_candle,
-                    step_index=feed.current_step_index,
-                    max_step=feed.steps_per_bar - 1,
-                )
-            else:
-                candle_for_adapter = raw_candle  # type: ignore[assignment]
-            plan = adapter.tick(
-                now_s=now_s,
-                mid=mid_price,
-                book=book,
-                equity_quote=current_equity,
-                position_base=position_base,
-                candle=candle_for_adapter,
-            )
-            if plan is not None:
-                order_count += adapter.last_submitted_count
-
-            # 6. Track regime
-            regime_ticks[regime] = regime_ticks.get(regime, 0) + 1
-            regime_ticks_this_day[regime] = regime_ticks_this_day.get(regime, 0) + 1
-
-            # 7. Daily equity snapshot
-            day = int(now_s // 86400)
-            if day != last_equity_day:
-                if last_equity_day >= 0:
-                    day_ts = datetime.fromtimestamp(now_s, tz=UTC)
-                    dd_pct = float((peak_equity - current_equity) / peak_equity) if peak_equity > _ZERO else 0.0
-                    ref_equity = prev_day_equity if prev_day_equity > _ZERO else initial_equity
-                    daily_ret = float((current_equity - ref_equity) / ref_equity) if ref_equity > _ZERO else 0.0
-                    cum_ret = float((current_equity - initial_equity) / initial_equity) if initial_equity > _ZERO else 0.0
-                    day_fills = len(fills) - fill_cursor_for_day
-                    fill_cursor_for_day = len(fills)
-                    equity_snapshots.append(EquitySnapshot(
-                        date=day_ts.strftime("%Y-%m-%d"),
-                        equity=current_equity,
-                        drawdown_pct=Decimal(str(dd_pct)),
-                        daily_return_pct=Decimal(str(daily_ret)),
-                        cumulative_return_pct=Decimal(str(cum_ret)),
-                        position_notional=position_base * mid_price if mid_price > _ZERO else _ZERO,
-                        num_fills=day_fills,
-                    ))
-                    dominant = max(regime_ticks_this_day, key=regime_ticks_this_day.get) if regime_ticks_this_day else regime
-                    snapshot_regimes.append(dominant)
-                regime_ticks_this_day = {}
-                prev_day_equity = current_equity
-                last_equity_day = day
+
+            # 2-7. Per-variant desk tick, fills, adapter tick, snapshots
+            for run in runs:
+                run.step(now_ns, feed, raw_candle)
 
             # 8. Progress emission
             if progress_dir and total_ticks % progress_interval == 0:
@@ -442,34 +656,6 @@ class BacktestHarness:
             # 9. Advance clock
             now_ns += step_interval_ns
 
-        # --- Final equity snapshot ---
-        if backtest_candles:
-            final_ts = datetime.fromtimestamp(end_ns / 1_000_000_000, tz=UTC)
-            dd_pct = float((peak_equity - current_equity) / peak_equity) if peak_equity > _ZERO else 0.0
-            ref_equity = prev_day_equity if prev_day_equity > _ZERO else initial_equity
-            daily_ret = float((current_equity - ref_equity) / ref_equity) if ref_equity > _ZERO else 0.0
-            cum_ret = float((current_equity - initial_equity) / initial_equity) if initial_equity > _ZERO else 0.0
-            equity_snapshots.append(EquitySnapshot(
-                date=final_ts.strftime("%Y-%m-%d"),
-                equity=current_equity,
-                drawdown_pct=Decimal(str(dd_pct)),
-                daily_return_pct=Decimal(str(daily_ret)),
-                cumulative_return_pct=Decimal(str(cum_ret)),
-                position_notional=position_base * mid_price if mid_price > _ZERO else _ZERO,
-                num_fills=len(fills) - fill_cursor_for_day,
-            ))
-            dominant = max(regime_ticks_this_day, key=regime_ticks_this_day.get) if regime_ticks_this_day else (adapter.regime_name or "unknown")
-            snapshot_regimes.append(dominant)
-
-        # --- Build regime return series from per-day dominant regime ---
-        # Skip the initial anchor snapshot (regime="initial", return=0) so it
-        # doesn't create a phantom regime or dilute real regime statistics.
-        returns_by_regime: dict[str, list[float]] = {}
-        for snap, rname in zip(equity_snapshots, snapshot_regimes, strict=True):
-            if rname == "initial":
-                continue
-            returns_by_regime.setdefault(rname, []).append(float(snap.daily_return_pct))
-
         # --- Final progress: 100% ---
         if progress_dir:
             try:
@@ -481,100 +667,29 @@ class BacktestHarness:
             except OSError:
                 pass
 
-        # --- Compute metrics ---
-        from controllers.backtesting.metrics import compute_all_metrics
-
         run_duration = time.monotonic() - t0
-        total_fees = sum((f.fee for f in fills), Decimal("0"))
-        actual_pnl = current_equity - initial_equity
-        result = compute_all_metrics(
-            equity_curve=equity_snapshots,
-            fills=fills,
-            order_count=order_count,
-            actual_pnl=actual_pnl,
-            total_fees=total_fees,
-            funding_paid=funding_paid,
-            funding_received=funding_received,
-            position_series=position_series,
-            returns_by_regime=returns_by_regime if returns_by_regime else None,
-            fills_by_regime=fills_by_regime if fills_by_regime else None,
-        )
-        from controllers.backtesting.metrics import compute_round_trips
-
-        rt = compute_round_trips(fills)
-        result.closed_trade_count = rt.total_count
-        result.winning_trade_count = rt.win_count
-        result.losing_trade_count = rt.loss_count
-        result.gross_profit_quote = rt.gross_profit
-        result.gross_loss_quote = rt.gross_loss
-        result.avg_win_quote = rt.avg_win
-        result.avg_loss_quote = rt.avg_loss
-        result.expectancy_quote = rt.expectancy
-        result.realized_net_pnl_quote = rt.realized_net
-        result.residual_pnl_quote = actual_pnl - rt.realized_net
-        result.terminal_position_base = position_base
-        result.terminal_mark_price = mid_price if mid_price > _ZERO else _ZERO
-        result.terminal_position_notional = (
-            position_base * result.terminal_mark_price
-            if result.terminal_mark_price > _ZERO else _ZERO
-        )
-        result.config = {
-            "strategy_class": config.strategy_class,
-            "exchange": config.data_source.exchange,
-            "pair": config.data_source.pair,
-            "resolution": config.data_source.resolution,
-            "initial_equity": str(config.initial_equity),
-            "fill_model": config.fill_model,
-            "step_interval_s": config.step_interval_s,
-            "warmup_bars": config.warmup_bars,
-            "seed": config.seed,
-        }
-        result.run_duration_s = run_duration
-        result.order_count = order_count
-        result.total_ticks = total_ticks
-        result.strategy_name = config.strategy_class.rsplit(".", 1)[-1] if config.strategy_class else ""
-        if backtest_candles:
-            result.data_start = datetime.fromtimestamp(
-                backtest_candles[0].timestamp_ms / 1000, tz=UTC,
-            ).strftime("%Y-%m-%dT%H:%M:%SZ")
-            result.data_end = datetime.fromtimestamp(
-                backtest_candles[-1].timestamp_ms / 1000, tz=UTC,
-            ).strftime("%Y-%m-%dT%H:%M:%SZ")
-        else:
-            result.data_start = ""
-            result.data_end = ""
-        result.equity_curve = equity_snapshots
-        result.fills = fills
-        result.fill_disclaimer = (
-            "Fills are approximate: synthetic order books from OHLCV candles. "
-            "Use LatencyAwareFillModel for conservative estimates."
-        )
-
-        logger.info(
-            "Backtest complete: %d ticks, %d fills, Sharpe=%.2f, return=%.2f%% in %.1fs",
-            total_ticks, len(fills), result.sharpe_ratio,
-            result.total_return_pct, run_duration,
-        )
-        return result
+        return [
+            run.finalize(backtest_candles, end_ns, total_ticks, run_duration)
+            for run in runs
+        ]
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    def _load_candles(self) -> list[CandleRow]:
+    def _load_candles(self) -> Sequence[CandleRow]:
         """Load candles from data catalog or explicit path, filtered by date range.
 
         Uses filtered parquet loading with predicate pushdown when a date
         range is configured, avoiding a full-file scan + Python filtering.
+        Returns columnar ``CandleArrays``; ``CandleRow`` objects are built
+        lazily as the feed and adapters touch each bar.
         """
         ds = self._config.data_source
         start_ms, end_ms = self._date_range_to_ms(ds.start_date, ds.end_date)
 
         if ds.data_path:
-            if start_ms or end_ms:
-                candles = load_candles_window(Path(ds.data_path), start_ms=start_ms, end_ms=end_ms)
-            else:
-                candles = load_candles(Path(ds.data_path))
+            candles = load_candle_arrays(Path(ds.data_path), start_ms=start_ms, end_ms=end_ms)
         else:
             from controllers.backtesting.data_catalog import DataCatalog
             catalog = DataCatalog(base_dir=Path(ds.catalog_dir))
@@ -593,10 +708,7 @@ class BacktestHarness:
                     f"--start {ds.start_date} --end {ds.end_date} "
                     f"(set --output to match catalog_dir, or BACKTEST_CATALOG_DIR in Docker)."
                 )
-            if start_ms or end_ms:
-                candles = load_candles_window(Path(entry["file_path"]), start_ms=start_ms, end_ms=end_ms)
-            else:
-                candles = load_candles(Path(entry["file_path"]))
+            candles = load_candle_arrays(Path(entry["file_path"]), start_ms=start_ms, end_ms=end_ms)
 
         return candles
 
@@ -618,7 +730,7 @@ class BacktestHarness:
 
     @staticmethod
     def _filter_by_date_range(
-        candles: list[CandleRow],
+        candles: Sequence[CandleRow],
         start_date: str,
         end_date: str,
     ) -> list[CandleRow]:
@@ -50,6 +50,7 @@ from __future__ import annotations
 import bisect
 import logging
 import random
+from collections.abc import Sequence
 from decimal import Decimal
 
 from controllers.backtesting.book_synthesizer import BookSynthesizer
@@ -71,7 +72,7 @@ _MIN_CANDLES_FOR_INTERVAL = 2
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _derive_candle_interval_ns(candles: list[CandleRow]) -> int:
+def _derive_candle_interval_ns(candles: Sequence[CandleRow]) -> int:
     """Return the candle bar width in nanoseconds.
 
     Uses the median inter-bar gap computed from the first few candles to be
@@ -118,8 +119,9 @@ class HistoricalDataFeed:
     Parameters
     ----------
     candles:
-        Chronologically ordered OHLCV bars.  Must contain at least two
-        entries so that the bar interval can be derived.
+        Chronologically ordered OHLCV bars (a list or a columnar
+        ``CandleArrays``).  Must contain at least two entries so that the
+        bar interval can be derived.
     instrument_id:
         Instrument this feed represents.  Queries for a *different*
         ``instrument_id`` return ``None`` (the feed is single-instrument).
@@ -144,7 +146,7 @@ class HistoricalDataFeed:
 
     def __init__(
         self,
-        candles: list[CandleRow],
+        candles: Sequence[CandleRow],
         instrument_id: InstrumentId,
         synthesizer: BookSynthesizer,
         step_interval_ns: int,
@@ -158,7 +160,7 @@ class HistoricalDataFeed:
                 f"HistoricalDataFeed: step_interval_ns must be > 0; got {step_interval_ns}"
             )
 
-        self._candles: list[CandleRow] = candles
+        self._candles: Sequence[CandleRow] = candles
         self._instrument_id: InstrumentId = instrument_id
         self._synthesizer: BookSynthesizer = synthesizer
         self._step_interval_ns: int = step_interval_ns
@@ -336,12 +336,15 @@ class MlSignalAdapter:
     def _precompute_features(self, all_candles: list[CandleRow]) -> None:
         import pandas as pd
         logger.info("Pre-computing ML features for %d candles...", len(all_candles))
-        df = pd.DataFrame([{
-            "timestamp_ms": int(c.timestamp_ms),
-            "open": float(c.open), "high": float(c.high),
-            "low": float(c.low), "close": float(c.close),
-            "volume": float(c.volume),
-        } for c in all_candles])
+        if callable(getattr(all_candles, "to_frame", None)):
+            df = all_candles.to_frame()  # CandleArrays: no per-row Decimal round trip
+        else:
+            df = pd.DataFrame([{
+                "timestamp_ms": int(c.timestamp_ms),
+                "open": float(c.open), "high": float(c.high),
+                "low": float(c.low), "close": float(c.close),
+                "volume": float(c.volume),
+            } for c in all_candles])
         features_df = compute_features(df)
         for _, row in features_df.iterrows():
             ts = int(row.get("timestamp_ms", 0))
@@ -20,7 +20,8 @@ from typing import Any
 
 from controllers.backtesting.types import CandleRow
 from controllers.common.ict._atr import IncrementalATR as _IncrementalATR
-from controllers.common.ict.state import ICTConfig, ICTState
+from controllers.common.ict.fast import FastICTState
+from controllers.common.ict.state import ICTConfig
 from simulation.desk import PaperDesk
 from simulation.types import (
     InstrumentId,
@@ -213,9 +214,10 @@ class SmcMMAdapter:
         self._fvg = _FVGTracker(decay_bars=self._cfg.fvg_decay_bars)
         self._bb = _BBRegime(period=self._cfg.bb_period, width_lookback=self._cfg.bb_width_lookback)
 
-        self._ict: ICTState | None = None
+        # Shadow ICT only feeds diagnostics, so it runs on the float pipeline.
+        self._ict: FastICTState | None = None
         if self._cfg.ict_shadow_enabled:
-            self._ict = ICTState(ICTConfig(atr_period=self._cfg.atr_period))
+            self._ict = FastICTState(ICTConfig(atr_period=self._cfg.atr_period))
 
         self._regime_name: str = "smc_adaptive"
         self._last_submitted_count: int = 0
@@ -240,7 +242,7 @@ class SmcMMAdapter:
             self._fvg.add_bar(c.high, c.low, c.open, c.close)
             self._bb.add_bar(c.close, c.high, c.low)
             if self._ict is not None:
-                self._ict.add_bar(c.open, c.high, c.low, c.close, c.volume)
+                self._ict.add_bar(float(c.open), float(c.high), float(c.low), float(c.close), float(c.volume))
         return len(candles)
 
     def tick(
@@ -261,7 +263,10 @@ class SmcMMAdapter:
             self._fvg.add_bar(candle.high, candle.low, candle.open, candle.close)
             self._bb.add_bar(candle.close, candle.high, candle.low)
             if self._ict is not None:
-                self._ict.add_bar(candle.open, candle.high, candle.low, candle.close, candle.volume)
+                self._ict.add_bar(
+                    float(candle.open), float(candle.high), float(candle.low),
+                    float(candle.close), float(candle.volume),
+                )
             self._last_candle_ts = candle.timestamp_ms
 
         day = int(now_s // 86400)
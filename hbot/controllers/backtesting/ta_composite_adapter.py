@@ -6,13 +6,18 @@ trailing stop/max hold), daily risk gating, and market/limit entry types.
 
 Config-driven via ``TaCompositeConfig`` — YAML-hydrated by the adapter
 registry just like every other adapter.
+
+When the harness provides the full candle history (``set_all_candles``),
+every configured signal is precomputed as a per-bar series
+(``ta_signal_series``) and ticks look results up by bar index instead of
+re-evaluating the primitives against the PriceBuffer.
 """
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from controllers.backtesting.ta_signals import (
     SIGNAL_REGISTRY,
@@ -30,6 +35,9 @@ from simulation.types import (
     PaperOrderType,
 )
 
+if TYPE_CHECKING:
+    from controllers.backtesting.ta_signal_series import SignalSeries
+
 logger = logging.getLogger(__name__)
 
 _ZERO = Decimal("0")
@@ -84,6 +92,7 @@ class TaCompositeConfig:
     min_warmup_bars: int = 0
     entry_order_type: str = "market"
     limit_entry_offset_atr: Decimal = Decimal("0.1")
+    precompute_signals: bool = True
 
     def hydrate_nested(self) -> None:
         """Convert raw dict entry/exit rules into proper dataclass instances.
@@ -177,18 +186,59 @@ class TaCompositeAdapter:
         self._current_day: int = -1
         self._last_candle_ts: int = 0
 
+        # Precomputed signal series, parallel to entry/exit rule signals.
+        # None means signals are evaluated live on the PriceBuffer.
+        self._entry_series: list[SignalSeries] | None = None
+        self._exit_series: list[SignalSeries] | None = None
+        self._series_index: dict[int, int] = {}
+        self._series_pos: int = -1
+
     @property
     def last_submitted_count(self) -> int:
         return self._last_submitted_count
 
+    @property
+    def uses_precomputed_signals(self) -> bool:
+        return self._entry_series is not None
+
+    def set_all_candles(self, all_candles: list[CandleRow]) -> None:
+        """Precompute every configured signal over the full candle history.
+
+        Skipped when disabled in config, or when the history has gaps or
+        non-positive prices: PriceBuffer forward-fills or drops such bars,
+        so bar indices would no longer line up with the series.
+        """
+        if not self._cfg.precompute_signals or not all_candles:
+            return
+        prev_minute = None
+        for c in all_candles:
+            minute = int(c.timestamp_ms // 1000 // 60)
+            gap = prev_minute is not None and minute != prev_minute + 1
+            if gap or min(c.open, c.high, c.low, c.close) <= _ZERO:
+                logger.info("ta_composite: candle history not contiguous, evaluating signals live")
+                return
+            prev_minute = minute
+
+        from controllers.backtesting.ta_signal_series import OhlcArrays, compute_signal_series
+
+        bars = OhlcArrays.from_candles(all_candles)
+        cfg = self._cfg
+        self._entry_series = [compute_signal_series(sc.signal_type, bars, sc.params) for sc in cfg.entry_rules.signals]
+        self._exit_series = [compute_signal_series(sc.signal_type, bars, sc.params) for sc in cfg.exit_rules.signals]
+        self._series_index = {int(c.timestamp_ms): i for i, c in enumerate(all_candles)}
+        self._series_pos = -1
+
     def warmup(self, candles: list[CandleRow]) -> int:
         from controllers.price_buffer import MinuteBar
         for c in candles:
+            bars_before = self._buf.bar_count
             self._buf.append_bar(MinuteBar(
                 ts_minute=int(c.timestamp_ms // 1000 // 60) * 60,
                 open=c.open, high=c.high,
                 low=c.low, close=c.close,
             ))
+            if self._buf.bar_count != bars_before:
+                self._advance_series(c.timestamp_ms)
         return len(candles)
 
     def tick(
@@ -205,12 +255,17 @@ class TaCompositeAdapter:
 
         if candle is not None and candle.timestamp_ms != self._last_candle_ts:
             from controllers.price_buffer import MinuteBar
+            bars_before = self._buf.bar_count
             self._buf.append_bar(MinuteBar(
                 ts_minute=int(candle.timestamp_ms // 1000 // 60) * 60,
                 open=candle.open, high=candle.high,
                 low=candle.low, close=candle.close,
             ))
             self._last_candle_ts = candle.timestamp_ms
+            # append_bar silently drops masked (NaN) intra-bar candles; the
+            # series must only move when the buffer actually gained a bar.
+            if self._buf.bar_count != bars_before:
+                self._advance_series(candle.timestamp_ms)
 
         day = int(now_s // 86400)
         if day != self._current_day:
@@ -306,13 +361,33 @@ class TaCompositeAdapter:
 
     # --- Rule evaluation ---
 
+    def _advance_series(self, timestamp_ms: int) -> None:
+        """Track the series index of the newest buffered bar (call only after a bar was appended).
+
+        Falls back to live evaluation for the rest of the run if a bar
+        arrives out of sequence with the precomputed history.
+        """
+        if self._entry_series is None:
+            return
+        idx = self._series_index.get(int(timestamp_ms))
+        if idx != self._series_pos + 1:
+            logger.info("ta_composite: bar %s out of sequence, evaluating signals live", timestamp_ms)
+            self._entry_series = None
+            self._exit_series = None
+            return
+        self._series_pos = idx
+
+    def _evaluate(self, sc: SignalConfig, series: list[SignalSeries] | None, i: int) -> SignalResult:
+        if series is not None and self._series_pos >= 0:
+            return series[i].at(self._series_pos)
+        return SIGNAL_REGISTRY[sc.signal_type](self._buf, **sc.params)
+
     def _eval_entry_rules(self) -> str | None:
         """Evaluate entry rules. Returns 'long', 'short', or None."""
         rules = self._cfg.entry_rules
         results: list[SignalResult] = []
-        for sc in rules.signals:
-            fn = SIGNAL_REGISTRY[sc.signal_type]
-            result = fn(self._buf, **sc.params)
+        for i, sc in enumerate(rules.signals):
+            result = self._evaluate(sc, self._entry_series, i)
             if sc.invert:
                 inv_dir = {"long": "short", "short": "long", "neutral": "neutral"}[result.direction]
                 result = SignalResult(inv_dir, result.strength)  # type: ignore[arg-type]
@@ -346,9 +421,8 @@ class TaCompositeAdapter:
         exit_dir = "short" if pos_side == "buy" else "long"
 
         matches = 0
-        for sc in rules.signals:
-            fn = SIGNAL_REGISTRY[sc.signal_type]
-            result = fn(self._buf, **sc.params)
+        for i, sc in enumerate(rules.signals):
+            result = self._evaluate(sc, self._exit_series, i)
             if sc.invert:
                 inv_dir = {"long": "short", "short": "long", "neutral": "neutral"}[result.direction]
                 result = SignalResult(inv_dir, result.strength)  # type: ignore[arg-type]
@@ -0,0 +1,343 @@
+"""Vectorised per-bar series for the ``ta_signals`` primitives.
+
+The primitives in :mod:`controllers.backtesting.ta_signals` are evaluated
+against a live ``PriceBuffer`` on every tick, re-deriving EMAs, windows and
+previous-bar values from the bar history each time.  Their output depends
+only on the closed bars, so a backtest that knows the full candle array up
+front can compute every configured signal once:
+
+    series = compute_signal_series("ema_cross", bars, {"fast": 8, "slow": 21})
+    series.at(i)   # == ema_cross(buf) with bars[0..i] in the buffer
+
+Index ``i`` is the signal after bar ``i`` closed.  Arithmetic is float64,
+so values agree with the incremental path to float precision (the
+primitives mix Decimal and float); directions only differ on exact ties.
+EMA-based signals seed at the first bar, which matches a ``PriceBuffer``
+that has not yet rolled over ``max_minutes``; beyond that the seed's weight
+has decayed below float resolution for any practical period.
+
+``ict_structure`` replays the ICT state machine over each window instead of
+vectorising it — same cost per bar as the live path, without the buffer
+copies.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from controllers.backtesting.ta_signals import SignalResult
+
+_DIRECTIONS = ("neutral", "long", "short")  # indexed by code: 0, 1, -1
+
+
+@dataclass(frozen=True)
+class OhlcArrays:
+    """Float OHLC columns of a contiguous 1m candle history."""
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Any]) -> OhlcArrays:
+        """Build from ``CandleRow``-like objects (Decimal or float fields)."""
+        return cls(
+            open=np.array([float(c.open) for c in candles], dtype=np.float64),
+            high=np.array([float(c.high) for c in candles], dtype=np.float64),
+            low=np.array([float(c.low) for c in candles], dtype=np.float64),
+            close=np.array([float(c.close) for c in candles], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+
+@dataclass(frozen=True)
+class SignalSeries:
+    """Per-bar direction codes (1 long, -1 short, 0 neutral) and strengths."""
+
+    direction: np.ndarray
+    strength: np.ndarray
+
+    def at(self, index: int) -> SignalResult:
+        return SignalResult(
+            _DIRECTIONS[int(self.direction[index])],  # type: ignore[arg-type]
+            float(self.strength[index]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.direction)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _ema(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA seeded at the first value, as every PriceBuffer EMA is."""
+    return pd.Series(values).ewm(alpha=2.0 / (period + 1), adjust=False).mean().to_numpy()
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    return pd.Series(values).rolling(window).mean().to_numpy()
+
+
+def _rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """Cutler's RSI over the last *period* deltas; NaN until ``period + 1`` bars."""
+    delta = np.diff(close, prepend=np.nan)
+    gains = pd.Series(np.where(delta > 0.0, delta, 0.0)).rolling(period).sum().to_numpy()
+    losses = pd.Series(np.where(delta < 0.0, -delta, 0.0)).rolling(period).sum().to_numpy()
+    # Rolling sums drift off exact zero; the all-gains branch keys off a count.
+    n_down = pd.Series((delta < 0.0).astype(np.float64)).rolling(period).sum().to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + gains / losses)
+    rsi = np.where(n_down == 0.0, 100.0, rsi)
+    rsi[:period] = np.nan
+    return rsi
+
+
+def _macd_histogram(close: np.ndarray, fast: int, slow: int, signal: int) -> np.ndarray:
+    macd = _ema(close, fast) - _ema(close, slow)
+    return macd - _ema(macd, signal)
+
+
+def _result(
+    n: int,
+    valid: np.ndarray,
+    long_mask: np.ndarray,
+    short_mask: np.ndarray,
+    strength: np.ndarray,
+) -> SignalSeries:
+    direction = np.zeros(n, dtype=np.int8)
+    direction[valid & long_mask] = 1
+    direction[valid & short_mask & ~long_mask] = -1
+    active = valid & (direction != 0)
+    out_strength = np.where(active, np.clip(np.nan_to_num(strength), 0.0, 1.0), 0.0)
+    return SignalSeries(direction, out_strength)
+
+
+def _bar_count(n: int) -> np.ndarray:
+    """Bars in the buffer after bar ``i`` closed."""
+    return np.arange(1, n + 1)
+
+
+# ---------------------------------------------------------------------------
+# Series implementations
+# ---------------------------------------------------------------------------
+
+def ema_cross_series(bars: OhlcArrays, *, fast: int = 8, slow: int = 21) -> SignalSeries:
+    close = bars.close
+    n = len(close)
+    cur_fast, cur_slow = _ema(close, fast), _ema(close, slow)
+    prev_fast, prev_slow = np.roll(cur_fast, 1), np.roll(cur_slow, 1)
+    valid = (_bar_count(n) >= slow + 1) & (close > 0.0)
+    is_above = cur_fast > cur_slow
+    was_above = prev_fast > prev_slow
+    was_equal = prev_fast == prev_slow
+    strength = np.minimum(1.0, np.abs(cur_fast - cur_slow) / close * 100)
+    long_mask = ~was_above & is_above
+    short_mask = (was_above | was_equal) & ~is_above & (cur_fast != cur_slow)
+    return _result(n, valid, long_mask, short_mask, strength)
+
+
+def rsi_zone_series(
+    bars: OhlcArrays,
+    *,
+    period: int = 14,
+    overbought: float = 70.0,
+    oversold: float = 30.0,
+) -> SignalSeries:
+    n = len(bars)
+    r = _rsi(bars.close, period)
+    valid = ~np.isnan(r)
+    long_strength = np.minimum(1.0, (oversold - r) / oversold) if oversold > 0 else np.ones(n)
+    short_strength = (
+        np.minimum(1.0, (r - overbought) / (100.0 - overbought)) if overbought < 100 else np.ones(n)
+    )
+    long_mask = r < oversold
+    strength = np.where(long_mask, long_strength, short_strength)
+    return _result(n, valid, long_mask, r > overbought, strength)
+
+
+def macd_cross_series(
+    bars: OhlcArrays,
+    *,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+) -> SignalSeries:
+    close = bars.close
+    n = len(close)
+    hist = _macd_histogram(close, fast, slow, signal)
+    prev_hist = np.roll(hist, 1)
+    valid = (_bar_count(n) >= max(fast, slow) + signal + 1) & (close > 0.0)
+    strength = np.minimum(1.0, np.abs(hist) / close * 100)
+    long_mask = (prev_hist <= 0) & (hist > 0)
+    short_mask = (prev_hist >= 0) & (hist < 0)
+    return _result(n, valid, long_mask, short_mask, strength)
+
+
+def macd_histogram_series(
+    bars: OhlcArrays,
+    *,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    threshold: float = 0.0,
+) -> SignalSeries:
+    close = bars.close
+    n = len(close)
+    hist = _macd_histogram(close, fast, slow, signal)
+    valid = (_bar_count(n) >= max(fast, slow) + signal) & (close > 0.0)
+    strength = np.minimum(1.0, np.abs(hist) / close * 100)
+    return _result(n, valid, hist > threshold, hist < -threshold, strength)
+
+
+def _bollinger(close: np.ndarray, period: int, stddev_mult: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    s = pd.Series(close).rolling(period)
+    basis = s.mean().to_numpy()
+    width = s.std(ddof=0).to_numpy() * stddev_mult
+    return basis - width, basis, basis + width
+
+
+def bb_breakout_series(bars: OhlcArrays, *, period: int = 20, stddev_mult: float = 2.0) -> SignalSeries:
+    close = bars.close
+    n = len(close)
+    lower, basis, upper = _bollinger(close, period, stddev_mult)
+    valid = ~np.isnan(basis) & (basis > 0.0)
+    long_mask = close > upper
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strength = np.where(long_mask, (close - upper) / basis, (lower - close) / basis) * 100
+    return _result(n, valid, long_mask, close < lower, strength)
+
+
+def bb_squeeze_series(
+    bars: OhlcArrays,
+    *,
+    period: int = 20,
+    stddev_mult: float = 2.0,
+    squeeze_threshold: float = 0.02,
+) -> SignalSeries:
+    close = bars.close
+    n = len(close)
+    lower, basis, upper = _bollinger(close, period, stddev_mult)
+    valid = ~np.isnan(basis) & (basis > 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bandwidth = (upper - lower) / basis
+    squeeze = valid & (bandwidth < squeeze_threshold)
+    # A squeeze carries strength but no direction.
+    strength = np.where(squeeze, np.minimum(1.0, 1.0 - bandwidth / squeeze_threshold), 0.0)
+    return SignalSeries(np.zeros(n, dtype=np.int8), np.clip(strength, 0.0, 1.0))
+
+
+def _stoch_k_d(
+    rsi: np.ndarray,
+    stoch_period: int,
+    k_smooth: int,
+    d_smooth: int,
+    *,
+    flat_eps: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    s = pd.Series(rsi)
+    hi = s.rolling(stoch_period).max().to_numpy()
+    lo = s.rolling(stoch_period).min().to_numpy()
+    rng = hi - lo
+    flat = (rng < flat_eps) | (rng == 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw_k = np.where(flat, 50.0, (rsi - lo) / rng * 100.0)
+    raw_k[np.isnan(hi)] = np.nan
+    k = _rolling_mean(raw_k, k_smooth)
+    return k, _rolling_mean(k, d_smooth)
+
+
+def stoch_rsi_cross_series(
+    bars: OhlcArrays,
+    *,
+    rsi_period: int = 14,
+    stoch_period: int = 14,
+    k_smooth: int = 3,
+    d_smooth: int = 3,
+    overbought: float = 80.0,
+    oversold: float = 20.0,
+) -> SignalSeries:
+    close = bars.close
+    n = len(close)
+    rsi = _rsi(close, rsi_period)
+    # PriceBuffer.stoch_rsi treats a range below 1e-12 as flat; the
+    # previous-bar replica in ta_signals only an exact zero range.
+    cur_k, cur_d = _stoch_k_d(rsi, stoch_period, k_smooth, d_smooth, flat_eps=1e-12)
+    prev_k, prev_d = _stoch_k_d(rsi, stoch_period, k_smooth, d_smooth, flat_eps=0.0)
+    prev_k, prev_d = np.roll(prev_k, 1), np.roll(prev_d, 1)
+    min_bars = rsi_period + 1 + stoch_period + k_smooth + d_smooth - 2
+    valid = _bar_count(n) >= min_bars + 1
+
+    long_mask = (prev_k <= prev_d) & (cur_k > cur_d) & (cur_k < oversold) & (cur_d < oversold)
+    short_mask = (prev_k >= prev_d) & (cur_k < cur_d) & (cur_k > overbought) & (cur_d > overbought)
+    long_strength = np.minimum(1.0, (oversold - cur_k) / oversold) if oversold > 0 else np.ones(n)
+    short_strength = (
+        np.minimum(1.0, (cur_k - overbought) / (100.0 - overbought)) if overbought < 100 else np.ones(n)
+    )
+    strength = np.where(long_mask, long_strength, short_strength)
+    return _result(n, valid, long_mask, short_mask, strength)
+
+
+def ict_structure_series(bars: OhlcArrays, *, lookback: int = 10) -> SignalSeries:
+    from controllers.common.ict.state import ICTConfig, ICTState
+
+    n = len(bars)
+    direction = np.zeros(n, dtype=np.int8)
+    strength = np.zeros(n, dtype=np.float64)
+    width = lookback + 2
+    cfg = ICTConfig(swing_length=max(3, lookback // 3))
+    ohlc = [
+        [Decimal(repr(v)) for v in col.tolist()]
+        for col in (bars.open, bars.high, bars.low, bars.close)
+    ]
+    opens, highs, lows, closes = ohlc
+    for i in range(width - 1, n):
+        ict = ICTState(cfg)
+        for j in range(i - width + 1, i + 1):
+            ict.add_bar(opens[j], highs[j], lows[j], closes[j])
+        trend = ict.trend
+        if trend == 0:
+            continue
+        value = 0.5
+        evt = ict.last_structure
+        price = closes[i]
+        if evt is not None and price > 0:
+            value = min(1.0, 0.5 + abs(float(evt.level) - float(price)) / float(price) * 10)
+        direction[i] = 1 if trend > 0 else -1
+        strength[i] = value
+    return SignalSeries(direction, strength)
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+SeriesFn = Callable[..., SignalSeries]
+
+SERIES_REGISTRY: dict[str, SeriesFn] = {
+    "ema_cross": ema_cross_series,
+    "rsi_zone": rsi_zone_series,
+    "macd_cross": macd_cross_series,
+    "macd_histogram": macd_histogram_series,
+    "bb_breakout": bb_breakout_series,
+    "bb_squeeze": bb_squeeze_series,
+    "stoch_rsi_cross": stoch_rsi_cross_series,
+    "ict_structure": ict_structure_series,
+}
+
+
+def compute_signal_series(signal_type: str, bars: OhlcArrays, params: dict[str, Any]) -> SignalSeries:
+    """Return the per-bar series of *signal_type* over *bars*.
+
+    Raises ``KeyError`` for signal types without a vectorised form.
+    """
+    return SERIES_REGISTRY[signal_type](bars, **params)
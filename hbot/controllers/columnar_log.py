@@ -0,0 +1,273 @@
+"""Columnar (Parquet) mirror of the minute and fill CSV logs.
+
+``CsvSplitLogger`` can mirror ``minute.csv`` / ``fills.csv`` rows into
+``<log_dir>/columnar/<kind>/`` as Parquet segments, one per
+``segment_s`` window of row time (hourly by default).  Rows are buffered
+and written as row groups of ``row_group_rows``; the Parquet footer
+therefore carries per-row-group min/max statistics for ``ts``, which
+is the time index readers prune on.
+
+A segment is written to ``*.parquet.tmp`` and renamed on rotation or
+close to ``<kind>-<first_ts_ms>-<last_ts_ms>.parquet``, so readers only
+ever see complete files and can skip whole segments by name.  A segment
+still open when the process dies is lost from the mirror; the CSV (and
+the fill WAL) remain the source of truth.
+
+Values are stored exactly as ``csv.DictWriter`` would render them
+(strings, ``""`` for ``None``) except ``ts``, which is a UTC timestamp
+column.  :func:`iter_columnar_rows` yields ``csv.DictReader``-compatible
+dicts, so existing consumers can switch readers without reparsing.
+
+pyarrow is imported lazily; without it the mirror is simply disabled.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import re
+import time
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_RE = re.compile(r"^(?P<kind>[a-z_]+)-(?P<first>\d+)-(?P<last>\d+)(?:-\d+)?\.parquet$")
+
+
+def columnar_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _ts_to_datetime(value: object) -> datetime | None:
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        text = str(value or "").strip()
+        if not text:
+            return None
+        try:
+            dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+
+
+def _to_ms(value: datetime | str | int | float | None) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    dt = _ts_to_datetime(value)
+    if dt is None:
+        raise ValueError(f"unparseable timestamp: {value!r}")
+    return int(dt.timestamp() * 1000)
+
+
+def _cell(value: object) -> str:
+    return "" if value is None else str(value)
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+class ColumnarSegmentWriter:
+    """Parquet sink for one log kind; same ``write/flush/close`` surface as ``_CsvBuffer``."""
+
+    def __init__(
+        self,
+        root: Path,
+        kind: str,
+        *,
+        segment_s: int = 3600,
+        row_group_rows: int = 256,
+    ):
+        self._path = root / kind
+        self._kind = kind
+        self._segment_ms = max(1, int(segment_s)) * 1000
+        self._row_group_rows = max(1, int(row_group_rows))
+        self._field_list: list[str] | None = None
+        self._schema: pa.Schema | None = None
+        self._writer: Any = None
+        self._tmp_path: Path | None = None
+        self._bucket: int | None = None
+        self._first_ms: int | None = None
+        self._last_ms: int | None = None
+        self._pending: list[dict[str, object]] = []
+
+    def write(self, row: dict[str, object], fieldnames: Iterable[str]) -> None:
+        field_list = list(fieldnames)
+        ts = _ts_to_datetime(row.get("ts"))
+        ts_ms = int(ts.timestamp() * 1000) if ts is not None else int(time.time() * 1000)
+        bucket = ts_ms // self._segment_ms
+        if self._field_list != field_list or (self._bucket is not None and bucket != self._bucket):
+            self.close()
+            self._field_list = field_list
+        self._bucket = bucket
+        self._first_ms = ts_ms if self._first_ms is None else min(self._first_ms, ts_ms)
+        self._last_ms = ts_ms if self._last_ms is None else max(self._last_ms, ts_ms)
+        self._pending.append({**row, "ts": ts})
+        if len(self._pending) >= self._row_group_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group of the open segment."""
+        if not self._pending or self._field_list is None:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows, self._pending = self._pending, []
+        try:
+            if self._schema is None:
+                self._schema = self._build_schema(self._field_list)
+            columns = [
+                pa.array([r.get("ts") for r in rows], type=self._schema.field("ts").type)
+                if name == "ts"
+                else pa.array([_cell(r.get(name)) for r in rows], type=pa.string())
+                for name in self._schema.names
+            ]
+            table = pa.Table.from_arrays(columns, schema=self._schema)
+            if self._writer is None:
+                self._path.mkdir(parents=True, exist_ok=True)
+                self._tmp_path = self._path / f"{self._kind}-{self._bucket}-{time.time_ns()}.parquet.tmp"
+                self._writer = pq.ParquetWriter(self._tmp_path, self._schema, compression="zstd")
+            self._writer.write_table(table, row_group_size=len(rows))
+        except Exception:
+            logger.warning("Columnar %s write failed; %d rows dropped from the mirror", self._kind, len(rows), exc_info=True)
+
+    def close(self) -> None:
+        """Flush and finalize the open segment under its ts-range name."""
+        self.flush()
+        if self._writer is not None and self._tmp_path is not None:
+            try:
+                self._writer.close()
+                final = self._path / f"{self._kind}-{self._first_ms}-{self._last_ms}.parquet"
+                suffix = 1
+                while final.exists():
+                    final = self._path / f"{self._kind}-{self._first_ms}-{self._last_ms}-{suffix}.parquet"
+                    suffix += 1
+                self._tmp_path.rename(final)
+            except Exception:
+                logger.warning("Columnar %s segment finalize failed for %s", self._kind, self._tmp_path, exc_info=True)
+        self._writer = None
+        self._tmp_path = None
+        self._schema = None
+        self._bucket = None
+        self._first_ms = None
+        self._last_ms = None
+
+    def _build_schema(self, field_list: list[str]) -> pa.Schema:
+        import pyarrow as pa
+
+        names = ["ts", *(name for name in dict.fromkeys(field_list) if name != "ts")]
+        fields = [
+            pa.field(name, pa.timestamp("us", tz="UTC") if name == "ts" else pa.string())
+            for name in names
+        ]
+        meta = {"kind": self._kind, "csv_fields": json.dumps(field_list)}
+        return pa.schema(fields, metadata=meta)
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+def _segments(root: Path, kind: str, start_ms: int | None, end_ms: int | None) -> list[Path]:
+    found: list[tuple[int, int, Path]] = []
+    for path in (root / kind).glob(f"{kind}-*.parquet"):
+        match = _SEGMENT_RE.match(path.name)
+        if match is None or match["kind"] != kind:
+            continue
+        first, last = int(match["first"]), int(match["last"])
+        if (start_ms is not None and last < start_ms) or (end_ms is not None and first >= end_ms):
+            continue
+        found.append((first, last, path))
+    return [path for _, _, path in sorted(found)]
+
+
+def _row_groups(meta: Any, ts_idx: int, start_ms: int | None, end_ms: int | None) -> list[int]:
+    keep: list[int] = []
+    for idx in range(meta.num_row_groups):
+        stats = meta.row_group(idx).column(ts_idx).statistics
+        if stats is not None and stats.has_min_max:
+            lo = int(stats.min.timestamp() * 1000)
+            hi = int(stats.max.timestamp() * 1000)
+            if (start_ms is not None and hi < start_ms) or (end_ms is not None and lo >= end_ms):
+                continue
+        keep.append(idx)
+    return keep
+
+
+def read_columnar_range(
+    log_dir: str | Path,
+    kind: str,
+    start: datetime | str | int | None = None,
+    end: datetime | str | int | None = None,
+    columns: Iterable[str] | None = None,
+) -> pa.Table:
+    """Rows of *kind* with ``start <= ts < end`` (epoch ms, ISO string or datetime), ts-ordered.
+
+    Segments are pruned by filename and row groups by the footer's ``ts``
+    statistics, so only overlapping row groups are decoded.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    root = Path(log_dir) / "columnar"
+    start_ms, end_ms = _to_ms(start), _to_ms(end)
+    wanted = None if columns is None else ["ts", *(c for c in columns if c != "ts")]
+    tables: list[pa.Table] = []
+    for path in _segments(root, kind, start_ms, end_ms):
+        try:
+            pf = pq.ParquetFile(path)
+            ts_idx = pf.schema_arrow.get_field_index("ts")
+            groups = _row_groups(pf.metadata, ts_idx, start_ms, end_ms)
+            if not groups:
+                continue
+            cols = None if wanted is None else [c for c in wanted if c in pf.schema_arrow.names]
+            tables.append(pf.read_row_groups(groups, columns=cols))
+        except Exception:
+            logger.warning("Skipping unreadable columnar segment %s", path, exc_info=True)
+    if not tables:
+        return pa.table({"ts": pa.array([], type=pa.timestamp("us", tz="UTC"))})
+    table = pa.concat_tables(tables, promote_options="permissive")
+    if start_ms is not None or end_ms is not None:
+        ts_ms = pc.cast(table["ts"], pa.timestamp("ms", tz="UTC")).cast(pa.int64())
+        mask = pc.is_valid(ts_ms)
+        if start_ms is not None:
+            mask = pc.and_(mask, pc.greater_equal(ts_ms, start_ms))
+        if end_ms is not None:
+            mask = pc.and_(mask, pc.less(ts_ms, end_ms))
+        table = table.filter(mask)
+    return table.sort_by("ts")
+
+
+def iter_columnar_rows(
+    log_dir: str | Path,
+    kind: str,
+    start: datetime | str | int | None = None,
+    end: datetime | str | int | None = None,
+    columns: Iterable[str] | None = None,
+) -> Iterator[dict[str, str]]:
+    """``csv.DictReader``-style rows (all strings, ISO ``ts``) for ``read_columnar_range``."""
+    table = read_columnar_range(log_dir, kind, start, end, columns)
+    for row in table.to_pylist():
+        ts = row.get("ts")
+        row["ts"] = ts.isoformat() if isinstance(ts, datetime) else ""
+        yield {key: "" if value is None else value for key, value in row.items()}
+
+
+__all__ = [
+    "ColumnarSegmentWriter",
+    "columnar_available",
+    "iter_columnar_rows",
+    "read_columnar_range",
+]
@@ -16,6 +16,7 @@ from controllers.common.ict._types import (
 )
 from controllers.common.ict.breaker import BreakerBlockTracker
 from controllers.common.ict.displacement import DisplacementDetector
+from controllers.common.ict.fast import FastICTState
 from controllers.common.ict.fvg import FVGDetector
 from controllers.common.ict.liquidity import LiquidityDetector
 from controllers.common.ict.order_block import OrderBlockDetector
@@ -32,6 +33,7 @@ __all__ = [
     "DisplacementEvent",
     "FVGDetector",
     "FVGEvent",
+    "FastICTState",
     "ICTConfig",
     "ICTState",
     "IncrementalATR",
@@ -0,0 +1,654 @@
+"""Float-based ICT pipeline for backtests and parameter sweeps.
+
+``FastICTState`` is a drop-in variant of :class:`ICTState` that runs the
+same detectors on ``float`` inputs:
+
+* Swing pivots come from monotonic max/min deques over the
+  ``2 * swing_length + 1`` window -- amortised O(1) per bar instead of
+  O(window) ``all(...)`` scans.
+* FVG, volume-imbalance and order-block zones live in bounded active
+  lists with index-based expiry; mitigated events are updated in history
+  by position rather than by identity search.
+* :meth:`FastICTState.add_bars` replays an ``(n, 4)`` / ``(n, 5)`` OHLC(V)
+  array for warm-up.
+
+Events are the same frozen dataclasses as the Decimal pipeline, with
+numeric fields holding floats.  For prices with at most 15 significant
+digits the event stream (indices, directions, types, statuses) is
+identical to :class:`ICTState`, and levels copied from bars equal
+``float()`` of the Decimal ones.  Liquidity clustering is evaluated in
+Decimal (once per swing) so pool levels round-trip exactly; other derived
+values (FVG size, ATR ratios, Fibonacci levels) agree to float precision,
+so a threshold comparison landing exactly on a tie could resolve
+differently.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import replace
+from decimal import Decimal
+from typing import Any
+
+from controllers.common.ict._types import (
+    DisplacementEvent,
+    FVGEvent,
+    LiquidityPool,
+    OrderBlockEvent,
+    StructureEvent,
+    SwingEvent,
+    VolumeImbalanceEvent,
+)
+from controllers.common.ict.premium_discount import _FIB_LEVELS
+from controllers.common.ict.state import ICTConfig
+
+_FIB_KEYS = [(f"fib_{fib}", float(fib)) for fib in _FIB_LEVELS]
+_FIB_62 = 0.618
+_FIB_79 = 0.786
+
+
+def _dec(value: float) -> Decimal:
+    return Decimal(repr(value))
+
+
+# ---------------------------------------------------------------------------
+# Building blocks
+# ---------------------------------------------------------------------------
+
+class _FloatSwing:
+    """Swing pivots from monotonic deques; alternation as in SwingDetector."""
+
+    __slots__ = (
+        "_bar_idx",
+        "_highs",
+        "_last_direction",
+        "_length",
+        "_lows",
+        "_max_q",
+        "_min_q",
+        "_swings",
+        "_window_size",
+    )
+
+    def __init__(self, length: int) -> None:
+        if length < 1:
+            raise ValueError("length must be >= 1")
+        self._length = length
+        self._window_size = 2 * length + 1
+        self._highs: deque[float] = deque(maxlen=self._window_size)
+        self._lows: deque[float] = deque(maxlen=self._window_size)
+        # (bar index, value); values non-increasing (max) / non-decreasing (min)
+        # from the front, equal values kept so strictness can be checked.
+        self._max_q: deque[tuple[int, float]] = deque()
+        self._min_q: deque[tuple[int, float]] = deque()
+        self._bar_idx = 0
+        self._swings: list[SwingEvent] = []
+        self._last_direction = 0
+
+    def add_bar(self, high: float, low: float) -> SwingEvent | None:
+        idx = self._bar_idx
+        self._bar_idx += 1
+        self._highs.append(high)
+        self._lows.append(low)
+
+        max_q, min_q = self._max_q, self._min_q
+        while max_q and max_q[-1][1] < high:
+            max_q.pop()
+        max_q.append((idx, high))
+        while min_q and min_q[-1][1] > low:
+            min_q.pop()
+        min_q.append((idx, low))
+
+        if self._bar_idx < self._window_size:
+            return None
+        start = idx - self._window_size + 1
+        while max_q[0][0] < start:
+            max_q.popleft()
+        while min_q[0][0] < start:
+            min_q.popleft()
+
+        # The pivot is the strict maximum iff it is the earliest maximum in
+        # the window and nothing after it ties.
+        pivot_idx = idx - self._length
+        pivot_high = self._highs[self._length]
+        pivot_low = self._lows[self._length]
+        is_swing_high = max_q[0][0] == pivot_idx and (len(max_q) == 1 or max_q[1][1] < pivot_high)
+        is_swing_low = min_q[0][0] == pivot_idx and (len(min_q) == 1 or min_q[1][1] > pivot_low)
+
+        if is_swing_high and is_swing_low:
+            # Rare outside-bar case: compare margins in Decimal so exact ties
+            # on tick-quantised prices resolve as in SwingDetector.
+            others = [i for i in range(self._window_size) if i != self._length]
+            dec_high, dec_low = _dec(pivot_high), _dec(pivot_low)
+            high_margin = min(dec_high - _dec(self._highs[i]) for i in others)
+            low_margin = min(_dec(self._lows[i]) - dec_low for i in others)
+            if high_margin >= low_margin:
+                return self._try_emit(pivot_idx, +1, pivot_high)
+            return self._try_emit(pivot_idx, -1, pivot_low)
+        if is_swing_high:
+            return self._try_emit(pivot_idx, +1, pivot_high)
+        if is_swing_low:
+            return self._try_emit(pivot_idx, -1, pivot_low)
+        return None
+
+    def _try_emit(self, index: int, direction: int, level: float) -> SwingEvent | None:
+        if self._last_direction == direction:
+            if not self._swings:
+                return None
+            prev = self._swings[-1]
+            if (direction == +1 and level > prev.level) or (direction == -1 and level < prev.level):
+                self._swings[-1] = SwingEvent(index=index, direction=direction, level=level)  # type: ignore[arg-type]
+                return self._swings[-1]
+            return None
+        event = SwingEvent(index=index, direction=direction, level=level)  # type: ignore[arg-type]
+        self._swings.append(event)
+        self._last_direction = direction
+        return event
+
+
+class _ActiveZones:
+    """Bounded active zone list with index-based expiry.
+
+    Items are ``(index, direction, top, bottom, history_position)``; a
+    bullish zone is mitigated when price trades down to its bottom, a
+    bearish one when price trades up to its top.
+    """
+
+    __slots__ = ("_items", "_max_active", "_max_age")
+
+    def __init__(self, max_active: int, max_age: int) -> None:
+        self._items: list[tuple[int, int, float, float, int]] = []
+        self._max_active = max_active
+        self._max_age = max_age
+
+    def add(self, index: int, direction: int, top: float, bottom: float, position: int) -> None:
+        self._items.append((index, direction, top, bottom, position))
+
+    def update(self, bar_index: int, high: float, low: float) -> list[int]:
+        """Drop expired zones and return history positions of mitigated ones."""
+        cutoff = bar_index - self._max_age
+        surviving: list[tuple[int, int, float, float, int]] = []
+        mitigated: list[int] = []
+        for item in self._items:
+            index, direction, top, bottom, position = item
+            if index < cutoff:
+                continue
+            if (direction == +1 and low <= bottom) or (direction == -1 and high >= top):
+                mitigated.append(position)
+                continue
+            surviving.append(item)
+        self._items = surviving
+        return mitigated
+
+    def trim(self) -> None:
+        if len(self._items) > self._max_active:
+            self._items = self._items[-self._max_active:]
+
+    def positions(self) -> list[int]:
+        return [item[4] for item in self._items]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+class FastICTState:
+    """Float ICT pipeline with the same accessors as :class:`ICTState`."""
+
+    __slots__ = (
+        "_atr",
+        "_atr_alpha",
+        "_atr_count",
+        "_atr_prev_close",
+        "_bar_idx",
+        "_breaker_candidates",
+        "_breakers",
+        "_config",
+        "_displacement_events",
+        "_displacement_mult",
+        "_equilibrium",
+        "_fib_prices",
+        "_fvg_active",
+        "_fvg_events",
+        "_fvg_prev1",
+        "_fvg_prev2",
+        "_liq_active",
+        "_liq_events",
+        "_liq_highs",
+        "_liq_lows",
+        "_liq_min_touches",
+        "_liq_range_pct",
+        "_newly_mitigated",
+        "_ob_active",
+        "_ob_candles",
+        "_ob_events",
+        "_ote_bottom",
+        "_ote_direction",
+        "_ote_high",
+        "_ote_low",
+        "_ote_top",
+        "_pd_high",
+        "_pd_low",
+        "_structure_events",
+        "_structure_high",
+        "_structure_low",
+        "_swing",
+        "_trend",
+        "_vi_active",
+        "_vi_events",
+        "_vi_prev_close",
+    )
+
+    def __init__(self, config: ICTConfig | None = None) -> None:
+        cfg = config or ICTConfig()
+        self._config = cfg
+        self._swing = _FloatSwing(cfg.swing_length)
+        self._atr_alpha = 2.0 / (cfg.atr_period + 1)
+        self._displacement_mult = float(cfg.displacement_atr_mult)
+        self._liq_range_pct = cfg.liquidity_range_pct
+        self._liq_min_touches = cfg.liquidity_min_touches
+        self._fvg_active = _ActiveZones(cfg.fvg_max_active, cfg.fvg_decay_bars)
+        self._vi_active = _ActiveZones(cfg.vi_max_active, cfg.vi_decay_bars)
+        self._ob_active = _ActiveZones(cfg.ob_max_active, cfg.ob_max_age)
+        self._ob_candles: deque[tuple[int, float, float, float, float]] = deque(maxlen=10)
+        self._fvg_events: list[FVGEvent] = []
+        self._vi_events: list[VolumeImbalanceEvent] = []
+        self._ob_events: list[OrderBlockEvent] = []
+        self._structure_events: list[StructureEvent] = []
+        self._displacement_events: list[DisplacementEvent] = []
+        self._liq_highs: list[tuple[SwingEvent, Decimal]] = []
+        self._liq_lows: list[tuple[SwingEvent, Decimal]] = []
+        self._liq_active: list[tuple[LiquidityPool, Decimal, int]] = []
+        self._liq_events: list[LiquidityPool] = []
+        self._newly_mitigated: list[OrderBlockEvent] = []
+        self._breaker_candidates: list[OrderBlockEvent] = []
+        self._breakers: list[OrderBlockEvent] = []
+        self._fib_prices: dict[str, float] = {}
+        self._reset_scalars()
+
+    def _reset_scalars(self) -> None:
+        self._bar_idx = 0
+        self._atr = 0.0
+        self._atr_count = 0
+        self._atr_prev_close = 0.0
+        self._fvg_prev1: tuple[float, float] | None = None
+        self._fvg_prev2: tuple[float, float] | None = None
+        self._vi_prev_close: float | None = None
+        self._structure_high: SwingEvent | None = None
+        self._structure_low: SwingEvent | None = None
+        self._trend = 0
+        self._pd_high: float | None = None
+        self._pd_low: float | None = None
+        self._equilibrium = 0.0
+        self._ote_high: float | None = None
+        self._ote_low: float | None = None
+        self._ote_direction = 0
+        self._ote_top = 0.0
+        self._ote_bottom = 0.0
+
+    # ------------------------------------------------------------------
+    # Feeding bars
+    # ------------------------------------------------------------------
+
+    def add_bar(
+        self,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0.0,
+    ) -> None:
+        """Feed one bar (floats) through the pipeline, in ICTState's order."""
+        t = self._bar_idx
+        self._bar_idx += 1
+
+        self._add_fvg(t, high, low)
+        self._add_displacement(t, open_, high, low, close)
+        self._add_vi(t, open_, high, low, close)
+
+        swing_event = self._swing.add_bar(high, low)
+        self._add_ob(t, open_, high, low, close)
+        self._sweep_liquidity(t, high, low)
+        self._retest_breakers(t, high, low)
+
+        if swing_event is not None:
+            structure_event = self._on_swing_structure(swing_event)
+            self._on_swing_liquidity(swing_event)
+            self._on_swing_premium_discount(swing_event)
+            self._on_swing_ote(swing_event)
+            if structure_event is not None:
+                self._on_structure_ob(structure_event)
+
+        for ob in self._newly_mitigated:
+            self._breaker_candidates.append(ob)
+
+    def add_bars(self, bars: Any) -> None:
+        """Feed a batch of bars: an ``(n, 4)`` / ``(n, 5)`` array or row sequence."""
+        rows: Iterable[Sequence[float]] = bars.tolist() if hasattr(bars, "tolist") else bars
+        add = self.add_bar
+        for row in rows:
+            add(*row)
+
+    def warmup(self, candles: Iterable[tuple[Any, Any, Any, Any]]) -> None:
+        """Replay historical OHLC bars (no volume); Decimals are converted."""
+        for o, h, lo, c in candles:
+            self.add_bar(float(o), float(h), float(lo), float(c))
+
+    def reset(self) -> None:
+        """Reset all detector state for backtest parameter sweeps."""
+        self._swing = _FloatSwing(self._config.swing_length)
+        for zones in (self._fvg_active, self._vi_active, self._ob_active):
+            zones.clear()
+        for events in (
+            self._ob_candles, self._fvg_events, self._vi_events, self._ob_events,
+            self._structure_events, self._displacement_events, self._liq_highs,
+            self._liq_lows, self._liq_active, self._liq_events, self._newly_mitigated,
+            self._breaker_candidates, self._breakers,
+        ):
+            events.clear()
+        self._fib_prices = {}
+        self._reset_scalars()
+
+    # ------------------------------------------------------------------
+    # Independent detectors
+    # ------------------------------------------------------------------
+
+    def _add_fvg(self, t: int, high: float, low: float) -> None:
+        prev2, prev1 = self._fvg_prev2, self._fvg_prev1
+        if prev2 is not None and prev1 is not None:
+            prev2_high, prev2_low = prev2
+            if prev2_high < low:
+                self._new_fvg(t, +1, low, prev2_high)
+            elif prev2_low > high:
+                self._new_fvg(t, -1, prev2_low, high)
+        zones = self._fvg_active
+        for position in zones.update(t, high, low):
+            e = self._fvg_events[position]
+            self._fvg_events[position] = FVGEvent(e.index, e.direction, e.top, e.bottom, e.size_bps, True, t)
+        zones.trim()
+        self._fvg_prev2 = prev1
+        self._fvg_prev1 = (high, low)
+
+    def _new_fvg(self, t: int, direction: int, top: float, bottom: float) -> None:
+        mid = (top + bottom) / 2
+        size_bps = (top - bottom) / mid * 10_000 if mid > 0 else 0.0
+        event = FVGEvent(index=t, direction=direction, top=top, bottom=bottom, size_bps=size_bps)  # type: ignore[arg-type]
+        self._fvg_active.add(t, direction, top, bottom, len(self._fvg_events))
+        self._fvg_events.append(event)
+
+    def _add_displacement(self, t: int, open_: float, high: float, low: float, close: float) -> None:
+        if self._atr_count == 0:
+            self._atr = high - low
+        else:
+            prev = self._atr_prev_close
+            tr = max(high - low, abs(high - prev), abs(low - prev))
+            self._atr = self._atr_alpha * tr + (1.0 - self._atr_alpha) * self._atr
+        self._atr_prev_close = close
+        self._atr_count += 1
+        if self._atr_count < 2 or self._atr <= 0.0:
+            return
+        ratio = abs(close - open_) / self._atr
+        if ratio >= self._displacement_mult:
+            self._displacement_events.append(DisplacementEvent(
+                index=t, direction=+1 if close > open_ else -1, body_atr_ratio=ratio,  # type: ignore[arg-type]
+            ))
+
+    def _add_vi(self, t: int, open_: float, high: float, low: float, close: float) -> None:
+        prev_close = self._vi_prev_close
+        if prev_close is not None and prev_close != open_:
+            direction = +1 if prev_close < open_ else -1
+            top, bottom = (open_, prev_close) if direction == +1 else (prev_close, open_)
+            self._vi_active.add(t, direction, top, bottom, len(self._vi_events))
+            self._vi_events.append(VolumeImbalanceEvent(
+                index=t, direction=direction, top=top, bottom=bottom,  # type: ignore[arg-type]
+            ))
+        zones = self._vi_active
+        for position in zones.update(t, high, low):
+            e = self._vi_events[position]
+            self._vi_events[position] = VolumeImbalanceEvent(e.index, e.direction, e.top, e.bottom, True, t)
+        zones.trim()
+        self._vi_prev_close = close
+
+    # ------------------------------------------------------------------
+    # Order blocks and breakers
+    # ------------------------------------------------------------------
+
+    def _add_ob(self, t: int, open_: float, high: float, low: float, close: float) -> None:
+        self._newly_mitigated = []
+        self._ob_candles.append((t, open_, high, low, close))
+        for position in self._ob_active.update(t, high, low):
+            e = self._ob_events[position]
+            mitigated = OrderBlockEvent(e.index, e.direction, e.top, e.bottom, "mitigated", t)
+            self._ob_events[position] = mitigated
+            self._newly_mitigated.append(mitigated)
+
+    def _on_structure_ob(self, event: StructureEvent) -> None:
+        for idx, o, h, lo, c in reversed(self._ob_candles):
+            if (event.direction == +1 and c < o) or (event.direction == -1 and c > o):
+                self._ob_active.add(idx, event.direction, h, lo, len(self._ob_events))
+                self._ob_events.append(OrderBlockEvent(
+                    index=idx, direction=event.direction, top=h, bottom=lo, status="active",  # type: ignore[arg-type]
+                ))
+                self._ob_active.trim()
+                return
+
+    def _retest_breakers(self, t: int, high: float, low: float) -> None:
+        if not self._breaker_candidates:
+            return
+        surviving: list[OrderBlockEvent] = []
+        for ob in self._breaker_candidates:
+            if low <= ob.top and high >= ob.bottom:
+                self._breakers.append(replace(ob, status="breaker", status_index=t))
+                continue
+            surviving.append(ob)
+        self._breaker_candidates = surviving
+
+    # ------------------------------------------------------------------
+    # Swing-driven detectors
+    # ------------------------------------------------------------------
+
+    def _on_swing_structure(self, swing: SwingEvent) -> StructureEvent | None:
+        event: StructureEvent | None = None
+        if swing.direction == +1:
+            last = self._structure_high
+            if last is not None and swing.level > last.level:
+                kind = "bos" if self._trend in (+1, 0) else "choch"
+                event = StructureEvent(swing.index, kind, +1, swing.level, swing.index)
+                self._trend = +1
+            self._structure_high = swing
+        else:
+            last = self._structure_low
+            if last is not None and swing.level < last.level:
+                kind = "bos" if self._trend in (-1, 0) else "choch"
+                event = StructureEvent(swing.index, kind, -1, swing.level, swing.index)
+                self._trend = -1
+            self._structure_low = swing
+        if event is not None:
+            self._structure_events.append(event)
+        return event
+
+    def _on_swing_liquidity(self, swing: SwingEvent) -> None:
+        # Clustering is done in Decimal on each level's shortest float repr
+        # (cached per swing and pool), so averages and range thresholds match
+        # the Decimal pipeline exactly instead of drifting by an ulp at ties.
+        if swing.direction == +1:
+            swings, direction = self._liq_highs, +1
+        else:
+            swings, direction = self._liq_lows, -1
+        latest = _dec(swing.level)
+        swings.append((swing, latest))
+        if len(swings) < self._liq_min_touches:
+            return
+        threshold = latest * self._liq_range_pct
+        cluster = [(s, level) for s, level in swings if abs(level - latest) <= threshold]
+        if len(cluster) < self._liq_min_touches:
+            return
+        avg_dec = sum(level for _, level in cluster) / Decimal(len(cluster))
+        pool = LiquidityPool(
+            start_index=cluster[0][0].index,
+            end_index=cluster[-1][0].index,
+            direction=direction,
+            level=float(avg_dec),  # type: ignore[arg-type]
+            count=len(cluster),
+        )
+        for i, (existing, existing_dec, position) in enumerate(self._liq_active):
+            if existing.direction == direction and abs(existing_dec - avg_dec) <= threshold:
+                self._liq_events[position] = pool
+                self._liq_active[i] = (pool, avg_dec, position)
+                return
+        self._liq_active.append((pool, avg_dec, len(self._liq_events)))
+        self._liq_events.append(pool)
+
+    def _sweep_liquidity(self, t: int, high: float, low: float) -> None:
+        if not self._liq_active:
+            return
+        surviving: list[tuple[LiquidityPool, Decimal, int]] = []
+        for item in self._liq_active:
+            pool = item[0]
+            if (pool.direction == +1 and high > pool.level) or (pool.direction == -1 and low < pool.level):
+                self._liq_events[item[2]] = replace(pool, swept=True, sweep_index=t)
+                continue
+            surviving.append(item)
+        self._liq_active = surviving
+
+    def _on_swing_premium_discount(self, swing: SwingEvent) -> None:
+        if swing.direction == +1:
+            self._pd_high = float(swing.level)
+        else:
+            self._pd_low = float(swing.level)
+        if self._pd_high is None or self._pd_low is None:
+            return
+        range_size = self._pd_high - self._pd_low
+        if range_size > 0:
+            self._equilibrium = self._pd_low + range_size * 0.5
+            self._fib_prices = {key: self._pd_low + range_size * fib for key, fib in _FIB_KEYS}
+
+    def _on_swing_ote(self, swing: SwingEvent) -> None:
+        if swing.direction == +1:
+            self._ote_high = float(swing.level)
+            self._ote_direction = +1
+        else:
+            self._ote_low = float(swing.level)
+            self._ote_direction = -1
+        if self._ote_high is None or self._ote_low is None:
+            return
+        range_size = self._ote_high - self._ote_low
+        if range_size <= 0:
+            return
+        if self._ote_direction == +1:
+            self._ote_top = self._ote_high - range_size * _FIB_62
+            self._ote_bottom = self._ote_high - range_size * _FIB_79
+        else:
+            self._ote_bottom = self._ote_low + range_size * _FIB_62
+            self._ote_top = self._ote_low + range_size * _FIB_79
+
+    # ------------------------------------------------------------------
+    # Read-only accessors (mirror ICTState)
+    # ------------------------------------------------------------------
+
+    @property
+    def bar_count(self) -> int:
+        return self._bar_idx
+
+    @property
+    def swings(self) -> list[SwingEvent]:
+        return list(self._swing._swings)
+
+    @property
+    def last_swing(self) -> SwingEvent | None:
+        swings = self._swing._swings
+        return swings[-1] if swings else None
+
+    @property
+    def all_fvgs(self) -> list[FVGEvent]:
+        return list(self._fvg_events)
+
+    @property
+    def active_fvgs(self) -> list[FVGEvent]:
+        return [self._fvg_events[p] for p in self._fvg_active.positions()]
+
+    @property
+    def fvg_bullish_bias(self) -> int:
+        return sum(self._fvg_events[p].direction for p in self._fvg_active.positions())
+
+    @property
+    def trend(self) -> int:
+        return self._trend
+
+    @property
+    def structure_events(self) -> list[StructureEvent]:
+        return list(self._structure_events)
+
+    @property
+    def last_structure(self) -> StructureEvent | None:
+        return self._structure_events[-1] if self._structure_events else None
+
+    @property
+    def all_obs(self) -> list[OrderBlockEvent]:
+        return list(self._ob_events)
+
+    @property
+    def active_obs(self) -> list[OrderBlockEvent]:
+        return [self._ob_events[p] for p in self._ob_active.positions()]
+
+    @property
+    def all_liquidity(self) -> list[LiquidityPool]:
+        return list(self._liq_events)
+
+    @property
+    def active_liquidity(self) -> list[LiquidityPool]:
+        return [item[0] for item in self._liq_active]
+
+    @property
+    def displacement_events(self) -> list[DisplacementEvent]:
+        return list(self._displacement_events)
+
+    @property
+    def all_vis(self) -> list[VolumeImbalanceEvent]:
+        return list(self._vi_events)
+
+    @property
+    def active_vis(self) -> list[VolumeImbalanceEvent]:
+        return [self._vi_events[p] for p in self._vi_active.positions()]
+
+    @property
+    def all_breakers(self) -> list[OrderBlockEvent]:
+        return list(self._breakers)
+
+    @property
+    def equilibrium(self) -> float:
+        return self._equilibrium
+
+    @property
+    def fib_levels(self) -> dict[str, float]:
+        return dict(self._fib_prices)
+
+    def zone_for_price(self, price: float | Decimal) -> str:
+        """Returns 'premium', 'discount', or 'equilibrium'."""
+        if self._equilibrium == 0.0:
+            return "equilibrium"
+        p = float(price)
+        if p > self._equilibrium:
+            return "premium"
+        if p < self._equilibrium:
+            return "discount"
+        return "equilibrium"
+
+    def in_ote_zone(self, price: float | Decimal) -> bool:
+        if self._ote_top == 0.0 and self._ote_bottom == 0.0:
+            return False
+        return self._ote_bottom <= float(price) <= self._ote_top
+
+    @property
+    def ote_top(self) -> float:
+        return self._ote_top
+
+    @property
+    def ote_bottom(self) -> float:
+        return self._ote_bottom
@@ -2,7 +2,9 @@
 
 Keeps file handles open and buffers rows, flushing periodically or when a
 buffer size threshold is reached.  Schema rotation (header mismatch) is
-checked only on first open, not on every write.
+checked only on first open, not on every write.  Minute and fill rows can
+additionally be mirrored into time-indexed Parquet segments (see
+``controllers.columnar_log``).
 
 Historical note: module filename is retained for backward compatibility.
 Prefer importing from ``controllers.runtime.logging``.
@@ -20,6 +22,8 @@ from datetime import UTC, datetime
 from io import TextIOWrapper
 from pathlib import Path
 
+from controllers.columnar_log import ColumnarSegmentWriter, columnar_available
+
 logger = logging.getLogger(__name__)
 
 
@@ -127,7 +131,7 @@ class _BackgroundCsvWriter:
 
     _SENTINEL = object()
 
-    def __init__(self, inner: _CsvBuffer, maxsize: int = 2000):
+    def __init__(self, inner: _CsvBuffer | ColumnarSegmentWriter, maxsize: int = 2000):
         self._inner = inner
         self._q: queue.Queue[tuple[dict[str, object], list[str] | None]] | None = queue.Queue(maxsize=maxsize)
         self._thread = threading.Thread(target=self._worker, daemon=True, name=f"csv_bg_{inner._path.stem}")
@@ -275,6 +279,10 @@ class _FillWal:
             logger.warning("Fill WAL replay failed", exc_info=True)
 
 
+def _env_flag(name: str, default: str = "false") -> bool:
+    return os.environ.get(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
 class CsvSplitLogger:
     FILL_FIELDS = (
         "ts",
@@ -308,6 +316,7 @@ class CsvSplitLogger:
         namespace: str = "epp_v24",
         flush_rows: int = 10,
         flush_interval_s: float = 5.0,
+        columnar: bool | None = None,
     ):
         root = Path(base_log_dir).expanduser().resolve()
         namespace_tag = str(namespace or "epp_v24").strip().replace("\\", "_").replace("/", "_")
@@ -336,15 +345,30 @@ class CsvSplitLogger:
         )
         self._size_check_counter: int = 0
         self._size_warned: dict[str, bool] = {}
+        self._columnar: dict[str, _BackgroundCsvWriter] = {}
+        if columnar is None:
+            columnar = _env_flag("COLUMNAR_LOG_ENABLED")
+        if columnar:
+            if columnar_available():
+                segment_s = int(os.environ.get("COLUMNAR_LOG_SEGMENT_S", "3600"))
+                for key in ("minute", "fills"):
+                    sink = ColumnarSegmentWriter(self.log_dir / "columnar", key, segment_s=segment_s)
+                    self._columnar[key] = _BackgroundCsvWriter(sink)
+            else:
+                logger.warning("COLUMNAR_LOG_ENABLED is set but pyarrow is not installed; columnar mirror disabled")
 
     def flush_all(self) -> None:
         for buf in self._buffers.values():
             buf.flush()
+        for sink in self._columnar.values():
+            sink.flush()
         self._fill_wal.mark_flushed()
 
     def close_all(self) -> None:
         for buf in self._buffers.values():
             buf.close()
+        for sink in self._columnar.values():
+            sink.close()
         self._fill_wal.mark_flushed()
         self._fill_wal.close()
 
@@ -357,6 +381,9 @@ class CsvSplitLogger:
 
     def _append(self, key: str, row: dict[str, object], fieldnames: Iterable[str]) -> None:
         self._buffers[key].write(row, fieldnames)
+        sink = self._columnar.get(key)
+        if sink is not None:
+            sink.write(row, fieldnames)
         self._check_file_size_warning(key)
 
     def _check_file_size_warning(self, key: str) -> None:
@@ -0,0 +1,278 @@
+"""Content-addressed cache of assembled feature/label datasets.
+
+``assemble_dataset`` is the slow step of every research run: it reloads all
+inputs and recomputes features and labels from scratch.  The feature store
+persists its output as Parquet keyed by
+
+* the sha256 of every input dataset, as recorded in the ``DataCatalog``, and
+* a version hash of the feature and label code (module sources).
+
+Directory structure::
+
+    {cache_dir}/{exchange}/{pair}/{key}.parquet
+    {cache_dir}/{exchange}/{pair}/{key}.json      # inputs, prefix hashes, rows
+
+Lookup order in :meth:`FeatureStore.get_or_build`:
+
+1. **Hit** — an entry with the exact key exists; only the catalog is read.
+2. **Extend** — an entry for the same code version exists whose inputs are a
+   strict prefix of the current inputs (new candles were appended).  Rows
+   that cannot change are reused; features and labels are recomputed only
+   for the tail, starting ``tail_warmup_bars`` before the first row that may
+   differ so every rolling window is fully warmed up.
+3. **Build** — full :func:`~controllers.ml.research.build_dataset`.
+
+Higher-timeframe candles (5m/15m/1h) are aligned to 1m rows *positionally*
+by ``compute_features``, so when they are present the reusable prefix ends at
+their previous row count.  Timestamp-aligned inputs (mark/index, funding,
+LS ratio) do not limit reuse.
+
+After every write, entries are evicted least-recently-used first until the
+store fits ``max_bytes``.  Hits refresh an entry's mtime.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+# Longest backward dependency in compute_features: the 7-day ATR percentile
+# (10_080-bar rank window over a 14-bar EWM ATR).  Two weeks of 1m bars
+# leaves ample room for EWM convergence and the 1_440-bar label buckets.
+_TAIL_WARMUP_BARS = 20_160
+
+# Trailing rows of a cached dataset whose labels were incomplete (forward
+# horizon ran past the data end) and must always be recomputed.
+_LABEL_REFRESH_ROWS = 60
+
+# Inputs compute_features aligns to 1m rows by position rather than timestamp.
+_POSITIONAL_INPUTS = ("5m", "15m", "1h")
+_TIMESTAMP_INPUTS = ("mark_1m", "index_1m", "funding", "ls_ratio")
+_INPUT_RESOLUTIONS = ("1m", *_POSITIONAL_INPUTS, *_TIMESTAMP_INPUTS)
+
+
+def code_version() -> str:
+    """Hash of the feature and label code; changes invalidate every entry."""
+    from controllers.ml import _indicators, feature_pipeline, label_generator
+
+    h = hashlib.sha256()
+    for module in (feature_pipeline, _indicators, label_generator):
+        h.update(Path(module.__file__).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def input_fingerprints(exchange: str, pair: str, catalog_dir: str | Path) -> dict[str, str]:
+    """Return ``{resolution: sha256}`` for every input ``load_dataset_inputs`` would read.
+
+    Single files use the sha256 stored in the catalog, or are hashed from
+    disk when registered without one.  Partitioned datasets are always
+    fingerprinted by their current manifest, which changes on every append.
+    """
+    from controllers.backtesting.data_catalog import DataCatalog, dataset_sha256
+    from controllers.backtesting.data_store import resolve_existing_dataset
+
+    catalog_dir = Path(catalog_dir)
+    catalog = DataCatalog(base_dir=catalog_dir)
+    out: dict[str, str] = {}
+    for resolution in _INPUT_RESOLUTIONS:
+        entry = catalog.find(exchange, pair, resolution)
+        if entry is None:
+            continue
+        path = resolve_existing_dataset(exchange, pair, resolution, catalog_dir)
+        if path is None:
+            continue
+        if path.is_dir():
+            out[resolution] = dataset_sha256(path)
+        else:
+            out[resolution] = str(entry.get("sha256") or dataset_sha256(path))
+    return out
+
+
+def _frame_sha256(df: pd.DataFrame) -> str:
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()).hexdigest()
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    tmp_path = path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp_path, index=False, compression="zstd", engine="pyarrow", row_group_size=100_000)
+    tmp_path.replace(path)
+
+
+class FeatureStore:
+    """Disk cache of assembled research datasets; see module docstring."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        tail_warmup_bars: int = _TAIL_WARMUP_BARS,
+    ) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._tail_warmup_bars = tail_warmup_bars
+        self.last_outcome: str = ""
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_or_build(self, exchange: str, pair: str, catalog_dir: str | Path) -> pd.DataFrame:
+        """Return the assembled dataset for (exchange, pair), computing only what changed.
+
+        Sets :attr:`last_outcome` to ``"hit"``, ``"extended"`` or ``"built"``.
+        """
+        from controllers.ml.research import build_dataset, load_dataset_inputs
+
+        version = code_version()
+        fingerprints = input_fingerprints(exchange, pair, catalog_dir)
+        key = self._key(version, fingerprints)
+        entry_dir = self._cache_dir / exchange / pair
+        data_path = entry_dir / f"{key}.parquet"
+
+        if data_path.exists():
+            os.utime(data_path)
+            self.last_outcome = "hit"
+            logger.info("Feature store hit %s/%s (%s)", exchange, pair, key)
+            return pd.read_parquet(data_path)
+
+        inputs = load_dataset_inputs(exchange, pair, catalog_dir)
+        dataset = self._try_extend(entry_dir, version, inputs)
+        if dataset is None:
+            dataset = build_dataset(inputs)
+            self.last_outcome = "built"
+        else:
+            self.last_outcome = "extended"
+
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        _write_parquet(dataset, data_path)
+        meta = {
+            "key": key,
+            "code_version": version,
+            "inputs": fingerprints,
+            "prefix": {
+                res: {"rows": len(df), "sha256": _frame_sha256(df)}
+                for res, df in inputs.items() if df is not None
+            },
+            "rows": len(dataset),
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        meta_path = entry_dir / f"{key}.json"
+        tmp = meta_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        tmp.replace(meta_path)
+        logger.info("Feature store %s %s/%s (%s, %d rows)", self.last_outcome, exchange, pair, key, len(dataset))
+
+        self.evict(keep={data_path})
+        return dataset
+
+    def evict(self, keep: set[Path] | None = None) -> list[Path]:
+        """Delete least-recently-used entries until the store fits ``max_bytes``.
+
+        Paths in *keep* are never removed.  Returns the removed Parquet paths.
+        """
+        keep = {p.resolve() for p in (keep or set())}
+        entries = [
+            (p.stat().st_mtime, p.stat().st_size, p)
+            for p in self._cache_dir.glob("*/*/*.parquet")
+        ]
+        total = sum(size for _, size, _ in entries)
+        removed: list[Path] = []
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self._max_bytes:
+                break
+            if path.resolve() in keep:
+                continue
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+        if removed:
+            logger.info("Feature store evicted %d entries (now %d bytes)", len(removed), total)
+        return removed
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(version: str, fingerprints: dict[str, str]) -> str:
+        payload = json.dumps({"code": version, "inputs": fingerprints}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+    def _try_extend(
+        self,
+        entry_dir: Path,
+        version: str,
+        inputs: dict[str, pd.DataFrame | None],
+    ) -> pd.DataFrame | None:
+        """Extend the newest compatible entry in *entry_dir*, or return None."""
+        from controllers.ml.research import build_dataset
+
+        if not entry_dir.exists():
+            return None
+        present = {res for res, df in inputs.items() if df is not None}
+        candidates = sorted(entry_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for meta_path in candidates:
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            data_path = meta_path.with_suffix(".parquet")
+            if meta.get("code_version") != version or not data_path.exists():
+                continue
+            prefix = meta.get("prefix", {})
+            if set(prefix) != present or not all(
+                len(inputs[res]) >= int(p["rows"])
+                and _frame_sha256(inputs[res].iloc[: int(p["rows"])]) == p["sha256"]
+                for res, p in prefix.items()
+            ):
+                continue
+
+            n_old = int(prefix["1m"]["rows"])
+            cached = pd.read_parquet(data_path)
+            if len(cached) != n_old:
+                continue
+
+            # First 1m row whose features or labels may differ from the cache.
+            refresh = n_old - _LABEL_REFRESH_ROWS
+            for res in _POSITIONAL_INPUTS:
+                if res in prefix:
+                    refresh = min(refresh, int(prefix[res]["rows"]))
+            refresh = max(refresh, 0)
+            start = max(refresh - self._tail_warmup_bars, 0)
+            if start == 0:
+                return None
+
+            candles_1m = inputs["1m"]
+            start_ts = int(candles_1m["timestamp_ms"].iloc[start])
+            refresh_ts = int(candles_1m["timestamp_ms"].iloc[refresh])
+            tail_inputs: dict[str, pd.DataFrame | None] = {}
+            for res, df in inputs.items():
+                if df is None:
+                    tail_inputs[res] = None
+                elif res == "1m" or res in _POSITIONAL_INPUTS:
+                    tail_inputs[res] = df.iloc[start:].reset_index(drop=True)
+                else:
+                    # Keep the last row at or before start_ts for the backward as-of merge.
+                    ts = df["timestamp_ms"].to_numpy()
+                    first = max(int((ts <= start_ts).sum()) - 1, 0)
+                    tail_inputs[res] = df.iloc[first:].reset_index(drop=True)
+
+            tail = build_dataset(tail_inputs)
+            tail = tail[tail["timestamp_ms"] >= refresh_ts]
+            logger.info(
+                "Extending cached dataset %s: reusing %d rows, recomputing %d",
+                meta.get("key"), refresh, len(tail),
+            )
+            return pd.concat([cached.iloc[:refresh], tail], ignore_index=True)
+        return None
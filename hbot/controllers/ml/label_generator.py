@@ -6,6 +6,13 @@ regime labels, or bot state.  Input is a float64 DataFrame from
 same timestamps.
 
 Trailing rows where forward data is insufficient are NaN.
+
+Every helper is a sliding-window computation over the whole series rather
+than a per-bar slice: forward max/min use pandas' monotonic-deque rolling
+max/min, forward volatility reduces strided window views in chunks, and the
+rolling percentile buckets use pandas' skiplist-backed rolling quantile.
+Cost is O(n log w) for the buckets and O(n) / O(n·h) vectorised for the
+forward labels, instead of O(n·w log w) interpreted loops.
 """
 from __future__ import annotations
 
@@ -103,39 +110,64 @@ def _return_sign(returns: np.ndarray, deadzone: float) -> np.ndarray:
     return result
 
 
+def _rolling_thresholds(
+    values: np.ndarray,
+    window: int,
+    percentiles: Sequence[float],
+    min_obs: int = 10,
+) -> np.ndarray:
+    """Percentiles of the trailing ``values[i - window:i]`` for every *i*.
+
+    Returns an ``(n, len(percentiles))`` array.  Row *i* excludes bar *i*
+    itself, skips NaNs, and is NaN when fewer than *min_obs* finite values are
+    in the lookback or when ``i < window``.  Linear interpolation matches
+    ``np.percentile``'s default.
+    """
+    n = len(values)
+    s = pd.Series(values)
+    roll = s.rolling(window, min_periods=min_obs)
+    out = np.full((n, len(percentiles)), np.nan)
+    for j, pct in enumerate(percentiles):
+        # Window ending at i-1 covers values[i-window:i]; shift by one bar.
+        q = roll.quantile(pct / 100.0, interpolation="linear").to_numpy()
+        out[1:, j] = q[:-1]
+    out[:window] = np.nan
+    return out
+
+
 def _rolling_percentile_buckets(
     values: np.ndarray,
     window: int,
     n_buckets: int,
 ) -> np.ndarray:
     """Quantize values into buckets using rolling percentile boundaries."""
-    s = pd.Series(values)
     result = np.full(len(values), np.nan)
-
     percentiles = np.linspace(0, 100, n_buckets + 1)[1:-1]
 
-    for i in range(window, len(values)):
-        if np.isnan(values[i]):
-            continue
-        lookback = values[max(0, i - window):i]
-        lookback = lookback[~np.isnan(lookback)]
-        if len(lookback) < 10:
-            continue
-        thresholds = np.percentile(lookback, percentiles)
-        result[i] = np.searchsorted(thresholds, values[i])
-
+    thresholds = _rolling_thresholds(values, window, percentiles)
+    valid = ~np.isnan(values) & ~np.isnan(thresholds[:, 0])
+    # searchsorted(thresholds, v) with side="left" == count(thresholds < v).
+    result[valid] = (thresholds[valid] < values[valid, None]).sum(axis=1)
     return result
 
 
+_STD_CHUNK_ROWS = 65_536
+
+
 def _forward_volatility(close: np.ndarray, horizon: int) -> np.ndarray:
     """Standard deviation of 1m log returns over the next *horizon* bars."""
     n = len(close)
     log_ret = np.log(close[1:] / close[:-1])
     result = np.full(n, np.nan)
-    for i in range(n - horizon):
-        segment = log_ret[i:i + horizon]
-        if len(segment) == horizon:
-            result[i] = np.std(segment)
+    count = n - horizon
+    if count <= 0 or horizon <= 0:
+        return result
+    # Row i of the view is log_ret[i:i + horizon]; reduce in chunks to bound
+    # the temporaries np.std allocates.
+    windows = np.lib.stride_tricks.sliding_window_view(log_ret, horizon)
+    for lo in range(0, count, _STD_CHUNK_ROWS):
+        hi = min(lo + _STD_CHUNK_ROWS, count)
+        result[lo:hi] = np.std(windows[lo:hi], axis=1)
     return result
 
 
@@ -144,43 +176,35 @@ def _volatility_buckets(
     window: int,
 ) -> np.ndarray:
     """Classify volatility into {low=0, normal=1, elevated=2, extreme=3}."""
-    s = pd.Series(vol)
     result = np.full(len(vol), np.nan)
 
-    for i in range(window, len(vol)):
-        if np.isnan(vol[i]):
-            continue
-        lookback = vol[max(0, i - window):i]
-        lookback = lookback[~np.isnan(lookback)]
-        if len(lookback) < 10:
-            continue
-        p25 = np.percentile(lookback, 25)
-        p75 = np.percentile(lookback, 75)
-        p95 = np.percentile(lookback, 95)
-        if vol[i] <= p25:
-            result[i] = 0
-        elif vol[i] <= p75:
-            result[i] = 1
-        elif vol[i] <= p95:
-            result[i] = 2
-        else:
-            result[i] = 3
-
+    thresholds = _rolling_thresholds(vol, window, (25, 75, 95))
+    valid = ~np.isnan(vol) & ~np.isnan(thresholds[:, 0])
+    # v <= p25 → 0, <= p75 → 1, <= p95 → 2, else 3.
+    result[valid] = (thresholds[valid] < vol[valid, None]).sum(axis=1)
     return result
 
 
+def _forward_extremes(
+    high: np.ndarray, low: np.ndarray, horizon: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Max of ``high`` and min of ``low`` over bars ``i+1 .. i+horizon``.
+
+    Trailing rows without a full forward window are NaN.
+    """
+    # rolling(h) at j covers [j-h+1, j]; the forward window of i ends at i+h.
+    fut_high = pd.Series(high).rolling(horizon, min_periods=horizon).max().shift(-horizon).to_numpy()
+    fut_low = pd.Series(low).rolling(horizon, min_periods=horizon).min().shift(-horizon).to_numpy()
+    return fut_high, fut_low
+
+
 def _forward_mae_mfe_long(
     close: np.ndarray, high: np.ndarray, low: np.ndarray, horizon: int,
 ) -> tuple[np.ndarray, np.ndarray]:
     """MAE/MFE for a hypothetical long entry at each bar's close."""
-    n = len(close)
-    mae = np.full(n, np.nan)
-    mfe = np.full(n, np.nan)
-    for i in range(n - horizon):
-        future_high = np.max(high[i + 1:i + 1 + horizon])
-        future_low = np.min(low[i + 1:i + 1 + horizon])
-        mfe[i] = (future_high - close[i]) / close[i]
-        mae[i] = (close[i] - future_low) / close[i]
+    future_high, future_low = _forward_extremes(high, low, horizon)
+    mfe = (future_high - close) / close
+    mae = (close - future_low) / close
     return np.clip(mae, 0, None), np.clip(mfe, 0, None)
 
 
@@ -188,12 +212,7 @@ def _forward_mae_mfe_short(
     close: np.ndarray, high: np.ndarray, low: np.ndarray, horizon: int,
 ) -> tuple[np.ndarray, np.ndarray]:
     """MAE/MFE for a hypothetical short entry at each bar's close."""
-    n = len(close)
-    mae = np.full(n, np.nan)
-    mfe = np.full(n, np.nan)
-    for i in range(n - horizon):
-        future_high = np.max(high[i + 1:i + 1 + horizon])
-        future_low = np.min(low[i + 1:i + 1 + horizon])
-        mfe[i] = (close[i] - future_low) / close[i]
-        mae[i] = (future_high - close[i]) / close[i]
+    future_high, future_low = _forward_extremes(high, low, horizon)
+    mfe = (close - future_low) / close
+    mae = (future_high - close) / close
     return np.clip(mae, 0, None), np.clip(mfe, 0, None)
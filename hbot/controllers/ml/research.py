@@ -9,8 +9,13 @@ Usage::
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
 import logging
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -60,22 +65,27 @@ _LABEL_MAPS: dict[str, dict[int, str]] = {
 # ---------------------------------------------------------------------------
 
 
-def assemble_dataset(
+def load_dataset_inputs(
     exchange: str,
     pair: str,
     catalog_dir: str | Path,
-) -> pd.DataFrame:
-    """Load all available data for (exchange, pair), compute features + labels.
+) -> dict[str, pd.DataFrame | None]:
+    """Load every catalogued input for (exchange, pair) as float DataFrames.
 
-    Returns a single DataFrame with timestamp_ms, feature columns, and label
-    columns joined on timestamp_ms.
+    Keys are catalog resolutions (``1m``, ``5m``, ``15m``, ``1h``,
+    ``mark_1m``, ``index_1m``, ``funding``, ``ls_ratio``); a value is None
+    when the dataset is not catalogued or missing on disk.  Partitioned
+    datasets (``<resolution>/parts/``) are read in preference to the
+    single ``data.parquet`` file.
+
+    Raises :class:`FileNotFoundError` if there is no 1m candle data.
     """
     from controllers.backtesting.data_catalog import DataCatalog
     from controllers.backtesting.data_store import (
         load_candles_df,
-        load_funding_rates,
+        load_funding_window,
         load_long_short_ratio,
-        resolve_data_path,
+        resolve_existing_dataset,
     )
 
     catalog_dir = Path(catalog_dir)
@@ -85,8 +95,8 @@ def assemble_dataset(
         entry = catalog.find(exchange, pair, resolution)
         if entry is None:
             return None
-        path = resolve_data_path(exchange, pair, resolution, catalog_dir)
-        if not path.exists():
+        path = resolve_existing_dataset(exchange, pair, resolution, catalog_dir)
+        if path is None:
             return None
         return load_candles_df(path)
 
@@ -94,30 +104,29 @@ def assemble_dataset(
     if candles_1m is None or candles_1m.empty:
         raise FileNotFoundError(f"No 1m candle data for {exchange}/{pair}")
 
-    candles_5m = _load_opt("5m")
-    candles_15m = _load_opt("15m")
-    candles_1h = _load_opt("1h")
-    mark_1m = _load_opt("mark_1m")
-    index_1m = _load_opt("index_1m")
+    inputs: dict[str, pd.DataFrame | None] = {"1m": candles_1m}
+    for resolution in ("5m", "15m", "1h", "mark_1m", "index_1m"):
+        inputs[resolution] = _load_opt(resolution)
 
     # Funding
     funding_df = None
     funding_entry = catalog.find(exchange, pair, "funding")
     if funding_entry:
-        funding_path = resolve_data_path(exchange, pair, "funding", catalog_dir)
-        if funding_path.exists():
-            rows = load_funding_rates(funding_path)
+        funding_path = resolve_existing_dataset(exchange, pair, "funding", catalog_dir)
+        if funding_path is not None:
+            rows = load_funding_window(funding_path)
             funding_df = pd.DataFrame([
                 {"timestamp_ms": r.timestamp_ms, "rate": float(r.rate)}
                 for r in rows
             ])
+    inputs["funding"] = funding_df
 
     # LS ratio
     ls_df = None
     ls_entry = catalog.find(exchange, pair, "ls_ratio")
     if ls_entry:
-        ls_path = resolve_data_path(exchange, pair, "ls_ratio", catalog_dir)
-        if ls_path.exists():
+        ls_path = resolve_existing_dataset(exchange, pair, "ls_ratio", catalog_dir)
+        if ls_path is not None:
             rows = load_long_short_ratio(ls_path)
             ls_df = pd.DataFrame([
                 {
@@ -128,29 +137,40 @@ def assemble_dataset(
                 }
                 for r in rows
             ])
+    inputs["ls_ratio"] = ls_df
+    return inputs
+
+
+def build_dataset(inputs: dict[str, pd.DataFrame | None]) -> pd.DataFrame:
+    """Compute features + labels from :func:`load_dataset_inputs` output.
+
+    Returns a single DataFrame with timestamp_ms, feature columns, and label
+    columns joined on timestamp_ms.
+    """
+    candles_1m = inputs["1m"]
+    if candles_1m is None:
+        raise ValueError("build_dataset requires 1m candles")
+
+    def _rows(key: str) -> int | str:
+        df = inputs.get(key)
+        return len(df) if df is not None else "N/A"
 
     logger.info(
-        "Assembling dataset for %s/%s: 1m=%d rows, 5m=%s, 15m=%s, 1h=%s, "
+        "Assembling dataset: 1m=%d rows, 5m=%s, 15m=%s, 1h=%s, "
         "mark=%s, index=%s, funding=%s, ls=%s",
-        exchange, pair, len(candles_1m),
-        len(candles_5m) if candles_5m is not None else "N/A",
-        len(candles_15m) if candles_15m is not None else "N/A",
-        len(candles_1h) if candles_1h is not None else "N/A",
-        len(mark_1m) if mark_1m is not None else "N/A",
-        len(index_1m) if index_1m is not None else "N/A",
-        len(funding_df) if funding_df is not None else "N/A",
-        len(ls_df) if ls_df is not None else "N/A",
+        len(candles_1m), _rows("5m"), _rows("15m"), _rows("1h"),
+        _rows("mark_1m"), _rows("index_1m"), _rows("funding"), _rows("ls_ratio"),
     )
 
     features = compute_features(
         candles_1m=candles_1m,
-        candles_5m=candles_5m,
-        candles_15m=candles_15m,
-        candles_1h=candles_1h,
-        funding=funding_df,
-        ls_ratio=ls_df,
-        mark_candles_1m=mark_1m,
-        index_candles_1m=index_1m,
+        candles_5m=inputs.get("5m"),
+        candles_15m=inputs.get("15m"),
+        candles_1h=inputs.get("1h"),
+        funding=inputs.get("funding"),
+        ls_ratio=inputs.get("ls_ratio"),
+        mark_candles_1m=inputs.get("mark_1m"),
+        index_candles_1m=inputs.get("index_1m"),
     )
 
     labels = compute_labels(candles_1m)
@@ -160,6 +180,30 @@ def assemble_dataset(
     return dataset
 
 
+def assemble_dataset(
+    exchange: str,
+    pair: str,
+    catalog_dir: str | Path,
+    *,
+    cache_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """Load all available data for (exchange, pair), compute features + labels.
+
+    Returns a single DataFrame with timestamp_ms, feature columns, and label
+    columns joined on timestamp_ms.
+
+    When *cache_dir* is given the result is served from (and stored in) a
+    :class:`~controllers.ml.feature_store.FeatureStore` there, so repeated
+    research runs on unchanged data skip feature/label computation and
+    appended candles only recompute the tail.
+    """
+    if cache_dir is not None:
+        from controllers.ml.feature_store import FeatureStore
+
+        return FeatureStore(cache_dir).get_or_build(exchange, pair, catalog_dir)
+    return build_dataset(load_dataset_inputs(exchange, pair, catalog_dir))
+
+
 # ---------------------------------------------------------------------------
 # Walk-forward cross-validation
 # ---------------------------------------------------------------------------
@@ -213,6 +257,9 @@ def purged_walk_forward_cv(
     embargo_bars: int | None = None,
     purge: bool = True,
     lgb_params: dict[str, Any] | None = None,
+    *,
+    n_jobs: int = 1,
+    threads_per_worker: int | None = None,
 ) -> list[dict[str, Any]]:
     """Purged walk-forward CV with embargo gaps (de Prado-style).
 
@@ -237,6 +284,13 @@ def purged_walk_forward_cv(
         the test period.
     lgb_params:
         LightGBM hyperparameters.  Falls back to ``_DEFAULT_LGB_PARAMS``.
+    n_jobs:
+        Worker processes; ``> 1`` trains folds concurrently (see
+        :func:`_cv_pool`).  Folds are independent, so results are the same
+        as a serial run with the same thread count.
+    threads_per_worker:
+        LightGBM threads per fold.  Defaults to ``cpu_count // n_jobs`` when
+        parallel and to LightGBM's own default when serial.
 
     Returns
     -------
@@ -244,13 +298,10 @@ def purged_walk_forward_cv(
         Per-fold results including metrics, feature importances, fold sizes,
         embargo/purge details, and the fitted model.
     """
-    import lightgbm as lgb
-
     target_col = _MODEL_TYPE_TARGETS.get(model_type)
     if target_col is None:
         raise ValueError(f"Unknown model_type: {model_type}")
 
-    is_classification = model_type in _CLASSIFICATION_TYPES
     feature_cols = _get_feature_cols(dataset)
 
     clean = dataset.dropna(subset=[target_col]).reset_index(drop=True)
@@ -259,6 +310,34 @@ def purged_walk_forward_cv(
     if embargo_bars is None:
         embargo_bars = 2 * _MAX_LABEL_HORIZON_BARS
 
+    params = dict(_DEFAULT_LGB_PARAMS)
+    if lgb_params:
+        params.update(lgb_params)
+
+    folds = _plan_folds(n, n_windows, embargo_bars, purge)
+    workers = min(n_jobs, len(folds))
+    if workers <= 1:
+        if threads_per_worker is not None:
+            params["n_jobs"] = threads_per_worker
+        columns = _fold_columns(clean, [*feature_cols, target_col])
+        fitted = [_fit_fold(columns, feature_cols, target_col, model_type, params, f) for f in folds]
+    else:
+        params["n_jobs"] = threads_per_worker or _default_threads(workers)
+        with _cv_pool(clean, [*feature_cols, target_col], workers) as pool:
+            fitted = pool.map(
+                _cv_fold_task,
+                [(feature_cols, target_col, model_type, params, f) for f in folds],
+            )
+    return fitted
+
+
+def _plan_folds(n: int, n_windows: int, embargo_bars: int, purge: bool) -> list[dict[str, int]]:
+    """Row ranges for each purged walk-forward fold.
+
+    Training rows are ``[0, train_stop)`` (purging only ever trims the tail
+    of the expanding window) and test rows ``[test_start, test_end)``.
+    Raises ``ValueError`` if *n* rows cannot hold the requested folds.
+    """
     min_rows_needed = (n_windows + 1) * 50 + n_windows * embargo_bars
     if n < min_rows_needed:
         raise ValueError(
@@ -269,12 +348,7 @@ def purged_walk_forward_cv(
     usable = n - n_windows * embargo_bars
     window_size = usable // (n_windows + 1)
 
-    params = dict(_DEFAULT_LGB_PARAMS)
-    if lgb_params:
-        params.update(lgb_params)
-
-    results: list[dict[str, Any]] = []
-
+    folds: list[dict[str, int]] = []
     for w in range(n_windows):
         train_end = window_size * (w + 1)
         test_start = train_end + embargo_bars
@@ -283,79 +357,162 @@ def purged_walk_forward_cv(
         if test_start >= n or test_end - test_start < 10:
             continue
 
-        train_idx = np.arange(0, train_end)
-
+        train_stop = train_end
         purged_count = 0
         if purge and _MAX_LABEL_HORIZON_BARS > 0:
-            purge_boundary = test_start - _MAX_LABEL_HORIZON_BARS
+            purge_boundary = max(test_start - _MAX_LABEL_HORIZON_BARS, 0)
             if purge_boundary < train_end:
-                purge_mask = train_idx >= purge_boundary
-                purged_count = int(purge_mask.sum())
-                train_idx = train_idx[~purge_mask]
+                purged_count = train_end - purge_boundary
+                train_stop = purge_boundary
 
-        train = clean.iloc[train_idx]
-        test = clean.iloc[test_start:test_end]
-
-        if len(train) < 50 or len(test) < 10:
+        if train_stop < 50:
             continue
 
-        X_train = train[feature_cols].values
-        y_train = train[target_col].values
-        X_test = test[feature_cols].values
-        y_test = test[target_col].values
-
-        if is_classification:
-            y_train_int = y_train.astype(int)
-            y_test_int = y_test.astype(int)
-            model = lgb.LGBMClassifier(**params)
-            model.fit(X_train, y_train_int)
-            preds = model.predict(X_test)
-            accuracy = float(np.mean(preds == y_test_int))
-            metric_name = "accuracy"
-            metric_value = accuracy
-        else:
-            model = lgb.LGBMRegressor(**params)
-            model.fit(X_train, y_train)
-            preds = model.predict(X_test)
-            ss_res = np.sum((y_test - preds) ** 2)
-            ss_tot = np.sum((y_test - np.mean(y_test)) ** 2)
-            r2 = 1.0 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
-            metric_name = "r_squared"
-            metric_value = float(r2)
-
-        importances = dict(zip(feature_cols, model.feature_importances_.tolist(), strict=True))
-        top_10 = sorted(importances, key=importances.get, reverse=True)[:10]
-
-        results.append({
+        folds.append({
             "window": w,
-            "train_rows": len(train),
-            "test_rows": len(test),
+            "train_stop": train_stop,
+            "test_start": test_start,
+            "test_end": test_end,
             "embargo_bars": embargo_bars,
             "purged_count": purged_count,
-            "metric_name": metric_name,
-            "metric_value": metric_value,
-            "top_10_features": top_10,
-            "feature_importances": importances,
-            "model": model,
         })
-        logger.info(
-            "Window %d: %s=%.4f (train=%d, test=%d, embargo=%d, purged=%d)",
-            w, metric_name, metric_value,
-            len(train), len(test), embargo_bars, purged_count,
-        )
+    return folds
 
-    return results
+
+def _fold_columns(clean: pd.DataFrame, names: list[str]) -> dict[str, np.ndarray]:
+    return {c: np.asarray(clean[c], dtype=np.float64) for c in names}
+
+
+def _fit_fold(
+    columns: dict[str, np.ndarray],
+    feature_cols: list[str],
+    target_col: str,
+    model_type: str,
+    params: dict[str, Any],
+    fold: dict[str, int],
+) -> dict[str, Any]:
+    """Train and score one fold from column arrays (in-process or memory-mapped)."""
+    import lightgbm as lgb
+
+    train_stop = fold["train_stop"]
+    test_start, test_end = fold["test_start"], fold["test_end"]
+    X_train = np.column_stack([columns[c][:train_stop] for c in feature_cols])
+    y_train = columns[target_col][:train_stop]
+    X_test = np.column_stack([columns[c][test_start:test_end] for c in feature_cols])
+    y_test = columns[target_col][test_start:test_end]
+
+    if model_type in _CLASSIFICATION_TYPES:
+        y_train_int = y_train.astype(int)
+        y_test_int = y_test.astype(int)
+        model = lgb.LGBMClassifier(**params)
+        model.fit(X_train, y_train_int)
+        preds = model.predict(X_test)
+        accuracy = float(np.mean(preds == y_test_int))
+        metric_name = "accuracy"
+        metric_value = accuracy
+    else:
+        model = lgb.LGBMRegressor(**params)
+        model.fit(X_train, y_train)
+        preds = model.predict(X_test)
+        ss_res = np.sum((y_test - preds) ** 2)
+        ss_tot = np.sum((y_test - np.mean(y_test)) ** 2)
+        r2 = 1.0 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
+        metric_name = "r_squared"
+        metric_value = float(r2)
+
+    importances = dict(zip(feature_cols, model.feature_importances_.tolist(), strict=True))
+    top_10 = sorted(importances, key=importances.get, reverse=True)[:10]
+
+    logger.info(
+        "Window %d: %s=%.4f (train=%d, test=%d, embargo=%d, purged=%d)",
+        fold["window"], metric_name, metric_value,
+        train_stop, test_end - test_start, fold["embargo_bars"], fold["purged_count"],
+    )
+    return {
+        "window": fold["window"],
+        "train_rows": train_stop,
+        "test_rows": test_end - test_start,
+        "embargo_bars": fold["embargo_bars"],
+        "purged_count": fold["purged_count"],
+        "metric_name": metric_name,
+        "metric_value": metric_value,
+        "top_10_features": top_10,
+        "feature_importances": importances,
+        "model": model,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Process-parallel CV (folds and tuning trials)
+# ---------------------------------------------------------------------------
+#
+# The parent writes the CV columns once to an uncompressed Arrow IPC file;
+# each pool worker memory-maps it in its initializer, so the dataset is
+# shared through the page cache instead of being pickled per task.  Tasks
+# carry only fold row ranges and hyperparameters.  LightGBM's thread count is
+# pinned per worker so ``workers * threads`` matches the machine.
+
+_WORKER_COLUMNS: dict[str, np.ndarray] = {}
+
+
+def _default_threads(workers: int) -> int:
+    return max(1, (os.cpu_count() or 1) // max(workers, 1))
+
+
+def _init_cv_worker(arrow_path: str) -> None:
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(arrow_path, "r")).read_all()
+    _WORKER_COLUMNS.clear()
+    for name in table.column_names:
+        _WORKER_COLUMNS[name] = table.column(name).chunk(0).to_numpy(zero_copy_only=True)
+
+
+@contextlib.contextmanager
+def _cv_pool(clean: pd.DataFrame, names: list[str], workers: int) -> Iterator[Any]:
+    """Yield a ``multiprocessing.Pool`` whose workers memory-map *names* of *clean*."""
+    import pyarrow as pa
+
+    with tempfile.TemporaryDirectory(prefix="hbot-cv-") as tmp:
+        arrow_path = Path(tmp) / "dataset.arrow"
+        table = pa.table({c: pa.array(arr) for c, arr in _fold_columns(clean, names).items()})
+        with pa.OSFile(str(arrow_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(len(clean), 1))
+        del table
+        # spawn, not fork: forking after LightGBM has started OpenMP threads
+        # can deadlock the children.
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes=workers, initializer=_init_cv_worker, initargs=(str(arrow_path),)) as pool:
+            yield pool
+
+
+def _cv_fold_task(args: tuple) -> dict[str, Any]:
+    """Pool task: one fold against the worker's memory-mapped columns."""
+    feature_cols, target_col, model_type, params, fold = args
+    return _fit_fold(_WORKER_COLUMNS, feature_cols, target_col, model_type, params, fold)
+
+
+def _cv_trial_task(args: tuple) -> float:
+    """Pool task: one tuning trial (all folds, serially) → mean fold metric."""
+    feature_cols, target_col, model_type, params, folds = args
+    metrics = [
+        _fit_fold(_WORKER_COLUMNS, feature_cols, target_col, model_type, params, f)["metric_value"]
+        for f in folds
+    ]
+    return float(np.mean(metrics)) if metrics else 0.0
 
 
 def walk_forward_cv(
     dataset: pd.DataFrame,
     model_type: str,
     n_windows: int = 5,
+    *,
+    n_jobs: int = 1,
 ) -> list[dict[str, Any]]:
     """Legacy unpurged walk-forward CV.  Delegates to purged variant."""
     return purged_walk_forward_cv(
         dataset, model_type, n_windows=n_windows,
-        embargo_bars=0, purge=False,
+        embargo_bars=0, purge=False, n_jobs=n_jobs,
     )
 
 
@@ -410,9 +567,18 @@ def run_hyperparameter_tuning(
     embargo_bars: int | None = None,
     n_trials: int = 50,
     seed: int = 42,
+    *,
+    n_jobs: int = 1,
+    threads_per_worker: int | None = None,
 ) -> dict[str, Any]:
     """Run Optuna TPE search over LightGBM hyperparams.
 
+    With ``n_jobs > 1`` trials run concurrently in worker processes that
+    memory-map the dataset (see :func:`_cv_pool`): the study asks for
+    ``n_jobs`` trials at a time, evaluates them in parallel and tells all
+    results before asking again, so a given ``(seed, n_jobs)`` is
+    reproducible.  Folds within a trial run serially in its worker.
+
     Returns dict with ``best_params``, ``best_score``, ``n_trials``,
     ``search_space``.
 
@@ -429,8 +595,8 @@ def run_hyperparameter_tuning(
     optuna.logging.set_verbosity(optuna.logging.WARNING)
     search_space = _SEARCH_SPACES.get(model_type, _SEARCH_SPACES["regime"])
 
-    def objective(trial: "optuna.Trial") -> float:
-        params = {
+    def suggest(trial: optuna.Trial) -> dict[str, Any]:
+        return {
             "n_estimators": trial.suggest_int("n_estimators", *search_space["n_estimators"]),
             "learning_rate": trial.suggest_float("learning_rate", *search_space["learning_rate"], log=True),
             "max_depth": trial.suggest_int("max_depth", *search_space["max_depth"]),
@@ -441,6 +607,11 @@ def run_hyperparameter_tuning(
             "verbose": -1,
             "random_state": seed,
         }
+
+    def objective(trial: optuna.Trial) -> float:
+        params = suggest(trial)
+        if threads_per_worker is not None:
+            params["n_jobs"] = threads_per_worker
         results = purged_walk_forward_cv(
             dataset, model_type, n_windows=n_windows,
             embargo_bars=embargo_bars, purge=True, lgb_params=params,
@@ -451,7 +622,14 @@ def run_hyperparameter_tuning(
 
     sampler = optuna.samplers.TPESampler(seed=seed)
     study = optuna.create_study(direction="maximize", sampler=sampler)
-    study.optimize(objective, n_trials=n_trials)
+    workers = min(n_jobs, n_trials)
+    if workers <= 1:
+        study.optimize(objective, n_trials=n_trials)
+    else:
+        _optimize_parallel(
+            study, suggest, dataset, model_type, n_windows, embargo_bars, n_trials,
+            workers, threads_per_worker or _default_threads(workers),
+        )
 
     logger.info(
         "Optuna tuning complete: best_score=%.4f after %d trials",
@@ -466,6 +644,40 @@ def run_hyperparameter_tuning(
     }
 
 
+def _optimize_parallel(
+    study: Any,
+    suggest: Any,
+    dataset: pd.DataFrame,
+    model_type: str,
+    n_windows: int,
+    embargo_bars: int | None,
+    n_trials: int,
+    workers: int,
+    threads: int,
+) -> None:
+    """Evaluate *study* trials in batches of *workers* on a memory-mapped pool."""
+    target_col = _MODEL_TYPE_TARGETS.get(model_type)
+    if target_col is None:
+        raise ValueError(f"Unknown model_type: {model_type}")
+    feature_cols = _get_feature_cols(dataset)
+    clean = dataset.dropna(subset=[target_col]).reset_index(drop=True)
+    if embargo_bars is None:
+        embargo_bars = 2 * _MAX_LABEL_HORIZON_BARS
+    folds = _plan_folds(len(clean), n_windows, embargo_bars, purge=True)
+
+    with _cv_pool(clean, [*feature_cols, target_col], workers) as pool:
+        remaining = n_trials
+        while remaining > 0:
+            batch = [study.ask() for _ in range(min(workers, remaining))]
+            tasks = []
+            for trial in batch:
+                params = {**_DEFAULT_LGB_PARAMS, **suggest(trial), "n_jobs": threads}
+                tasks.append((feature_cols, target_col, model_type, params, folds))
+            for trial, score in zip(batch, pool.map(_cv_trial_task, tasks), strict=True):
+                study.tell(trial, score)
+            remaining -= len(batch)
+
+
 # ---------------------------------------------------------------------------
 # Baseline comparison
 # ---------------------------------------------------------------------------
@@ -661,6 +873,8 @@ def train_and_evaluate(
     n_trials: int = 50,
     seed: int = 42,
     dataset_path: str | Path | None = None,
+    feature_cache_dir: str | Path | None = None,
+    n_jobs: int = 1,
 ) -> dict[str, Any]:
     """End-to-end: assemble, CV, baseline, gate check, save.
 
@@ -669,13 +883,16 @@ def train_and_evaluate(
 
     If *dataset_path* is provided, load from that parquet directly
     instead of assembling from raw candle data.  Useful for model types
-    whose labels require non-candle data (e.g. adverse fills).
+    whose labels require non-candle data (e.g. adverse fills).  Otherwise
+    *feature_cache_dir* enables the feature store (see
+    :func:`assemble_dataset`).  *n_jobs* runs tuning trials and CV folds in
+    that many worker processes.
     """
     if dataset_path is not None:
         dataset = pd.read_parquet(dataset_path)
         logger.info("Loaded pre-built dataset from %s: %d rows", dataset_path, len(dataset))
     else:
-        dataset = assemble_dataset(exchange, pair, catalog_dir)
+        dataset = assemble_dataset(exchange, pair, catalog_dir, cache_dir=feature_cache_dir)
 
     tuning_result: dict[str, Any] | None = None
     lgb_params: dict[str, Any] | None = None
@@ -683,13 +900,13 @@ def train_and_evaluate(
     if tune:
         tuning_result = run_hyperparameter_tuning(
             dataset, model_type, n_windows=n_windows,
-            embargo_bars=embargo_bars, n_trials=n_trials, seed=seed,
+            embargo_bars=embargo_bars, n_trials=n_trials, seed=seed, n_jobs=n_jobs,
         )
         lgb_params = {**tuning_result["best_params"], "verbose": -1, "random_state": seed}
 
     cv_results = purged_walk_forward_cv(
         dataset, model_type, n_windows=n_windows,
-        embargo_bars=embargo_bars, purge=purge, lgb_params=lgb_params,
+        embargo_bars=embargo_bars, purge=purge, lgb_params=lgb_params, n_jobs=n_jobs,
     )
 
     if not cv_results:
@@ -788,6 +1005,11 @@ def main() -> None:
     parser.add_argument("--n-trials", type=int, default=50, help="Number of Optuna trials (default 50)")
     parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
     parser.add_argument("--dataset", default=None, help="Pre-built parquet path (bypasses assemble_dataset)")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for CV folds / tuning trials")
+    parser.add_argument(
+        "--feature-cache-dir", default=None,
+        help="Feature store directory; reuses assembled datasets across runs",
+    )
     args = parser.parse_args()
 
     metadata = train_and_evaluate(
@@ -803,6 +1025,8 @@ def main() -> None:
         n_trials=args.n_trials,
         seed=args.seed,
         dataset_path=args.dataset,
+        feature_cache_dir=args.feature_cache_dir,
+        n_jobs=args.jobs,
     )
     print(json.dumps(metadata, indent=2, default=str))
 
@@ -59,6 +59,7 @@ from controllers.tick_emitter import TickEmitter
 from controllers.types import ProcessedState
 from platform_lib.core.daily_state_store import DailyStateStore
 from platform_lib.core.utils import to_decimal
+from platform_lib.market_data.bar_disk_cache import disk_cache_from_env
 from simulation.config import PaperEngineConfig
 
 logger = logging.getLogger(__name__)
@@ -576,6 +577,7 @@ class SharedRuntimeKernel(FillHandlerMixin, RiskMixin, TelemetryMixin, AutoCalib
         self._history_seed_source = ""
         self._history_seed_bars = 0
         self._history_seed_latency_ms = 0.0
+        self._bar_disk_cache = disk_cache_from_env()
 
     # ── Tick loop ───────────────────────────────────────────────────────
 
@@ -19,7 +19,7 @@ from platform_lib.market_data.market_history_policy import runtime_seed_policy,
 from platform_lib.market_data.ccxt_ohlcv_bar_reader import ccxt_rest_bar_reader, _pair_to_ccxt_symbol
 from controllers.backtesting.data_store import resolve_data_path
 from platform_lib.market_data.market_history_provider_impl import MarketHistoryProviderImpl
-from platform_lib.market_data.market_history_types import MarketBarKey
+from platform_lib.market_data.market_history_types import MarketBar, MarketBarKey
 from platform_lib.core.utils import to_decimal
 
 logger = logging.getLogger(__name__)
@@ -180,20 +180,20 @@ class StartupMixin:
         self._history_seed_attempted = True
         started = _time_mod.perf_counter()
 
-        # --- Phase 1: parquet + API bridge (always attempted) -------------
-        parquet_seeded = self._try_seed_from_parquet(now)
-        if parquet_seeded:
-            self._history_seed_latency_ms = (_time_mod.perf_counter() - started) * 1000.0
-            return
-
-        # --- Phase 2: full REST fetch (fallback) --------------------------
-        rest_seeded = self._try_seed_from_rest(now)
-        if rest_seeded:
-            self._history_seed_latency_ms = (_time_mod.perf_counter() - started) * 1000.0
+        # With a local bar cache the whole seed runs under its per-key host
+        # lock: bots restarting together queue behind the first seeder and
+        # then read its bars from disk instead of re-fetching parquet/REST.
+        cache_key = self._bar_cache_key()
+        if cache_key is not None:
+            with self._bar_disk_cache.locked(cache_key):
+                seeded = self._seed_price_buffer_from_sources(now, cache_key)
+        else:
+            seeded = self._seed_price_buffer_from_sources(now, None)
+        self._history_seed_latency_ms = (_time_mod.perf_counter() - started) * 1000.0
+        if seeded:
             return
 
-        # --- Both paths failed — bot must NOT trade on empty indicators ---
-        self._history_seed_latency_ms = (_time_mod.perf_counter() - started) * 1000.0
+        # --- All paths failed — bot must NOT trade on empty indicators ---
         if self._history_seed_status not in ("rejected",):
             self._history_seed_status = "failed"
         logger.error(
@@ -206,6 +206,19 @@ class StartupMixin:
             getattr(self.config, "trading_pair", "?"),
         )
 
+    def _seed_price_buffer_from_sources(self, now: float, cache_key: MarketBarKey | None) -> bool:
+        # --- Phase 0: local bar cache + API bridge for the gap ------------
+        if cache_key is not None and self._try_seed_from_disk_cache(now, cache_key):
+            return True
+        # --- Phase 1: parquet + API bridge (always attempted) -------------
+        # --- Phase 2: full REST fetch (fallback) --------------------------
+        for seed in (self._try_seed_from_parquet, self._try_seed_from_rest):
+            if seed(now):
+                if cache_key is not None:
+                    self._persist_seed_bars(now, cache_key)
+                return True
+        return False
+
     def seed_ok(self) -> bool:
         """Return True only if the price buffer was seeded with gapless data."""
         return self._history_seed_status == "ok"
@@ -315,6 +328,87 @@ class StartupMixin:
         )
         return True
 
+    # ------------------------------------------------------------------
+    # Local 1m bar cache
+    # ------------------------------------------------------------------
+
+    def _bar_cache_key(self) -> MarketBarKey | None:
+        """Cache key for this controller's PriceBuffer bars, or None without a cache."""
+        if getattr(self, "_bar_disk_cache", None) is None:
+            return None
+        connector_name = _canonical_connector_name(str(getattr(self.config, "connector_name", "") or "").strip())
+        trading_pair = str(getattr(self.config, "trading_pair", "") or "").strip()
+        if not connector_name or not trading_pair:
+            return None
+        return MarketBarKey(connector_name=connector_name, trading_pair=trading_pair, bar_source="exchange_ohlcv")
+
+    def _try_seed_from_disk_cache(self, now: float, cache_key: MarketBarKey) -> bool:
+        """Seed from the local bar cache, bridging only the bars closed since its tail."""
+        import pandas as pd
+
+        bars_needed = self._required_seed_bars()
+        now_ms = int(now * 1000.0)
+        cached = self._bar_disk_cache.read(cache_key, bars_needed, end_ms=now_ms)
+        if len(cached) < bars_needed:
+            return False
+        df = pd.DataFrame(
+            [(int(b.bucket_start_ms), b.open, b.high, b.low, b.close) for b in cached],
+            columns=["timestamp_ms", "open", "high", "low", "close"],
+        )
+        last_cached_ts = int(cached[-1].bucket_start_ms)
+        gap_minutes = max(0, (now_ms - last_cached_ts) // 60_000)
+        source_label = "disk_cache"
+        if gap_minutes > 1:
+            try:
+                bridge_df = self._fetch_bridge_bars(
+                    cache_key.connector_name, cache_key.trading_pair, last_cached_ts - 5 * 60_000, now_ms,
+                )
+            except Exception as exc:
+                logger.debug("Bar cache bridge failed for %s: %s", cache_key.trading_pair, exc)
+                return False
+            if bridge_df is None or bridge_df.empty:
+                return False
+            combined = pd.concat([df, bridge_df[["timestamp_ms", "open", "high", "low", "close"]]], ignore_index=True)
+            combined = combined.drop_duplicates(subset=["timestamp_ms"], keep="last").sort_values("timestamp_ms")
+            df = combined.tail(bars_needed).reset_index(drop=True)
+            source_label = "disk_cache_bridge"
+        if not self._validate_and_seed(df, now_ms, source_label=source_label):
+            return False
+        self._persist_seed_bars(now, cache_key)
+        return True
+
+    def _persist_seed_bars(self, now: float, cache_key: MarketBarKey) -> None:
+        """Append the bars just seeded from exchange OHLCV to the local bar cache.
+
+        Called right after a successful seed, under *cache_key*'s cache lock,
+        when the buffer holds only exchange bars.  Live bars sampled into the
+        PriceBuffer afterwards are never persisted: they are built from polled
+        prices, not exchange candles, and the first one covers a partial
+        minute.  The exchange bucket still open at *now* is skipped too.
+        """
+        open_minute = int(now // 60) * 60
+        fresh: list[MarketBar] = []
+        for bar in self._price_buffer.bars_1m:
+            ts_minute = int(bar.ts_minute)
+            if ts_minute >= open_minute:
+                continue  # exchange candle not closed yet
+            fresh.append(MarketBar(
+                bucket_start_ms=ts_minute * 1000,
+                bar_interval_s=60,
+                open=bar.open,
+                high=bar.high,
+                low=bar.low,
+                close=bar.close,
+                is_closed=True,
+                bar_source=cache_key.bar_source,
+            ))
+        if not fresh:
+            return
+        try:
+            self._bar_disk_cache.append(cache_key, fresh, lock=False)
+        except Exception:
+            logger.debug("Bar cache append failed for %s", cache_key.trading_pair, exc_info=True)
+
     def _try_seed_from_parquet(self, now: float) -> bool:
         """Seed PriceBuffer from local parquet + API bridge for the gap.
 
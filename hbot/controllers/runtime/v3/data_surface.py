@@ -2,7 +2,9 @@
 
 The kernel still computes everything; this class provides a clean API
 boundary so that strategy code never touches private attributes.
-Snapshots are assembled once per tick and cached.
+Snapshots are assembled once per tick and cached.  Indicator values are
+computed only when a strategy reads them and memoised per PriceBuffer bar,
+so sub-second ticks within one bar share a single computation.
 """
 
 from __future__ import annotations
@@ -10,12 +12,16 @@ from __future__ import annotations
 import logging
 import time
 from decimal import Decimal
+from functools import partial
 from typing import Any
 
 from controllers.runtime.v3.types import (
+    DEFAULT_INDICATOR_SPEC,
     EquitySnapshot,
     FundingSnapshot,
     IndicatorSnapshot,
+    IndicatorSpec,
+    LazyIndicatorMap,
     MarketSnapshot,
     MlSnapshot,
     OrderBookSnapshot,
@@ -37,14 +43,20 @@ class KernelDataSurface:
         surface = KernelDataSurface(kernel)
         snap = surface.snapshot()  # assembled once per tick
         snap.mid                   # Decimal
-        snap.indicators.ema[20]    # Decimal
+        snap.indicators.ema[20]    # Decimal, computed on first access
         snap.regime.name           # str
+
+    *indicators* declares the periods the strategy reads (see
+    ``StrategyEntry.indicators``); it defaults to the full legacy set.
     """
 
-    def __init__(self, kernel: Any) -> None:
+    def __init__(self, kernel: Any, indicators: IndicatorSpec | None = None) -> None:
         self._kernel = kernel
+        self._indicator_spec = indicators if indicators is not None else DEFAULT_INDICATOR_SPEC
         self._cached_snapshot: MarketSnapshot | None = None
         self._cached_tick_id: int = -1
+        self._indicator_memo: dict[tuple[str, int], Decimal | None] = {}
+        self._indicator_memo_bar: int | None = None
 
     # ── Public API ────────────────────────────────────────────────────
 
@@ -66,6 +78,8 @@ class KernelDataSurface:
         """Force re-computation on next snapshot() call."""
         self._cached_snapshot = None
         self._cached_tick_id = -1
+        self._indicator_memo = {}
+        self._indicator_memo_bar = None
 
     @property
     def price_buffer(self) -> Any:
@@ -118,46 +132,15 @@ class KernelDataSurface:
         if pb is None:
             return IndicatorSnapshot()
 
-        ema_periods = [9, 20, 50, 100, 200]
-        atr_periods = [14]
-        rsi_periods = [14]
-        adx_periods = [14]
-
-        ema = {}
-        for p in ema_periods:
-            try:
-                val = pb.ema(p)
-                if val is not None:
-                    ema[p] = Decimal(str(val)) if not isinstance(val, Decimal) else val
-            except Exception:
-                pass
-
-        atr = {}
-        for p in atr_periods:
-            try:
-                val = pb.atr(p)
-                if val is not None:
-                    atr[p] = Decimal(str(val)) if not isinstance(val, Decimal) else val
-            except Exception:
-                pass
-
-        rsi = {}
-        for p in rsi_periods:
-            try:
-                val = pb.rsi(p)
-                if val is not None:
-                    rsi[p] = Decimal(str(val)) if not isinstance(val, Decimal) else val
-            except Exception:
-                pass
-
-        adx = {}
-        for p in adx_periods:
-            try:
-                val = pb.adx(p)
-                if val is not None:
-                    adx[p] = Decimal(str(val)) if not isinstance(val, Decimal) else val
-            except Exception:
-                pass
+        # PriceBuffer indicators only change when a bar is added, so values
+        # are shared by every tick until bar_count moves.  Buffers without an
+        # integer bar_count get a fresh memo per snapshot.
+        bar = getattr(pb, "bar_count", None)
+        if not isinstance(bar, int) or bar != self._indicator_memo_bar:
+            self._indicator_memo = {}
+            self._indicator_memo_bar = bar if isinstance(bar, int) else None
+        memo = self._indicator_memo
+        spec = self._indicator_spec
 
         band_pct = self._safe_decimal(k, "_band_pct_ewma", _ZERO)
         bars = 0
@@ -180,14 +163,34 @@ class KernelDataSurface:
                 pass
 
         return IndicatorSnapshot(
-            ema=ema,
-            atr=atr,
-            rsi=rsi,
-            adx=adx,
+            ema=LazyIndicatorMap(partial(self._indicator_value, pb, memo, "ema"), spec.ema),
+            atr=LazyIndicatorMap(partial(self._indicator_value, pb, memo, "atr"), spec.atr),
+            rsi=LazyIndicatorMap(partial(self._indicator_value, pb, memo, "rsi"), spec.rsi),
+            adx=LazyIndicatorMap(partial(self._indicator_value, pb, memo, "adx"), spec.adx),
             band_pct=band_pct,
             bars_available=bars,
         )
 
+    @staticmethod
+    def _indicator_value(
+        pb: Any,
+        memo: dict[tuple[str, int], Decimal | None],
+        name: str,
+        period: int,
+    ) -> Decimal | None:
+        key = (name, period)
+        if key in memo:
+            return memo[key]
+        val = None
+        try:
+            raw = getattr(pb, name)(period)
+            if raw is not None:
+                val = raw if isinstance(raw, Decimal) else Decimal(str(raw))
+        except Exception:
+            pass
+        memo[key] = val
+        return val
+
     def _build_order_book(self, k: Any) -> OrderBookSnapshot:
         bid = self._safe_decimal(k, "_last_book_bid", _ZERO)
         ask = self._safe_decimal(k, "_last_book_ask", _ZERO)
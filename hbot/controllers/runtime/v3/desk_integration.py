@@ -150,7 +150,7 @@ class V3DeskIntegration:
         from controllers.runtime.v3.risk.desk_risk_gate import DeskRiskGate
         from controllers.runtime.v3.risk.portfolio_gate import PortfolioRiskGate
         from controllers.runtime.v3.risk.signal_gate import SignalRiskGate
-        from controllers.runtime.v3.strategy_registry import load_strategy
+        from controllers.runtime.v3.strategy_registry import get_entry, load_strategy
         from controllers.runtime.v3.trading_desk import TradingDesk
 
         # Find the kernel controller from the legacy strategy
@@ -158,17 +158,21 @@ class V3DeskIntegration:
         if controller is None:
             raise RuntimeError("No active controller found in legacy strategy")
 
-        # Build data surface wrapping the existing kernel
-        surface = KernelDataSurface(controller)
-
-        # Build risk gate (reads thresholds from controller config)
-        risk_gate = self._build_risk_gate(controller)
+        # Build data surface wrapping the existing kernel, exposing only the
+        # indicators the registered strategy declares
+        indicators = None
+        if self._strategy_name:
+            indicators = get_entry(self._strategy_name).indicators
+        surface = KernelDataSurface(controller, indicators)
 
         # Resolve the instance name
         instance_name = os.getenv("INSTANCE_NAME", "")
         if not instance_name:
             instance_name = getattr(controller, "controller_id", "unknown")
 
+        # Build risk gate (reads thresholds from controller config)
+        risk_gate = self._build_risk_gate(controller, instance_name)
+
         # Build the strategy signal source
         if self._mode == "shadow" and self._bot_id:
             # Shadow mode: compare shim vs native
@@ -192,7 +196,6 @@ class V3DeskIntegration:
         # Resolve execution family
         execution_family = "mm_grid"
         if self._strategy_name:
-            from controllers.runtime.v3.strategy_registry import get_entry
             execution_family = get_entry(self._strategy_name).execution_family
 
         # Build the desk
@@ -228,7 +231,7 @@ class V3DeskIntegration:
             return next(iter(controllers.values()))
         return None
 
-    def _build_risk_gate(self, controller: Any) -> Any:
+    def _build_risk_gate(self, controller: Any, instance_name: str = "") -> Any:
         from controllers.runtime.v3.risk.bot_gate import BotRiskConfig, BotRiskGate
         from controllers.runtime.v3.risk.desk_risk_gate import DeskRiskGate
         from controllers.runtime.v3.risk.portfolio_gate import PortfolioRiskGate
@@ -260,7 +263,7 @@ class V3DeskIntegration:
             )
             regime_gate_enabled = bool(getattr(cfg, "regime_risk_gate_enabled", False))
 
-        # Portfolio gate uses Redis if bus client is available
+        # Portfolio gate subscribes to the risk stream via the bus client, if any
         redis_client = getattr(self._legacy, "_bus_client", None)
 
         # Regime gate: enforces regime-dependent constraints on strategy
@@ -280,7 +283,7 @@ class V3DeskIntegration:
             regime_gate = RegimeRiskGate(policy=policy)
 
         return DeskRiskGate(
-            portfolio=PortfolioRiskGate(redis_client=redis_client),
+            portfolio=PortfolioRiskGate(redis_client=redis_client, instance_name=instance_name),
             bot=BotRiskGate(bot_config),
             regime=regime_gate,
             signal=SignalRiskGate(signal_config),
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any
 
+from controllers.runtime.v3.risk.portfolio_subscription import (
+    PortfolioRiskSubscription,
+    get_portfolio_risk_subscription,
+)
 from controllers.runtime.v3.risk_types import RiskDecision
 from controllers.runtime.v3.signals import TradingSignal
 from controllers.runtime.v3.types import MarketSnapshot
@@ -16,15 +19,29 @@ logger = logging.getLogger(__name__)
 class PortfolioRiskGate:
     """Layer 1: Cross-bot portfolio risk.
 
-    Reads PORTFOLIO_RISK_STREAM from Redis.  When a breach is detected,
-    hard-stops all signal processing.
+    Reads breaches latched by the process-wide
+    :class:`~controllers.runtime.v3.risk.portfolio_subscription.PortfolioRiskSubscription`,
+    which tails PORTFOLIO_RISK_STREAM in a background thread.  ``evaluate``
+    does no I/O.  When a breach scoped to this bot is seen, hard-stops all
+    signal processing until :meth:`reset`.
     """
 
-    def __init__(self, redis_client: Any = None) -> None:
-        self._redis = redis_client
+    def __init__(
+        self,
+        redis_client: Any = None,
+        *,
+        subscription: PortfolioRiskSubscription | None = None,
+        instance_name: str = "",
+    ) -> None:
+        if subscription is None and redis_client is not None:
+            try:
+                subscription = get_portfolio_risk_subscription(redis_client)
+            except Exception as e:
+                logger.warning("Portfolio risk subscription unavailable: %s", e)
+        self._subscription = subscription
+        self._instance_name = instance_name
         self._hard_stop_latched: bool = False
-        self._last_check_ts: float = 0.0
-        self._check_interval_s: float = 1.0
+        self._acked_seq: int = 0
 
     def evaluate(
         self,
@@ -34,47 +51,29 @@ class PortfolioRiskGate:
         if self._hard_stop_latched:
             return RiskDecision.reject("portfolio", "portfolio_hard_stop_latched")
 
-        now = time.time()
-        if now - self._last_check_ts < self._check_interval_s:
-            return RiskDecision.approve("portfolio")
-
-        self._last_check_ts = now
-
-        if self._redis is not None:
-            try:
-                breach = self._check_redis_stream()
-                if breach:
-                    self._hard_stop_latched = True
-                    logger.warning("Portfolio risk breach detected: %s", breach)
-                    return RiskDecision.reject(
-                        "portfolio",
-                        "portfolio_breach",
-                        breach_detail=breach,
-                    )
-            except Exception as e:
-                logger.debug("Portfolio risk check failed: %s", e)
+        breach = self._subscription.breach if self._subscription is not None else None
+        if breach is not None and breach.seq > self._acked_seq and breach.applies_to(self._instance_name):
+            self._hard_stop_latched = True
+            self._acked_seq = breach.seq
+            logger.warning("Portfolio risk breach detected: %s", breach.reason)
+            return RiskDecision.reject(
+                "portfolio",
+                "portfolio_breach",
+                breach_detail=breach.reason,
+                reaction_latency_ms=breach.reaction_latency_ms,
+            )
 
         return RiskDecision.approve("portfolio")
 
-    def _check_redis_stream(self) -> str:
-        """Check PORTFOLIO_RISK_STREAM for breach events. Returns reason or empty."""
-        from platform_lib.contracts.stream_names import PORTFOLIO_RISK_STREAM
-
-        try:
-            entries = self._redis.read_latest(PORTFOLIO_RISK_STREAM, count=1)
-            if entries:
-                for _stream, messages in entries:
-                    for _msg_id, data in messages:
-                        action = data.get("action", "")
-                        if action in ("hard_stop", "emergency_stop"):
-                            return data.get("reason", action)
-        except Exception:
-            pass
-        return ""
-
     def reset(self) -> None:
-        """Clear latched hard-stop (manual recovery)."""
+        """Clear latched hard-stop (manual recovery).
+
+        Breaches already seen stay acknowledged; only a new one re-latches.
+        """
         self._hard_stop_latched = False
+        breach = self._subscription.breach if self._subscription is not None else None
+        if breach is not None:
+            self._acked_seq = breach.seq
 
 
 __all__ = ["PortfolioRiskGate"]
@@ -0,0 +1,250 @@
+"""Process-wide push subscription to PORTFOLIO_RISK_STREAM.
+
+One daemon thread per (client, stream) tails the portfolio risk stream
+with a blocking XREAD and latches breaches in memory.  Every
+``PortfolioRiskGate`` in the process reads that latch, so gate evaluation
+on the tick thread does no Redis I/O and sees a breach as soon as the
+subscriber thread wakes up rather than at the next poll interval.
+
+Breach payloads are the ``portfolio_risk_snapshot`` events published by
+``portfolio_risk_service`` (``portfolio_action == "kill_switch"``); the
+legacy ``action`` values ``hard_stop`` / ``emergency_stop`` are accepted
+too.  Reaction latency (publish ``timestamp_ms`` → latch) is recorded per
+breach and exposed through :meth:`PortfolioRiskSubscription.stats`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_BREACH_ACTIONS = frozenset({"kill_switch", "hard_stop", "emergency_stop"})
+
+
+@dataclass(frozen=True)
+class PortfolioBreach:
+    """One latched portfolio breach."""
+
+    seq: int
+    reason: str
+    entry_id: str
+    published_ms: int
+    latched_ms: int
+    scope: frozenset[str] = frozenset()
+
+    @property
+    def reaction_latency_ms(self) -> float:
+        """Publish → latch latency; 0 when the payload carried no timestamp."""
+        if self.published_ms <= 0:
+            return 0.0
+        return float(max(0, self.latched_ms - self.published_ms))
+
+    def applies_to(self, instance_name: str) -> bool:
+        """An empty scope (or unnamed bot) means the breach is global."""
+        return not self.scope or not instance_name or instance_name in self.scope
+
+
+def parse_breach(payload: dict[str, Any]) -> tuple[str, frozenset[str]] | None:
+    """Return ``(reason, scope)`` when *payload* is a breach, else None."""
+    action = str(payload.get("portfolio_action") or payload.get("action") or "")
+    if action not in _BREACH_ACTIONS:
+        return None
+    scope_raw = payload.get("risk_scope_bots", [])
+    scope = frozenset(str(x) for x in scope_raw) if isinstance(scope_raw, list) else frozenset()
+    return str(payload.get("reason") or action), scope
+
+
+class PortfolioRiskSubscription:
+    """Background tail of the portfolio risk stream with an in-memory breach latch.
+
+    ``redis_client`` must provide ``read_latest(stream)``, ``ping()`` and
+    ``read_after(stream, last_id, count=..., block_ms=...)`` (see
+    ``services.hb_bridge.redis_client.RedisStreamClient``, whose
+    ``read_after`` blocks on this thread over its own connection rather
+    than the client's shared I/O executor).  On start the
+    latest entry is checked once so a breach published shortly before the
+    process came up (within ``max_age_s``) still latches.  Tailing resumes
+    after that entry, or from ``0-0`` when the stream is empty, so nothing
+    written between the seed and the first blocking read is skipped; while
+    Redis is unreachable the seed is retried rather than guessed.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        stream: str,
+        *,
+        block_ms: int = 1000,
+        max_age_s: float = 300.0,
+        idle_backoff_s: float = 0.5,
+    ) -> None:
+        self._redis = redis_client
+        self._stream = stream
+        self._block_ms = block_ms
+        self._max_age_s = max_age_s
+        self._idle_backoff_s = idle_backoff_s
+        self._breach: PortfolioBreach | None = None
+        self._seq = 0
+        self._last_id = "0-0"
+        self._events_seen = 0
+        self._latency_samples: list[float] = []
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    # ── Lifecycle ─────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="portfolio-risk-sub",
+            )
+            self._thread.start()
+
+    def stop(self, timeout_s: float = 2.0) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout_s)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ── Tick-thread reads (no I/O) ────────────────────────────────────
+
+    @property
+    def breach(self) -> PortfolioBreach | None:
+        """Most recent latched breach (a single attribute read)."""
+        return self._breach
+
+    def stats(self) -> dict[str, Any]:
+        samples = list(self._latency_samples)
+        breach = self._breach
+        return {
+            "running": self.running,
+            "events_seen": self._events_seen,
+            "breach_count": self._seq,
+            "last_breach_reason": breach.reason if breach is not None else "",
+            "reaction_latency_last_ms": samples[-1] if samples else 0.0,
+            "reaction_latency_max_ms": max(samples) if samples else 0.0,
+        }
+
+    # ── Subscriber thread ─────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while not self._stop.is_set() and not self._seed_from_latest():
+            self._stop.wait(self._idle_backoff_s)
+        while not self._stop.is_set():
+            t0 = time.monotonic()
+            try:
+                entries = self._redis.read_after(
+                    self._stream, self._last_id, count=100, block_ms=self._block_ms,
+                )
+            except Exception:
+                logger.debug("Portfolio risk subscription read failed", exc_info=True)
+                entries = []
+            for entry_id, payload in entries:
+                self._last_id = entry_id
+                self.on_entry(entry_id, payload)
+            # The client returns immediately while Redis is down; avoid spinning.
+            if not entries and time.monotonic() - t0 < self._block_ms / 1000.0 / 2:
+                self._stop.wait(self._idle_backoff_s)
+
+    def _seed_from_latest(self) -> bool:
+        """Position the tail after the latest entry; False when Redis could not be read."""
+        try:
+            latest = self._redis.read_latest(self._stream)
+            # read_latest returns None both for an empty stream and a failed read.
+            if not latest and not self._redis.ping():
+                return False
+        except Exception:
+            logger.debug("Portfolio risk subscription seed failed", exc_info=True)
+            return False
+        if not latest:
+            self._last_id = "0-0"
+            return True
+        entry_id, payload = latest
+        self._last_id = entry_id
+        published_ms = int(payload.get("timestamp_ms") or 0)
+        if published_ms > 0 and time.time() - published_ms / 1000.0 > self._max_age_s:
+            return True
+        self.on_entry(entry_id, payload)
+        return True
+
+    def on_entry(self, entry_id: str, payload: dict[str, Any]) -> PortfolioBreach | None:
+        """Process one stream entry; latches and returns a breach if it is one."""
+        self._events_seen += 1
+        parsed = parse_breach(payload)
+        if parsed is None:
+            return None
+        reason, scope = parsed
+        self._seq += 1
+        breach = PortfolioBreach(
+            seq=self._seq,
+            reason=reason,
+            entry_id=str(entry_id),
+            published_ms=int(payload.get("timestamp_ms") or 0),
+            latched_ms=int(time.time() * 1000),
+            scope=scope,
+        )
+        self._breach = breach
+        self._latency_samples.append(breach.reaction_latency_ms)
+        if len(self._latency_samples) > 200:
+            self._latency_samples = self._latency_samples[-200:]
+        logger.warning(
+            "Portfolio risk breach latched: %s (entry=%s, reaction=%.0fms)",
+            reason, entry_id, breach.reaction_latency_ms,
+        )
+        return breach
+
+
+# ── Process-wide registry ────────────────────────────────────────────
+
+_subscriptions: dict[tuple[int, str], PortfolioRiskSubscription] = {}
+_registry_lock = threading.Lock()
+
+
+def get_portfolio_risk_subscription(
+    redis_client: Any,
+    stream: str | None = None,
+) -> PortfolioRiskSubscription:
+    """Return the started subscription shared by every gate using *redis_client*."""
+    if stream is None:
+        from platform_lib.contracts.stream_names import PORTFOLIO_RISK_STREAM
+        stream = PORTFOLIO_RISK_STREAM
+    key = (id(redis_client), stream)
+    with _registry_lock:
+        sub = _subscriptions.get(key)
+        if sub is None:
+            sub = PortfolioRiskSubscription(redis_client, stream)
+            _subscriptions[key] = sub
+    sub.start()
+    return sub
+
+
+def stop_all_subscriptions() -> None:
+    """Stop and forget every shared subscription (shutdown / tests)."""
+    with _registry_lock:
+        subs = list(_subscriptions.values())
+        _subscriptions.clear()
+    for sub in subs:
+        sub.stop()
+
+
+__all__ = [
+    "PortfolioBreach",
+    "PortfolioRiskSubscription",
+    "get_portfolio_risk_subscription",
+    "parse_breach",
+    "stop_all_subscriptions",
+]
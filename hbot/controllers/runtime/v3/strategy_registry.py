@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from controllers.runtime.v3.protocols import StrategySignalSource
+from controllers.runtime.v3.types import DEFAULT_INDICATOR_SPEC, IndicatorSpec
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,12 @@ class StrategyEntry:
     bool_attrs: tuple[str, ...] = ()
     """Config attributes that should be hydrated as bool."""
 
+    indicators: IndicatorSpec = DEFAULT_INDICATOR_SPEC
+    """Indicator periods the signal source and its execution adapter read.
+
+    Only these are exposed by the snapshot; values are computed on access.
+    """
+
 
 # ── Registry ─────────────────────────────────────────────────────────
 # Entries are added as bots are migrated (Phases 9-12).
@@ -60,6 +67,7 @@ STRATEGY_REGISTRY: dict[str, StrategyEntry] = {
         decimal_attrs=("min_spread_pct", "quote_size_pct"),
         int_attrs=("levels",),
         bool_attrs=("edge_gate_enabled",),
+        indicators=IndicatorSpec(),
     ),
 
     # Phase 10: Bot7 migration
@@ -78,6 +86,7 @@ STRATEGY_REGISTRY: dict[str, StrategyEntry] = {
         ),
         int_attrs=("bb_period", "rsi_period", "adx_period", "atr_period", "max_grid_legs", "trend_sma_period"),
         bool_attrs=("session_filter_enabled",),
+        indicators=IndicatorSpec(ema=(20,), atr=(14,), rsi=(14,), adx=(14,)),
     ),
 
     # Phase 11: Bot5 migration
@@ -92,6 +101,7 @@ STRATEGY_REGISTRY: dict[str, StrategyEntry] = {
             "bias_threshold", "directional_threshold",
             "target_net_base_pct", "max_base_pct",
         ),
+        indicators=IndicatorSpec(ema=(20,)),
     ),
 
     # Phase 12: Bot6 migration
@@ -107,6 +117,7 @@ STRATEGY_REGISTRY: dict[str, StrategyEntry] = {
             "dynamic_size_cap_mult", "per_leg_risk_pct", "spread_pct",
         ),
         int_attrs=("sma_fast_period", "sma_slow_period", "adx_period", "signal_score_threshold"),
+        indicators=IndicatorSpec(ema=(20, 60), atr=(14,), adx=(14,)),
     ),
 
     # Bot7 ML signal-driven strategy
@@ -122,6 +133,7 @@ STRATEGY_REGISTRY: dict[str, StrategyEntry] = {
         ),
         int_attrs=("max_levels",),
         bool_attrs=("use_ml_sizing",),
+        indicators=IndicatorSpec(),
     ),
 }
 
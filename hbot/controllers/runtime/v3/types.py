@@ -7,6 +7,7 @@ once per tick from the existing kernel internals.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any
@@ -17,20 +18,79 @@ _ZERO = Decimal("0")
 
 # ── Indicator snapshot ───────────────────────────────────────────────
 
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """Indicator periods a strategy reads from its snapshot.
+
+    Declared in ``strategy_registry`` so the data surface only exposes what
+    a strategy uses.
+    """
+
+    ema: tuple[int, ...] = ()
+    atr: tuple[int, ...] = ()
+    rsi: tuple[int, ...] = ()
+    adx: tuple[int, ...] = ()
+
+
+DEFAULT_INDICATOR_SPEC = IndicatorSpec(
+    ema=(9, 20, 50, 100, 200),
+    atr=(14,),
+    rsi=(14,),
+    adx=(14,),
+)
+"""Periods exposed when no declaration is given (legacy and shim strategies)."""
+
+
+class LazyIndicatorMap(Mapping[int, Decimal]):
+    """Read-only ``{period: value}`` mapping computed on first access.
+
+    The declared *periods* are the mapping's keys for iteration, ``len`` and
+    equality.  Other periods are still served through *compute* so config
+    overrides of a period keep working.  ``compute`` returns None while an
+    indicator is warming up, which is reported as a missing key.  It is
+    expected to memoise; the map itself holds no values.
+    """
+
+    __slots__ = ("_compute", "_periods")
+
+    def __init__(self, compute: Callable[[int], Decimal | None], periods: Iterable[int] = ()) -> None:
+        self._compute = compute
+        self._periods = tuple(periods)
+
+    def __getitem__(self, period: int) -> Decimal:
+        value = self._compute(period)
+        if value is None:
+            raise KeyError(period)
+        return value
+
+    def __iter__(self) -> Iterator[int]:
+        return (p for p in self._periods if self._compute(p) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LazyIndicatorMap({dict(self)!r})"
+
+
 @dataclass(frozen=True)
 class IndicatorSnapshot:
-    """Pre-computed technical indicators from PriceBuffer."""
+    """Technical indicators from PriceBuffer.
+
+    The per-period maps may be plain dicts or :class:`LazyIndicatorMap`
+    views that compute a value only when a strategy reads it.
+    """
 
-    ema: dict[int, Decimal] = field(default_factory=dict)
+    ema: Mapping[int, Decimal] = field(default_factory=dict)
     """EMA values keyed by period (e.g. {20: Decimal("65123.4")})."""
 
-    atr: dict[int, Decimal] = field(default_factory=dict)
+    atr: Mapping[int, Decimal] = field(default_factory=dict)
     """ATR values keyed by period."""
 
-    rsi: dict[int, Decimal] = field(default_factory=dict)
+    rsi: Mapping[int, Decimal] = field(default_factory=dict)
     """RSI values keyed by period."""
 
-    adx: dict[int, Decimal] = field(default_factory=dict)
+    adx: Mapping[int, Decimal] = field(default_factory=dict)
     """ADX values keyed by period."""
 
     bb_lower: Decimal = _ZERO
@@ -196,9 +256,12 @@ class MarketSnapshot:
 
 
 __all__ = [
+    "DEFAULT_INDICATOR_SPEC",
     "EquitySnapshot",
     "FundingSnapshot",
     "IndicatorSnapshot",
+    "IndicatorSpec",
+    "LazyIndicatorMap",
     "MarketSnapshot",
     "MlSnapshot",
     "OrderBookSnapshot",
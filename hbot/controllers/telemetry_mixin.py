@@ -10,7 +10,9 @@ import logging
 import math
 import os
 import time as _time_mod
+from collections.abc import Callable
 from decimal import Decimal
+from operator import attrgetter, methodcaller
 from typing import TYPE_CHECKING, Any
 
 from controllers.ops_guard import GuardState
@@ -24,6 +26,7 @@ if TYPE_CHECKING:
         SpreadEdgeState,
     )
 
+from controllers.tick_record import TickRecord, TickSchema
 from controllers.tick_types import TickSnapshot
 
 try:
@@ -58,19 +61,244 @@ _SUB_MINUTE_INTERVAL_S = float(os.environ.get("TELEMETRY_SUB_MINUTE_INTERVAL_S",
 
 
 def _sanitize_floats(obj: Any, _key: str = "") -> Any:
-    """Recursively replace NaN/Inf floats with 0.0 to prevent invalid JSON."""
+    """Replace NaN/Inf floats with 0.0 to prevent invalid JSON.
+
+    Containers are copied only along the path to a substituted value; a
+    payload with nothing to fix is returned as-is without allocating.
+    """
     if isinstance(obj, float):
         if not math.isfinite(obj):
             logger.warning("Non-finite gauge value substituted with 0.0 (key=%s, value=%s)", _key, obj)
             return 0.0
         return obj
     if isinstance(obj, dict):
-        return {k: _sanitize_floats(v, _key=k) for k, v in obj.items()}
+        out: dict[Any, Any] | None = None
+        for k, v in obj.items():
+            clean = _sanitize_floats(v, _key=k)
+            if clean is not v:
+                if out is None:
+                    out = dict(obj)
+                out[k] = clean
+        return obj if out is None else out
     if isinstance(obj, list):
-        return [_sanitize_floats(v, _key=_key) for v in obj]
+        items: list[Any] | None = None
+        for idx, v in enumerate(obj):
+            clean = _sanitize_floats(v, _key=_key)
+            if clean is not v:
+                if items is None:
+                    items = list(obj)
+                items[idx] = clean
+        return obj if items is None else items
     return obj
 
 
+# ---------------------------------------------------------------------------
+# Tick snapshot schema
+# ---------------------------------------------------------------------------
+# Declared once; ``_build_tick_snapshot`` refreshes a reused ``TickRecord``
+# from it every tick instead of assembling a new dict.
+
+def _quote_geometry_field(name: str) -> Callable[[Any], Any]:
+    def _extract(ctrl: Any) -> Any:
+        geometry = getattr(getattr(ctrl, "_last_spread_state", None), "quote_geometry", None)
+        return getattr(geometry, name) if geometry is not None else _ZERO
+    return _extract
+
+
+def _reason_counts_json(attr: str) -> Callable[[Any], str]:
+    """Serialise a reason-count dict, re-encoding only when its contents changed."""
+    cache_attr = f"{attr}_json_cache"
+
+    def _extract(ctrl: Any) -> str:
+        counts = getattr(ctrl, attr)
+        cached = ctrl.__dict__.get(cache_attr)
+        if cached is not None and cached[0] == counts:
+            return cached[1]
+        text = (
+            _orjson.dumps(counts, option=_orjson.OPT_SORT_KEYS).decode()
+            if _orjson is not None
+            else json.dumps(counts, sort_keys=True)
+        )
+        setattr(ctrl, cache_attr, (dict(counts), text))
+        return text
+    return _extract
+
+
+def _adverse_fill_active(ctrl: Any) -> bool:
+    return ctrl._adverse_fill_count >= ctrl.config.adverse_fill_count_threshold and ctrl._fill_edge_ewma is not None
+
+
+_attr = attrgetter
+_call = methodcaller
+
+_TICK_SCHEMA = TickSchema({
+    "runtime_family": None,
+    "spread_multiplier": lambda c: c.config.adverse_fill_spread_multiplier if _adverse_fill_active(c) else _ONE,
+    "spread_floor_pct": _attr("_spread_floor_pct"),
+    "base_spread_pct": _quote_geometry_field("base_spread_pct"),
+    "reservation_price_adjustment_pct": _quote_geometry_field("reservation_price_adjustment_pct"),
+    "inventory_skew_pct": _quote_geometry_field("inventory_skew"),
+    "alpha_skew_pct": _quote_geometry_field("alpha_skew"),
+    "inventory_urgency_pct": _attr("_inventory_urgency_score"),
+    "adaptive_effective_min_edge_pct": _attr("_adaptive_effective_min_edge_pct"),
+    "adaptive_fill_age_s": _attr("_adaptive_fill_age_s"),
+    "adaptive_market_spread_bps_ewma": _attr("_market_spread_bps_ewma"),
+    "adaptive_band_pct_ewma": _attr("_band_pct_ewma"),
+    "adaptive_market_floor_pct": _attr("_adaptive_market_floor_pct"),
+    "adaptive_vol_ratio": _attr("_adaptive_vol_ratio"),
+    "pnl_governor_active": _attr("_pnl_governor_active"),
+    "pnl_governor_day_progress": _attr("_pnl_governor_day_progress"),
+    "pnl_governor_target_pnl_pct": _attr("_pnl_governor_target_pnl_pct"),
+    "pnl_governor_target_pnl_quote": _attr("_pnl_governor_target_pnl_quote"),
+    "pnl_governor_expected_pnl_quote": _attr("_pnl_governor_expected_pnl_quote"),
+    "pnl_governor_actual_pnl_quote": _attr("_pnl_governor_actual_pnl_quote"),
+    "pnl_governor_deficit_ratio": _attr("_pnl_governor_deficit_ratio"),
+    "pnl_governor_edge_relax_bps": _attr("_pnl_governor_edge_relax_bps"),
+    "pnl_governor_size_mult": _attr("_pnl_governor_size_mult"),
+    "pnl_governor_size_boost_active": _attr("_pnl_governor_size_boost_active"),
+    "pnl_governor_activation_reason": _attr("_pnl_governor_activation_reason"),
+    "pnl_governor_size_boost_reason": _attr("_pnl_governor_size_boost_reason"),
+    "pnl_governor_activation_reason_counts": _reason_counts_json("_pnl_governor_activation_reason_counts"),
+    "pnl_governor_size_boost_reason_counts": _reason_counts_json("_pnl_governor_size_boost_reason_counts"),
+    "pnl_governor_target_mode": _attr("_pnl_governor_target_mode"),
+    "pnl_governor_target_source": _attr("_pnl_governor_target_source"),
+    "pnl_governor_target_equity_open_quote": _attr("_pnl_governor_target_equity_open_quote"),
+    "pnl_governor_target_effective_pct": _attr("_pnl_governor_target_effective_pct"),
+    "pnl_governor_size_mult_applied": _attr("_runtime_size_mult_applied"),
+    "spread_competitiveness_cap_active": _attr("_spread_competitiveness_cap_active"),
+    "spread_competitiveness_cap_side_pct": _attr("_spread_competitiveness_cap_side_pct"),
+    "soft_pause_edge": _attr("_soft_pause_edge"),
+    "edge_gate_blocked": _attr("_edge_gate_blocked"),
+    "selective_quote_state": _attr("_selective_quote_state"),
+    "selective_quote_score": _attr("_selective_quote_score"),
+    "selective_quote_reason": _attr("_selective_quote_reason"),
+    "selective_quote_adverse_ratio": _attr("_selective_quote_adverse_ratio"),
+    "selective_quote_slippage_p95_bps": _attr("_selective_quote_slippage_p95_bps"),
+    "alpha_policy_state": _attr("_alpha_policy_state"),
+    "alpha_policy_reason": _attr("_alpha_policy_reason"),
+    "alpha_maker_score": _attr("_alpha_maker_score"),
+    "alpha_aggressive_score": _attr("_alpha_aggressive_score"),
+    "alpha_cross_allowed": _attr("_alpha_cross_allowed"),
+    "adverse_fill_soft_pause_active": _call("_adverse_fill_soft_pause_active"),
+    "edge_confidence_soft_pause_active": _call("_edge_confidence_soft_pause_active"),
+    "slippage_soft_pause_active": _call("_slippage_soft_pause_active"),
+    "fills_count_today": _attr("_fills_count_today"),
+    "fees_paid_today_quote": _attr("_fees_paid_today_quote"),
+    "paper_fill_count": _attr("_paper_fill_count"),
+    "paper_reject_count": _attr("_paper_reject_count"),
+    "paper_avg_queue_delay_ms": _attr("_paper_avg_queue_delay_ms"),
+    "traded_notional_today": _attr("_traded_notional_today"),
+    "daily_equity_open": _attr("_daily_equity_open"),
+    "external_soft_pause": _attr("_external_soft_pause"),
+    "external_pause_reason": _attr("_external_pause_reason"),
+    "external_model_version": _attr("_last_external_model_version"),
+    "external_intent_reason": _attr("_last_external_intent_reason"),
+    "external_daily_pnl_target_pct_override": _attr("_external_daily_pnl_target_pct_override"),
+    "external_daily_pnl_target_pct_override_expires_ts": _attr("_external_daily_pnl_target_pct_override_expires_ts"),
+    "fee_source": _attr("_fee_source"),
+    "maker_fee_pct": _attr("_maker_fee_pct"),
+    "taker_fee_pct": _attr("_taker_fee_pct"),
+    "balance_read_failed": _attr("_runtime_adapter.balance_read_failed"),
+    "funding_rate": _attr("_funding_rate"),
+    "funding_cost_today_quote": _attr("_funding_cost_today_quote"),
+    "net_realized_pnl_today": lambda c: c._realized_pnl_today - c._funding_cost_today_quote,
+    "margin_ratio": _attr("_margin_ratio"),
+    "regime_source": _attr("_regime_source"),
+    "is_perp": _attr("_is_perp"),
+    "realized_pnl_today": _attr("_realized_pnl_today"),
+    "avg_entry_price": _attr("_avg_entry_price"),
+    "avg_entry_price_long": _attr("_avg_entry_price_long"),
+    "avg_entry_price_short": _attr("_avg_entry_price_short"),
+    "position_base": _attr("_position_base"),
+    "position_gross_base": _attr("_position_gross_base"),
+    "position_long_base": _attr("_position_long_base"),
+    "position_short_base": _attr("_position_short_base"),
+    "derisk_force_taker_min_base": _call("_derisk_force_min_base_amount"),
+    "derisk_force_taker_expectancy_guard_blocked": lambda c: bool(
+        getattr(c, "_derisk_force_taker_expectancy_guard_blocked", False)
+    ),
+    "derisk_force_taker_expectancy_guard_reason": lambda c: str(
+        getattr(c, "_derisk_force_taker_expectancy_guard_reason", "")
+    ),
+    "derisk_force_taker_expectancy_mean_quote": lambda c: to_decimal(
+        getattr(c, "_derisk_force_taker_expectancy_mean_quote", _ZERO)
+    ),
+    "derisk_force_taker_expectancy_taker_fills": lambda c: int(
+        getattr(c, "_derisk_force_taker_expectancy_taker_fills", 0)
+    ),
+    "position_drift_pct": _attr("_position_drift_pct"),
+    "fill_edge_ewma": _attr("_fill_edge_ewma"),
+    "adverse_fill_active": _adverse_fill_active,
+    "ws_reconnect_count": _attr("_ws_reconnect_count"),
+    "connector_status": lambda c: c._runtime_adapter.status_summary(),
+    "ob_imbalance": _attr("_ob_imbalance"),
+    "kelly_size_active": lambda c: c._fill_count_for_kelly >= c.config.kelly_min_observations and c.config.use_kelly_sizing,
+    "kelly_order_quote": None,
+    "ml_regime_override": lambda c: c._external_regime_override or "",
+    "adverse_skip_count": _attr("_adverse_skip_count"),
+    "indicator_duration_ms": _attr("_indicator_duration_ms"),
+    "connector_io_duration_ms": _attr("_connector_io_duration_ms"),
+    "min_base_pct": _attr("config.min_base_pct"),
+    "max_base_pct": _attr("config.max_base_pct"),
+    "max_total_notional_quote": _attr("config.max_total_notional_quote"),
+    "max_daily_turnover_x_hard": _attr("config.max_daily_turnover_x_hard"),
+    "max_daily_loss_pct_hard": _attr("config.max_daily_loss_pct_hard"),
+    "max_drawdown_pct_hard": _attr("config.max_drawdown_pct_hard"),
+    "margin_ratio_soft_pause_pct": _attr("config.margin_ratio_soft_pause_pct"),
+    "margin_ratio_hard_stop_pct": _attr("config.margin_ratio_hard_stop_pct"),
+    "position_drift_soft_pause_pct": _attr("config.position_drift_soft_pause_pct"),
+    "variant": _attr("config.variant"),
+    "bot_mode": _attr("config.bot_mode"),
+    "is_paper": lambda c: _config_is_paper_check(c.config),
+    "connector_name": _attr("config.connector_name"),
+    "trading_pair": _attr("config.trading_pair"),
+})
+
+
+# Snapshot fields copied verbatim into ``processed_data`` each tick.
+_PROCESSED_FROM_SNAPSHOT: tuple[str, ...] = (
+    "adverse_fill_soft_pause_active",
+    "edge_confidence_soft_pause_active",
+    "slippage_soft_pause_active",
+    "adaptive_effective_min_edge_pct",
+    "adaptive_fill_age_s",
+    "adaptive_market_spread_bps_ewma",
+    "adaptive_band_pct_ewma",
+    "adaptive_market_floor_pct",
+    "adaptive_vol_ratio",
+    "pnl_governor_active",
+    "pnl_governor_day_progress",
+    "pnl_governor_target_pnl_pct",
+    "pnl_governor_target_pnl_quote",
+    "pnl_governor_expected_pnl_quote",
+    "pnl_governor_actual_pnl_quote",
+    "pnl_governor_deficit_ratio",
+    "pnl_governor_edge_relax_bps",
+    "pnl_governor_size_mult",
+    "pnl_governor_size_boost_active",
+    "pnl_governor_activation_reason",
+    "pnl_governor_size_boost_reason",
+    "pnl_governor_activation_reason_counts",
+    "pnl_governor_size_boost_reason_counts",
+    "derisk_force_taker_min_base",
+    "derisk_force_taker_expectancy_guard_blocked",
+    "derisk_force_taker_expectancy_guard_reason",
+    "derisk_force_taker_expectancy_mean_quote",
+    "derisk_force_taker_expectancy_taker_fills",
+    "selective_quote_state",
+    "selective_quote_score",
+    "selective_quote_reason",
+    "selective_quote_adverse_ratio",
+    "selective_quote_slippage_p95_bps",
+    "alpha_policy_state",
+    "alpha_policy_reason",
+    "alpha_maker_score",
+    "alpha_aggressive_score",
+    "alpha_cross_allowed",
+    "inventory_urgency_pct",
+)
+
+
 class TelemetryMixin:
     """Mixin providing telemetry emission methods for SharedRuntimeKernel."""
 
@@ -279,7 +507,7 @@ class TelemetryMixin:
         self._publish_bot_minute_snapshot_telemetry(event_ts, refreshed)
 
     def _build_tick_snapshot(self, equity_quote: Decimal) -> TickSnapshot:
-        """Gather controller-level state into a snapshot dict for TickEmitter."""
+        """Refresh this controller's reusable ``TickRecord`` from ``_TICK_SCHEMA``."""
         adapter_stats: dict[str, Any] = {}
         connector = self._connector()
         if connector is not None and hasattr(connector, "paper_stats"):
@@ -300,147 +528,13 @@ class TelemetryMixin:
         else:
             runtime_family = "unknown"
 
-        return {
-            "runtime_family": runtime_family,
-            "spread_multiplier": self.config.adverse_fill_spread_multiplier if (
-                self._adverse_fill_count >= self.config.adverse_fill_count_threshold
-                and self._fill_edge_ewma is not None
-            ) else _ONE,
-            "spread_floor_pct": self._spread_floor_pct,
-            "base_spread_pct": getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None).base_spread_pct
-            if getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None) is not None
-            else _ZERO,
-            "reservation_price_adjustment_pct": getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None).reservation_price_adjustment_pct
-            if getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None) is not None
-            else _ZERO,
-            "inventory_skew_pct": getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None).inventory_skew
-            if getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None) is not None
-            else _ZERO,
-            "alpha_skew_pct": getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None).alpha_skew
-            if getattr(getattr(self, "_last_spread_state", None), "quote_geometry", None) is not None
-            else _ZERO,
-            "inventory_urgency_pct": self._inventory_urgency_score,
-            "adaptive_effective_min_edge_pct": self._adaptive_effective_min_edge_pct,
-            "adaptive_fill_age_s": self._adaptive_fill_age_s,
-            "adaptive_market_spread_bps_ewma": self._market_spread_bps_ewma,
-            "adaptive_band_pct_ewma": self._band_pct_ewma,
-            "adaptive_market_floor_pct": self._adaptive_market_floor_pct,
-            "adaptive_vol_ratio": self._adaptive_vol_ratio,
-            "pnl_governor_active": self._pnl_governor_active,
-            "pnl_governor_day_progress": self._pnl_governor_day_progress,
-            "pnl_governor_target_pnl_pct": self._pnl_governor_target_pnl_pct,
-            "pnl_governor_target_pnl_quote": self._pnl_governor_target_pnl_quote,
-            "pnl_governor_expected_pnl_quote": self._pnl_governor_expected_pnl_quote,
-            "pnl_governor_actual_pnl_quote": self._pnl_governor_actual_pnl_quote,
-            "pnl_governor_deficit_ratio": self._pnl_governor_deficit_ratio,
-            "pnl_governor_edge_relax_bps": self._pnl_governor_edge_relax_bps,
-            "pnl_governor_size_mult": self._pnl_governor_size_mult,
-            "pnl_governor_size_boost_active": self._pnl_governor_size_boost_active,
-            "pnl_governor_activation_reason": self._pnl_governor_activation_reason,
-            "pnl_governor_size_boost_reason": self._pnl_governor_size_boost_reason,
-            "pnl_governor_activation_reason_counts": (
-                _orjson.dumps(self._pnl_governor_activation_reason_counts, option=_orjson.OPT_SORT_KEYS).decode()
-                if _orjson is not None
-                else json.dumps(self._pnl_governor_activation_reason_counts, sort_keys=True)
-            ),
-            "pnl_governor_size_boost_reason_counts": (
-                _orjson.dumps(self._pnl_governor_size_boost_reason_counts, option=_orjson.OPT_SORT_KEYS).decode()
-                if _orjson is not None
-                else json.dumps(self._pnl_governor_size_boost_reason_counts, sort_keys=True)
-            ),
-            "pnl_governor_target_mode": self._pnl_governor_target_mode,
-            "pnl_governor_target_source": self._pnl_governor_target_source,
-            "pnl_governor_target_equity_open_quote": self._pnl_governor_target_equity_open_quote,
-            "pnl_governor_target_effective_pct": self._pnl_governor_target_effective_pct,
-            "pnl_governor_size_mult_applied": self._runtime_size_mult_applied,
-            "spread_competitiveness_cap_active": self._spread_competitiveness_cap_active,
-            "spread_competitiveness_cap_side_pct": self._spread_competitiveness_cap_side_pct,
-            "soft_pause_edge": self._soft_pause_edge,
-            "edge_gate_blocked": self._edge_gate_blocked,
-            "selective_quote_state": self._selective_quote_state,
-            "selective_quote_score": self._selective_quote_score,
-            "selective_quote_reason": self._selective_quote_reason,
-            "selective_quote_adverse_ratio": self._selective_quote_adverse_ratio,
-            "selective_quote_slippage_p95_bps": self._selective_quote_slippage_p95_bps,
-            "alpha_policy_state": self._alpha_policy_state,
-            "alpha_policy_reason": self._alpha_policy_reason,
-            "alpha_maker_score": self._alpha_maker_score,
-            "alpha_aggressive_score": self._alpha_aggressive_score,
-            "alpha_cross_allowed": self._alpha_cross_allowed,
-            "adverse_fill_soft_pause_active": self._adverse_fill_soft_pause_active(),
-            "edge_confidence_soft_pause_active": self._edge_confidence_soft_pause_active(),
-            "slippage_soft_pause_active": self._slippage_soft_pause_active(),
-            "fills_count_today": self._fills_count_today,
-            "fees_paid_today_quote": self._fees_paid_today_quote,
-            "paper_fill_count": self._paper_fill_count,
-            "paper_reject_count": self._paper_reject_count,
-            "paper_avg_queue_delay_ms": self._paper_avg_queue_delay_ms,
-            "traded_notional_today": self._traded_notional_today,
-            "daily_equity_open": self._daily_equity_open,
-            "external_soft_pause": self._external_soft_pause,
-            "external_pause_reason": self._external_pause_reason,
-            "external_model_version": self._last_external_model_version,
-            "external_intent_reason": self._last_external_intent_reason,
-            "external_daily_pnl_target_pct_override": self._external_daily_pnl_target_pct_override,
-            "external_daily_pnl_target_pct_override_expires_ts": self._external_daily_pnl_target_pct_override_expires_ts,
-            "fee_source": self._fee_source,
-            "maker_fee_pct": self._maker_fee_pct,
-            "taker_fee_pct": self._taker_fee_pct,
-            "balance_read_failed": self._runtime_adapter.balance_read_failed,
-            "funding_rate": self._funding_rate,
-            "funding_cost_today_quote": self._funding_cost_today_quote,
-            "net_realized_pnl_today": self._realized_pnl_today - self._funding_cost_today_quote,
-            "margin_ratio": self._margin_ratio,
-            "regime_source": self._regime_source,
-            "is_perp": self._is_perp,
-            "realized_pnl_today": self._realized_pnl_today,
-            "avg_entry_price": self._avg_entry_price,
-            "avg_entry_price_long": self._avg_entry_price_long,
-            "avg_entry_price_short": self._avg_entry_price_short,
-            "position_base": self._position_base,
-            "position_gross_base": self._position_gross_base,
-            "position_long_base": self._position_long_base,
-            "position_short_base": self._position_short_base,
-            "derisk_force_taker_min_base": self._derisk_force_min_base_amount(),
-            "derisk_force_taker_expectancy_guard_blocked": bool(
-                getattr(self, "_derisk_force_taker_expectancy_guard_blocked", False)
-            ),
-            "derisk_force_taker_expectancy_guard_reason": str(
-                getattr(self, "_derisk_force_taker_expectancy_guard_reason", "")
-            ),
-            "derisk_force_taker_expectancy_mean_quote": to_decimal(
-                getattr(self, "_derisk_force_taker_expectancy_mean_quote", _ZERO)
-            ),
-            "derisk_force_taker_expectancy_taker_fills": int(
-                getattr(self, "_derisk_force_taker_expectancy_taker_fills", 0)
-            ),
-            "position_drift_pct": self._position_drift_pct,
-            "fill_edge_ewma": self._fill_edge_ewma,
-            "adverse_fill_active": self._adverse_fill_count >= self.config.adverse_fill_count_threshold and self._fill_edge_ewma is not None,
-            "ws_reconnect_count": self._ws_reconnect_count,
-            "connector_status": self._runtime_adapter.status_summary(),
-            "ob_imbalance": self._ob_imbalance,
-            "kelly_size_active": self._fill_count_for_kelly >= self.config.kelly_min_observations and self.config.use_kelly_sizing,
-            "kelly_order_quote": self._get_kelly_order_quote(equity_quote) if self.config.use_kelly_sizing else _ZERO,
-            "ml_regime_override": self._external_regime_override or "",
-            "adverse_skip_count": self._adverse_skip_count,
-            "indicator_duration_ms": self._indicator_duration_ms,
-            "connector_io_duration_ms": self._connector_io_duration_ms,
-            "min_base_pct": self.config.min_base_pct,
-            "max_base_pct": self.config.max_base_pct,
-            "max_total_notional_quote": self.config.max_total_notional_quote,
-            "max_daily_turnover_x_hard": self.config.max_daily_turnover_x_hard,
-            "max_daily_loss_pct_hard": self.config.max_daily_loss_pct_hard,
-            "max_drawdown_pct_hard": self.config.max_drawdown_pct_hard,
-            "margin_ratio_soft_pause_pct": self.config.margin_ratio_soft_pause_pct,
-            "margin_ratio_hard_stop_pct": self.config.margin_ratio_hard_stop_pct,
-            "position_drift_soft_pause_pct": self.config.position_drift_soft_pause_pct,
-            "variant": self.config.variant,
-            "bot_mode": self.config.bot_mode,
-            "is_paper": _config_is_paper_check(self.config),
-            "connector_name": self.config.connector_name,
-            "trading_pair": self.config.trading_pair,
-        }
+        record = self.__dict__.get("_tick_record")
+        if record is None:
+            record = self._tick_record = TickRecord()
+        record.refresh(self, _TICK_SCHEMA)
+        record["runtime_family"] = runtime_family
+        record["kelly_order_quote"] = self._get_kelly_order_quote(equity_quote) if self.config.use_kelly_sizing else _ZERO
+        return record  # type: ignore[return-value]
 
     def _emit_tick_output(
         self, _t0: float, now: float, mid: Decimal,
@@ -510,53 +604,9 @@ class TelemetryMixin:
         self.processed_data["target_net_base_pct"] = target_net_base_pct
         self.processed_data["net_edge_gate_pct"] = self._net_edge_gate
         self.processed_data["net_edge_ewma_pct"] = self._net_edge_ewma if self._net_edge_ewma is not None else spread_state.net_edge
-        self.processed_data["adverse_fill_soft_pause_active"] = snapshot["adverse_fill_soft_pause_active"]
-        self.processed_data["edge_confidence_soft_pause_active"] = snapshot["edge_confidence_soft_pause_active"]
-        self.processed_data["slippage_soft_pause_active"] = snapshot["slippage_soft_pause_active"]
-        self.processed_data["adaptive_effective_min_edge_pct"] = snapshot["adaptive_effective_min_edge_pct"]
-        self.processed_data["adaptive_fill_age_s"] = snapshot["adaptive_fill_age_s"]
-        self.processed_data["adaptive_market_spread_bps_ewma"] = snapshot["adaptive_market_spread_bps_ewma"]
-        self.processed_data["adaptive_band_pct_ewma"] = snapshot["adaptive_band_pct_ewma"]
-        self.processed_data["adaptive_market_floor_pct"] = snapshot["adaptive_market_floor_pct"]
-        self.processed_data["adaptive_vol_ratio"] = snapshot["adaptive_vol_ratio"]
-        self.processed_data["pnl_governor_active"] = snapshot["pnl_governor_active"]
-        self.processed_data["pnl_governor_day_progress"] = snapshot["pnl_governor_day_progress"]
-        self.processed_data["pnl_governor_target_pnl_pct"] = snapshot["pnl_governor_target_pnl_pct"]
-        self.processed_data["pnl_governor_target_pnl_quote"] = snapshot["pnl_governor_target_pnl_quote"]
-        self.processed_data["pnl_governor_expected_pnl_quote"] = snapshot["pnl_governor_expected_pnl_quote"]
-        self.processed_data["pnl_governor_actual_pnl_quote"] = snapshot["pnl_governor_actual_pnl_quote"]
-        self.processed_data["pnl_governor_deficit_ratio"] = snapshot["pnl_governor_deficit_ratio"]
-        self.processed_data["pnl_governor_edge_relax_bps"] = snapshot["pnl_governor_edge_relax_bps"]
-        self.processed_data["pnl_governor_size_mult"] = snapshot["pnl_governor_size_mult"]
-        self.processed_data["pnl_governor_size_boost_active"] = snapshot["pnl_governor_size_boost_active"]
-        self.processed_data["pnl_governor_activation_reason"] = snapshot["pnl_governor_activation_reason"]
-        self.processed_data["pnl_governor_size_boost_reason"] = snapshot["pnl_governor_size_boost_reason"]
-        self.processed_data["pnl_governor_activation_reason_counts"] = snapshot["pnl_governor_activation_reason_counts"]
-        self.processed_data["pnl_governor_size_boost_reason_counts"] = snapshot["pnl_governor_size_boost_reason_counts"]
-        self.processed_data["derisk_force_taker_min_base"] = snapshot["derisk_force_taker_min_base"]
-        self.processed_data["derisk_force_taker_expectancy_guard_blocked"] = snapshot[
-            "derisk_force_taker_expectancy_guard_blocked"
-        ]
-        self.processed_data["derisk_force_taker_expectancy_guard_reason"] = snapshot[
-            "derisk_force_taker_expectancy_guard_reason"
-        ]
-        self.processed_data["derisk_force_taker_expectancy_mean_quote"] = snapshot[
-            "derisk_force_taker_expectancy_mean_quote"
-        ]
-        self.processed_data["derisk_force_taker_expectancy_taker_fills"] = snapshot[
-            "derisk_force_taker_expectancy_taker_fills"
-        ]
-        self.processed_data["selective_quote_state"] = snapshot["selective_quote_state"]
-        self.processed_data["selective_quote_score"] = snapshot["selective_quote_score"]
-        self.processed_data["selective_quote_reason"] = snapshot["selective_quote_reason"]
-        self.processed_data["selective_quote_adverse_ratio"] = snapshot["selective_quote_adverse_ratio"]
-        self.processed_data["selective_quote_slippage_p95_bps"] = snapshot["selective_quote_slippage_p95_bps"]
-        self.processed_data["alpha_policy_state"] = snapshot["alpha_policy_state"]
-        self.processed_data["alpha_policy_reason"] = snapshot["alpha_policy_reason"]
-        self.processed_data["alpha_maker_score"] = snapshot["alpha_maker_score"]
-        self.processed_data["alpha_aggressive_score"] = snapshot["alpha_aggressive_score"]
-        self.processed_data["alpha_cross_allowed"] = snapshot["alpha_cross_allowed"]
-        self.processed_data["inventory_urgency_pct"] = snapshot["inventory_urgency_pct"]
+        processed_data = self.processed_data
+        for key in _PROCESSED_FROM_SNAPSHOT:
+            processed_data[key] = snapshot[key]
         self.processed_data["quote_side_mode"] = self._quote_side_mode
         self.processed_data["quote_side_reason"] = self._quote_side_reason
         self.processed_data["history_seed_status"] = self._history_seed_status
@@ -23,6 +23,7 @@ _10K = Decimal("10000")
 
 _WRITE_QUEUE_SIZE = 100
 _SENTINEL = object()
+_MISSING = object()
 
 
 class TickEmitter:
@@ -32,13 +33,15 @@ class TickEmitter:
         self._csv = csv_logger
         self._last_minute_key: int | None = None
         self._missing_snapshot_keys_warned: set[str] = set()
+        self._processed: dict[str, Any] = {}
         self._write_queue: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
         self._writer_thread: threading.Thread | None = None
         self._writer_started = False
 
     def _snapshot_get(self, snapshot: dict[str, Any], key: str, default: Any) -> Any:
-        if key in snapshot:
-            return snapshot[key]
+        value = snapshot.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         if key not in self._missing_snapshot_keys_warned:
             logger.warning("TickEmitter: snapshot missing key '%s'; using default=%s", key, default)
             self._missing_snapshot_keys_warned.add(key)
@@ -127,144 +130,140 @@ class TickEmitter:
         projected_total_quote: Decimal,
         snapshot: dict[str, Any],
     ) -> ProcessedState:
-        """Build the ``ProcessedState`` dict from tick data and a controller snapshot."""
-        from controllers.types import PROCESSED_STATE_SCHEMA_VERSION
+        """Refresh the ``ProcessedState`` dict from tick data and a controller snapshot.
 
-        adaptive_effective_min_edge_pct = self._snapshot_get(snapshot, "adaptive_effective_min_edge_pct", _ZERO)
-        adaptive_fill_age_s = self._snapshot_get(snapshot, "adaptive_fill_age_s", _ZERO)
-        adaptive_market_spread_bps_ewma = self._snapshot_get(snapshot, "adaptive_market_spread_bps_ewma", _ZERO)
-        adaptive_band_pct_ewma = self._snapshot_get(snapshot, "adaptive_band_pct_ewma", _ZERO)
-        adaptive_market_floor_pct = self._snapshot_get(snapshot, "adaptive_market_floor_pct", _ZERO)
-        adaptive_vol_ratio = self._snapshot_get(snapshot, "adaptive_vol_ratio", _ZERO)
+        The same dict is returned every tick and overwritten key by key, so its
+        hash table is reused instead of rebuilt.  Keys added by extension hooks
+        persist until they are written again; callers that keep a tick's output
+        must copy it (``get_custom_info`` already does).
+        """
+        from controllers.types import PROCESSED_STATE_SCHEMA_VERSION
 
-        return {
-            "schema_version": PROCESSED_STATE_SCHEMA_VERSION,
-            "runtime_family": self._snapshot_get(snapshot, "runtime_family", "unknown"),
-            "reference_price": mid,
-            "spread_multiplier": snapshot["spread_multiplier"],
-            "regime": regime_name,
-            "target_base_pct": target_base_pct,
-            "base_pct": base_pct,
-            "state": state.value,
-            "spread_pct": spread_state.spread_pct,
-            "spread_floor_pct": snapshot["spread_floor_pct"],
-            "base_spread_pct": self._snapshot_get(snapshot, "base_spread_pct", _ZERO),
-            "net_edge_pct": spread_state.net_edge,
-            "turnover_x": spread_state.turnover_x,
-            "adaptive_effective_min_edge_pct": adaptive_effective_min_edge_pct,
-            "adaptive_fill_age_s": adaptive_fill_age_s,
-            "adaptive_market_spread_bps_ewma": adaptive_market_spread_bps_ewma,
-            "adaptive_band_pct_ewma": adaptive_band_pct_ewma,
-            "adaptive_market_floor_pct": adaptive_market_floor_pct,
-            "adaptive_vol_ratio": adaptive_vol_ratio,
-            "pnl_governor_active": snapshot["pnl_governor_active"],
-            "pnl_governor_day_progress": snapshot["pnl_governor_day_progress"],
-            "pnl_governor_target_pnl_pct": self._snapshot_get(snapshot, "pnl_governor_target_pnl_pct", _ZERO),
-            "pnl_governor_target_pnl_quote": snapshot["pnl_governor_target_pnl_quote"],
-            "pnl_governor_expected_pnl_quote": snapshot["pnl_governor_expected_pnl_quote"],
-            "pnl_governor_actual_pnl_quote": snapshot["pnl_governor_actual_pnl_quote"],
-            "pnl_governor_deficit_ratio": snapshot["pnl_governor_deficit_ratio"],
-            "pnl_governor_edge_relax_bps": snapshot["pnl_governor_edge_relax_bps"],
-            "pnl_governor_size_mult": self._snapshot_get(snapshot, "pnl_governor_size_mult", _ONE),
-            "pnl_governor_size_boost_active": self._snapshot_get(snapshot, "pnl_governor_size_boost_active", False),
-            "pnl_governor_target_mode": self._snapshot_get(snapshot, "pnl_governor_target_mode", "disabled"),
-            "pnl_governor_target_source": self._snapshot_get(snapshot, "pnl_governor_target_source", "none"),
-            "pnl_governor_target_equity_open_quote": self._snapshot_get(snapshot, "pnl_governor_target_equity_open_quote", _ZERO),
-            "pnl_governor_target_effective_pct": self._snapshot_get(snapshot, "pnl_governor_target_effective_pct", _ZERO),
-            "pnl_governor_size_mult_applied": self._snapshot_get(snapshot, "pnl_governor_size_mult_applied", _ONE),
-            "pnl_governor_activation_reason": self._snapshot_get(snapshot, "pnl_governor_activation_reason", "unknown"),
-            "pnl_governor_size_boost_reason": self._snapshot_get(snapshot, "pnl_governor_size_boost_reason", "unknown"),
-            "pnl_governor_activation_reason_counts": self._snapshot_get(
-                snapshot, "pnl_governor_activation_reason_counts", "{}"
-            ),
-            "pnl_governor_size_boost_reason_counts": self._snapshot_get(
-                snapshot, "pnl_governor_size_boost_reason_counts", "{}"
-            ),
-            "skew": spread_state.skew,
-            "reservation_price_adjustment_pct": self._snapshot_get(
-                snapshot, "reservation_price_adjustment_pct", _ZERO
-            ),
-            "inventory_urgency_pct": self._snapshot_get(snapshot, "inventory_urgency_pct", _ZERO),
-            "inventory_skew_pct": self._snapshot_get(snapshot, "inventory_skew_pct", _ZERO),
-            "alpha_skew_pct": self._snapshot_get(snapshot, "alpha_skew_pct", _ZERO),
-            "adverse_drift_30s": spread_state.adverse_drift,
-            "adverse_drift_smooth_30s": spread_state.smooth_drift,
-            "drift_spread_mult": spread_state.drift_spread_mult,
-            "market_spread_pct": market.market_spread_pct,
-            "market_spread_bps": market.market_spread_pct * _10K,
-            "best_bid_price": market.bid_p,
-            "best_ask_price": market.ask_p,
-            "best_bid_size": market.best_bid_size,
-            "best_ask_size": market.best_ask_size,
-            "equity_quote": equity_quote,
-            "mid": mid,
-            "base_balance": base_bal,
-            "quote_balance": quote_bal,
-            "soft_pause_edge": snapshot["soft_pause_edge"],
-            "edge_gate_blocked": snapshot["edge_gate_blocked"],
-            "selective_quote_state": self._snapshot_get(snapshot, "selective_quote_state", "inactive"),
-            "selective_quote_score": self._snapshot_get(snapshot, "selective_quote_score", _ZERO),
-            "selective_quote_reason": self._snapshot_get(snapshot, "selective_quote_reason", "disabled"),
-            "selective_quote_adverse_ratio": self._snapshot_get(snapshot, "selective_quote_adverse_ratio", _ZERO),
-            "selective_quote_slippage_p95_bps": self._snapshot_get(snapshot, "selective_quote_slippage_p95_bps", _ZERO),
-            "alpha_policy_state": self._snapshot_get(snapshot, "alpha_policy_state", "maker_two_sided"),
-            "alpha_policy_reason": self._snapshot_get(snapshot, "alpha_policy_reason", "unknown"),
-            "alpha_maker_score": self._snapshot_get(snapshot, "alpha_maker_score", _ZERO),
-            "alpha_aggressive_score": self._snapshot_get(snapshot, "alpha_aggressive_score", _ZERO),
-            "alpha_cross_allowed": self._snapshot_get(snapshot, "alpha_cross_allowed", False),
-            "edge_pause_threshold_pct": spread_state.min_edge_threshold,
-            "edge_resume_threshold_pct": spread_state.edge_resume_threshold,
-            "risk_hard_stop": risk_hard_stop,
-            "risk_reasons": "|".join(risk_reasons),
-            "daily_loss_pct": daily_loss_pct,
-            "drawdown_pct": drawdown_pct,
-            "projected_total_quote": projected_total_quote,
-            "fills_count_today": snapshot["fills_count_today"],
-            "fees_paid_today_quote": snapshot["fees_paid_today_quote"],
-            "paper_fill_count": snapshot["paper_fill_count"],
-            "paper_reject_count": snapshot["paper_reject_count"],
-            "paper_avg_queue_delay_ms": snapshot["paper_avg_queue_delay_ms"],
-            "spread_capture_est_quote": snapshot["traded_notional_today"] * spread_state.spread_pct * spread_state.fill_factor,
-            "pnl_quote": equity_quote - (snapshot["daily_equity_open"] or equity_quote),
-            "external_soft_pause": snapshot["external_soft_pause"],
-            "external_pause_reason": snapshot["external_pause_reason"],
-            "external_model_version": snapshot["external_model_version"],
-            "external_intent_reason": snapshot["external_intent_reason"],
-            "fee_source": snapshot["fee_source"],
-            "maker_fee_pct": snapshot["maker_fee_pct"],
-            "taker_fee_pct": snapshot["taker_fee_pct"],
-            "balance_read_failed": snapshot["balance_read_failed"],
-            "funding_rate": snapshot["funding_rate"],
-            "funding_cost_today_quote": snapshot["funding_cost_today_quote"],
-            "net_realized_pnl_today_quote": snapshot["net_realized_pnl_today"],
-            "margin_ratio": snapshot["margin_ratio"],
-            "regime_source": snapshot["regime_source"],
-            "is_perpetual": snapshot["is_perp"],
-            "realized_pnl_today_quote": snapshot["realized_pnl_today"],
-            "avg_entry_price": snapshot["avg_entry_price"],
-            "avg_entry_price_long": self._snapshot_get(snapshot, "avg_entry_price_long", _ZERO),
-            "avg_entry_price_short": self._snapshot_get(snapshot, "avg_entry_price_short", _ZERO),
-            "position_base": snapshot["position_base"],
-            "position_gross_base": self._snapshot_get(snapshot, "position_gross_base", abs(snapshot["position_base"])),
-            "position_long_base": self._snapshot_get(snapshot, "position_long_base", max(_ZERO, snapshot["position_base"])),
-            "position_short_base": self._snapshot_get(snapshot, "position_short_base", max(_ZERO, -snapshot["position_base"])),
-            "position_drift_pct": snapshot["position_drift_pct"],
-            "fill_edge_ewma_bps": snapshot["fill_edge_ewma"] if snapshot["fill_edge_ewma"] is not None else _ZERO,
-            "adverse_fill_active": snapshot["adverse_fill_active"],
-            "order_book_stale": market.order_book_stale,
-            "ws_reconnect_count": snapshot["ws_reconnect_count"],
-            "connector_status": snapshot["connector_status"],
-            "ob_imbalance": snapshot["ob_imbalance"],
-            "kelly_size_active": snapshot["kelly_size_active"],
-            "kelly_order_quote": snapshot["kelly_order_quote"],
-            "ml_regime_override": snapshot["ml_regime_override"],
-            "adverse_skip_count": snapshot["adverse_skip_count"],
-            "spread_competitiveness_cap_active": self._snapshot_get(snapshot, "spread_competitiveness_cap_active", False),
-            "spread_competitiveness_cap_side_pct": self._snapshot_get(snapshot, "spread_competitiveness_cap_side_pct", _ZERO),
-            "_tick_duration_ms": 0.0,
-            "_indicator_duration_ms": snapshot["indicator_duration_ms"],
-            "_connector_io_duration_ms": snapshot["connector_io_duration_ms"],
-        }
+        get = self._snapshot_get
+        out = self._processed
+        out["schema_version"] = PROCESSED_STATE_SCHEMA_VERSION
+        out["runtime_family"] = get(snapshot, "runtime_family", "unknown")
+        out["reference_price"] = mid
+        out["spread_multiplier"] = snapshot["spread_multiplier"]
+        out["regime"] = regime_name
+        out["target_base_pct"] = target_base_pct
+        out["base_pct"] = base_pct
+        out["state"] = state.value
+        out["spread_pct"] = spread_state.spread_pct
+        out["spread_floor_pct"] = snapshot["spread_floor_pct"]
+        out["base_spread_pct"] = get(snapshot, "base_spread_pct", _ZERO)
+        out["net_edge_pct"] = spread_state.net_edge
+        out["turnover_x"] = spread_state.turnover_x
+        out["adaptive_effective_min_edge_pct"] = get(snapshot, "adaptive_effective_min_edge_pct", _ZERO)
+        out["adaptive_fill_age_s"] = get(snapshot, "adaptive_fill_age_s", _ZERO)
+        out["adaptive_market_spread_bps_ewma"] = get(snapshot, "adaptive_market_spread_bps_ewma", _ZERO)
+        out["adaptive_band_pct_ewma"] = get(snapshot, "adaptive_band_pct_ewma", _ZERO)
+        out["adaptive_market_floor_pct"] = get(snapshot, "adaptive_market_floor_pct", _ZERO)
+        out["adaptive_vol_ratio"] = get(snapshot, "adaptive_vol_ratio", _ZERO)
+        out["pnl_governor_active"] = snapshot["pnl_governor_active"]
+        out["pnl_governor_day_progress"] = snapshot["pnl_governor_day_progress"]
+        out["pnl_governor_target_pnl_pct"] = get(snapshot, "pnl_governor_target_pnl_pct", _ZERO)
+        out["pnl_governor_target_pnl_quote"] = snapshot["pnl_governor_target_pnl_quote"]
+        out["pnl_governor_expected_pnl_quote"] = snapshot["pnl_governor_expected_pnl_quote"]
+        out["pnl_governor_actual_pnl_quote"] = snapshot["pnl_governor_actual_pnl_quote"]
+        out["pnl_governor_deficit_ratio"] = snapshot["pnl_governor_deficit_ratio"]
+        out["pnl_governor_edge_relax_bps"] = snapshot["pnl_governor_edge_relax_bps"]
+        out["pnl_governor_size_mult"] = get(snapshot, "pnl_governor_size_mult", _ONE)
+        out["pnl_governor_size_boost_active"] = get(snapshot, "pnl_governor_size_boost_active", False)
+        out["pnl_governor_target_mode"] = get(snapshot, "pnl_governor_target_mode", "disabled")
+        out["pnl_governor_target_source"] = get(snapshot, "pnl_governor_target_source", "none")
+        out["pnl_governor_target_equity_open_quote"] = get(snapshot, "pnl_governor_target_equity_open_quote", _ZERO)
+        out["pnl_governor_target_effective_pct"] = get(snapshot, "pnl_governor_target_effective_pct", _ZERO)
+        out["pnl_governor_size_mult_applied"] = get(snapshot, "pnl_governor_size_mult_applied", _ONE)
+        out["pnl_governor_activation_reason"] = get(snapshot, "pnl_governor_activation_reason", "unknown")
+        out["pnl_governor_size_boost_reason"] = get(snapshot, "pnl_governor_size_boost_reason", "unknown")
+        out["pnl_governor_activation_reason_counts"] = get(snapshot, "pnl_governor_activation_reason_counts", "{}")
+        out["pnl_governor_size_boost_reason_counts"] = get(snapshot, "pnl_governor_size_boost_reason_counts", "{}")
+        out["skew"] = spread_state.skew
+        out["reservation_price_adjustment_pct"] = get(snapshot, "reservation_price_adjustment_pct", _ZERO)
+        out["inventory_urgency_pct"] = get(snapshot, "inventory_urgency_pct", _ZERO)
+        out["inventory_skew_pct"] = get(snapshot, "inventory_skew_pct", _ZERO)
+        out["alpha_skew_pct"] = get(snapshot, "alpha_skew_pct", _ZERO)
+        out["adverse_drift_30s"] = spread_state.adverse_drift
+        out["adverse_drift_smooth_30s"] = spread_state.smooth_drift
+        out["drift_spread_mult"] = spread_state.drift_spread_mult
+        out["market_spread_pct"] = market.market_spread_pct
+        out["market_spread_bps"] = market.market_spread_pct * _10K
+        out["best_bid_price"] = market.bid_p
+        out["best_ask_price"] = market.ask_p
+        out["best_bid_size"] = market.best_bid_size
+        out["best_ask_size"] = market.best_ask_size
+        out["equity_quote"] = equity_quote
+        out["mid"] = mid
+        out["base_balance"] = base_bal
+        out["quote_balance"] = quote_bal
+        out["soft_pause_edge"] = snapshot["soft_pause_edge"]
+        out["edge_gate_blocked"] = snapshot["edge_gate_blocked"]
+        out["selective_quote_state"] = get(snapshot, "selective_quote_state", "inactive")
+        out["selective_quote_score"] = get(snapshot, "selective_quote_score", _ZERO)
+        out["selective_quote_reason"] = get(snapshot, "selective_quote_reason", "disabled")
+        out["selective_quote_adverse_ratio"] = get(snapshot, "selective_quote_adverse_ratio", _ZERO)
+        out["selective_quote_slippage_p95_bps"] = get(snapshot, "selective_quote_slippage_p95_bps", _ZERO)
+        out["alpha_policy_state"] = get(snapshot, "alpha_policy_state", "maker_two_sided")
+        out["alpha_policy_reason"] = get(snapshot, "alpha_policy_reason", "unknown")
+        out["alpha_maker_score"] = get(snapshot, "alpha_maker_score", _ZERO)
+        out["alpha_aggressive_score"] = get(snapshot, "alpha_aggressive_score", _ZERO)
+        out["alpha_cross_allowed"] = get(snapshot, "alpha_cross_allowed", False)
+        out["edge_pause_threshold_pct"] = spread_state.min_edge_threshold
+        out["edge_resume_threshold_pct"] = spread_state.edge_resume_threshold
+        out["risk_hard_stop"] = risk_hard_stop
+        out["risk_reasons"] = "|".join(risk_reasons)
+        out["daily_loss_pct"] = daily_loss_pct
+        out["drawdown_pct"] = drawdown_pct
+        out["projected_total_quote"] = projected_total_quote
+        out["fills_count_today"] = snapshot["fills_count_today"]
+        out["fees_paid_today_quote"] = snapshot["fees_paid_today_quote"]
+        out["paper_fill_count"] = snapshot["paper_fill_count"]
+        out["paper_reject_count"] = snapshot["paper_reject_count"]
+        out["paper_avg_queue_delay_ms"] = snapshot["paper_avg_queue_delay_ms"]
+        out["spread_capture_est_quote"] = (
+            snapshot["traded_notional_today"] * spread_state.spread_pct * spread_state.fill_factor
+        )
+        out["pnl_quote"] = equity_quote - (snapshot["daily_equity_open"] or equity_quote)
+        out["external_soft_pause"] = snapshot["external_soft_pause"]
+        out["external_pause_reason"] = snapshot["external_pause_reason"]
+        out["external_model_version"] = snapshot["external_model_version"]
+        out["external_intent_reason"] = snapshot["external_intent_reason"]
+        out["fee_source"] = snapshot["fee_source"]
+        out["maker_fee_pct"] = snapshot["maker_fee_pct"]
+        out["taker_fee_pct"] = snapshot["taker_fee_pct"]
+        out["balance_read_failed"] = snapshot["balance_read_failed"]
+        out["funding_rate"] = snapshot["funding_rate"]
+        out["funding_cost_today_quote"] = snapshot["funding_cost_today_quote"]
+        out["net_realized_pnl_today_quote"] = snapshot["net_realized_pnl_today"]
+        out["margin_ratio"] = snapshot["margin_ratio"]
+        out["regime_source"] = snapshot["regime_source"]
+        out["is_perpetual"] = snapshot["is_perp"]
+        out["realized_pnl_today_quote"] = snapshot["realized_pnl_today"]
+        out["avg_entry_price"] = snapshot["avg_entry_price"]
+        out["avg_entry_price_long"] = get(snapshot, "avg_entry_price_long", _ZERO)
+        out["avg_entry_price_short"] = get(snapshot, "avg_entry_price_short", _ZERO)
+        out["position_base"] = snapshot["position_base"]
+        out["position_gross_base"] = get(snapshot, "position_gross_base", abs(snapshot["position_base"]))
+        out["position_long_base"] = get(snapshot, "position_long_base", max(_ZERO, snapshot["position_base"]))
+        out["position_short_base"] = get(snapshot, "position_short_base", max(_ZERO, -snapshot["position_base"]))
+        out["position_drift_pct"] = snapshot["position_drift_pct"]
+        out["fill_edge_ewma_bps"] = snapshot["fill_edge_ewma"] if snapshot["fill_edge_ewma"] is not None else _ZERO
+        out["adverse_fill_active"] = snapshot["adverse_fill_active"]
+        out["order_book_stale"] = market.order_book_stale
+        out["ws_reconnect_count"] = snapshot["ws_reconnect_count"]
+        out["connector_status"] = snapshot["connector_status"]
+        out["ob_imbalance"] = snapshot["ob_imbalance"]
+        out["kelly_size_active"] = snapshot["kelly_size_active"]
+        out["kelly_order_quote"] = snapshot["kelly_order_quote"]
+        out["ml_regime_override"] = snapshot["ml_regime_override"]
+        out["adverse_skip_count"] = snapshot["adverse_skip_count"]
+        out["spread_competitiveness_cap_active"] = get(snapshot, "spread_competitiveness_cap_active", False)
+        out["spread_competitiveness_cap_side_pct"] = get(snapshot, "spread_competitiveness_cap_side_pct", _ZERO)
+        out["_tick_duration_ms"] = 0.0
+        out["_indicator_duration_ms"] = snapshot["indicator_duration_ms"]
+        out["_connector_io_duration_ms"] = snapshot["connector_io_duration_ms"]
+        return out  # type: ignore[return-value]
 
     # ------------------------------------------------------------------
     # Minute-level CSV logging
@@ -280,7 +279,11 @@ class TickEmitter:
         snapshot: dict[str, Any],
         strategy_telemetry: tuple[tuple[str, str, Any], ...] = (),
     ) -> dict[str, Any] | None:
-        """Write one row to ``minute.csv`` per calendar minute and return it."""
+        """Write one row to ``minute.csv`` per calendar minute and return it.
+
+        Columns that come from the controller snapshot are read from the tick
+        record itself; *pd* only supplies the values computed during the tick.
+        """
         minute_key = int(now_ts // 60)
         if self._last_minute_key == minute_key:
             return None
@@ -295,7 +298,7 @@ class TickEmitter:
             "trading_pair": snapshot["trading_pair"],
             "state": state.value,
             "regime": pd.get("regime", ""),
-            "regime_source": pd.get("regime_source", "price_buffer"),
+            "regime_source": snapshot.get("regime_source", "price_buffer"),
             "mid": str(pd.get("mid", _ZERO)),
             "equity_quote": str(pd.get("equity_quote", _ZERO)),
             "base_pct": str(pd.get("base_pct", _ZERO)),
@@ -303,55 +306,55 @@ class TickEmitter:
             "net_base_pct": str(pd.get("net_base_pct", _ZERO)),
             "target_net_base_pct": str(pd.get("target_net_base_pct", _ZERO)),
             "spread_pct": str(pd.get("spread_pct", _ZERO)),
-            "spread_floor_pct": str(pd.get("spread_floor_pct", _ZERO)),
-            "base_spread_pct": str(pd.get("base_spread_pct", _ZERO)),
+            "spread_floor_pct": str(snapshot.get("spread_floor_pct", _ZERO)),
+            "base_spread_pct": str(snapshot.get("base_spread_pct", _ZERO)),
             "net_edge_pct": str(pd.get("net_edge_pct", _ZERO)),
             "net_edge_gate_pct": str(pd.get("net_edge_gate_pct", _ZERO)),
             "net_edge_ewma_pct": str(pd.get("net_edge_ewma_pct", _ZERO)),
-            "adaptive_effective_min_edge_pct": str(pd.get("adaptive_effective_min_edge_pct", _ZERO)),
-            "adaptive_fill_age_s": str(pd.get("adaptive_fill_age_s", _ZERO)),
-            "adaptive_market_spread_bps_ewma": str(pd.get("adaptive_market_spread_bps_ewma", _ZERO)),
-            "adaptive_band_pct_ewma": str(pd.get("adaptive_band_pct_ewma", _ZERO)),
-            "adaptive_market_floor_pct": str(pd.get("adaptive_market_floor_pct", _ZERO)),
-            "adaptive_vol_ratio": str(pd.get("adaptive_vol_ratio", _ZERO)),
-            "pnl_governor_active": str(pd.get("pnl_governor_active", False)),
-            "pnl_governor_day_progress": str(pd.get("pnl_governor_day_progress", _ZERO)),
-            "pnl_governor_target_pnl_pct": str(pd.get("pnl_governor_target_pnl_pct", _ZERO)),
-            "pnl_governor_target_pnl_quote": str(pd.get("pnl_governor_target_pnl_quote", _ZERO)),
-            "pnl_governor_expected_pnl_quote": str(pd.get("pnl_governor_expected_pnl_quote", _ZERO)),
-            "pnl_governor_actual_pnl_quote": str(pd.get("pnl_governor_actual_pnl_quote", _ZERO)),
-            "pnl_governor_deficit_ratio": str(pd.get("pnl_governor_deficit_ratio", _ZERO)),
-            "pnl_governor_edge_relax_bps": str(pd.get("pnl_governor_edge_relax_bps", _ZERO)),
-            "pnl_governor_size_mult": str(pd.get("pnl_governor_size_mult", _ONE)),
-            "pnl_governor_size_boost_active": str(pd.get("pnl_governor_size_boost_active", False)),
-            "pnl_governor_target_mode": str(pd.get("pnl_governor_target_mode", "disabled")),
-            "pnl_governor_target_source": str(pd.get("pnl_governor_target_source", "none")),
-            "pnl_governor_target_equity_open_quote": str(pd.get("pnl_governor_target_equity_open_quote", _ZERO)),
-            "pnl_governor_target_effective_pct": str(pd.get("pnl_governor_target_effective_pct", _ZERO)),
-            "pnl_governor_size_mult_applied": str(pd.get("pnl_governor_size_mult_applied", _ONE)),
-            "pnl_governor_activation_reason": str(pd.get("pnl_governor_activation_reason", "unknown")),
-            "pnl_governor_size_boost_reason": str(pd.get("pnl_governor_size_boost_reason", "unknown")),
-            "pnl_governor_activation_reason_counts": str(pd.get("pnl_governor_activation_reason_counts", "{}")),
-            "pnl_governor_size_boost_reason_counts": str(pd.get("pnl_governor_size_boost_reason_counts", "{}")),
+            "adaptive_effective_min_edge_pct": str(snapshot.get("adaptive_effective_min_edge_pct", _ZERO)),
+            "adaptive_fill_age_s": str(snapshot.get("adaptive_fill_age_s", _ZERO)),
+            "adaptive_market_spread_bps_ewma": str(snapshot.get("adaptive_market_spread_bps_ewma", _ZERO)),
+            "adaptive_band_pct_ewma": str(snapshot.get("adaptive_band_pct_ewma", _ZERO)),
+            "adaptive_market_floor_pct": str(snapshot.get("adaptive_market_floor_pct", _ZERO)),
+            "adaptive_vol_ratio": str(snapshot.get("adaptive_vol_ratio", _ZERO)),
+            "pnl_governor_active": str(snapshot.get("pnl_governor_active", False)),
+            "pnl_governor_day_progress": str(snapshot.get("pnl_governor_day_progress", _ZERO)),
+            "pnl_governor_target_pnl_pct": str(snapshot.get("pnl_governor_target_pnl_pct", _ZERO)),
+            "pnl_governor_target_pnl_quote": str(snapshot.get("pnl_governor_target_pnl_quote", _ZERO)),
+            "pnl_governor_expected_pnl_quote": str(snapshot.get("pnl_governor_expected_pnl_quote", _ZERO)),
+            "pnl_governor_actual_pnl_quote": str(snapshot.get("pnl_governor_actual_pnl_quote", _ZERO)),
+            "pnl_governor_deficit_ratio": str(snapshot.get("pnl_governor_deficit_ratio", _ZERO)),
+            "pnl_governor_edge_relax_bps": str(snapshot.get("pnl_governor_edge_relax_bps", _ZERO)),
+            "pnl_governor_size_mult": str(snapshot.get("pnl_governor_size_mult", _ONE)),
+            "pnl_governor_size_boost_active": str(snapshot.get("pnl_governor_size_boost_active", False)),
+            "pnl_governor_target_mode": str(snapshot.get("pnl_governor_target_mode", "disabled")),
+            "pnl_governor_target_source": str(snapshot.get("pnl_governor_target_source", "none")),
+            "pnl_governor_target_equity_open_quote": str(snapshot.get("pnl_governor_target_equity_open_quote", _ZERO)),
+            "pnl_governor_target_effective_pct": str(snapshot.get("pnl_governor_target_effective_pct", _ZERO)),
+            "pnl_governor_size_mult_applied": str(snapshot.get("pnl_governor_size_mult_applied", _ONE)),
+            "pnl_governor_activation_reason": str(snapshot.get("pnl_governor_activation_reason", "unknown")),
+            "pnl_governor_size_boost_reason": str(snapshot.get("pnl_governor_size_boost_reason", "unknown")),
+            "pnl_governor_activation_reason_counts": str(snapshot.get("pnl_governor_activation_reason_counts", "{}")),
+            "pnl_governor_size_boost_reason_counts": str(snapshot.get("pnl_governor_size_boost_reason_counts", "{}")),
             "skew": str(pd.get("skew", _ZERO)),
-            "reservation_price_adjustment_pct": str(pd.get("reservation_price_adjustment_pct", _ZERO)),
-            "inventory_urgency_pct": str(pd.get("inventory_urgency_pct", _ZERO)),
-            "inventory_skew_pct": str(pd.get("inventory_skew_pct", _ZERO)),
-            "alpha_skew_pct": str(pd.get("alpha_skew_pct", _ZERO)),
+            "reservation_price_adjustment_pct": str(snapshot.get("reservation_price_adjustment_pct", _ZERO)),
+            "inventory_urgency_pct": str(snapshot.get("inventory_urgency_pct", _ZERO)),
+            "inventory_skew_pct": str(snapshot.get("inventory_skew_pct", _ZERO)),
+            "alpha_skew_pct": str(snapshot.get("alpha_skew_pct", _ZERO)),
             "adverse_drift_30s": str(pd.get("adverse_drift_30s", _ZERO)),
             "adverse_drift_smooth_30s": str(pd.get("adverse_drift_smooth_30s", _ZERO)),
             "drift_spread_mult": str(pd.get("drift_spread_mult", _ZERO)),
-            "soft_pause_edge": str(pd.get("soft_pause_edge", False)),
-            "selective_quote_state": str(pd.get("selective_quote_state", "inactive")),
-            "selective_quote_score": str(pd.get("selective_quote_score", _ZERO)),
-            "selective_quote_reason": str(pd.get("selective_quote_reason", "disabled")),
-            "selective_quote_adverse_ratio": str(pd.get("selective_quote_adverse_ratio", _ZERO)),
-            "selective_quote_slippage_p95_bps": str(pd.get("selective_quote_slippage_p95_bps", _ZERO)),
-            "alpha_policy_state": str(pd.get("alpha_policy_state", "maker_two_sided")),
-            "alpha_policy_reason": str(pd.get("alpha_policy_reason", "unknown")),
-            "alpha_maker_score": str(pd.get("alpha_maker_score", _ZERO)),
-            "alpha_aggressive_score": str(pd.get("alpha_aggressive_score", _ZERO)),
-            "alpha_cross_allowed": str(pd.get("alpha_cross_allowed", False)),
+            "soft_pause_edge": str(snapshot.get("soft_pause_edge", False)),
+            "selective_quote_state": str(snapshot.get("selective_quote_state", "inactive")),
+            "selective_quote_score": str(snapshot.get("selective_quote_score", _ZERO)),
+            "selective_quote_reason": str(snapshot.get("selective_quote_reason", "disabled")),
+            "selective_quote_adverse_ratio": str(snapshot.get("selective_quote_adverse_ratio", _ZERO)),
+            "selective_quote_slippage_p95_bps": str(snapshot.get("selective_quote_slippage_p95_bps", _ZERO)),
+            "alpha_policy_state": str(snapshot.get("alpha_policy_state", "maker_two_sided")),
+            "alpha_policy_reason": str(snapshot.get("alpha_policy_reason", "unknown")),
+            "alpha_maker_score": str(snapshot.get("alpha_maker_score", _ZERO)),
+            "alpha_aggressive_score": str(snapshot.get("alpha_aggressive_score", _ZERO)),
+            "alpha_cross_allowed": str(snapshot.get("alpha_cross_allowed", False)),
             "quote_side_mode": str(pd.get("quote_side_mode", "off")),
             "quote_side_reason": str(pd.get("quote_side_reason", "regime")),
             "base_balance": str(pd.get("base_balance", _ZERO)),
@@ -410,8 +413,8 @@ class TickEmitter:
             "order_book_stale": str(snapshot["order_book_stale"]),
             "derisk_runtime_recovered": str(pd.get("derisk_runtime_recovered", False)),
             "derisk_runtime_recovery_count": str(pd.get("derisk_runtime_recovery_count", 0)),
-            "spread_competitiveness_cap_active": str(pd.get("spread_competitiveness_cap_active", False)),
-            "spread_competitiveness_cap_side_pct": str(pd.get("spread_competitiveness_cap_side_pct", _ZERO)),
+            "spread_competitiveness_cap_active": str(snapshot.get("spread_competitiveness_cap_active", False)),
+            "spread_competitiveness_cap_side_pct": str(snapshot.get("spread_competitiveness_cap_side_pct", _ZERO)),
             "_tick_duration_ms": str(snapshot["tick_duration_ms"]),
             "_indicator_duration_ms": str(snapshot["indicator_duration_ms"]),
             "_connector_io_duration_ms": str(snapshot["connector_io_duration_ms"]),
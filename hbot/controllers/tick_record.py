@@ -0,0 +1,116 @@
+"""Fixed-layout, reusable tick telemetry record.
+
+``TickRecord`` stores one value per ``TickSnapshot`` field in a
+preallocated list whose slot order is the TypedDict's declaration order
+(``TICK_FIELDS``).  A :class:`TickSchema` maps field names to extractor
+callables once at import time; ``TickRecord.refresh`` then overwrites the
+slots in place each tick, so the emit phase no longer builds a fresh
+~120-entry dict per tick.
+
+The record is a ``MutableMapping``: existing ``snapshot["key"]`` /
+``snapshot.get(...)`` readers (``TickEmitter``, bot extension hooks,
+auto-calibration) work unchanged.  Keys outside the layout are kept in a
+small overflow dict.  The record is reused across ticks, so callers that
+need to keep a tick's values must copy them (``to_dict()``).
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+from controllers.tick_types import TickSnapshot
+
+TICK_FIELDS: tuple[str, ...] = tuple(TickSnapshot.__annotations__)
+_INDEX: dict[str, int] = {name: idx for idx, name in enumerate(TICK_FIELDS)}
+_UNSET: Any = object()
+_BLANK: tuple[Any, ...] = (_UNSET,) * len(TICK_FIELDS)
+
+Extractor = Callable[[Any], Any]
+
+
+class TickSchema:
+    """Extractors for ``TICK_FIELDS``; a ``None`` extractor marks a field the caller sets itself."""
+
+    __slots__ = ("_plan",)
+
+    def __init__(self, extractors: Mapping[str, Extractor | None]) -> None:
+        unknown = sorted(set(extractors) - set(_INDEX))
+        if unknown:
+            raise ValueError(f"unknown tick fields: {unknown}")
+        self._plan: tuple[tuple[int, Extractor], ...] = tuple(
+            (_INDEX[name], fn) for name, fn in extractors.items() if fn is not None
+        )
+
+
+class TickRecord(MutableMapping[str, Any]):
+    __slots__ = ("_extra", "_values")
+
+    def __init__(self) -> None:
+        self._values: list[Any] = list(_BLANK)
+        self._extra: dict[str, Any] = {}
+
+    def refresh(self, source: Any, schema: TickSchema) -> TickRecord:
+        """Clear every slot and re-extract the schema's fields from *source*."""
+        values = self._values
+        values[:] = _BLANK
+        if self._extra:
+            self._extra.clear()
+        for idx, extract in schema._plan:
+            values[idx] = extract(source)
+        return self
+
+    def __getitem__(self, key: str) -> Any:
+        idx = _INDEX.get(key)
+        if idx is None:
+            return self._extra[key]
+        value = self._values[idx]
+        if value is _UNSET:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        idx = _INDEX.get(key)
+        if idx is None:
+            return self._extra.get(key, default)
+        value = self._values[idx]
+        return default if value is _UNSET else value
+
+    def __contains__(self, key: object) -> bool:
+        idx = _INDEX.get(key) if isinstance(key, str) else None
+        if idx is None:
+            return key in self._extra
+        return self._values[idx] is not _UNSET
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        idx = _INDEX.get(key)
+        if idx is None:
+            self._extra[key] = value
+        else:
+            self._values[idx] = value
+
+    def __delitem__(self, key: str) -> None:
+        idx = _INDEX.get(key)
+        if idx is None:
+            del self._extra[key]
+        elif self._values[idx] is _UNSET:
+            raise KeyError(key)
+        else:
+            self._values[idx] = _UNSET
+
+    def __iter__(self) -> Iterator[str]:
+        for name, value in zip(TICK_FIELDS, self._values, strict=True):
+            if value is not _UNSET:
+                yield name
+        yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not _UNSET) + len(self._extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"TickRecord({self.to_dict()!r})"
+
+
+__all__ = ["TICK_FIELDS", "TickRecord", "TickSchema"]
@@ -158,3 +158,9 @@ class TickSnapshot(TypedDict, total=False):
     margin_ratio_soft_pause_pct: Decimal
     margin_ratio_hard_stop_pct: Decimal
     position_drift_soft_pause_pct: Decimal
+
+    # -- Emit phase (filled in after the tick output is built) --
+    tick_duration_ms: float
+    order_book_stale: bool
+    cancel_per_min: int
+    orders_active: int
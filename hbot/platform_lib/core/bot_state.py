@@ -0,0 +1,507 @@
+"""Shared per-bot state document materialised from bot log files.
+
+Several ops services need the same facts about each bot -- the last
+``minute.csv`` row, the last fill and running fill totals, the current
+``daily_state*.json`` and ``paper_desk_v2.json``, and the recovered open
+orders -- and each used to re-read those files on its own timer.
+
+:class:`BotStateMaterializer` tails them once.  CSV files are read
+incrementally from the last consumed byte offset (:class:`CsvTail`), JSON
+files are re-parsed only when their mtime changes, and the loop wakes on
+Linux inotify events with plain polling as the fallback.  The result is
+one JSON document written atomically to ``reports/bot_state/latest.json``::
+
+    {"schema_version": 1, "generated_ts": ..., "generated_epoch": ...,
+     "bots": {"bot1": {"minute": {...}, "fill_stats": {...}, ...}}}
+
+Consumers read it through :class:`BotStateView`, which re-parses the file
+only when it changes and treats a document older than ``max_age_s`` as
+absent so callers fall back to reading the raw files themselves.
+"""
+from __future__ import annotations
+
+import csv
+import ctypes
+import ctypes.util
+import io
+import json
+import logging
+import os
+import select
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from platform_lib.core.utils import CachedJsonFile, safe_float
+from platform_lib.logging.log_namespace import DEFAULT_LOG_NAMESPACES, list_bot_log_dirs
+
+logger = logging.getLogger(__name__)
+
+BOT_STATE_SCHEMA_VERSION = 1
+_READ_CHUNK = 1024 * 1024
+
+
+def bot_state_path(reports_root: Path) -> Path:
+    """Location of the shared document; ``HB_BOT_STATE_PATH`` overrides it."""
+    explicit = os.getenv("HB_BOT_STATE_PATH", "").strip()
+    if explicit:
+        return Path(explicit)
+    return Path(reports_root) / "bot_state" / "latest.json"
+
+
+def _iso_epoch(value: object) -> float:
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+# ---------------------------------------------------------------------------
+# Fill statistics
+# ---------------------------------------------------------------------------
+
+def new_fill_stats() -> dict[str, Any]:
+    return {
+        "total": 0, "buys": 0, "sells": 0,
+        "maker_total": 0, "taker_total": 0,
+        "buy_notional": 0.0, "sell_notional": 0.0,
+        "total_fees": 0.0, "total_realized_pnl": 0.0,
+        "last_ts": "", "last_side": "", "last_price": 0.0, "last_amount": 0.0,
+        "last_epoch": 0.0,
+        "first_epoch": 0.0,
+    }
+
+
+def fold_fill_row(stats: dict[str, Any], row: dict[str, Any]) -> None:
+    """Add one ``fills.csv`` row to *stats* (see :func:`new_fill_stats`)."""
+    side = str(row.get("side", "")).upper()
+    price = safe_float(row.get("price"))
+    amount = safe_float(row.get("amount_base"))
+    fee = safe_float(row.get("fee_quote", row.get("fee", 0)))
+    pnl = safe_float(row.get("realized_pnl_quote"))
+    is_maker = str(row.get("is_maker", "")).lower() == "true"
+    ts_str = str(row.get("ts", ""))
+    notional = price * amount
+    stats["total"] += 1
+    if side == "BUY":
+        stats["buys"] += 1
+        stats["buy_notional"] += notional
+    elif side == "SELL":
+        stats["sells"] += 1
+        stats["sell_notional"] += notional
+    if is_maker:
+        stats["maker_total"] += 1
+    else:
+        stats["taker_total"] += 1
+    stats["total_fees"] += fee
+    stats["total_realized_pnl"] += pnl
+    epoch = _iso_epoch(ts_str)
+    if epoch:
+        if stats["first_epoch"] == 0.0:
+            stats["first_epoch"] = epoch
+        stats["last_epoch"] = epoch
+        stats["last_ts"] = ts_str
+        stats["last_side"] = side
+        stats["last_price"] = price
+        stats["last_amount"] = amount
+
+
+# ---------------------------------------------------------------------------
+# Incremental file readers
+# ---------------------------------------------------------------------------
+
+class CsvTail:
+    """Incremental reader for an append-only CSV file with a header row.
+
+    :meth:`poll` parses only bytes appended since the previous call and
+    returns the newly completed rows.  A trailing line without a newline
+    (writer mid-append) is left unread until its newline arrives, so
+    :attr:`last_row` only ever reflects fully written rows.  A replaced or
+    truncated file is re-read from the start.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.header: list[str] | None = None
+        self.last_row: dict[str, str] | None = None
+        self.rows = 0
+        self.mtime = 0.0
+        self.generation = 0
+        self._offset = 0
+        self._inode: int | None = None
+
+    def _reset(self) -> None:
+        self.generation += 1
+        self.header = None
+        self.last_row = None
+        self.rows = 0
+        self._offset = 0
+
+    def poll(self) -> list[dict[str, str]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            self._reset()
+            self.mtime = 0.0
+            self._inode = None
+            return []
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset()
+            self._inode = st.st_ino
+        self.mtime = st.st_mtime
+        if st.st_size == self._offset:
+            return []
+        new_rows: list[dict[str, str]] = []
+        remainder = b""
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(self._offset)
+                while True:
+                    chunk = handle.read(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    data = remainder + chunk
+                    cut = data.rfind(b"\n") + 1
+                    if cut:
+                        new_rows.extend(self._parse(data[:cut]))
+                        self._offset += cut
+                    remainder = data[cut:]
+        except OSError:
+            logger.debug("CSV tail read failed for %s", self.path, exc_info=True)
+        return new_rows
+
+    def _parse(self, raw: bytes) -> list[dict[str, str]]:
+        text = raw.decode("utf-8", errors="replace")
+        if self.header is None:
+            first, _, text = text.partition("\n")
+            header = next(csv.reader([first.strip()]), [])
+            if not header:
+                return []
+            self.header = header
+        rows = [dict(r) for r in csv.DictReader(io.StringIO(text, newline=""), fieldnames=self.header)]
+        if rows:
+            self.rows += len(rows)
+            self.last_row = rows[-1]
+        return rows
+
+
+class _LogDirState:
+    """Incremental state of one ``logs/<namespace>/<session>/`` directory."""
+
+    def __init__(self, log_dir: Path) -> None:
+        self.log_dir = log_dir
+        self.minute = CsvTail(log_dir / "minute.csv")
+        self.fills = CsvTail(log_dir / "fills.csv")
+        self.fill_stats = new_fill_stats()
+        self.portfolio = CachedJsonFile(log_dir / "paper_desk_v2.json")
+        self._daily: dict[Path, CachedJsonFile] = {}
+
+    def poll(self) -> None:
+        self.minute.poll()
+        generation = self.fills.generation
+        new_rows = self.fills.poll()
+        if self.fills.generation != generation:
+            self.fill_stats = new_fill_stats()
+        for row in new_rows:
+            fold_fill_row(self.fill_stats, row)
+
+    @property
+    def minute_epoch(self) -> float:
+        latest = self.minute.last_row
+        return _iso_epoch(latest.get("ts", "")) if latest else -1.0
+
+    def daily_state(self) -> dict[str, Any]:
+        """Same precedence as the controller: newest ``daily_state_*.json`` name first."""
+        candidates = list(self.log_dir.glob("daily_state_*.json")) + [self.log_dir / "daily_state.json"]
+        for path in sorted(candidates, reverse=True):
+            cache = self._daily.get(path)
+            if cache is None:
+                cache = self._daily[path] = CachedJsonFile(path)
+            payload = cache.get()
+            if payload:
+                return dict(payload)
+        return {}
+
+
+# ---------------------------------------------------------------------------
+# Change notification
+# ---------------------------------------------------------------------------
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+
+class _ChangeWaiter:
+    """Sleeps until a watched directory changes (inotify) or the timeout elapses."""
+
+    def __init__(self, use_inotify: bool = True) -> None:
+        self._fd = -1
+        self._libc: Any = None
+        self._watched: set[Path] = set()
+        if not use_inotify or not hasattr(os, "O_NONBLOCK"):
+            return
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd >= 0:
+            self._libc, self._fd = libc, fd
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd >= 0
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        if self._fd < 0:
+            return
+        for directory in directories:
+            if directory in self._watched or not directory.is_dir():
+                continue
+            if self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK) >= 0:
+                self._watched.add(directory)
+
+    def wait(self, timeout_s: float, stop: threading.Event) -> None:
+        if self._fd < 0:
+            stop.wait(timeout_s)
+            return
+        ready, _, _ = select.select([self._fd], [], [], timeout_s)
+        if ready:
+            try:
+                while os.read(self._fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+# ---------------------------------------------------------------------------
+# Materialiser
+# ---------------------------------------------------------------------------
+
+class BotStateMaterializer:
+    """Tails every bot's log files once and publishes the shared document."""
+
+    def __init__(
+        self,
+        data_root: Path,
+        out_path: Path,
+        *,
+        namespaces: Sequence[str] = DEFAULT_LOG_NAMESPACES,
+    ) -> None:
+        self._data_root = Path(data_root)
+        self._out_path = Path(out_path)
+        self._namespaces = namespaces
+        self._dirs: dict[Path, _LogDirState] = {}
+        self._open_orders: dict[str, CachedJsonFile] = {}
+        self._bots: dict[str, dict[str, Any]] = {}
+        self._published_epoch = 0.0
+
+    def _discover(self) -> list[tuple[str, Path]]:
+        try:
+            return [
+                (d.name, d) for d in sorted(self._data_root.iterdir())
+                if d.is_dir() and (d / "logs").exists()
+            ]
+        except OSError:
+            return []
+
+    def watched_dirs(self) -> list[Path]:
+        """Directories whose changes should wake the loop."""
+        dirs = [self._data_root]
+        for _, bot_dir in self._discover():
+            dirs.extend([bot_dir / "logs", bot_dir / "logs" / "recovery"])
+            dirs.extend(bot_dir / "logs" / ns for ns in self._namespaces)
+        dirs.extend(self._dirs)
+        return dirs
+
+    def _bot_doc(self, bot: str, bot_dir: Path) -> dict[str, Any]:
+        states: list[_LogDirState] = []
+        for log_dir in list_bot_log_dirs(bot_dir, namespaces=self._namespaces):
+            state = self._dirs.get(log_dir)
+            if state is None:
+                state = self._dirs[log_dir] = _LogDirState(log_dir)
+            state.poll()
+            states.append(state)
+
+        # Freshest minute row picks the active session; daily_state and the
+        # portfolio come from that directory only (stale sessions are ignored).
+        active = max(states, key=lambda s: s.minute_epoch, default=None)
+        if active is not None and active.minute.last_row is None:
+            active = None
+        fills_src = max(states, key=lambda s: s.fill_stats["total"], default=None)
+
+        orders_cache = self._open_orders.get(bot)
+        if orders_cache is None:
+            orders_path = bot_dir / "logs" / "recovery" / "open_orders_latest.json"
+            orders_cache = self._open_orders[bot] = CachedJsonFile(orders_path)
+        orders = orders_cache.get().get("orders", [])
+
+        doc: dict[str, Any] = {
+            "bot": bot,
+            "log_dir": str(active.log_dir) if active else "",
+            "minute_path": str(active.minute.path) if active else "",
+            "minute": dict(active.minute.last_row or {}) if active else {},
+            "minute_epoch": active.minute_epoch if active else 0.0,
+            "minute_rows": active.minute.rows if active else 0,
+            "minute_mtime": active.minute.mtime if active else 0.0,
+            "fills_path": "",
+            "last_fill": {},
+            "fill_stats": new_fill_stats(),
+            "fills_mtime": 0.0,
+            "daily_state": active.daily_state() if active else {},
+            "portfolio": dict(active.portfolio.get()) if active else {},
+            "open_orders": orders if isinstance(orders, list) else [],
+            "heartbeat_mtime": max((_mtime(s.log_dir / "strategy_heartbeat.json") for s in states), default=0.0),
+        }
+        if fills_src is not None and fills_src.fills.last_row is not None:
+            doc.update(
+                fills_path=str(fills_src.fills.path),
+                last_fill=dict(fills_src.fills.last_row),
+                fill_stats=dict(fills_src.fill_stats),
+                fills_mtime=fills_src.fills.mtime,
+            )
+        return doc
+
+    def refresh(self) -> bool:
+        """Fold new file content into the per-bot documents; True if any changed."""
+        bots: dict[str, dict[str, Any]] = {}
+        for bot, bot_dir in self._discover():
+            try:
+                bots[bot] = self._bot_doc(bot, bot_dir)
+            except Exception:
+                logger.exception("Bot state refresh failed for %s", bot)
+                if bot in self._bots:
+                    bots[bot] = self._bots[bot]
+        live = {d for d in self._dirs if d.exists()}
+        self._dirs = {d: s for d, s in self._dirs.items() if d in live}
+        changed = bots != self._bots
+        self._bots = bots
+        return changed
+
+    def document(self) -> dict[str, Any]:
+        now = time.time()
+        return {
+            "schema_version": BOT_STATE_SCHEMA_VERSION,
+            "generated_ts": datetime.fromtimestamp(now, UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "generated_epoch": now,
+            "bots": self._bots,
+        }
+
+    def publish(self) -> Path:
+        doc = self.document()
+        self._out_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._out_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(doc, default=str), encoding="utf-8")
+        tmp.replace(self._out_path)
+        self._published_epoch = float(doc["generated_epoch"])
+        return self._out_path
+
+    def run_once(self, *, heartbeat_s: float = 30.0) -> bool:
+        """Refresh and publish when something changed or the heartbeat is due."""
+        changed = self.refresh()
+        if changed or time.time() - self._published_epoch >= heartbeat_s:
+            self.publish()
+            return True
+        return False
+
+    def run_forever(
+        self,
+        *,
+        poll_s: float = 5.0,
+        heartbeat_s: float = 30.0,
+        min_interval_s: float = 0.5,
+        use_inotify: bool = True,
+        stop: threading.Event | None = None,
+    ) -> None:
+        stop = stop or threading.Event()
+        waiter = _ChangeWaiter(use_inotify)
+        logger.info(
+            "Bot state materialiser: data=%s out=%s mode=%s",
+            self._data_root, self._out_path, "inotify" if waiter.uses_inotify else "poll",
+        )
+        try:
+            while not stop.is_set():
+                started = time.monotonic()
+                try:
+                    self.run_once(heartbeat_s=heartbeat_s)
+                except Exception:
+                    logger.exception("Bot state materialiser cycle failed")
+                waiter.watch(self.watched_dirs())
+                # Writers append in bursts; coalesce them into one refresh.
+                stop.wait(max(0.0, min_interval_s - (time.monotonic() - started)))
+                waiter.wait(min(poll_s, heartbeat_s), stop)
+        finally:
+            waiter.close()
+
+
+# ---------------------------------------------------------------------------
+# Consumer view
+# ---------------------------------------------------------------------------
+
+class BotStateView:
+    """Read side of the shared document; re-parses only when the file changes."""
+
+    def __init__(self, path: Path, *, max_age_s: float = 180.0) -> None:
+        self._path = Path(path)
+        self._max_age_s = max_age_s
+        self._signature: tuple[int, int] | None = None
+        self._doc: dict[str, Any] | None = None
+
+    def document(self) -> dict[str, Any] | None:
+        """The current document, or None when missing, unreadable or stale."""
+        try:
+            st = self._path.stat()
+        except OSError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature != self._signature:
+            try:
+                payload = json.loads(self._path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            self._doc = payload if isinstance(payload, dict) else None
+            self._signature = signature
+        doc = self._doc
+        if doc is None or int(doc.get("schema_version", 0)) != BOT_STATE_SCHEMA_VERSION:
+            return None
+        if time.time() - safe_float(doc.get("generated_epoch")) > self._max_age_s:
+            return None
+        return doc
+
+    def bots(self) -> dict[str, dict[str, Any]]:
+        doc = self.document()
+        bots = doc.get("bots") if doc else None
+        return bots if isinstance(bots, dict) else {}
+
+    def get(self, bot: str) -> dict[str, Any] | None:
+        return self.bots().get(bot)
+
+
+__all__ = [
+    "BOT_STATE_SCHEMA_VERSION",
+    "BotStateMaterializer",
+    "BotStateView",
+    "CsvTail",
+    "bot_state_path",
+    "fold_fill_row",
+    "new_fill_stats",
+]
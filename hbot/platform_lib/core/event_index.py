@@ -0,0 +1,351 @@
+"""Sidecar byte-offset index for event-store JSONL files.
+
+Daily ``events_YYYYMMDD.jsonl`` files reach gigabytes on busy days, so
+queries must not read them whole.  For every data file this module keeps a
+sidecar ``events_YYYYMMDD.jsonl.idx`` with one tab-separated line per
+event::
+
+    <offset>\\t<length>\\t<minute>\\t<event_type>\\t<instance_name>
+
+``minute`` is the first 16 characters of ``ts_utc`` (``YYYY-MM-DDTHH:MM``),
+``event_type`` is lower-cased.  The sidecar starts with a header holding a
+CRC of the data file's first line so a replaced file is detected.
+
+The index is extended incrementally: :meth:`EventFileIndex.refresh` parses
+only bytes appended since the last refresh and appends their entries to the
+sidecar.  Only newline-terminated lines are indexed; a trailing partial line
+(writer mid-append) is parsed on the fly by queries and never persisted.
+
+Counts are answered from the index alone; scans seek to the matching
+offsets, so memory stays bounded by the index, not the data file.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import zlib
+from array import array
+from collections.abc import Collection, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_HEADER_PREFIX = "#eventidx v1 head_crc="
+_READ_CHUNK = 1024 * 1024
+_MAX_CACHED_INDEXES = 32
+
+# (minute, event_type, instance_name)
+IndexKey = tuple[str, str, str]
+
+
+def index_path_for(path: Path) -> Path:
+    """Sidecar index path for an event-store JSONL file."""
+    return path.with_name(path.name + ".idx")
+
+
+def _clean(value: object) -> str:
+    return str(value or "").strip().replace("\t", " ").replace("\n", " ")
+
+
+def _row_key(row: dict[str, Any]) -> IndexKey:
+    return (
+        _clean(row.get("ts_utc"))[:16],
+        _clean(row.get("event_type")).lower(),
+        _clean(row.get("instance_name")),
+    )
+
+
+def _parse_line(raw: bytes) -> dict[str, Any] | None:
+    line = raw.strip()
+    if not line:
+        return None
+    try:
+        payload = json.loads(line)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+class EventFileIndex:
+    """In-memory view of one data file's sidecar index; see module docstring."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._idx_path = index_path_for(self._path)
+        self._offsets: dict[IndexKey, array] = {}
+        self._lengths: dict[IndexKey, array] = {}
+        self._end = 0
+        self._head_crc: int | None = None
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def indexed_bytes(self) -> int:
+        """Bytes of the data file covered by the index."""
+        return self._end
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the data file, appending to the sidecar."""
+        try:
+            size = self._path.stat().st_size
+        except OSError:
+            self._reset()
+            return
+        if not self._loaded:
+            self._load_sidecar()
+            self._loaded = True
+        if size < self._end or not self._head_matches():
+            logger.info("Event index for %s is stale; rebuilding", self._path.name)
+            self._reset()
+            self._idx_path.unlink(missing_ok=True)
+        if size > self._end:
+            self._index_new_bytes()
+
+    def keys(self) -> list[IndexKey]:
+        return list(self._offsets)
+
+    def _reset(self) -> None:
+        self._offsets.clear()
+        self._lengths.clear()
+        self._end = 0
+        self._head_crc = None
+
+    def _add(self, key: IndexKey, offset: int, length: int) -> None:
+        offsets = self._offsets.get(key)
+        if offsets is None:
+            offsets = self._offsets[key] = array("q")
+            self._lengths[key] = array("q")
+        offsets.append(offset)
+        self._lengths[key].append(length)
+
+    def _load_sidecar(self) -> None:
+        try:
+            raw = self._idx_path.read_bytes()
+        except OSError:
+            return
+        lines = raw.split(b"\n")
+        lines.pop()  # torn or empty remainder after the last newline
+        if not lines or not lines[0].startswith(_HEADER_PREFIX.encode()):
+            return
+        try:
+            self._head_crc = int(lines[0][len(_HEADER_PREFIX):])
+        except ValueError:
+            return
+        end = 0
+        for line in lines[1:]:
+            parts = line.decode("utf-8", errors="ignore").split("\t")
+            if len(parts) != 5:
+                continue
+            try:
+                offset, length = int(parts[0]), int(parts[1])
+            except ValueError:
+                continue
+            # Entries appended twice by concurrent refreshers are skipped.
+            if offset < end:
+                continue
+            self._add((parts[2], parts[3], parts[4]), offset, length)
+            end = offset + length + 1
+        self._end = end
+
+    def _head_matches(self) -> bool:
+        if self._head_crc is None:
+            return self._end == 0
+        first = self._first_line()
+        return first is not None and zlib.crc32(first) == self._head_crc
+
+    def _first_line(self) -> bytes | None:
+        try:
+            with self._path.open("rb") as handle:
+                line = handle.readline()
+        except OSError:
+            return None
+        return line if line.endswith(b"\n") else None
+
+    def _index_new_bytes(self) -> None:
+        new_entries: list[str] = []
+        try:
+            with self._path.open("rb") as handle:
+                handle.seek(self._end)
+                position = self._end
+                remainder = b""
+                while True:
+                    chunk = handle.read(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    data = remainder + chunk
+                    start = 0
+                    while True:
+                        nl = data.find(b"\n", start)
+                        if nl < 0:
+                            break
+                        raw = data[start:nl]
+                        offset = position + start
+                        row = _parse_line(raw)
+                        if row is not None:
+                            key = _row_key(row)
+                            self._add(key, offset, len(raw))
+                            new_entries.append(f"{offset}\t{len(raw)}\t{key[0]}\t{key[1]}\t{key[2]}\n")
+                        start = nl + 1
+                    position += start
+                    remainder = data[start:]
+                self._end = position
+        except OSError:
+            logger.warning("Event index refresh failed for %s", self._path, exc_info=True)
+            return
+        self._persist(new_entries)
+
+    def _persist(self, new_entries: list[str]) -> None:
+        try:
+            if self._head_crc is None:
+                first = self._first_line()
+                if first is None:
+                    return
+                self._head_crc = zlib.crc32(first)
+                tmp = self._idx_path.with_suffix(".idx.tmp")
+                tmp.write_text(f"{_HEADER_PREFIX}{self._head_crc}\n" + "".join(new_entries), encoding="utf-8")
+                tmp.replace(self._idx_path)
+            elif new_entries:
+                with self._idx_path.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(new_entries))
+        except OSError:
+            # Read-only stores still get the in-memory index.
+            logger.debug("Could not write event index %s", self._idx_path, exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _matching_keys(
+        self,
+        event_types: Collection[str] | None,
+        instance_name: str | None,
+        start_minute: str | None,
+        end_minute: str | None,
+    ) -> list[IndexKey]:
+        return [key for key in self._offsets if _key_matches(key, event_types, instance_name, start_minute, end_minute)]
+
+    def _tail_rows(self) -> list[dict[str, Any]]:
+        """Rows after the last newline (at most one, if it is valid JSON)."""
+        try:
+            with self._path.open("rb") as handle:
+                handle.seek(self._end)
+                tail = handle.read()
+        except OSError:
+            return []
+        if not tail or b"\n" in tail:
+            return []
+        row = _parse_line(tail)
+        return [row] if row is not None else []
+
+    def count(
+        self,
+        *,
+        event_types: Collection[str] | None = None,
+        instance_name: str | None = None,
+        start_minute: str | None = None,
+        end_minute: str | None = None,
+    ) -> int:
+        """Number of matching events, answered without reading event rows."""
+        self.refresh()
+        total = sum(
+            len(self._offsets[key])
+            for key in self._matching_keys(event_types, instance_name, start_minute, end_minute)
+        )
+        for row in self._tail_rows():
+            if _key_matches(_row_key(row), event_types, instance_name, start_minute, end_minute):
+                total += 1
+        return total
+
+    def scan(
+        self,
+        *,
+        event_types: Collection[str] | None = None,
+        instance_name: str | None = None,
+        start_minute: str | None = None,
+        end_minute: str | None = None,
+        reverse: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield matching rows in file order (or reverse), seeking to each one.
+
+        Filters: ``event_types`` (lower-case), exact ``instance_name`` and an
+        inclusive ``YYYY-MM-DDTHH:MM`` minute range.
+        """
+        self.refresh()
+        keys = self._matching_keys(event_types, instance_name, start_minute, end_minute)
+        tail = [
+            row for row in self._tail_rows()
+            if _key_matches(_row_key(row), event_types, instance_name, start_minute, end_minute)
+        ]
+        if reverse:
+            yield from tail
+        if keys:
+            try:
+                with self._path.open("rb") as handle:
+                    for offset, length in _merge_positions(
+                        [(self._offsets[k], self._lengths[k]) for k in keys], reverse,
+                    ):
+                        handle.seek(offset)
+                        row = _parse_line(handle.read(length))
+                        if row is not None:
+                            yield row
+            except OSError:
+                return
+        if not reverse:
+            yield from tail
+
+
+def _key_matches(
+    key: IndexKey,
+    event_types: Collection[str] | None,
+    instance_name: str | None,
+    start_minute: str | None,
+    end_minute: str | None,
+) -> bool:
+    minute, event_type, instance = key
+    if event_types is not None and event_type not in event_types:
+        return False
+    if instance_name is not None and instance != instance_name:
+        return False
+    if start_minute is not None and minute < start_minute:
+        return False
+    return end_minute is None or minute <= end_minute
+
+
+def _merge_positions(columns: list[tuple[array, array]], reverse: bool) -> Iterable[tuple[int, int]]:
+    if len(columns) == 1:
+        offsets, lengths = columns[0]
+        if reverse:
+            return zip(reversed(offsets), reversed(lengths), strict=True)
+        return zip(offsets, lengths, strict=True)
+    if reverse:
+        return heapq.merge(
+            *(zip(reversed(o), reversed(n), strict=True) for o, n in columns), reverse=True,
+        )
+    return heapq.merge(*(zip(o, n, strict=True) for o, n in columns))
+
+
+_index_cache: dict[Path, EventFileIndex] = {}
+
+
+def open_event_index(path: Path) -> EventFileIndex:
+    """Return the process-wide, refreshed index for *path*."""
+    key = Path(path)
+    index = _index_cache.get(key)
+    if index is None:
+        if len(_index_cache) >= _MAX_CACHED_INDEXES:
+            _index_cache.pop(next(iter(_index_cache)))
+        index = _index_cache[key] = EventFileIndex(key)
+    index.refresh()
+    return index
+
+
+__all__ = ["EventFileIndex", "IndexKey", "index_path_for", "open_event_index"]
@@ -0,0 +1,464 @@
+"""Columnar (Parquet) form of closed event-store days.
+
+The event store appends normalised envelopes to ``events_YYYYMMDD.jsonl``.
+Once a UTC day is closed, :func:`compact_day` rewrites it as Zstd Parquet,
+partitioned by stream and date::
+
+    {event_store_root}/parquet/stream={stream}/date={YYYY-MM-DD}/events.parquet
+    {event_store_root}/parquet/_manifests/events_{YYYYMMDD}.json
+
+Hot envelope fields are promoted to typed columns (``ts_ms`` is derived
+from ``ts_utc``); ``payload`` stays a JSON string and any other top-level
+keys go to the ``extra`` JSON column, so rows round-trip exactly.  ``seq``
+is the row's position in the source file and restores file order when
+streams are merged.
+
+A day counts as compacted once its manifest exists and, if the JSONL file
+is still present, its size matches the size recorded at compaction time.
+Readers (``event_store_reader``) then query Parquet for that day and fall
+back to JSONL otherwise -- today's file is never compacted.
+
+Queries push their predicates into the read: stream partitions are pruned
+by name and by the event types the manifest recorded for them, row groups
+by their ``ts_ms`` statistics, and ``payload``/``extra`` are only read for
+row groups in which the small key columns matched.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+from collections.abc import Collection, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PARQUET_DIRNAME = "parquet"
+_MANIFEST_DIRNAME = "_manifests"
+_FILE_NAME = "events.parquet"
+_BATCH_ROWS = 50_000
+_ROW_GROUP_ROWS = 10_000
+# Columns every query filters on; the wide columns are read only where these match.
+_KEY_COLUMNS: tuple[str, ...] = ("seq", "ts_ms", "event_type", "instance_name")
+
+# Promoted envelope string columns, in services.event_store._normalize order.
+ENVELOPE_FIELDS: tuple[str, ...] = (
+    "event_id",
+    "event_type",
+    "event_version",
+    "ts_utc",
+    "producer",
+    "instance_name",
+    "controller_id",
+    "connector_name",
+    "trading_pair",
+    "correlation_id",
+    "stream",
+    "stream_entry_id",
+    "ingest_ts_utc",
+    "schema_validation_status",
+)
+_ENVELOPE_SET = frozenset(ENVELOPE_FIELDS)
+
+
+def _schema() -> Any:
+    import pyarrow as pa
+
+    return pa.schema(
+        [pa.field("seq", pa.int64()), pa.field("ts_ms", pa.int64())]
+        + [pa.field(name, pa.string()) for name in ENVELOPE_FIELDS]
+        + [pa.field("payload", pa.string()), pa.field("extra", pa.string())]
+    )
+
+
+def _norm_type(value: object) -> str:
+    return str(value or "").strip().lower()
+
+
+def _day_key(day: str) -> str:
+    """Normalise ``YYYY-MM-DD`` / ``YYYYMMDD`` to ``YYYYMMDD``."""
+    return str(day).replace("-", "")
+
+
+def _day_iso(day: str) -> str:
+    key = _day_key(day)
+    return f"{key[:4]}-{key[4:6]}-{key[6:8]}"
+
+
+def jsonl_path(event_store_root: Path, day: str) -> Path:
+    return Path(event_store_root) / f"events_{_day_key(day)}.jsonl"
+
+
+def manifest_path(event_store_root: Path, day: str) -> Path:
+    return Path(event_store_root) / PARQUET_DIRNAME / _MANIFEST_DIRNAME / f"events_{_day_key(day)}.json"
+
+
+def day_partitions(event_store_root: Path, day: str) -> list[Path]:
+    """Parquet files of one compacted day, one per stream."""
+    root = Path(event_store_root) / PARQUET_DIRNAME
+    return sorted(root.glob(f"stream=*/date={_day_iso(day)}/{_FILE_NAME}"))
+
+
+def read_manifest(event_store_root: Path, day: str) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(manifest_path(event_store_root, day).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def is_compacted(event_store_root: Path, day: str) -> bool:
+    """True when the day's Parquet is complete and still matches its JSONL source."""
+    manifest = read_manifest(event_store_root, day)
+    if manifest is None:
+        return False
+    source = jsonl_path(event_store_root, day)
+    if source.exists():
+        try:
+            return source.stat().st_size == int(manifest.get("source_bytes", -1))
+        except OSError:
+            return False
+    return True
+
+
+def compacted_days(event_store_root: Path) -> list[str]:
+    """``YYYYMMDD`` keys of every day with a manifest."""
+    root = Path(event_store_root) / PARQUET_DIRNAME / _MANIFEST_DIRNAME
+    return sorted(p.stem.replace("events_", "") for p in root.glob("events_*.json"))
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+def _ts_ms(value: object) -> int | None:
+    raw = str(value or "").strip()
+    if not raw:
+        return None
+    try:
+        dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp() * 1000)
+
+
+def _to_record(seq: int, row: dict[str, Any]) -> dict[str, Any]:
+    record: dict[str, Any] = {"seq": seq, "ts_ms": _ts_ms(row.get("ts_utc"))}
+    extra: dict[str, Any] = {}
+    for name in ENVELOPE_FIELDS:
+        value = row.get(name)
+        if isinstance(value, str):
+            record[name] = value
+        else:
+            record[name] = None
+            if name in row:
+                extra[name] = value
+    record["payload"] = json.dumps(row["payload"], default=str) if "payload" in row else None
+    for key, value in row.items():
+        if key != "payload" and key not in _ENVELOPE_SET:
+            extra[key] = value
+    record["extra"] = json.dumps(extra, default=str) if extra else None
+    return record
+
+
+def _from_record(record: dict[str, Any]) -> dict[str, Any]:
+    row: dict[str, Any] = {}
+    for name in ENVELOPE_FIELDS:
+        value = record.get(name)
+        if value is not None:
+            row[name] = value
+    payload = record.get("payload")
+    if payload is not None:
+        row["payload"] = json.loads(payload)
+    extra = record.get("extra")
+    if extra:
+        row.update(json.loads(extra))
+    return row
+
+
+def compact_day(event_store_root: Path, day: str, *, delete_source: bool = False) -> dict[str, Any]:
+    """Rewrite one closed day's JSONL as per-stream Parquet and write its manifest.
+
+    Output is staged under a temporary directory and moved into place only
+    after every partition is written; the manifest goes last.  With
+    ``delete_source`` the JSONL file (and its offset index) is removed once
+    the Parquet row count matches.  Returns the manifest.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from platform_lib.core.event_index import index_path_for
+    from platform_lib.core.event_store_reader import _iter_jsonl
+
+    root = Path(event_store_root)
+    source = jsonl_path(root, day)
+    source_bytes = source.stat().st_size
+    schema = _schema()
+    staging = root / PARQUET_DIRNAME / f".staging_{_day_key(day)}"
+    shutil.rmtree(staging, ignore_errors=True)
+
+    writers: dict[str, Any] = {}
+    pending: dict[str, list[dict[str, Any]]] = {}
+    rows_by_stream: dict[str, int] = {}
+    types_by_stream: dict[str, set[str]] = {}
+
+    def _flush(stream: str) -> None:
+        batch = pending.pop(stream, [])
+        if not batch:
+            return
+        writer = writers.get(stream)
+        if writer is None:
+            out_dir = staging / f"stream={stream}" / f"date={_day_iso(day)}"
+            out_dir.mkdir(parents=True, exist_ok=True)
+            writer = writers[stream] = pq.ParquetWriter(out_dir / _FILE_NAME, schema, compression="zstd")
+        writer.write_table(pa.Table.from_pylist(batch, schema=schema), row_group_size=_ROW_GROUP_ROWS)
+
+    try:
+        seq = 0
+        for row in _iter_jsonl(source):
+            record = _to_record(seq, row)
+            seq += 1
+            stream = record["stream"] or "unknown"
+            bucket = pending.setdefault(stream, [])
+            bucket.append(record)
+            rows_by_stream[stream] = rows_by_stream.get(stream, 0) + 1
+            types_by_stream.setdefault(stream, set()).add(_norm_type(record["event_type"]))
+            if len(bucket) >= _BATCH_ROWS:
+                _flush(stream)
+        for stream in list(pending):
+            _flush(stream)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    parquet_root = root / PARQUET_DIRNAME
+    for old in day_partitions(root, day):
+        old.unlink()
+    for staged in staging.glob(f"stream=*/date={_day_iso(day)}/{_FILE_NAME}"):
+        target = parquet_root / staged.relative_to(staging)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staged.replace(target)
+    shutil.rmtree(staging, ignore_errors=True)
+
+    manifest = {
+        "day": _day_iso(day),
+        "source_file": source.name,
+        "source_bytes": source_bytes,
+        "rows": seq,
+        "rows_by_stream": rows_by_stream,
+        "event_types_by_stream": {stream: sorted(types) for stream, types in types_by_stream.items()},
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+    target = manifest_path(root, day)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    tmp.replace(target)
+    logger.info("Compacted %s: %d rows across %d streams", source.name, seq, len(rows_by_stream))
+
+    if delete_source:
+        written = sum(pq.ParquetFile(p).metadata.num_rows for p in day_partitions(root, day))
+        if written == seq:
+            source.unlink()
+            index_path_for(source).unlink(missing_ok=True)
+        else:
+            logger.error("Keeping %s: Parquet has %d rows, expected %d", source.name, written, seq)
+    return manifest
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def _stream_of(partition: Path) -> str:
+    return partition.parent.parent.name.removeprefix("stream=")
+
+
+def _query_partitions(
+    event_store_root: Path,
+    day: str,
+    event_types: Collection[str] | None,
+    streams: Collection[str] | None,
+) -> list[Path]:
+    """Stream partitions of *day* that can hold a matching row."""
+    partitions = day_partitions(event_store_root, day)
+    if streams is not None:
+        wanted = {str(s) for s in streams}
+        partitions = [p for p in partitions if _stream_of(p) in wanted]
+    if event_types is not None:
+        by_stream = (read_manifest(event_store_root, day) or {}).get("event_types_by_stream")
+        if isinstance(by_stream, dict):
+            partitions = [
+                p for p in partitions
+                if _stream_of(p) not in by_stream or not set(event_types).isdisjoint(by_stream[_stream_of(p)])
+            ]
+    return partitions
+
+
+def _candidate_row_groups(parquet_file: Any, start_ms: int | None, end_ms: int | None) -> list[int]:
+    """Row groups whose ``ts_ms`` range overlaps ``[start_ms, end_ms)``."""
+    metadata = parquet_file.metadata
+    groups = list(range(metadata.num_row_groups))
+    if start_ms is None and end_ms is None:
+        return groups
+    ts_index = parquet_file.schema_arrow.get_field_index("ts_ms")
+    selected: list[int] = []
+    for group in groups:
+        stats = metadata.row_group(group).column(ts_index).statistics
+        if stats is None or not stats.has_min_max:
+            selected.append(group)
+            continue
+        if start_ms is not None and stats.max < start_ms:
+            continue
+        if end_ms is not None and stats.min >= end_ms:
+            continue
+        selected.append(group)
+    return selected
+
+
+def _row_mask(
+    keys: Any,
+    event_types: Collection[str] | None,
+    instance_name: str | None,
+    start_ms: int | None,
+    end_ms: int | None,
+) -> Any:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    masks = []
+    if event_types is not None:
+        lowered = pc.utf8_lower(pc.utf8_trim_whitespace(pc.fill_null(keys["event_type"], "")))
+        masks.append(pc.is_in(lowered, value_set=pa.array(sorted(event_types), pa.string())))
+    if instance_name is not None:
+        masks.append(pc.equal(pc.utf8_trim_whitespace(pc.fill_null(keys["instance_name"], "")), instance_name))
+    if start_ms is not None:
+        masks.append(pc.fill_null(pc.greater_equal(keys["ts_ms"], start_ms), False))
+    if end_ms is not None:
+        masks.append(pc.fill_null(pc.less(keys["ts_ms"], end_ms), False))
+    if not masks:
+        return None
+    mask = masks[0]
+    for extra in masks[1:]:
+        mask = pc.and_(mask, extra)
+    return mask
+
+
+def _filtered_table(
+    event_store_root: Path,
+    day: str,
+    columns: list[str],
+    *,
+    event_types: Collection[str] | None,
+    instance_name: str | None,
+    streams: Collection[str] | None = None,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> Any:
+    """Matching rows of *day*, reading only the partitions and row groups that can match.
+
+    The key columns are read first for each candidate row group; the
+    remaining *columns* are read only for row groups with at least one match.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    key_columns = list(_KEY_COLUMNS)
+    wide = [c for c in columns if c not in _KEY_COLUMNS]
+    tables = []
+    for path in _query_partitions(event_store_root, day, event_types, streams):
+        parquet_file = pq.ParquetFile(path)
+        for group in _candidate_row_groups(parquet_file, start_ms, end_ms):
+            keys = parquet_file.read_row_group(group, columns=key_columns)
+            mask = _row_mask(keys, event_types, instance_name, start_ms, end_ms)
+            if mask is not None:
+                if not pc.any(mask).as_py():
+                    continue
+                keys = keys.filter(mask)
+            if wide:
+                rest = parquet_file.read_row_group(group, columns=wide)
+                if mask is not None:
+                    rest = rest.filter(mask)
+                for name in wide:
+                    keys = keys.append_column(name, rest[name])
+            tables.append(keys.select(columns))
+    if not tables:
+        return pa.Table.from_pylist([], schema=_schema()).select(columns)
+    return pa.concat_tables(tables)
+
+
+def count_compacted(
+    event_store_root: Path,
+    day: str,
+    *,
+    event_types: Collection[str] | None = None,
+    instance_name: str | None = None,
+    streams: Collection[str] | None = None,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> int:
+    """Count matching events of a compacted day from the key columns only."""
+    table = _filtered_table(
+        event_store_root,
+        day,
+        ["seq"],
+        event_types=event_types,
+        instance_name=instance_name,
+        streams=streams,
+        start_ms=start_ms,
+        end_ms=end_ms,
+    )
+    return table.num_rows
+
+
+def scan_compacted(
+    event_store_root: Path,
+    day: str,
+    *,
+    event_types: Collection[str] | None = None,
+    instance_name: str | None = None,
+    streams: Collection[str] | None = None,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    reverse: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Yield matching envelopes of a compacted day in source-file order (or reverse).
+
+    ``streams`` restricts the stream partitions read; ``start_ms``/``end_ms``
+    bound ``ts_ms`` to ``[start_ms, end_ms)``.
+    """
+    table = _filtered_table(
+        event_store_root,
+        day,
+        list(_schema().names),
+        event_types=event_types,
+        instance_name=instance_name,
+        streams=streams,
+        start_ms=start_ms,
+        end_ms=end_ms,
+    )
+    if table.num_rows == 0:
+        return
+    table = table.sort_by([("seq", "descending" if reverse else "ascending")])
+    for batch in table.to_batches(max_chunksize=10_000):
+        for record in batch.to_pylist():
+            yield _from_record(record)
+
+
+__all__ = [
+    "ENVELOPE_FIELDS",
+    "compact_day",
+    "compacted_days",
+    "count_compacted",
+    "day_partitions",
+    "is_compacted",
+    "jsonl_path",
+    "manifest_path",
+    "read_manifest",
+    "scan_compacted",
+]
@@ -1,34 +1,47 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable, Iterator
+from collections.abc import Collection, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
+from platform_lib.core import event_store_columnar as columnar
+from platform_lib.core.event_index import open_event_index
 
-def _event_files(event_store_root: Path) -> list[Path]:
-    return sorted(event_store_root.glob("events_*.jsonl"), reverse=True)
+FILL_EVENT_TYPES = frozenset({"order_filled", "bot_fill"})
+
+
+def _event_days(event_store_root: Path) -> list[str]:
+    """``YYYYMMDD`` keys of every day held as JSONL or compacted Parquet, newest first."""
+    days = {p.stem.replace("events_", "") for p in event_store_root.glob("events_*.jsonl")}
+    days.update(columnar.compacted_days(event_store_root))
+    return sorted(days, reverse=True)
+
+
+def _scan_day(
+    event_store_root: Path,
+    day: str,
+    *,
+    event_types: Collection[str],
+    reverse: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Rows of one day from Parquet when compacted, else from the indexed JSONL."""
+    if columnar.is_compacted(event_store_root, day):
+        return columnar.scan_compacted(event_store_root, day, event_types=event_types, reverse=reverse)
+    return open_event_index(columnar.jsonl_path(event_store_root, day)).scan(event_types=event_types, reverse=reverse)
+
+
+def _count_day(event_store_root: Path, day: str, *, event_types: Collection[str], instance_name: str) -> int:
+    if columnar.is_compacted(event_store_root, day):
+        return columnar.count_compacted(event_store_root, day, event_types=event_types, instance_name=instance_name)
+    event_file = columnar.jsonl_path(event_store_root, day)
+    if not event_file.exists():
+        return 0
+    return open_event_index(event_file).count(event_types=event_types, instance_name=instance_name)
 
 
 def _read_jsonl_reverse(path: Path) -> Iterable[dict[str, Any]]:
-    if not path.exists():
-        return []
-    try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    except Exception:
-        return []
-    out: list[dict[str, Any]] = []
-    for raw in reversed(lines):
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except (json.JSONDecodeError, ValueError):
-            continue
-        if isinstance(payload, dict):
-            out.append(payload)
-    return out
+    return _iter_jsonl_reverse_streaming(path)
 
 
 def _iter_lines_reverse(path: Path, *, chunk_size: int = 1024 * 1024) -> Iterator[str]:
@@ -109,13 +122,11 @@ def load_bot_snapshot_windows(
 ) -> dict[str, list[dict[str, Any]]]:
     windows: dict[str, list[dict[str, Any]]] = {}
     max_snapshots_per_bot = max(1, int(max_snapshots_per_bot))
-    for event_file in _event_files(event_store_root):
+    for day in _event_days(event_store_root):
         all_satisfied = bool(windows) and all(len(rows) >= max_snapshots_per_bot for rows in windows.values())
         if all_satisfied:
             break
-        for row in _iter_jsonl_reverse_streaming(event_file):
-            if str(row.get("event_type", "")).strip() != "bot_minute_snapshot":
-                continue
+        for row in _scan_day(event_store_root, day, event_types={"bot_minute_snapshot"}, reverse=True):
             snapshot = _merged_snapshot(row)
             bot = str(snapshot.get("instance_name", "")).strip()
             if not bot:
@@ -128,19 +139,9 @@ def load_bot_snapshot_windows(
 
 
 def count_bot_fill_events(event_store_root: Path, bot: str, *, day_utc: str | None = None) -> int:
-    files: list[Path]
-    if day_utc:
-        files = [event_store_root / f"events_{str(day_utc).replace('-', '')}.jsonl"]
-    else:
-        files = _event_files(event_store_root)
-    count = 0
+    days = [str(day_utc).replace("-", "")] if day_utc else _event_days(event_store_root)
     bot_name = str(bot or "").strip()
-    for event_file in files:
-        for row in _iter_jsonl(event_file):
-            event_type = str(row.get("event_type", "")).strip().lower()
-            if event_type not in {"order_filled", "bot_fill"}:
-                continue
-            if str(row.get("instance_name", "")).strip() != bot_name:
-                continue
-            count += 1
-    return count
+    return sum(
+        _count_day(event_store_root, day, event_types=FILL_EVENT_TYPES, instance_name=bot_name)
+        for day in days
+    )
@@ -0,0 +1,266 @@
+"""Shared bounded psycopg connection pool and TTL query-result cache.
+
+Read paths that used to open a fresh Postgres connection per query
+(``OpsDbReadModel``, ``MarketHistoryProviderImpl``) borrow one from a
+process-wide :class:`PgConnectionPool` instead.  Pooled connections run
+in autocommit mode so a borrowed connection never sits idle inside a
+transaction, and queries are executed with ``prepare=True`` so the
+server-side plan is reused across borrows of the same connection.
+
+A connection that raised during use is closed rather than returned, so
+a dropped socket or a cancelled statement never poisons the pool.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+try:
+    import psycopg
+except Exception:  # pragma: no cover - optional in lightweight test environments.
+    psycopg = None  # type: ignore[assignment]
+
+from platform_lib.exceptions import ConnectivityError
+
+logger = logging.getLogger(__name__)
+
+Connector = Callable[[], Any]
+
+
+class PoolTimeoutError(ConnectivityError):
+    """Raised when no pooled connection became free within the acquire timeout."""
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+class PgConnectionPool:
+    """Bounded, thread-safe pool of psycopg connections.
+
+    At most ``max_size`` connections exist at once; callers block for up
+    to ``acquire_timeout_s`` for one to be returned before
+    :class:`PoolTimeoutError` is raised.  Idle connections older than
+    ``max_idle_s`` are closed on the next acquire.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        *,
+        max_size: int = 4,
+        acquire_timeout_s: float = 3.0,
+        max_idle_s: float = 300.0,
+    ) -> None:
+        self._connector = connector
+        self._max_size = max(1, int(max_size))
+        self._acquire_timeout_s = max(0.0, float(acquire_timeout_s))
+        self._max_idle_s = max(0.0, float(max_idle_s))
+        self._cond = threading.Condition()
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._open = 0
+        self._created = 0
+        self._discarded = 0
+        self._closed = False
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def _checkout(self) -> Any | None:
+        """Pop a healthy idle connection, or reserve a slot (returns None) for a new one."""
+        deadline = time.monotonic() + self._acquire_timeout_s
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ConnectivityError("connection pool is closed")
+                while self._idle:
+                    conn, idle_since = self._idle.pop()
+                    if self._usable(conn) and time.monotonic() - idle_since <= self._max_idle_s:
+                        return conn
+                    self._open -= 1
+                    self._discarded += 1
+                    _close_quietly(conn)
+                if self._open < self._max_size:
+                    self._open += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(f"no pooled connection free within {self._acquire_timeout_s:.1f}s")
+                self._cond.wait(remaining)
+
+    def _release(self, conn: Any | None, *, healthy: bool) -> None:
+        with self._cond:
+            if conn is not None and healthy and not self._closed and self._usable(conn):
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._open -= 1
+                if conn is not None:
+                    self._discarded += 1
+                    _close_quietly(conn)
+            self._cond.notify()
+
+    @staticmethod
+    def _usable(conn: Any) -> bool:
+        return not bool(getattr(conn, "closed", False)) and not bool(getattr(conn, "broken", False))
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection; it is returned on success and closed on error."""
+        conn = self._checkout()
+        healthy = False
+        try:
+            if conn is None:
+                conn = self._connector()
+                with self._cond:
+                    self._created += 1
+            yield conn
+            healthy = True
+        finally:
+            self._release(conn, healthy=healthy)
+
+    def fetch_dicts(self, sql: str, params: Mapping[str, Any] | None = None) -> list[dict[str, Any]]:
+        """Run *sql* as a prepared statement and return the rows as dicts."""
+        with self.connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params, prepare=True)
+            rows = cur.fetchall() if cur.description else []
+            cols = [desc[0] for desc in cur.description or []]
+        out: list[dict[str, Any]] = []
+        for row in rows:
+            if isinstance(row, dict):
+                out.append(row)
+            elif isinstance(row, tuple):
+                out.append({cols[idx]: row[idx] for idx in range(min(len(cols), len(row)))})
+        return out
+
+    def fetch_rows(self, sql: str, params: Mapping[str, Any] | None = None) -> list[tuple[Any, ...]]:
+        """Run *sql* as a prepared statement and return the raw row tuples."""
+        with self.connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params, prepare=True)
+            return list(cur.fetchall() or []) if cur.description else []
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._open -= 1
+                _close_quietly(conn)
+            self._cond.notify_all()
+
+    def metrics(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "max_size": self._max_size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "created": self._created,
+                "discarded": self._discarded,
+            }
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        logger.debug("Closing pooled connection failed", exc_info=True)
+
+
+_SHARED_POOLS: dict[tuple[tuple[str, str], ...], PgConnectionPool] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_pool(
+    *,
+    max_size: int = 4,
+    acquire_timeout_s: float = 3.0,
+    **connect_kwargs: Any,
+) -> PgConnectionPool | None:
+    """Process-wide pool for *connect_kwargs* (host, port, dbname, user, password, options, ...).
+
+    Callers asking for the same connection parameters share one pool;
+    the first caller's ``max_size`` wins.  Returns None when psycopg is
+    not installed.
+    """
+    if psycopg is None:
+        return None
+    key = tuple(sorted((str(k), str(v)) for k, v in connect_kwargs.items()))
+    with _SHARED_LOCK:
+        pool = _SHARED_POOLS.get(key)
+        if pool is None:
+            kwargs = dict(connect_kwargs)
+            kwargs.setdefault("connect_timeout", 3)
+            pool = PgConnectionPool(
+                lambda: psycopg.connect(autocommit=True, **kwargs),
+                max_size=max_size,
+                acquire_timeout_s=acquire_timeout_s,
+            )
+            _SHARED_POOLS[key] = pool
+        return pool
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    return value
+
+
+class TtlResultCache:
+    """LRU-bounded cache of query results, each entry with its own TTL."""
+
+    def __init__(self, *, max_entries: int = 256, clock: Callable[[], float] = time.monotonic) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(sql: str, params: Mapping[str, Any] | None) -> Any:
+        return (sql, _freeze(params or {}))
+
+    def get_or_load(self, key: Any, ttl_s: float, loader: Callable[[], Any]) -> Any:
+        """Cached value for *key* when younger than *ttl_s*, else ``loader()``.
+
+        A ``None`` result is returned but not stored, so failures and empty
+        reads are retried on the next call.
+        """
+        if ttl_s <= 0:
+            return loader()
+        now = self._clock()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        value = loader()
+        if value is None:
+            return None
+        with self._lock:
+            self._entries[key] = (now + ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = ["PgConnectionPool", "PoolTimeoutError", "TtlResultCache", "shared_pool"]
@@ -0,0 +1,226 @@
+"""Append-only on-disk cache of closed 1m bars, one file per (connector, pair, bar_source).
+
+Each file is a flat run of fixed-width little-endian records
+(``bucket_ms`` int64 followed by open/high/low/close/volume_base/
+volume_quote float64, NaN for a missing volume) in ascending bucket order.
+Reads memory-map the file and binary-search the end bucket, so loading
+the newest N bars costs O(log n + N) regardless of file size.  Prices
+round-trip through float64 and come back as ``Decimal(repr(x))``, which
+is exact for prices up to 15 significant digits.
+
+Writers take an exclusive ``flock`` on a sibling ``.lock`` file.
+:meth:`DiskBarCache.locked` exposes the same lock so callers can
+single-flight a fetch-and-append: bots starting together on one host
+queue behind the first seeder and then find the cache already warm.
+"""
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX dev hosts fall back to in-process locking.
+    fcntl = None  # type: ignore[assignment]
+
+from platform_lib.market_data.market_history_types import MarketBar, MarketBarKey
+
+logger = logging.getLogger(__name__)
+
+_RECORD = struct.Struct("<q6d")
+_NAN = float("nan")
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _safe(part: str) -> str:
+    return _UNSAFE.sub("_", str(part or "").strip()) or "_"
+
+
+def _dec(value: float) -> Decimal | None:
+    return None if math.isnan(value) else Decimal(repr(value))
+
+
+def _encode(bar: MarketBar) -> bytes:
+    return _RECORD.pack(
+        int(bar.bucket_start_ms),
+        float(bar.open),
+        float(bar.high),
+        float(bar.low),
+        float(bar.close),
+        float(bar.volume_base) if bar.volume_base is not None else _NAN,
+        float(bar.volume_quote) if bar.volume_quote is not None else _NAN,
+    )
+
+
+class DiskBarCache:
+    """Local 1m bar files under *root*; at most ``max_bars`` (default two weeks) kept per key."""
+
+    def __init__(self, root: str | Path, *, max_bars: int = 20_160) -> None:
+        self._root = Path(root)
+        self._max_bars = max(1, int(max_bars))
+        self._locks_guard = threading.Lock()
+        self._thread_locks: dict[Path, threading.Lock] = {}
+
+    def path_for(self, key: MarketBarKey) -> Path:
+        return self._root / _safe(key.connector_name) / f"{_safe(key.trading_pair.upper())}.{_safe(key.bar_source)}.bars"
+
+    # ── Reads ─────────────────────────────────────────────────────────
+
+    def read(self, key: MarketBarKey, limit: int, end_ms: int | None = None) -> list[MarketBar]:
+        """The newest *limit* cached bars with ``bucket_start_ms <= end_ms``, ascending."""
+        path = self.path_for(key)
+        try:
+            with path.open("rb") as fh:
+                count = os.fstat(fh.fileno()).st_size // _RECORD.size
+                if count == 0:
+                    return []
+                with mmap.mmap(fh.fileno(), count * _RECORD.size, access=mmap.ACCESS_READ) as mm:
+                    hi = count if end_ms is None else self._upper_bound(mm, count, int(end_ms))
+                    lo = max(0, hi - max(1, int(limit)))
+                    return [self._decode(mm, idx, key.bar_source) for idx in range(lo, hi)]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError):
+            logger.warning("Unreadable bar cache file %s", path, exc_info=True)
+            return []
+
+    def tail_ms(self, key: MarketBarKey) -> int | None:
+        bars = self.read(key, 1)
+        return int(bars[-1].bucket_start_ms) if bars else None
+
+    @staticmethod
+    def _bucket_at(mm: mmap.mmap, idx: int) -> int:
+        return struct.unpack_from("<q", mm, idx * _RECORD.size)[0]
+
+    def _upper_bound(self, mm: mmap.mmap, count: int, end_ms: int) -> int:
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._bucket_at(mm, mid) <= end_ms:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @staticmethod
+    def _decode(mm: mmap.mmap, idx: int, bar_source: str) -> MarketBar:
+        bucket_ms, o, h, lo, c, vb, vq = _RECORD.unpack_from(mm, idx * _RECORD.size)
+        return MarketBar(
+            bucket_start_ms=int(bucket_ms),
+            bar_interval_s=60,
+            open=Decimal(repr(o)),
+            high=Decimal(repr(h)),
+            low=Decimal(repr(lo)),
+            close=Decimal(repr(c)),
+            volume_base=_dec(vb),
+            volume_quote=_dec(vq),
+            is_closed=True,
+            bar_source=bar_source,
+        )
+
+    # ── Writes ────────────────────────────────────────────────────────
+
+    @contextmanager
+    def locked(self, key: MarketBarKey) -> Iterator[None]:
+        """Exclusive per-key lock across threads and processes on this host."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locks_guard:
+            thread_lock = self._thread_locks.setdefault(path, threading.Lock())
+        with thread_lock, open(path.with_suffix(".lock"), "a+b") as lock_fh:
+            if fcntl is not None:
+                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+    def append(self, key: MarketBarKey, bars: Iterable[MarketBar], *, lock: bool = True) -> int:
+        """Append closed 1m bars newer than the cached tail; returns how many were written.
+
+        A bar for the tail bucket itself replaces the stored record, and
+        when *bars* repeats a bucket the last one wins.  Pass ``lock=False``
+        when already inside :meth:`locked` for this key.
+        """
+        by_bucket = {
+            int(bar.bucket_start_ms): bar
+            for bar in bars
+            if bar.is_closed and int(bar.bar_interval_s or 60) == 60
+        }
+        fresh = [by_bucket[bucket_ms] for bucket_ms in sorted(by_bucket)]
+        if not fresh:
+            return 0
+        if lock:
+            with self.locked(key):
+                return self._append_locked(key, fresh)
+        return self._append_locked(key, fresh)
+
+    def _append_locked(self, key: MarketBarKey, bars: list[MarketBar]) -> int:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a+b") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            count = size // _RECORD.size
+            if size != count * _RECORD.size:
+                fh.truncate(count * _RECORD.size)  # drop a torn record from an interrupted write
+            tail_ms: int | None = None
+            if count:
+                fh.seek((count - 1) * _RECORD.size)
+                tail_ms = struct.unpack("<q", fh.read(8))[0]
+            written = 0
+            chunks: list[bytes] = []
+            for bar in bars:
+                bucket_ms = int(bar.bucket_start_ms)
+                if tail_ms is not None and bucket_ms < tail_ms:
+                    continue
+                if tail_ms is not None and bucket_ms == tail_ms and not chunks:
+                    # Same bucket as the stored tail: rewrite it in place.
+                    fh.flush()
+                    with path.open("r+b") as patch:
+                        patch.seek((count - 1) * _RECORD.size)
+                        patch.write(_encode(bar))
+                    continue
+                chunks.append(_encode(bar))
+                tail_ms = bucket_ms
+                written += 1
+            if chunks:
+                fh.seek(0, os.SEEK_END)
+                fh.write(b"".join(chunks))
+            count += written
+        if count > 2 * self._max_bars:
+            self._compact(path, count)
+        return written
+
+    def _compact(self, path: Path, count: int) -> None:
+        keep = self._max_bars * _RECORD.size
+        with path.open("rb") as fh:
+            fh.seek((count * _RECORD.size) - keep)
+            tail = fh.read(keep)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(tail)
+        os.replace(tmp, path)
+
+
+@functools.cache
+def _shared_cache(root: str) -> DiskBarCache:
+    return DiskBarCache(root)
+
+
+def disk_cache_from_env() -> DiskBarCache | None:
+    """Process-wide cache rooted at ``MARKET_HISTORY_DISK_CACHE_DIR`` (None when unset)."""
+    root = str(os.getenv("MARKET_HISTORY_DISK_CACHE_DIR", "") or "").strip()
+    return _shared_cache(root) if root else None
+
+
+__all__ = ["DiskBarCache", "disk_cache_from_env"]
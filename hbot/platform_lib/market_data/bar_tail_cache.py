@@ -0,0 +1,169 @@
+"""Incremental cache of 1m market bars read from ``market_bar_v2``.
+
+Each cache key (connector, pair candidates, bar source, ...) holds one
+contiguous, ascending run of 1m bars.  A request for the live tail is
+answered from the cache while the entry is younger than the TTL; once it
+expires, only bars at or after the cached tail are fetched (the tail bar
+itself is re-read in case it was still being written) and spliced on.
+A full fetch happens only on a cold key or when the caller asks for
+deeper history than the cache holds.
+
+Callers whose query has a rolling lower bound (e.g. "the last N hours")
+pass it as ``since_ms``; cached bars older than it are never returned,
+even though the entry may still hold them.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from platform_lib.market_data.market_history_types import MarketBar
+
+# fetch(since_ms, end_ms, limit) -> ascending bars with since_ms <= bucket <= end_ms,
+# the newest ``limit`` of them; ``None`` bounds are open.
+BarFetcher = Callable[[int | None, int | None, int], list[MarketBar]]
+
+
+@dataclass
+class _Entry:
+    bars: list[MarketBar]
+    fetched_at: float
+    # True while the run still starts at the oldest bar the source had:
+    # the full fetch came back short and nothing has been trimmed since.
+    exhausted: bool = False
+
+    @property
+    def tail_ms(self) -> int:
+        return int(self.bars[-1].bucket_start_ms)
+
+
+def _bucket(bar: MarketBar) -> int:
+    return int(bar.bucket_start_ms)
+
+
+def _window(bars: list[MarketBar], since_ms: int | None, end_ms: int | None) -> list[MarketBar]:
+    lo = 0 if since_ms is None else bisect.bisect_left(bars, since_ms, key=_bucket)
+    hi = len(bars) if end_ms is None else bisect.bisect_right(bars, end_ms, key=_bucket)
+    return bars[lo:hi]
+
+
+class IncrementalBarCache:
+    def __init__(
+        self,
+        *,
+        ttl_s: float = 5.0,
+        max_bars: int = 5_000,
+        max_keys: int = 128,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_s = max(0.0, float(ttl_s))
+        self._max_bars = max(1, int(max_bars))
+        self._max_keys = max(1, int(max_keys))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, _Entry] = {}
+        self.full_fetches = 0
+        self.incremental_fetches = 0
+        self.hits = 0
+
+    def get(
+        self,
+        key: Hashable,
+        limit: int,
+        end_ms: int | None,
+        fetch: BarFetcher,
+        *,
+        since_ms: int | None = None,
+    ) -> list[MarketBar]:
+        """The newest *limit* 1m bars in ``[since_ms, end_ms]`` for *key*."""
+        limit = max(1, int(limit))
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and (end_ms is None or end_ms >= entry.tail_ms):
+            if self._clock() - entry.fetched_at >= self._ttl_s:
+                entry = self._extend(key, entry, end_ms, fetch)
+            else:
+                self.hits += 1
+            window = _window(entry.bars, since_ms, end_ms)
+            if self._covers(entry, window, limit, since_ms):
+                return window[-limit:]
+        elif entry is not None:
+            # Historical window that ends inside the cached run.
+            window = _window(entry.bars, since_ms, end_ms)
+            if self._covers(entry, window, limit, since_ms):
+                self.hits += 1
+                return window[-limit:]
+        return self._full(key, limit, since_ms, end_ms, fetch)
+
+    @staticmethod
+    def _covers(entry: _Entry, window: list[MarketBar], limit: int, since_ms: int | None) -> bool:
+        """Whether *window* is the full answer: enough bars, or nothing older exists."""
+        if len(window) >= limit:
+            return True
+        if since_ms is None:
+            return False
+        return entry.exhausted or _bucket(entry.bars[0]) <= since_ms
+
+    def _extend(self, key: Hashable, entry: _Entry, end_ms: int | None, fetch: BarFetcher) -> _Entry:
+        self.incremental_fetches += 1
+        tail_ms = entry.tail_ms
+        fresh = fetch(tail_ms, end_ms, self._max_bars)
+        exhausted = entry.exhausted
+        if not fresh:
+            bars = entry.bars
+        elif len(fresh) >= self._max_bars:
+            bars = fresh  # the gap since the tail is wider than the cache; restart from the new run
+            exhausted = False
+        else:
+            bars = [bar for bar in entry.bars if int(bar.bucket_start_ms) < tail_ms] + fresh
+        if len(bars) > self._max_bars:
+            bars = bars[-self._max_bars:]
+            exhausted = False
+        updated = _Entry(bars=bars, fetched_at=self._clock(), exhausted=exhausted)
+        with self._lock:
+            self._entries[key] = updated
+        return updated
+
+    def _full(
+        self,
+        key: Hashable,
+        limit: int,
+        since_ms: int | None,
+        end_ms: int | None,
+        fetch: BarFetcher,
+    ) -> list[MarketBar]:
+        self.full_fetches += 1
+        bars = fetch(None, end_ms, limit)
+        if not bars:
+            return []
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or int(bars[-1].bucket_start_ms) >= current.tail_ms:
+                if current is None and len(self._entries) >= self._max_keys:
+                    self._entries.pop(next(iter(self._entries)))
+                self._entries[key] = _Entry(
+                    bars=bars[-self._max_bars:],
+                    fetched_at=self._clock(),
+                    exhausted=len(bars) < limit and len(bars) <= self._max_bars,
+                )
+        return _window(bars, since_ms, None)[-limit:]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            keys = len(self._entries)
+        return {
+            "keys": keys,
+            "hits": self.hits,
+            "incremental_fetches": self.incremental_fetches,
+            "full_fetches": self.full_fetches,
+        }
+
+
+__all__ = ["BarFetcher", "IncrementalBarCache"]
@@ -14,6 +14,9 @@ try:
 except Exception:  # pragma: no cover - optional in lightweight test environments.
     psycopg = None  # type: ignore[assignment]
 
+from platform_lib.core.pg_pool import shared_pool
+from platform_lib.market_data.bar_disk_cache import DiskBarCache, disk_cache_from_env
+from platform_lib.market_data.bar_tail_cache import IncrementalBarCache
 from platform_lib.market_data.market_history_provider import MarketHistoryProvider
 from platform_lib.market_data.market_history_types import MarketBar, MarketBarKey, MarketHistoryStatus
 
@@ -28,6 +31,12 @@ logger = logging.getLogger(__name__)
 
 _ZERO = Decimal("0")
 
+# Shared by every provider in the process: controllers and the UI API ask for the
+# same keys, so one warm tail serves them all.
+_DB_BAR_CACHE = IncrementalBarCache(ttl_s=float(os.getenv("MARKET_HISTORY_DB_CACHE_TTL_S", "5")))
+
+_MINUTE_MS = 60_000
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
@@ -56,8 +65,12 @@ class MarketHistoryProviderImpl(MarketHistoryProvider):
         file_reader: BarReader | None = None,
         sample_reader: SampleReader | None = None,
         now_ms_reader: NowMsReader | None = None,
+        db_bar_cache: IncrementalBarCache | None = None,
+        disk_cache: DiskBarCache | None = None,
     ) -> None:
         self._db_reader = db_reader or self._read_bars_from_db
+        self._db_bar_cache = db_bar_cache or _DB_BAR_CACHE
+        self._disk_cache = disk_cache if disk_cache is not None else disk_cache_from_env()
         self._stream_reader = stream_reader
         self._rest_reader = rest_reader
         self._file_reader = file_reader
@@ -166,13 +179,7 @@ class MarketHistoryProviderImpl(MarketHistoryProvider):
     ) -> MarketHistoryStatus:
         from controllers.price_buffer import MinuteBar  # lazy: avoid circular layer dep
 
-        bars, status = self.get_bars(
-            key=key,
-            bar_interval_s=60,
-            limit=max(1, int(bars_needed)),
-            end_time_ms=now_ms,
-            require_closed=True,
-        )
+        bars, status = self._seed_bars(key, max(1, int(bars_needed)), int(now_ms))
         if not bars:
             return status
         minute_bars = [
@@ -206,6 +213,46 @@ class MarketHistoryProviderImpl(MarketHistoryProvider):
         )
         return seeded_status
 
+    def _seed_bars(self, key: MarketBarKey, limit: int, now_ms: int) -> tuple[list[MarketBar], MarketHistoryStatus]:
+        """Closed 1m seed bars, served from the disk cache plus a delta fetch when one is configured.
+
+        The fetch-and-append runs under the cache's per-key lock, so
+        identical seeds from bots starting together wait for the first one
+        and then read its bars locally instead of hitting Postgres / REST.
+        """
+        if self._disk_cache is None:
+            return self.get_bars(key=key, bar_interval_s=60, limit=limit, end_time_ms=now_ms, require_closed=True)
+        with self._disk_cache.locked(key):
+            local = self._disk_cache.read(key, limit, end_ms=now_ms)
+            last_closed_ms = (now_ms // _MINUTE_MS - 1) * _MINUTE_MS
+            source_used = "disk_cache"
+            degraded_reason = ""
+            if len(local) < limit:
+                fetch_limit = limit
+            else:
+                fetch_limit = min(limit, max(0, (last_closed_ms - int(local[-1].bucket_start_ms)) // _MINUTE_MS + 1))
+                if int(local[-1].bucket_start_ms) >= last_closed_ms:
+                    fetch_limit = 0
+            if fetch_limit:
+                fetched, fetched_status = self.get_bars(
+                    key=key, bar_interval_s=60, limit=fetch_limit, end_time_ms=now_ms, require_closed=True,
+                )
+                if fetched:
+                    self._disk_cache.append(key, fetched, lock=False)
+                    local = self._merge_bars(local, fetched)
+                source_used = f"disk_cache+{fetched_status.source_used}" if local else fetched_status.source_used
+                degraded_reason = fetched_status.degraded_reason
+        bars = self._prepare_bars(local, require_closed=True, end_time_ms=now_ms, limit=limit)
+        status = self._build_status(
+            bars=bars,
+            bar_interval_s=60,
+            requested=limit,
+            source_used=source_used if bars else "empty",
+            degraded_reason=degraded_reason,
+            now_ms=now_ms,
+        )
+        return bars, status
+
     def _read_with(
         self,
         reader: BarReader | None,
@@ -232,68 +279,86 @@ class MarketHistoryProviderImpl(MarketHistoryProvider):
     ) -> list[MarketBar]:
         if psycopg is None:
             return []
-        host = os.getenv("OPS_DB_HOST", "postgres")
-        port = int(os.getenv("OPS_DB_PORT", "5432"))
-        dbname = os.getenv("OPS_DB_NAME", "kzay_capital_ops")
-        user = os.getenv("OPS_DB_USER", "hbot")
-        password = os.getenv("OPS_DB_PASSWORD", "kzay_capital_dev_password")
-        rows: list[MarketBar] = []
-        conn = None
+        pairs = self._pair_candidates(key.trading_pair)
+        cache_key = (str(key.connector_name or "").strip(), tuple(pairs), str(key.bar_source or "quote_mid"))
         try:
-            conn = psycopg.connect(host=host, port=port, dbname=dbname, user=user, password=password, connect_timeout=3)
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT EXTRACT(EPOCH FROM bucket_minute_utc) * 1000.0 AS bucket_ms,
-                           open_price,
-                           high_price,
-                           low_price,
-                           close_price,
-                           bar_source
-                    FROM market_bar_v2
-                    WHERE connector_name = %(connector_name)s
-                      AND trading_pair = ANY(%(pairs)s)
-                      AND bar_source = %(bar_source)s
-                      AND bar_interval_s = 60
-                      AND (%(end_ts_utc)s IS NULL OR bucket_minute_utc <= %(end_ts_utc)s::timestamptz)
-                    ORDER BY bucket_minute_utc DESC
-                    LIMIT %(limit)s
-                    """,
-                    {
-                        "connector_name": str(key.connector_name or "").strip(),
-                        "pairs": self._pair_candidates(key.trading_pair),
-                        "bar_source": str(key.bar_source or "quote_mid"),
-                        "end_ts_utc": _to_ts_utc_from_ms(int(end_time_ms)) if end_time_ms else None,
-                        "limit": max(1, int(limit)),
-                    },
-                )
-                for row in reversed(list(cur.fetchall() or [])):
-                    bucket_ms = int(float(row[0]))
-                    open_price = _to_decimal(row[1])
-                    high_price = _to_decimal(row[2])
-                    low_price = _to_decimal(row[3])
-                    close_price = _to_decimal(row[4])
-                    bar_source = str(row[5] or key.bar_source)
-                    if None in {open_price, high_price, low_price, close_price}:
-                        continue
-                    rows.append(
-                        MarketBar(
-                            bucket_start_ms=bucket_ms,
-                            bar_interval_s=60,
-                            open=open_price or _ZERO,
-                            high=high_price or _ZERO,
-                            low=low_price or _ZERO,
-                            close=close_price or _ZERO,
-                            is_closed=True,
-                            bar_source=bar_source,
-                        )
-                    )
+            return self._db_bar_cache.get(
+                cache_key,
+                max(1, int(limit)),
+                int(end_time_ms) if end_time_ms else None,
+                lambda since_ms, end_ms, fetch_limit: self._fetch_db_bars(key, pairs, since_ms, end_ms, fetch_limit),
+            )
         except Exception:
             logger.warning("_read_bars_from_db query failed for %s", key, exc_info=True)
             return []
-        finally:
-            if conn:
-                conn.close()
+
+    def _fetch_db_bars(
+        self,
+        key: MarketBarKey,
+        pairs: list[str],
+        since_ms: int | None,
+        end_time_ms: int | None,
+        limit: int,
+    ) -> list[MarketBar]:
+        pool = shared_pool(
+            host=os.getenv("OPS_DB_HOST", "postgres"),
+            port=int(os.getenv("OPS_DB_PORT", "5432")),
+            dbname=os.getenv("OPS_DB_NAME", "kzay_capital_ops"),
+            user=os.getenv("OPS_DB_USER", "hbot"),
+            password=os.getenv("OPS_DB_PASSWORD", "kzay_capital_dev_password"),
+            connect_timeout=3,
+        )
+        if pool is None:
+            return []
+        fetched = pool.fetch_rows(
+            """
+            SELECT EXTRACT(EPOCH FROM bucket_minute_utc) * 1000.0 AS bucket_ms,
+                   open_price,
+                   high_price,
+                   low_price,
+                   close_price,
+                   bar_source
+            FROM market_bar_v2
+            WHERE connector_name = %(connector_name)s
+              AND trading_pair = ANY(%(pairs)s)
+              AND bar_source = %(bar_source)s
+              AND bar_interval_s = 60
+              AND (%(end_ts_utc)s IS NULL OR bucket_minute_utc <= %(end_ts_utc)s::timestamptz)
+              AND (%(since_ts_utc)s IS NULL OR bucket_minute_utc >= %(since_ts_utc)s::timestamptz)
+            ORDER BY bucket_minute_utc DESC
+            LIMIT %(limit)s
+            """,
+            {
+                "connector_name": str(key.connector_name or "").strip(),
+                "pairs": pairs,
+                "bar_source": str(key.bar_source or "quote_mid"),
+                "end_ts_utc": _to_ts_utc_from_ms(int(end_time_ms)) if end_time_ms else None,
+                "since_ts_utc": _to_ts_utc_from_ms(int(since_ms)) if since_ms is not None else None,
+                "limit": max(1, int(limit)),
+            },
+        )
+        rows: list[MarketBar] = []
+        for row in reversed(fetched):
+            bucket_ms = int(float(row[0]))
+            open_price = _to_decimal(row[1])
+            high_price = _to_decimal(row[2])
+            low_price = _to_decimal(row[3])
+            close_price = _to_decimal(row[4])
+            bar_source = str(row[5] or key.bar_source)
+            if None in {open_price, high_price, low_price, close_price}:
+                continue
+            rows.append(
+                MarketBar(
+                    bucket_start_ms=bucket_ms,
+                    bar_interval_s=60,
+                    open=open_price or _ZERO,
+                    high=high_price or _ZERO,
+                    low=low_price or _ZERO,
+                    close=close_price or _ZERO,
+                    is_closed=True,
+                    bar_source=bar_source,
+                )
+            )
         return rows
 
     def _prepare_bars(
@@ -0,0 +1,60 @@
+"""Trailing-window performance and fill metrics for bot1 from persisted pre-aggregates.
+
+Folds only the minute.csv / fills.csv rows appended since the previous run
+into ``RollingAggregates`` state (kept next to the logs by default), then
+prints Sharpe, drawdown, fill and TCA stats for each trailing window.
+
+Usage:
+    python hbot/scripts/analysis/bot1_rolling_metrics.py
+    python hbot/scripts/analysis/bot1_rolling_metrics.py --windows 1h,24h,7d,30d --daily
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SCRIPT_DIR.parents[1]
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from controllers.analytics.rolling_aggregates import DEFAULT_WINDOWS, RollingAggregates
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", default="data/bot1/logs/epp_v24/bot1_a", help="log root")
+    ap.add_argument("--state", default=None, help="aggregate state file (default: <root>/rolling_aggregates.json)")
+    ap.add_argument("--windows", default=",".join(DEFAULT_WINDOWS), help="comma-separated, e.g. 1h,24h,7d")
+    ap.add_argument("--now", default=None, help="Optional ISO timestamp the windows end at (default: newest row)")
+    ap.add_argument("--daily", action="store_true", help="also print one summary per UTC day")
+    args = ap.parse_args()
+
+    root = Path(args.root)
+    state_path = Path(args.state) if args.state else root / "rolling_aggregates.json"
+    agg = RollingAggregates.load(state_path)
+    ingested = {
+        "minute": agg.ingest_csv(root / "minute.csv", "minute"),
+        "fills": agg.ingest_csv(root / "fills.csv", "fills"),
+    }
+    agg.save(state_path)
+
+    windows = [w.strip() for w in args.windows.split(",") if w.strip()]
+    out: dict[str, object] = {
+        "state": str(state_path),
+        "rows_ingested": ingested,
+        "all_time": {
+            "peak_equity": str(agg.peak_equity) if agg.peak_equity is not None else None,
+            "max_drawdown_pct": str(agg.max_drawdown_pct),
+        },
+        "windows": {spec: summary.to_dict() for spec, summary in agg.trailing(windows, now=args.now).items()},
+    }
+    if args.daily:
+        out["daily"] = {day: summary.to_dict() for day, summary in agg.daily().items()}
+    print(json.dumps(out, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -43,6 +43,8 @@ def archive_old_files(
             original_mb = jsonl_file.stat().st_size / (1024 * 1024)
             compressed_mb = gz_path.stat().st_size / (1024 * 1024)
             jsonl_file.unlink()
+            # Sidecar byte-offset index (platform_lib.core.event_index)
+            jsonl_file.with_name(jsonl_file.name + ".idx").unlink(missing_ok=True)
             archived += 1
             logger.info("Archived %s (%.1f MB → %.1f MB)", jsonl_file.name, original_mb, compressed_mb)
         except Exception:
@@ -0,0 +1,72 @@
+"""Event store daily Parquet compaction.
+
+Rewrites each closed UTC day's ``events_YYYYMMDD.jsonl`` as Zstd Parquet
+partitioned by stream and date (see ``platform_lib.core.event_store_columnar``).
+Today's file is never touched.  A day is recompacted when its JSONL grew
+after the last run (late appends).  JSONL originals are kept unless
+``--delete-source`` is given; ``archive_event_store.py`` still rotates them.
+
+Usage::
+
+    python scripts/ops/compact_event_store.py --once
+    python scripts/ops/compact_event_store.py --interval-hours 6 --delete-source
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from platform_lib.core.event_store_columnar import compact_day, is_compacted
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def compact_closed_days(event_store_dir: Path, *, delete_source: bool = False, today: str | None = None) -> int:
+    """Compact every closed, not-yet-compacted day. Returns count compacted."""
+    today_key = today or datetime.now(UTC).strftime("%Y%m%d")
+    compacted = 0
+    for jsonl_file in sorted(event_store_dir.glob("events_*.jsonl")):
+        day = jsonl_file.stem.replace("events_", "")
+        if day >= today_key or is_compacted(event_store_dir, day):
+            continue
+        try:
+            manifest = compact_day(event_store_dir, day, delete_source=delete_source)
+            compacted += 1
+            logger.info(
+                "Compacted %s (%.1f MB, %d rows)",
+                jsonl_file.name, manifest["source_bytes"] / (1024 * 1024), manifest["rows"],
+            )
+        except Exception:
+            logger.error("Failed to compact %s", jsonl_file.name, exc_info=True)
+    return compacted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compact closed event store days into Parquet")
+    parser.add_argument("--once", action="store_true")
+    parser.add_argument("--interval-hours", type=int, default=6)
+    parser.add_argument("--delete-source", action="store_true")
+    parser.add_argument("--event-store-dir", default="/workspace/hbot/reports/event_store")
+    args = parser.parse_args()
+
+    event_store_dir = Path(args.event_store_dir)
+
+    if args.once:
+        count = compact_closed_days(event_store_dir, delete_source=args.delete_source)
+        logger.info("Compacted %d day(s)", count)
+        sys.exit(0)
+
+    while True:
+        count = compact_closed_days(event_store_dir, delete_source=args.delete_source)
+        if count > 0:
+            logger.info("Compacted %d day(s)", count)
+        time.sleep(args.interval_hours * 3600)
+
+
+if __name__ == "__main__":
+    main()
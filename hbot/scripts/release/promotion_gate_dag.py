@@ -0,0 +1,367 @@
+"""Dependency-graph executor for promotion gate runners.
+
+``run_promotion_gates.py`` declares each subprocess-backed gate as a
+``GateSpec``: the runner callable and its arguments, the gates it must
+run after (``deps``), the files it reads (``inputs``) and the evidence
+files it writes (``outputs``).  ``GateExecutor`` then either
+
+- runs each gate lazily, the first time ``result(name)`` is called, which
+  reproduces the historical sequential order exactly, or
+- runs the whole graph up front on a bounded thread pool
+  (``run_all(max_workers)``), starting every gate as soon as the gates it
+  depends on have finished.  ``deferred`` gates are left out of
+  ``run_all`` and only run at their ``result(name)`` call site, for gates
+  that must observe artifacts written outside the graph.
+
+A failing dependency does not cancel its dependents: every gate still runs
+and is judged on its own evidence, as in the sequential path.  Dependencies
+on gates that are not part of the graph (disabled by CLI flags) are
+treated as satisfied.
+
+Gates that declare ``inputs`` are cacheable.  Their cache key is the
+sha256 of the gate name, runner arguments, ``config``, the Python
+version and installed distributions, the spec's optional ``fingerprint()``
+(e.g. the container image a runner may use) and the content of every
+input file (directories are hashed recursively).  After a passing
+run (rc == 0) the evidence ``outputs`` are copied into a content-addressed
+blob store; a later run with the same key restores those artifacts and
+returns the cached result without invoking the runner.  Failing runs are
+never cached.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+_SKIP_DIRS = frozenset({"__pycache__", ".git", ".mypy_cache", ".pytest_cache", ".ruff_cache", "node_modules"})
+_CHUNK = 1 << 20
+
+
+@dataclass(frozen=True)
+class GateSpec:
+    name: str
+    fn: Callable[..., tuple[int, str]]
+    args: tuple[object, ...] = ()
+    kwargs: Mapping[str, object] = field(default_factory=dict)
+    deps: tuple[str, ...] = ()
+    inputs: tuple[str, ...] = ()  # root-relative files/dirs; empty => never cached
+    outputs: tuple[str, ...] = ()  # root-relative evidence files restored on a cache hit
+    config: Mapping[str, object] = field(default_factory=dict)
+    fingerprint: Callable[[], object] | None = None  # extra runtime state hashed into the cache key
+    deferred: bool = False  # skipped by run_all; runs at its result() call site
+
+    @property
+    def cacheable(self) -> bool:
+        return bool(self.inputs)
+
+
+@dataclass
+class GateResult:
+    name: str
+    rc: int
+    msg: str
+    cached: bool = False
+    duration_s: float = 0.0
+    cache_key: str = ""
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "rc": int(self.rc),
+            "cached": bool(self.cached),
+            "duration_s": round(float(self.duration_s), 3),
+            "cache_key": self.cache_key,
+        }
+
+
+def _sha256_path(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _iter_files(path: Path) -> Iterable[Path]:
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+        for name in sorted(filenames):
+            if not name.endswith((".pyc", ".pyo")):
+                yield Path(dirpath) / name
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+class GateCache:
+    """Content-addressed gate result cache under ``cache_dir``.
+
+    ``index.json`` maps gate name to the key, result and output digests of
+    its last passing run; ``blobs/<sha256>`` holds the evidence files.
+    """
+
+    def __init__(self, root: Path, cache_dir: Path):
+        self._root = root
+        self._dir = cache_dir
+        self._blobs = cache_dir / "blobs"
+        self._index_path = cache_dir / "index.json"
+        self._lock = threading.Lock()
+        self._digests: dict[str, str] = {}
+        self._environment: str | None = None
+        try:
+            index = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = {}
+        self._index: dict[str, dict[str, object]] = index if isinstance(index, dict) else {}
+
+    def _digest(self, rel: str) -> str:
+        """Digest of one input path, memoized for the lifetime of the cache."""
+        with self._lock:
+            cached = self._digests.get(rel)
+        if cached is not None:
+            return cached
+        path = self._root / rel
+        if path.is_file():
+            digest = _sha256_path(path)
+        elif path.is_dir():
+            h = hashlib.sha256()
+            for file in _iter_files(path):
+                h.update(file.relative_to(path).as_posix().encode("utf-8"))
+                h.update(b"\0")
+                h.update(_sha256_path(file).encode("ascii"))
+                h.update(b"\n")
+            digest = h.hexdigest()
+        else:
+            digest = "missing"
+        with self._lock:
+            self._digests[rel] = digest
+        return digest
+
+    def _environment_digest(self) -> str:
+        """Digest of the interpreter and every installed distribution version."""
+        with self._lock:
+            if self._environment is not None:
+                return self._environment
+        dists = sorted(
+            f"{dist.metadata['Name'] or ''}=={dist.version}".lower()
+            for dist in importlib.metadata.distributions()
+        )
+        h = hashlib.sha256(sys.version.encode("utf-8"))
+        for line in dists:
+            h.update(b"\n")
+            h.update(line.encode("utf-8"))
+        digest = h.hexdigest()
+        with self._lock:
+            self._environment = digest
+        return digest
+
+    def key(self, spec: GateSpec) -> str:
+        payload = {
+            "gate": spec.name,
+            "args": [str(a) for a in spec.args],
+            "kwargs": {k: str(v) for k, v in sorted(spec.kwargs.items())},
+            "config": dict(spec.config),
+            "environment": self._environment_digest(),
+            "fingerprint": spec.fingerprint() if spec.fingerprint is not None else None,
+            "inputs": {rel: self._digest(rel) for rel in sorted(spec.inputs)},
+        }
+        raw = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, spec: GateSpec, key: str) -> GateResult | None:
+        """Cached result for *key*, with its evidence artifacts restored, or None."""
+        with self._lock:
+            entry = self._index.get(spec.name)
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        outputs = entry.get("outputs")
+        if not isinstance(outputs, dict):
+            return None
+        for rel, digest in outputs.items():
+            target = self._root / rel
+            if target.is_file() and _sha256_path(target) == digest:
+                continue
+            blob = self._blobs / str(digest)
+            if not blob.is_file():
+                return None
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(blob, target)
+        stamp = str(entry.get("ts_utc", ""))
+        return GateResult(
+            name=spec.name,
+            rc=int(entry.get("rc", 0)),
+            msg=f"[cached key={key[:12]} from {stamp}] {entry.get('msg', '')}".strip(),
+            cached=True,
+            cache_key=key,
+        )
+
+    def store(self, spec: GateSpec, key: str, result: GateResult) -> None:
+        if result.rc != 0:
+            return
+        outputs: dict[str, str] = {}
+        for rel in spec.outputs:
+            path = self._root / rel
+            if not path.is_file():
+                return  # incomplete evidence is not worth reusing
+            digest = _sha256_path(path)
+            blob = self._blobs / digest
+            if not blob.exists():
+                self._blobs.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, blob)
+            outputs[rel] = digest
+        entry = {
+            "key": key,
+            "rc": int(result.rc),
+            "msg": result.msg[:4000],
+            "outputs": outputs,
+            "ts_utc": datetime.now(UTC).isoformat(),
+        }
+        with self._lock:
+            self._index[spec.name] = entry
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._index_path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(self._index, indent=2, sort_keys=True), encoding="utf-8")
+            tmp.replace(self._index_path)
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+class GateExecutor:
+    """Runs ``GateSpec`` runners lazily (sequential) or as a parallel DAG."""
+
+    def __init__(self, specs: Iterable[GateSpec], *, cache: GateCache | None = None):
+        self._specs: dict[str, GateSpec] = {}
+        for spec in specs:
+            if spec.name in self._specs:
+                raise ValueError(f"duplicate gate name: {spec.name}")
+            self._specs[spec.name] = spec
+        for spec in self._specs.values():
+            if not spec.deferred and any(self._specs[d].deferred for d in self._deps(spec)):
+                raise ValueError(f"gate {spec.name} cannot depend on a deferred gate")
+        self._cache = cache
+        self._results: dict[str, GateResult] = {}
+        self._order = self._topological_order()
+        self.mode = "sequential"
+        self.max_workers = 1
+        self.wall_s = 0.0
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    def _deps(self, spec: GateSpec) -> list[str]:
+        return [d for d in spec.deps if d in self._specs]
+
+    def _topological_order(self) -> list[str]:
+        order: list[str] = []
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, path: list[str]) -> None:
+            mark = state.get(name, 0)
+            if mark == 2:
+                return
+            if mark == 1:
+                raise ValueError("gate dependency cycle: " + " -> ".join([*path, name]))
+            state[name] = 1
+            for dep in self._deps(self._specs[name]):
+                visit(dep, [*path, name])
+            state[name] = 2
+            order.append(name)
+
+        for name in self._specs:
+            visit(name, [])
+        return order
+
+    def _execute(self, spec: GateSpec) -> GateResult:
+        started = time.perf_counter()
+        key = ""
+        if self._cache is not None and spec.cacheable:
+            key = self._cache.key(spec)
+            hit = self._cache.lookup(spec, key)
+            if hit is not None:
+                hit.duration_s = time.perf_counter() - started
+                return hit
+        try:
+            rc, msg = spec.fn(*spec.args, **dict(spec.kwargs))
+        except Exception as e:
+            rc, msg = 2, str(e)
+        result = GateResult(
+            name=spec.name,
+            rc=int(rc),
+            msg=str(msg),
+            duration_s=time.perf_counter() - started,
+            cache_key=key,
+        )
+        if key and self._cache is not None:
+            self._cache.store(spec, key, result)
+        return result
+
+    def result(self, name: str) -> tuple[int, str]:
+        """``(rc, msg)`` of gate *name*, running it (and its deps) now if needed."""
+        if name not in self._results:
+            started = time.perf_counter()
+            spec = self._specs[name]
+            for dep in self._deps(spec):
+                self.result(dep)
+            self._results[name] = self._execute(spec)
+            self.wall_s += time.perf_counter() - started
+        res = self._results[name]
+        return res.rc, res.msg
+
+    def run_all(self, max_workers: int) -> dict[str, GateResult]:
+        """Run every non-deferred gate not yet run, at most *max_workers* at a time."""
+        self.mode = "dag"
+        self.max_workers = max(1, int(max_workers))
+        started = time.perf_counter()
+        remaining = {
+            name: {d for d in self._deps(self._specs[name]) if d not in self._results}
+            for name in self._order
+            if name not in self._results and not self._specs[name].deferred
+        }
+        running: dict[Future[GateResult], str] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gate") as pool:
+            while remaining or running:
+                for name in [n for n in self._order if n in remaining and not remaining[n]]:
+                    del remaining[name]
+                    running[pool.submit(self._execute, self._specs[name])] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    self._results[name] = fut.result()
+                    for deps in remaining.values():
+                        deps.discard(name)
+        self.wall_s += time.perf_counter() - started
+        return dict(self._results)
+
+    def summary(self) -> dict[str, object]:
+        gates = {name: self._results[name].to_dict() for name in self._order if name in self._results}
+        serial_s = sum(r.duration_s for r in self._results.values())
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "wall_s": round(self.wall_s, 3),
+            "serial_s": round(serial_s, 3),
+            "cache_enabled": self._cache is not None,
+            "cache_hits": sorted(name for name, r in self._results.items() if r.cached),
+            "gates": gates,
+        }
+
+
+__all__ = [
+    "GateCache",
+    "GateExecutor",
+    "GateResult",
+    "GateSpec",
+]
@@ -10,6 +10,12 @@ import sys
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.release.promotion_gate_dag import GateCache, GateExecutor, GateSpec
+
 
 def _utc_now() -> str:
     return datetime.now(UTC).isoformat()
@@ -1209,6 +1215,43 @@ def _run_tests(root: Path, runtime: str = "auto") -> tuple[int, str]:
         return 2, str(e)
 
 
+def _tests_runtime_fingerprint(root: Path, runtime: str) -> dict[str, str]:
+    """Identity of the container image ``run_tests.py --runtime`` may use.
+
+    The host interpreter and its packages are already part of every gate
+    cache key; ``docker`` and ``auto`` can also run pytest inside the
+    event-store service image, so its image id is hashed as well.
+    """
+    if runtime == "host":
+        return {"runtime": runtime}
+    compose = [
+        "docker",
+        "compose",
+        "--env-file",
+        str(root / "env" / ".env"),
+        "--profile",
+        "external",
+        "-f",
+        str(root / "compose" / "docker-compose.yml"),
+    ]
+    try:
+        images = subprocess.run(
+            [*compose, "config", "--images", "event-store-service"],
+            cwd=str(root), capture_output=True, text=True, check=False, timeout=30,
+        )
+        image = (images.stdout or "").strip().splitlines()[0] if images.returncode == 0 and images.stdout else ""
+        if not image:
+            return {"runtime": runtime, "docker_image": "unavailable"}
+        inspect = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{.Id}}", image],
+            capture_output=True, text=True, check=False, timeout=30,
+        )
+        image_id = (inspect.stdout or "").strip() if inspect.returncode == 0 else "missing"
+        return {"runtime": runtime, "docker_image": image, "docker_image_id": image_id}
+    except Exception as e:
+        return {"runtime": runtime, "docker_image": f"unavailable: {e}"}
+
+
 def _run_ruff_check(root: Path) -> tuple[int, str]:
     cmd = [sys.executable, "-m", "ruff", "check", "controllers/", "services/", "--no-fix"]
     try:
@@ -2050,6 +2093,217 @@ def _run_runtime_performance_budgets_check(
         return 2, str(e)
 
 
+# Source trees hashed into the cache key of the code-only gates.
+_CODE_INPUTS = ("controllers", "services", "platform_lib", "simulation", "pyproject.toml")
+
+
+def _promotion_gate_specs(
+    root: Path,
+    args: argparse.Namespace,
+    *,
+    refresh_parity_once: bool,
+    refresh_event_integrity_once: bool,
+    attempt_fill_event_backfill: bool,
+    day2_min_hours_override: float,
+    max_report_age_min: float,
+    enforce_live_promotion_gates: bool,
+) -> list[GateSpec]:
+    """Subprocess-backed gate runners of this cycle as a dependency graph.
+
+    ``deps`` keep the historical order wherever gates share mutable
+    artifacts (event store JSONL, reconciliation and ops-db reports).
+    Only gates whose verdict depends purely on repository content declare
+    ``inputs`` and are therefore cacheable; freshness-based gates always
+    run.  ``secrets_hygiene`` scans the reports every other step writes, so
+    it depends on the whole graph and is deferred until after the inline
+    evidence steps (1b-1o) of ``main``.
+    """
+    specs: list[GateSpec] = []
+    if refresh_parity_once:
+        specs.append(GateSpec("parity_refresh", _refresh_parity_once, (root,)))
+    if refresh_event_integrity_once:
+        specs.append(GateSpec("event_integrity_refresh", _refresh_event_store_integrity_once, (root,)))
+    if attempt_fill_event_backfill:
+        specs.append(
+            GateSpec(
+                "fill_event_backfill",
+                _run_fill_event_backfill_once,
+                (root,),
+                {"day_utc": datetime.now(UTC).date().isoformat()},
+                deps=("event_integrity_refresh",),
+            )
+        )
+    if args.attempt_day2_catchup:
+        specs.append(
+            GateSpec(
+                "day2_catchup",
+                _attempt_day2_catchup,
+                (root,),
+                {
+                    "cycles": int(args.day2_catchup_cycles),
+                    "day2_min_hours_override": day2_min_hours_override,
+                    "day2_max_delta_override": int(args.day2_max_delta),
+                },
+                deps=("event_integrity_refresh", "fill_event_backfill"),
+            )
+        )
+    if args.check_recon_exchange_preflight:
+        specs.append(GateSpec("reconciliation_refresh", _refresh_reconciliation_exchange_once, (root,)))
+    if args.check_alerting_health:
+        specs.append(GateSpec("alerting_health", _run_alerting_health_check, (root,), {"strict": bool(args.ci)}))
+    if args.check_dashboard_readiness:
+        specs.append(
+            GateSpec(
+                "dashboard_readiness",
+                _run_dashboard_readiness_check,
+                (root,),
+                {
+                    "max_data_age_s": int(max(60, int(args.dashboard_max_data_age_s))),
+                    "required_grafana_bot_variants": str(args.dashboard_required_grafana_bot_variants),
+                },
+            )
+        )
+    if args.check_realtime_l2_data_quality:
+        specs.append(
+            GateSpec(
+                "realtime_l2_data_quality",
+                _run_realtime_l2_data_quality_check,
+                (root,),
+                {
+                    "max_age_sec": int(args.realtime_l2_max_age_sec),
+                    "max_sequence_gap": int(args.realtime_l2_max_sequence_gap),
+                    "min_sampled_events": int(args.realtime_l2_min_sampled_events),
+                    "max_raw_to_sampled_ratio": float(args.realtime_l2_max_raw_to_sampled_ratio),
+                    "max_depth_stream_share": float(args.realtime_l2_max_depth_stream_share),
+                    "max_depth_event_bytes": int(args.realtime_l2_max_depth_event_bytes),
+                    "lookback_depth_events": int(args.realtime_l2_lookback_events),
+                },
+                deps=("day2_catchup",),
+            )
+        )
+    if args.check_runtime_performance_budgets:
+        specs.append(
+            GateSpec(
+                "runtime_performance_budgets",
+                _run_runtime_performance_budgets_check,
+                (root,),
+                {
+                    "exporter_render_samples": int(args.runtime_performance_exporter_render_samples),
+                    "max_controller_tick_p95_ms": float(args.runtime_performance_max_controller_tick_p95_ms),
+                    "max_exporter_render_p95_ms": float(args.runtime_performance_max_exporter_render_p95_ms),
+                    "max_event_store_ingest_p95_ms": float(args.runtime_performance_max_event_store_ingest_p95_ms),
+                    "max_source_age_min": float(args.max_report_age_min),
+                },
+                deps=("day2_catchup",),
+            )
+        )
+    if args.check_canonical_plane_gates:
+        specs.append(
+            GateSpec(
+                "canonical_plane",
+                _run_canonical_plane_gate,
+                (root,),
+                {
+                    "max_db_ingest_age_min": float(args.canonical_max_db_ingest_age_min),
+                    "max_parity_delta_ratio": float(args.canonical_max_parity_delta_ratio),
+                    "min_duplicate_suppression_rate": float(args.canonical_min_duplicate_suppression_rate),
+                    "max_replay_lag_delta": int(args.canonical_max_replay_lag_delta),
+                },
+                deps=("day2_catchup",),
+            )
+        )
+
+    specs.extend(
+        [
+            GateSpec(
+                "multi_bot_policy",
+                _run_multi_bot_policy_check,
+                (root,),
+                inputs=("config", "scripts/release/check_multi_bot_policy.py"),
+                outputs=("reports/policy/latest.json",),
+            ),
+            GateSpec(
+                "strategy_catalog",
+                _run_strategy_catalog_check,
+                (root,),
+                inputs=("config", "controllers", "scripts/release/check_strategy_catalog_consistency.py"),
+                outputs=("reports/strategy_catalog/latest.json",),
+            ),
+            GateSpec(
+                "coordination_policy",
+                _run_coordination_policy_check,
+                (root,),
+                inputs=("config", "compose/docker-compose.yml", "scripts/release/check_coordination_policy.py"),
+                outputs=("reports/policy/coordination_policy_latest.json",),
+            ),
+            GateSpec(
+                "unit_tests",
+                _run_tests,
+                (root,),
+                {"runtime": str(args.tests_runtime)},
+                inputs=(*_CODE_INPUTS, "config", "scripts", "tests"),
+                fingerprint=lambda: _tests_runtime_fingerprint(root, str(args.tests_runtime)),
+                outputs=(
+                    "reports/tests/latest.json",
+                    "reports/tests/latest.md",
+                    "reports/tests/coverage.xml",
+                    "reports/tests/coverage.json",
+                ),
+            ),
+            GateSpec("ruff", _run_ruff_check, (root,), inputs=_CODE_INPUTS),
+            GateSpec("mypy", _run_mypy_check, (root,), inputs=_CODE_INPUTS),
+            GateSpec("ml_governance", _run_ml_governance_check, (root,)),
+            GateSpec(
+                "backtest_regression",
+                _run_regression,
+                (root,),
+                deps=("event_integrity_refresh", "fill_event_backfill", "day2_catchup"),
+            ),
+            GateSpec(
+                "accounting_integrity",
+                _run_accounting_integrity_check,
+                (root, max_report_age_min),
+                deps=("reconciliation_refresh",),
+            ),
+            GateSpec(
+                "market_data_freshness",
+                _run_market_data_freshness_check,
+                (root, max_report_age_min),
+                deps=("day2_catchup",),
+            ),
+        ]
+    )
+    if not args.skip_replay_cycle:
+        specs.append(
+            GateSpec(
+                "replay_regression",
+                _run_replay_regression_multi_window,
+                (root,),
+                {"require_portfolio_risk_healthy": bool(enforce_live_promotion_gates)},
+                deps=("parity_refresh", "fill_event_backfill", "day2_catchup"),
+            )
+        )
+    if bool(args.ci):
+        specs.append(
+            GateSpec(
+                "ops_db_writer",
+                _run_ops_db_writer_once,
+                (root,),
+                deps=("day2_catchup", "canonical_plane", "reconciliation_refresh", "parity_refresh"),
+            )
+        )
+    specs.append(
+        GateSpec(
+            "secrets_hygiene",
+            _run_secrets_hygiene_check,
+            (root,),
+            deps=tuple(spec.name for spec in specs),
+            deferred=True,
+        )
+    )
+    return specs
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Run promotion gate contract checks.")
     live_promotion_mode_default = str(os.getenv("PROMOTION_LIVE_PROMOTION_GATES_MODE", "auto")).strip().lower()
@@ -2821,6 +3075,33 @@ def main() -> int:
         default=float(os.getenv("PAPER_EXCHANGE_PERF_WAIVER_MAX_HOURS", "24")),
         help="Maximum allowed waiver validity window (hours).",
     )
+    parser.add_argument(
+        "--gate-executor",
+        choices=["sequential", "dag"],
+        default=str(os.getenv("PROMOTION_GATE_EXECUTOR", "sequential")).strip().lower(),
+        help=(
+            "sequential=run gate runners one by one in report order; "
+            "dag=run independent gate runners concurrently with content-addressed result caching."
+        ),
+    )
+    parser.add_argument(
+        "--gate-max-workers",
+        type=int,
+        default=int(os.getenv("PROMOTION_GATE_MAX_WORKERS", "4")),
+        help="Worker pool size for --gate-executor dag.",
+    )
+    parser.add_argument(
+        "--gate-cache",
+        action="store_true",
+        default=str(os.getenv("PROMOTION_GATE_CACHE", "true")).strip().lower() in {"1", "true", "yes", "on"},
+        help="Reuse passing results/evidence of gates whose inputs are unchanged (dag executor only).",
+    )
+    parser.add_argument(
+        "--no-gate-cache",
+        action="store_false",
+        dest="gate_cache",
+        help="Always re-run every gate in dag mode.",
+    )
     args = parser.parse_args()
 
     root = Path("/workspace/hbot") if Path("/.dockerenv").exists() else Path(__file__).resolve().parents[2]
@@ -2921,70 +3202,48 @@ def main() -> int:
     if args.ci and args.max_report_age_min == 20:
         max_report_age_min = 15.0
 
-    if refresh_parity_once:
-        parity_refresh_rc, parity_refresh_msg = _refresh_parity_once(root)
-
-    if refresh_event_integrity_once:
-        integrity_refresh_rc, integrity_refresh_msg = _refresh_event_store_integrity_once(root)
-
     attempt_fill_event_backfill = bool(args.attempt_fill_event_backfill or args.ci)
-    if attempt_fill_event_backfill:
-        fill_backfill_rc, fill_backfill_msg = _run_fill_event_backfill_once(
-            root, day_utc=datetime.now(UTC).date().isoformat()
-        )
-
     day2_min_hours_override = float(args.day2_min_hours)
     if day2_min_hours_override < 0 and args.ci:
         day2_min_hours_override = 0.0
 
-    if args.attempt_day2_catchup:
-        day2_catchup_rc, day2_catchup_msg = _attempt_day2_catchup(
+    use_gate_dag = str(args.gate_executor) == "dag"
+    gates = GateExecutor(
+        _promotion_gate_specs(
             root,
-            cycles=int(args.day2_catchup_cycles),
+            args,
+            refresh_parity_once=refresh_parity_once,
+            refresh_event_integrity_once=refresh_event_integrity_once,
+            attempt_fill_event_backfill=attempt_fill_event_backfill,
             day2_min_hours_override=day2_min_hours_override,
-            day2_max_delta_override=int(args.day2_max_delta),
-        )
-
-    if args.check_recon_exchange_preflight:
-        recon_refresh_rc, recon_refresh_msg = _refresh_reconciliation_exchange_once(root)
-
-    if args.check_alerting_health:
-        alerting_health_rc, alerting_health_msg = _run_alerting_health_check(root, strict=bool(args.ci))
-
-    if args.check_dashboard_readiness:
-        dashboard_readiness_rc, dashboard_readiness_msg = _run_dashboard_readiness_check(
-            root,
-            max_data_age_s=int(max(60, int(args.dashboard_max_data_age_s))),
-            required_grafana_bot_variants=str(args.dashboard_required_grafana_bot_variants),
-        )
-    if args.check_realtime_l2_data_quality:
-        realtime_l2_data_quality_rc, realtime_l2_data_quality_msg = _run_realtime_l2_data_quality_check(
-            root,
-            max_age_sec=int(args.realtime_l2_max_age_sec),
-            max_sequence_gap=int(args.realtime_l2_max_sequence_gap),
-            min_sampled_events=int(args.realtime_l2_min_sampled_events),
-            max_raw_to_sampled_ratio=float(args.realtime_l2_max_raw_to_sampled_ratio),
-            max_depth_stream_share=float(args.realtime_l2_max_depth_stream_share),
-            max_depth_event_bytes=int(args.realtime_l2_max_depth_event_bytes),
-            lookback_depth_events=int(args.realtime_l2_lookback_events),
-        )
-    if args.check_runtime_performance_budgets:
-        runtime_performance_budgets_rc, runtime_performance_budgets_msg = _run_runtime_performance_budgets_check(
-            root,
-            exporter_render_samples=int(args.runtime_performance_exporter_render_samples),
-            max_controller_tick_p95_ms=float(args.runtime_performance_max_controller_tick_p95_ms),
-            max_exporter_render_p95_ms=float(args.runtime_performance_max_exporter_render_p95_ms),
-            max_event_store_ingest_p95_ms=float(args.runtime_performance_max_event_store_ingest_p95_ms),
-            max_source_age_min=float(args.max_report_age_min),
-        )
-    if args.check_canonical_plane_gates:
-        canonical_gate_rc, canonical_gate_msg = _run_canonical_plane_gate(
-            root,
-            max_db_ingest_age_min=float(args.canonical_max_db_ingest_age_min),
-            max_parity_delta_ratio=float(args.canonical_max_parity_delta_ratio),
-            min_duplicate_suppression_rate=float(args.canonical_min_duplicate_suppression_rate),
-            max_replay_lag_delta=int(args.canonical_max_replay_lag_delta),
-        )
+            max_report_age_min=max_report_age_min,
+            enforce_live_promotion_gates=bool(enforce_live_promotion_gates),
+        ),
+        cache=GateCache(root, reports / "promotion_gates" / "gate_cache") if use_gate_dag and args.gate_cache else None,
+    )
+    if use_gate_dag:
+        gates.run_all(max_workers=int(args.gate_max_workers))
+
+    if "parity_refresh" in gates:
+        parity_refresh_rc, parity_refresh_msg = gates.result("parity_refresh")
+    if "event_integrity_refresh" in gates:
+        integrity_refresh_rc, integrity_refresh_msg = gates.result("event_integrity_refresh")
+    if "fill_event_backfill" in gates:
+        fill_backfill_rc, fill_backfill_msg = gates.result("fill_event_backfill")
+    if "day2_catchup" in gates:
+        day2_catchup_rc, day2_catchup_msg = gates.result("day2_catchup")
+    if "reconciliation_refresh" in gates:
+        recon_refresh_rc, recon_refresh_msg = gates.result("reconciliation_refresh")
+    if "alerting_health" in gates:
+        alerting_health_rc, alerting_health_msg = gates.result("alerting_health")
+    if "dashboard_readiness" in gates:
+        dashboard_readiness_rc, dashboard_readiness_msg = gates.result("dashboard_readiness")
+    if "realtime_l2_data_quality" in gates:
+        realtime_l2_data_quality_rc, realtime_l2_data_quality_msg = gates.result("realtime_l2_data_quality")
+    if "runtime_performance_budgets" in gates:
+        runtime_performance_budgets_rc, runtime_performance_budgets_msg = gates.result("runtime_performance_budgets")
+    if "canonical_plane" in gates:
+        canonical_gate_rc, canonical_gate_msg = gates.result("canonical_plane")
 
     # 1) Preflight checks
     required_files = [
@@ -3777,7 +4036,7 @@ def main() -> int:
 
     # 2) Multi-bot policy consistency check
     policy_check_path = reports / "policy" / "latest.json"
-    policy_rc, policy_msg = _run_multi_bot_policy_check(root)
+    policy_rc, policy_msg = gates.result("multi_bot_policy")
     policy_report = _read_json(policy_check_path, {})
     policy_ok = policy_rc == 0 and str(policy_report.get("status", "fail")) == "pass"
     checks.append(
@@ -3794,7 +4053,7 @@ def main() -> int:
 
     # 3) Strategy catalog consistency check
     strategy_catalog_path = reports / "strategy_catalog" / "latest.json"
-    strategy_rc, strategy_msg = _run_strategy_catalog_check(root)
+    strategy_rc, strategy_msg = gates.result("strategy_catalog")
     strategy_report = _read_json(strategy_catalog_path, {})
     strategy_ok = strategy_rc == 0 and str(strategy_report.get("status", "fail")) == "pass"
     checks.append(
@@ -3811,7 +4070,7 @@ def main() -> int:
 
     # 4) Coordination policy scope check
     coord_policy_path = reports / "policy" / "coordination_policy_latest.json"
-    coord_rc, coord_msg = _run_coordination_policy_check(root)
+    coord_rc, coord_msg = gates.result("coordination_policy")
     coord_report = _read_json(coord_policy_path, {})
     coord_ok = coord_rc == 0 and str(coord_report.get("status", "fail")) == "pass"
     checks.append(
@@ -3828,7 +4087,7 @@ def main() -> int:
 
     # 5) Deterministic tests + coverage
     tests_path = reports / "tests" / "latest.json"
-    tests_rc, tests_msg = _run_tests(root, runtime=args.tests_runtime)
+    tests_rc, tests_msg = gates.result("unit_tests")
     tests_report = _read_json(tests_path, {})
     tests_ok = tests_rc == 0 and str(tests_report.get("status", "fail")) == "pass"
     checks.append(
@@ -3844,7 +4103,7 @@ def main() -> int:
     )
 
     # 5b) Ruff lint check
-    ruff_rc, ruff_msg = _run_ruff_check(root)
+    ruff_rc, ruff_msg = gates.result("ruff")
     ruff_ok = ruff_rc == 0
     checks.append(
         _check(
@@ -3859,7 +4118,7 @@ def main() -> int:
     )
 
     # 5c) Mypy type check (controllers/ gradual strict)
-    mypy_rc, mypy_msg = _run_mypy_check(root)
+    mypy_rc, mypy_msg = gates.result("mypy")
     mypy_ok = mypy_rc == 0
     checks.append(
         _check(
@@ -3920,7 +4179,7 @@ def main() -> int:
 
     # 6) Secrets hygiene check
     secrets_check_path = reports / "security" / "latest.json"
-    secrets_rc, secrets_msg = _run_secrets_hygiene_check(root)
+    secrets_rc, secrets_msg = gates.result("secrets_hygiene")
     secrets_report = _read_json(secrets_check_path, {})
     secrets_ok = secrets_rc == 0 and str(secrets_report.get("status", "fail")) == "pass"
     checks.append(
@@ -3981,10 +4240,7 @@ def main() -> int:
     replay_cycle_path = reports / "replay_regression_multi_window" / "latest.json"
     replay_cycle = {}
     if not args.skip_replay_cycle:
-        replay_cycle_rc, replay_cycle_msg = _run_replay_regression_multi_window(
-            root,
-            require_portfolio_risk_healthy=bool(enforce_live_promotion_gates),
-        )
+        replay_cycle_rc, replay_cycle_msg = gates.result("replay_regression")
         replay_cycle = _read_json(replay_cycle_path, {})
     replay_cycle_ok = True if args.skip_replay_cycle else (replay_cycle_rc == 0 and str(replay_cycle.get("status", "fail")) == "pass")
     checks.append(
@@ -4001,7 +4257,7 @@ def main() -> int:
 
     # 10) ML governance policy + retirement/drift checks
     ml_governance_path = reports / "policy" / "ml_governance_latest.json"
-    ml_rc, ml_msg = _run_ml_governance_check(root)
+    ml_rc, ml_msg = gates.result("ml_governance")
     ml_report = _read_json(ml_governance_path, {})
     ml_ok = ml_rc == 0 and str(ml_report.get("status", "fail")) == "pass"
     checks.append(
@@ -4017,7 +4273,7 @@ def main() -> int:
     )
 
     # 11) Regression backtest harness (required)
-    rc, reg_msg = _run_regression(root)
+    rc, reg_msg = gates.result("backtest_regression")
     reg_report = reports / "backtest_regression" / "latest.json"
     regression_ok = rc == 0 and reg_report.exists()
     checks.append(
@@ -4127,7 +4383,7 @@ def main() -> int:
 
     # 15) Accounting integrity
     accounting_path = reports / "accounting" / "latest.json"
-    accounting_rc, accounting_msg = _run_accounting_integrity_check(root, max_report_age_min)
+    accounting_rc, accounting_msg = gates.result("accounting_integrity")
     accounting_report = _read_json(accounting_path, {})
     accounting_ok = accounting_rc == 0 and str(accounting_report.get("status", "fail")) == "pass"
     checks.append(
@@ -4224,7 +4480,7 @@ def main() -> int:
 
     # 19) Ops DB writer freshness + non-empty ingestion
     if bool(args.ci):
-        ops_db_writer_refresh_rc, ops_db_writer_refresh_msg = _run_ops_db_writer_once(root)
+        ops_db_writer_refresh_rc, ops_db_writer_refresh_msg = gates.result("ops_db_writer")
     ops_db_writer_path = reports / "ops_db_writer" / "latest.json"
     ops_db_writer = _read_json(ops_db_writer_path, {})
     ops_db_writer_fresh = (
@@ -4282,7 +4538,7 @@ def main() -> int:
 
     # 20) Market data freshness
     md_path = reports / "market_data" / "latest.json"
-    md_rc, md_msg = _run_market_data_freshness_check(root, max_report_age_min)
+    md_rc, md_msg = gates.result("market_data_freshness")
     md_report = _read_json(md_path, {})
     md_ok = md_rc == 0 and str(md_report.get("status", "fail")) == "pass"
     checks.append(
@@ -4668,6 +4924,7 @@ def main() -> int:
             "paper_exchange_thresholds_output": paper_exchange_thresholds_msg[:2000],
             "paper_exchange_thresholds_rc": paper_exchange_thresholds_rc,
             "trading_validation_ladder": ladder_diag,
+            "gate_execution": gates.summary(),
         },
     }
 
@@ -4682,6 +4939,13 @@ def main() -> int:
     _write_markdown_summary(out_root / "latest.md", summary)
 
     print(f"[promotion-gates] status={status} validation_level={validation_level}")
+    if use_gate_dag:
+        gate_execution = gates.summary()
+        print(
+            f"[promotion-gates] gate_executor=dag workers={gate_execution['max_workers']} "
+            f"wall_s={gate_execution['wall_s']} serial_s={gate_execution['serial_s']} "
+            f"cache_hits={','.join(gate_execution['cache_hits']) or 'none'}"
+        )
     if critical_failures:
         print("[promotion-gates] critical_failures=" + ",".join(critical_failures))
     print(f"[promotion-gates] evidence={out_file}")
@@ -2,7 +2,9 @@
 
 Runs synthetic tick cycles (snapshot build + spread compute + JSON serialize +
 CSV emit) against constant synthetic data.  No external dependencies (no Redis,
-no live market data).
+no live market data).  Also drives the real ``TickEmitter`` emit path and
+reports, via ``tracemalloc``, the memory allocated per tick with fresh
+snapshot/output dicts versus the reused ``TickRecord`` and output dict.
 
 Outputs:
   reports/verification/tick_benchmark_latest.json
@@ -15,6 +17,7 @@ import logging
 import statistics
 import sys
 import time
+import tracemalloc
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
@@ -172,6 +175,150 @@ def _bench_spread_compute(iterations: int) -> list[float]:
     return timings
 
 
+def _bench_emit_allocations(iterations: int) -> dict[str, Any]:
+    """Bytes and time per tick on the real emit path (``TickRecord`` + ``TickEmitter``).
+
+    ``fresh`` replays the old allocation pattern through the same code: a new
+    snapshot dict and a new ``ProcessedState`` dict every tick.  ``reused``
+    is what the controller does now.  The minute row is the once-a-minute
+    CSV/Redis payload built from the record.
+    """
+    if str(_ROOT) not in sys.path:
+        sys.path.insert(0, str(_ROOT))
+    from operator import attrgetter
+
+    from controllers.core import MarketConditions, QuoteGeometry, SpreadEdgeState
+    from controllers.ops_guard import GuardState
+    from controllers.tick_emitter import TickEmitter
+    from controllers.tick_record import TICK_FIELDS, TickRecord, TickSchema
+
+    class _Source:
+        pass
+
+    class _NullCsv:
+        def log_minute(self, *_args: Any, **_kwargs: Any) -> None:
+            return None
+
+    source = _Source()
+    for idx, name in enumerate(TICK_FIELDS):
+        setattr(source, name, _D(idx))
+    getters = {name: attrgetter(name) for name in TICK_FIELDS}
+    schema = TickSchema(getters)
+    record = TickRecord()
+    emitter = TickEmitter(csv_logger=_NullCsv())
+
+    snap = _synthetic_snapshot()
+    mc = _synthetic_market_conditions()
+    spread_state = SpreadEdgeState(
+        band_pct=snap["adaptive_band_pct_ewma"],
+        spread_pct=snap["spread_pct"],
+        net_edge=snap["net_edge_pct"],
+        skew=_ZERO,
+        adverse_drift=_ZERO,
+        smooth_drift=_ZERO,
+        drift_spread_mult=_D("1"),
+        turnover_x=snap["turnover_x"],
+        min_edge_threshold=snap["edge_pause_threshold_pct"],
+        edge_resume_threshold=snap["edge_resume_threshold_pct"],
+        fill_factor=_D("0.4"),
+        quote_geometry=QuoteGeometry(
+            base_spread_pct=snap["base_spread_pct"],
+            spread_floor_pct=snap["spread_floor_pct"],
+            reservation_price_adjustment_pct=_ZERO,
+            inventory_urgency=_ZERO,
+            inventory_skew=_ZERO,
+            alpha_skew=_ZERO,
+        ),
+    )
+    market = MarketConditions(
+        is_high_vol=False,
+        bid_p=mc["bid"],
+        ask_p=mc["ask"],
+        market_spread_pct=mc["spread_bps"] / _D("10000"),
+        best_bid_size=_D("1"),
+        best_ask_size=_D("1"),
+        connector_ready=True,
+        order_book_stale=False,
+        market_spread_too_small=False,
+        side_spread_floor=_ZERO,
+    )
+    risk_reasons: list[str] = []
+
+    def emit(snapshot: Any) -> Any:
+        return emitter.build_tick_output(
+            mid=mc["mid"], regime_name="neutral_low_vol", target_base_pct=_D("0.50"), base_pct=_D("0.48"),
+            state=GuardState.RUNNING, spread_state=spread_state, market=market, equity_quote=_D("1000"),
+            base_bal=_D("0.01"), quote_bal=_D("500"), risk_hard_stop=False, risk_reasons=risk_reasons,
+            daily_loss_pct=_D("0.001"), drawdown_pct=_D("0.002"),
+            projected_total_quote=snap["projected_total_quote"], snapshot=snapshot,
+        )
+
+    def fresh() -> object:
+        return dict(emit({name: getter(source) for name, getter in getters.items()}))
+
+    def reused() -> object:
+        return emit(record.refresh(source, schema))
+
+    def measure_bytes(build: Any) -> int:
+        peaks: list[int] = []
+        for _ in range(max(1, iterations)):
+            tracemalloc.reset_peak()
+            base, _peak = tracemalloc.get_traced_memory()
+            build()
+            _cur, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+        return int(statistics.median(peaks))
+
+    def measure_ns(build: Any) -> int:
+        samples: list[int] = []
+        for _ in range(max(1, iterations)):
+            t0 = time.perf_counter_ns()
+            build()
+            samples.append(time.perf_counter_ns() - t0)
+        return int(statistics.median(samples))
+
+    reused()
+    processed = reused()
+    reuses_output = reused() is processed
+    fresh_ns = measure_ns(fresh)
+    reused_ns = measure_ns(reused)
+
+    minute = 0
+
+    def minute_row() -> object:
+        nonlocal minute
+        minute += 1
+        return emitter.log_minute(minute * 60.0, "bench", processed, GuardState.RUNNING, risk_reasons, record)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        fresh_bytes = measure_bytes(fresh)
+        reused_bytes = measure_bytes(reused)
+        minute_row()  # starts the background writer outside the measurement
+        tracemalloc.reset_peak()
+        base, _peak = tracemalloc.get_traced_memory()
+        minute_row()
+        _cur, peak = tracemalloc.get_traced_memory()
+        minute_row_bytes = peak - base
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        emitter.stop()
+    return {
+        "fields": len(TICK_FIELDS),
+        "processed_keys": len(processed),
+        "processed_dict_reused": reuses_output,
+        "fresh_bytes_per_tick": fresh_bytes,
+        "reused_bytes_per_tick": reused_bytes,
+        "bytes_saved_per_tick": fresh_bytes - reused_bytes,
+        "fresh_ns_per_tick": fresh_ns,
+        "reused_ns_per_tick": reused_ns,
+        "minute_row_bytes": minute_row_bytes,
+    }
+
+
 def _make_stats(timings: list[float]) -> dict[str, float]:
     if not timings:
         return {"samples": 0, "p50_ms": 0, "p95_ms": 0, "p99_ms": 0, "max_ms": 0, "mean_ms": 0}
@@ -225,6 +372,7 @@ def run(
         "spread_compute": _make_stats(spread_timings),
         "json_serialize": _make_stats(json_timings),
         "csv_format": _make_stats(csv_timings),
+        "emit_allocations": _bench_emit_allocations(min(iterations, 200)),
     }
 
     reports_dir = root / "reports" / "verification"
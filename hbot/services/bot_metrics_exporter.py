@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import bisect
 import csv
 import json
 import logging
 import os
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime, timedelta
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 
+from platform_lib.core.bot_state import CsvTail
 from platform_lib.logging.log_namespace import iter_bot_log_files
 from platform_lib.core.utils import env_int as _env_int
 from platform_lib.core.utils import parse_iso_ts
@@ -200,6 +203,250 @@ class FillsFileSummary:
     recent_fills: list[dict[str, object]] = field(default_factory=list)
 
 
+# ---------------------------------------------------------------------------
+# Incremental minute.csv / fills.csv folds
+# ---------------------------------------------------------------------------
+
+_RECENT_FILLS_KEEP = 200
+_FILL_WINDOW_S = 24 * 3600
+# Day buckets older than this cannot reach the 30-day aggregate.
+_DAY_PNL_KEEP_DAYS = 31
+# Folds not polled for this long (bot retired, file rotated away) are evicted.
+_FOLD_IDLE_S = 3600.0
+
+
+def _recent_fill_view(row: dict[str, str]) -> dict[str, object]:
+    return {
+        "ts": row.get("ts", ""),
+        "side": row.get("side", ""),
+        "price": _safe_float(row.get("price")),
+        "amount": _safe_float(row.get("amount_base")),
+        "notional": _safe_float(row.get("notional_quote")),
+        "fee": _safe_float(row.get("fee_quote")),
+        "is_maker": str(row.get("is_maker", "")).lower() == "true",
+        "pnl": _safe_float(row.get("realized_pnl_quote")),
+        "order_id": row.get("order_id", ""),
+        "state": row.get("state", ""),
+        "spread_pct": _safe_float(row.get("expected_spread_pct")),
+    }
+
+
+class _MinuteFold:
+    """minute.csv row count, last row and history KPIs, folded from a ``CsvTail``.
+
+    Only bytes appended since the previous poll are parsed; a replaced or
+    truncated file restarts the fold.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.tail = CsvTail(path)
+        self.last_used = time.monotonic()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.equity_start: float | None = None
+        # Last (ts, realized_pnl_today_quote) seen for each UTC day.
+        self.day_pnl: dict[date, tuple[datetime, float]] = {}
+        self.last_dt: datetime | None = None
+        self.last_gross = 0.0
+        self.stall_start: datetime | None = None
+        self.stall_position: tuple[float, float] | None = None
+
+    def poll(self) -> None:
+        generation = self.tail.generation
+        rows = self.tail.poll()
+        if self.tail.generation != generation:
+            self._reset()
+        for row in rows:
+            self._fold(row)
+
+    def _fold(self, row: dict[str, str]) -> None:
+        if self.equity_start is None:
+            self.equity_start = _safe_float(row.get("equity_quote"))
+        dt = parse_iso_ts(row.get("ts", ""))
+        self.last_dt = dt
+        if dt is None:
+            self.stall_start = None
+            return
+        day = dt.date()
+        if day not in self.day_pnl:
+            oldest = day - timedelta(days=_DAY_PNL_KEEP_DAYS)
+            for stale in [d for d in self.day_pnl if d < oldest]:
+                del self.day_pnl[stale]
+        self.day_pnl[day] = (dt, _safe_float(row.get("realized_pnl_today_quote")))
+        position_base = _safe_float(row.get("position_base"))
+        position_gross = _safe_float(row.get("position_gross_base"), abs(position_base))
+        self.last_gross = position_gross
+        state = str(row.get("state", "")).strip().lower()
+        # SOFT_PAUSE requires explicit derisk reason.
+        soft_pause_derisk = state == "soft_pause" and bool(
+            set(_split_reasons(str(row.get("risk_reasons", "")))).intersection(_DERISK_WATCHDOG_REASONS)
+        )
+        # HARD_STOP with non-zero position is treated as forced flatten context.
+        hard_stop_flatten = state == "hard_stop" and abs(position_gross) > 1e-12
+        if not (soft_pause_derisk or hard_stop_flatten):
+            self.stall_start = None
+            return
+        same_position = self.stall_position is not None and (
+            abs(position_base - self.stall_position[0]) <= 1e-10
+            and abs(position_gross - self.stall_position[1]) <= 1e-10
+        )
+        if self.stall_start is None or not same_position:
+            self.stall_start = dt
+            self.stall_position = (position_base, position_gross)
+
+    def scan(self) -> MinuteFileScan:
+        return MinuteFileScan(last_row=self.tail.last_row, row_count=self.tail.rows)
+
+    def history(self, now_utc: datetime) -> MinuteHistoryStats | None:
+        """Same day-boundary aggregation as ``DashboardData._pnl_since()``."""
+        if self.equity_start is None:
+            return None
+
+        def _pnl_since(days: int) -> float:
+            cutoff = now_utc - timedelta(days=days)
+            return sum(pnl for last_dt, pnl in self.day_pnl.values() if last_dt >= cutoff)
+
+        stall_seconds = 0.0
+        if self.last_dt is not None and self.stall_start is not None and abs(self.last_gross) > 1e-12:
+            stall_seconds = max(0.0, (self.last_dt - self.stall_start).total_seconds())
+        return MinuteHistoryStats(
+            equity_start_quote=self.equity_start,
+            realized_pnl_week_quote=_pnl_since(7),
+            realized_pnl_month_quote=_pnl_since(30),
+            derisk_stall_seconds=stall_seconds,
+            derisk_stall_active=1.0 if stall_seconds > 0 else 0.0,
+        )
+
+
+class _FillsFold:
+    """fills.csv summary folded from a ``CsvTail``; only appended rows are parsed."""
+
+    def __init__(self, path: Path) -> None:
+        self.tail = CsvTail(path)
+        self.last_used = time.monotonic()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.stats = FillStats()
+        self.buy_price_sum = 0.0
+        self.sell_price_sum = 0.0
+        self.wins: list[float] = []  # kept sorted
+        self.losses: list[float] = []  # kept sorted
+        self.window: deque[tuple[float, float]] = deque()  # (epoch, pnl) of the last 24h
+        self.recent: deque[dict[str, str]] = deque(maxlen=_RECENT_FILLS_KEEP)
+
+    def poll(self) -> None:
+        generation = self.tail.generation
+        rows = self.tail.poll()
+        if self.tail.generation != generation:
+            self._reset()
+        for row in rows:
+            self._fold(row)
+
+    def _fold(self, row: dict[str, str]) -> None:
+        stats = self.stats
+        side = str(row.get("side", "")).lower()
+        notional = _safe_float(row.get("notional_quote"))
+        fee = _safe_float(row.get("fee_quote"))
+        price = _safe_float(row.get("price"))
+        pnl = _safe_float(row.get("realized_pnl_quote"))
+        mid_ref = _safe_float(row.get("mid_ref"))
+        expected_spread_pct = _safe_float(row.get("expected_spread_pct"))
+        adverse_drift_30s = _safe_float(row.get("adverse_drift_30s"))
+        ts_str = str(row.get("ts", ""))
+
+        stats.trades_total += 1
+        stats.total_fees += fee
+        stats.total_realized_pnl += pnl
+        if pnl > 0:
+            bisect.insort(self.wins, pnl)
+        elif pnl < 0:
+            bisect.insort(self.losses, pnl)
+        epoch = _safe_iso_ts_to_epoch(ts_str) if ts_str else None
+        if epoch:
+            if stats.first_fill_timestamp_seconds == 0.0:
+                stats.first_fill_timestamp_seconds = epoch
+            stats.last_fill_timestamp_seconds = max(stats.last_fill_timestamp_seconds, epoch)
+            self.window.append((epoch, pnl))
+        if str(row.get("is_maker", "")).lower() == "true":
+            stats.maker_fills += 1
+        else:
+            stats.taker_fills += 1
+        if side == "buy":
+            stats.buys += 1
+            stats.buy_notional += notional
+            self.buy_price_sum += price
+        elif side == "sell":
+            stats.sells += 1
+            stats.sell_notional += notional
+            self.sell_price_sum += price
+        stats.last_fill_ts = ts_str
+        stats.last_fill_side = side
+        stats.last_fill_price = price
+        stats.last_fill_amount = _safe_float(row.get("amount_base"))
+        stats.last_fill_pnl = pnl
+        if mid_ref > 0 and price > 0:
+            if side == "sell":
+                slippage_bps = ((mid_ref - price) / mid_ref) * 10000.0
+            else:
+                slippage_bps = ((price - mid_ref) / mid_ref) * 10000.0
+            stats.fill_slippage_bps_sum += slippage_bps
+            stats.fill_slippage_bps_count += 1
+        if expected_spread_pct != 0.0:
+            stats.expected_spread_bps_sum += expected_spread_pct * 10000.0
+            stats.expected_spread_bps_count += 1
+        if adverse_drift_30s != 0.0:
+            stats.adverse_drift_30s_bps_sum += adverse_drift_30s * 10000.0
+            stats.adverse_drift_30s_bps_count += 1
+        if notional > 0:
+            stats.fee_bps_sum += (fee / notional) * 10000.0
+            stats.fee_bps_count += 1
+        self.recent.append(row)
+
+    def summary(self, now_epoch: float, recent_limit: int) -> FillsFileSummary:
+        stats = replace(self.stats)
+        if stats.buys:
+            stats.avg_buy_price = self.buy_price_sum / stats.buys
+        if stats.sells:
+            stats.avg_sell_price = self.sell_price_sum / stats.sells
+        stats.closed_pnl_total = stats.total_realized_pnl
+        wins, losses = self.wins, self.losses
+        stats.trade_wins_total = len(wins)
+        stats.trade_losses_total = len(losses)
+        denom = len(wins) + len(losses)
+        if denom > 0:
+            sum_wins, sum_losses = sum(wins), sum(losses)
+            stats.trade_winrate = len(wins) / denom
+            stats.trade_expectancy_quote = (sum_wins + sum_losses) / denom
+            avg_win = sum_wins / len(wins) if wins else 0.0
+            avg_loss = abs(sum_losses / len(losses)) if losses else 0.0
+            wr = stats.trade_winrate
+            stats.trade_expectancy_rate_quote = avg_win * wr - avg_loss * (1 - wr)
+        stats.trade_median_win_quote = _median(wins)
+        stats.trade_median_loss_quote = _median(losses)
+
+        while self.window and self.window[0][0] < now_epoch - _FILL_WINDOW_S:
+            self.window.popleft()
+        for epoch, pnl in self.window:
+            if epoch >= now_epoch - _FILL_WINDOW_S:
+                stats.fills_24h_count += 1
+                stats.realized_pnl_24h_quote += pnl
+            if epoch >= now_epoch - 3600:
+                stats.fills_1h_count += 1
+                stats.realized_pnl_1h_quote += pnl
+            if epoch >= now_epoch - 300:
+                stats.fills_5m_count += 1
+
+        recent = list(self.recent)[-max(1, int(recent_limit)):]
+        recent.reverse()
+        return FillsFileSummary(
+            row_count=self.tail.rows,
+            fill_stats=stats,
+            recent_fills=[_recent_fill_view(row) for row in recent],
+        )
+
+
 @dataclass
 class OpenOrderSnapshot:
     order_id: str = ""
@@ -341,6 +588,9 @@ class BotMetricsExporter:
         self._render_duration_samples_ms: list[float] = []
         self._source_read_failures_total: dict[str, int] = {}
         self._redis_clients: dict[str, object] = {}
+        self._fold_lock = threading.Lock()
+        self._minute_folds: dict[Path, _MinuteFold] = {}
+        self._fills_folds: dict[Path, _FillsFold] = {}
 
     def register_redis_client(self, name: str, client: object) -> None:
         """Register a RedisStreamClient (or any object with a .health() method) for metrics collection."""
@@ -451,8 +701,19 @@ class BotMetricsExporter:
             snapshot = self._collect_snapshot(minute_file)
             if snapshot is not None:
                 snapshots.append(snapshot)
+        self._prune_folds()
         return snapshots
 
+    def _prune_folds(self) -> None:
+        """Evict folds and cached file results for removed files or idle folds."""
+        cutoff = time.monotonic() - _FOLD_IDLE_S
+        with self._fold_lock:
+            for folds in (self._minute_folds, self._fills_folds):
+                for path in [p for p, fold in folds.items() if fold.last_used < cutoff or not p.exists()]:
+                    del folds[path]
+        for key in [k for k in list(self._file_result_cache) if not Path(k[1]).exists()]:
+            self._file_result_cache.pop(key, None)
+
     def _collect_snapshot(self, minute_file: Path) -> BotSnapshot | None:
         bot_name = minute_file.parts[-5]
         minute_scan = self._cached_minute_file_scan(minute_file)
@@ -1452,9 +1713,27 @@ class BotMetricsExporter:
                 return None
         return self._cached_file_result("portfolio", portfolio_path, _load)
 
+    def _minute_fold(self, minute_file: Path) -> _MinuteFold:
+        """Polled incremental fold of *minute_file*; call with ``_fold_lock`` held."""
+        fold = self._minute_folds.get(minute_file)
+        if fold is None:
+            fold = self._minute_folds[minute_file] = _MinuteFold(minute_file)
+        fold.last_used = time.monotonic()
+        fold.poll()
+        return fold
+
+    def _fills_fold(self, fills_path: Path) -> _FillsFold:
+        """Polled incremental fold of *fills_path*; call with ``_fold_lock`` held."""
+        fold = self._fills_folds.get(fills_path)
+        if fold is None:
+            fold = self._fills_folds[fills_path] = _FillsFold(fills_path)
+        fold.last_used = time.monotonic()
+        fold.poll()
+        return fold
+
     def _compute_minute_history(self, minute_file: Path) -> MinuteHistoryStats | None:
         """
-        Scan all rows in minute.csv to compute:
+        History KPIs of minute.csv, folded incrementally from the appended rows:
         - equity_start_quote: equity_quote of the first row
         - realized_pnl_week_quote: 7-day day-boundary aggregation
         - realized_pnl_month_quote: 30-day day-boundary aggregation
@@ -1463,101 +1742,21 @@ class BotMetricsExporter:
         if not minute_file.exists():
             return None
         try:
-            rows: list[dict[str, str]] = []
-            with minute_file.open("r", encoding="utf-8", newline="") as fp:
-                reader = csv.DictReader(fp)
-                for row in reader:
-                    rows.append(row)
-            if not rows:
-                return None
-
-            equity_start = _safe_float(rows[0].get("equity_quote"))
-            now_utc = datetime.now(UTC)
-
-            def _pnl_since(days: int) -> float:
-                cutoff = now_utc - timedelta(days=days)
-                pnl = 0.0
-                prev_date = None
-                prev_pnl_today = 0.0
-                for row in rows:
-                    ts_str = row.get("ts", "")
-                    dt = parse_iso_ts(ts_str)
-                    if dt is None:
-                        continue
-                    if dt < cutoff:
-                        continue
-                    day = dt.date()
-                    cur_pnl_today = _safe_float(row.get("realized_pnl_today_quote"))
-                    if prev_date is not None and day != prev_date:
-                        pnl += prev_pnl_today
-                    prev_date = day
-                    prev_pnl_today = cur_pnl_today
-                pnl += prev_pnl_today
-                return pnl
-
-            derisk_stall_seconds = 0.0
-            derisk_stall_active = 0.0
-            latest_row = rows[-1]
-            latest_dt = parse_iso_ts(latest_row.get("ts", ""))
-            latest_position_base = _safe_float(latest_row.get("position_base"))
-            latest_position_gross = _safe_float(latest_row.get("position_gross_base"), abs(latest_position_base))
-            if latest_dt is not None and abs(latest_position_gross) > 1e-12:
-                stall_start_dt = None
-                for row in reversed(rows):
-                    row_dt = parse_iso_ts(row.get("ts", ""))
-                    if row_dt is None:
-                        break
-                    row_state = str(row.get("state", "")).strip().lower()
-                    row_reasons = set(_split_reasons(str(row.get("risk_reasons", ""))))
-                    row_position_base = _safe_float(row.get("position_base"))
-                    row_position_gross = _safe_float(row.get("position_gross_base"), abs(row_position_base))
-                    same_position = (
-                        abs(row_position_base - latest_position_base) <= 1e-10
-                        and abs(row_position_gross - latest_position_gross) <= 1e-10
-                    )
-                    # SOFT_PAUSE requires explicit derisk reason.
-                    soft_pause_derisk = (
-                        row_state == "soft_pause"
-                        and bool(row_reasons.intersection(_DERISK_WATCHDOG_REASONS))
-                    )
-                    # HARD_STOP with non-zero position is treated as forced flatten context.
-                    hard_stop_flatten = row_state == "hard_stop" and abs(row_position_gross) > 1e-12
-                    if same_position and (soft_pause_derisk or hard_stop_flatten):
-                        stall_start_dt = row_dt
-                        continue
-                    break
-                if stall_start_dt is not None:
-                    derisk_stall_seconds = max(0.0, (latest_dt - stall_start_dt).total_seconds())
-                    derisk_stall_active = 1.0 if derisk_stall_seconds > 0 else 0.0
-
-            return MinuteHistoryStats(
-                equity_start_quote=equity_start,
-                realized_pnl_week_quote=_pnl_since(7),
-                realized_pnl_month_quote=_pnl_since(30),
-                derisk_stall_seconds=derisk_stall_seconds,
-                derisk_stall_active=derisk_stall_active,
-            )
+            with self._fold_lock:
+                return self._minute_fold(minute_file).history(datetime.now(UTC))
         except Exception:
             self._record_source_read_failure("minute_history")
             return None
 
     def _scan_minute_file(self, minute_file: Path) -> MinuteFileScan:
-        scan = MinuteFileScan()
         if not minute_file.exists():
-            return scan
+            return MinuteFileScan()
         try:
-            with minute_file.open("r", encoding="utf-8", newline="") as fp:
-                reader = csv.DictReader(fp)
-                last = None
-                count = 0
-                for row in reader:
-                    last = row
-                    count += 1
-                scan.last_row = last
-                scan.row_count = count
+            with self._fold_lock:
+                return self._minute_fold(minute_file).scan()
         except Exception:
             self._record_source_read_failure("minute_file_scan")
-        return scan
+            return MinuteFileScan()
 
     def _read_daily_state_any(self, log_dir: Path) -> dict[str, str] | None:
         """Read any daily_state*.json file (v1 or v2 naming convention)."""
@@ -1593,186 +1792,28 @@ class BotMetricsExporter:
         return self._cached_file_result("last_csv_row", path, _load)
 
     def _scan_fills_file(self, fills_path: Path, recent_limit: int = 50) -> FillsFileSummary:
-        summary = FillsFileSummary()
         if not fills_path.exists():
-            return summary
+            return FillsFileSummary()
         try:
-            buy_prices, sell_prices = [], []
-            pnl_values: list[float] = []
-            recent_rows: list[dict[str, str]] = []
-            first_ts_epoch: float = 0.0
-            last_ts_epoch: float = 0.0
-            cutoff_5m = datetime.now(UTC).timestamp() - (5 * 60)
-            cutoff_1h = datetime.now(UTC).timestamp() - (60 * 60)
-            cutoff_24h = datetime.now(UTC).timestamp() - (24 * 3600)
-            safe_recent_limit = max(1, int(recent_limit))
-            with fills_path.open("r", encoding="utf-8", newline="") as fp:
-                reader = csv.DictReader(fp)
-                for row in reader:
-                    summary.row_count += 1
-                    side = str(row.get("side", "")).lower()
-                    notional = _safe_float(row.get("notional_quote"))
-                    fee = _safe_float(row.get("fee_quote"))
-                    price = _safe_float(row.get("price"))
-                    amount = _safe_float(row.get("amount_base"))
-                    pnl = _safe_float(row.get("realized_pnl_quote"))
-                    is_maker = str(row.get("is_maker", "")).lower() == "true"
-                    mid_ref = _safe_float(row.get("mid_ref"))
-                    expected_spread_pct = _safe_float(row.get("expected_spread_pct"))
-                    adverse_drift_30s = _safe_float(row.get("adverse_drift_30s"))
-                    ts_str = str(row.get("ts", ""))
-
-                    stats = summary.fill_stats
-                    stats.trades_total += 1
-                    stats.total_fees += fee
-                    stats.total_realized_pnl += pnl
-                    pnl_values.append(pnl)
-
-                    if first_ts_epoch == 0.0 and ts_str:
-                        epoch = _safe_iso_ts_to_epoch(ts_str)
-                        if epoch:
-                            first_ts_epoch = epoch
-                    if ts_str:
-                        epoch = _safe_iso_ts_to_epoch(ts_str)
-                        if epoch:
-                            last_ts_epoch = max(last_ts_epoch, epoch)
-                            if epoch >= cutoff_5m:
-                                stats.fills_5m_count += 1
-                            if epoch >= cutoff_1h:
-                                stats.fills_1h_count += 1
-                                stats.realized_pnl_1h_quote += pnl
-                            if epoch >= cutoff_24h:
-                                stats.fills_24h_count += 1
-                                stats.realized_pnl_24h_quote += pnl
-
-                    if is_maker:
-                        stats.maker_fills += 1
-                    else:
-                        stats.taker_fills += 1
-                    if side == "buy":
-                        stats.buys += 1
-                        stats.buy_notional += notional
-                        buy_prices.append(price)
-                    elif side == "sell":
-                        stats.sells += 1
-                        stats.sell_notional += notional
-                        sell_prices.append(price)
-                    stats.last_fill_ts = ts_str
-                    stats.last_fill_side = side
-                    stats.last_fill_price = price
-                    stats.last_fill_amount = amount
-                    stats.last_fill_pnl = pnl
-
-                    if mid_ref > 0 and price > 0:
-                        if side == "sell":
-                            slippage_bps = ((mid_ref - price) / mid_ref) * 10000.0
-                        else:
-                            slippage_bps = ((price - mid_ref) / mid_ref) * 10000.0
-                        stats.fill_slippage_bps_sum += slippage_bps
-                        stats.fill_slippage_bps_count += 1
-
-                    if expected_spread_pct != 0.0:
-                        stats.expected_spread_bps_sum += expected_spread_pct * 10000.0
-                        stats.expected_spread_bps_count += 1
-
-                    if adverse_drift_30s != 0.0:
-                        stats.adverse_drift_30s_bps_sum += adverse_drift_30s * 10000.0
-                        stats.adverse_drift_30s_bps_count += 1
-
-                    if notional > 0:
-                        stats.fee_bps_sum += (fee / notional) * 10000.0
-                        stats.fee_bps_count += 1
-
-                    recent_rows.append(row)
-                    if len(recent_rows) > safe_recent_limit:
-                        recent_rows = recent_rows[-safe_recent_limit:]
-
-            stats = summary.fill_stats
-            if buy_prices:
-                stats.avg_buy_price = sum(buy_prices) / len(buy_prices)
-            if sell_prices:
-                stats.avg_sell_price = sum(sell_prices) / len(sell_prices)
-
-            stats.first_fill_timestamp_seconds = first_ts_epoch
-            stats.last_fill_timestamp_seconds = last_ts_epoch
-            stats.closed_pnl_total = sum(pnl_values)
-
-            wins = [p for p in pnl_values if p > 0]
-            losses = [p for p in pnl_values if p < 0]
-            stats.trade_wins_total = len(wins)
-            stats.trade_losses_total = len(losses)
-            nonzero = wins + losses
-            denom = len(wins) + len(losses)
-            if denom > 0:
-                stats.trade_winrate = len(wins) / denom
-                stats.trade_expectancy_quote = sum(nonzero) / len(nonzero)
-                avg_win = sum(wins) / len(wins) if wins else 0.0
-                avg_loss = abs(sum(losses) / len(losses)) if losses else 0.0
-                wr = stats.trade_winrate
-                stats.trade_expectancy_rate_quote = avg_win * wr - avg_loss * (1 - wr)
-            stats.trade_median_win_quote = _median(wins)
-            stats.trade_median_loss_quote = _median(losses)
-
-            recent_rows.reverse()
-            summary.recent_fills = [
-                {
-                    "ts": row.get("ts", ""),
-                    "side": row.get("side", ""),
-                    "price": _safe_float(row.get("price")),
-                    "amount": _safe_float(row.get("amount_base")),
-                    "notional": _safe_float(row.get("notional_quote")),
-                    "fee": _safe_float(row.get("fee_quote")),
-                    "is_maker": str(row.get("is_maker", "")).lower() == "true",
-                    "pnl": _safe_float(row.get("realized_pnl_quote")),
-                    "order_id": row.get("order_id", ""),
-                    "state": row.get("state", ""),
-                    "spread_pct": _safe_float(row.get("expected_spread_pct")),
-                }
-                for row in recent_rows
-            ]
+            with self._fold_lock:
+                return self._fills_fold(fills_path).summary(datetime.now(UTC).timestamp(), recent_limit)
         except Exception:
             self._record_source_read_failure("fills_summary")
-        return summary
+            return FillsFileSummary()
 
     def _compute_fill_stats(self, fills_path: Path) -> FillStats:
         return self._scan_fills_file(fills_path, recent_limit=1).fill_stats
 
     def _read_recent_fills(self, fills_path: Path, limit: int = 50) -> list[dict[str, object]]:
+        """Newest-first fills from the incremental fold.
+
+        The fold only retains the last ``_RECENT_FILLS_KEEP`` (200) rows, so
+        *limit* is capped there; callers needing older fills must read the CSV.
+        """
         if not fills_path.exists():
             return []
-        safe_limit = max(1, int(limit))
-        if safe_limit == 50:
-            return list(self._cached_fills_summary(fills_path, limit=safe_limit).recent_fills)
-        cache_key = f"recent_fills_{int(limit)}"
-        def _load() -> list[dict[str, object]]:
-            try:
-                rows: list[dict[str, str]] = []
-                with fills_path.open("r", encoding="utf-8", newline="") as fp:
-                    reader = csv.DictReader(fp)
-                    for row in reader:
-                        rows.append(row)
-                recent = rows[-limit:]
-                recent.reverse()
-                result = []
-                for row in recent:
-                    result.append({
-                        "ts": row.get("ts", ""),
-                        "side": row.get("side", ""),
-                        "price": _safe_float(row.get("price")),
-                        "amount": _safe_float(row.get("amount_base")),
-                        "notional": _safe_float(row.get("notional_quote")),
-                        "fee": _safe_float(row.get("fee_quote")),
-                        "is_maker": str(row.get("is_maker", "")).lower() == "true",
-                        "pnl": _safe_float(row.get("realized_pnl_quote")),
-                        "order_id": row.get("order_id", ""),
-                        "state": row.get("state", ""),
-                        "spread_pct": _safe_float(row.get("expected_spread_pct")),
-                    })
-                return result
-            except Exception:
-                self._record_source_read_failure("recent_fills")
-                return []
-        return self._cached_file_result(cache_key, fills_path, _load)
+        safe_limit = max(1, min(int(limit), _RECENT_FILLS_KEEP))
+        return [dict(fill) for fill in self._cached_fills_summary(fills_path, limit=safe_limit).recent_fills]
 
     def _count_csv_rows(self, path: Path) -> int:
         if not path.exists():
@@ -1838,6 +1879,8 @@ class MetricsHandler(BaseHTTPRequestHandler):
             if "?" in self.path:
                 params = dict(p.split("=", 1) for p in self.path.split("?", 1)[1].split("&") if "=" in p)
                 bot_filter = params.get("bot")
+            # Per-bot reads are capped at _RECENT_FILLS_KEEP (200) rows by the
+            # fills fold; this endpoint no longer sees a bot's full history.
             limit = 50
             all_fills: list = []
             data_root = self.exporter._data_root
@@ -0,0 +1,52 @@
+"""Bot state materialiser service.
+
+Tails every bot's minute.csv, fills.csv, daily_state*.json,
+paper_desk_v2.json and recovery/open_orders_latest.json once and publishes
+a compact per-bot document to:
+
+    reports/bot_state/latest.json
+
+desk_snapshot_service and shadow_execution read that document through
+``platform_lib.core.bot_state.BotStateView`` instead of re-scanning the
+files themselves, and fall back to the raw files when it is missing or
+stale.
+
+Run:
+    python services/bot_state_service/main.py
+"""
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+from platform_lib.core.bot_state import BotStateMaterializer, bot_state_path
+from platform_lib.logging.logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+_DATA_ROOT = Path(os.environ.get("HB_DATA_ROOT", ""))
+if not _DATA_ROOT or not _DATA_ROOT.is_absolute():
+    _DATA_ROOT = Path(__file__).resolve().parents[2] / "data"
+
+_REPORTS_ROOT = Path(os.environ.get("HB_REPORTS_ROOT", ""))
+if not _REPORTS_ROOT or not _REPORTS_ROOT.is_absolute():
+    _REPORTS_ROOT = Path(__file__).resolve().parents[2] / "reports"
+
+_POLL_INTERVAL_S = float(os.environ.get("BOT_STATE_POLL_INTERVAL_S", "5"))
+_HEARTBEAT_S = float(os.environ.get("BOT_STATE_HEARTBEAT_S", "30"))
+_USE_INOTIFY = os.environ.get("BOT_STATE_INOTIFY", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def main() -> None:
+    materializer = BotStateMaterializer(_DATA_ROOT, bot_state_path(_REPORTS_ROOT))
+    materializer.run_forever(
+        poll_s=_POLL_INTERVAL_S,
+        heartbeat_s=_HEARTBEAT_S,
+        use_inotify=_USE_INOTIFY,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from platform_lib.core.bot_state import BotStateView, bot_state_path, fold_fill_row, new_fill_stats
 from platform_lib.logging.log_namespace import list_bot_log_dirs
 from platform_lib.logging.logging_config import configure_logging
 
@@ -54,6 +55,7 @@ if not _REPORTS_ROOT or not _REPORTS_ROOT.is_absolute():
     _REPORTS_ROOT = Path(__file__).resolve().parents[2] / "reports"
 
 _POLL_INTERVAL_S = float(os.environ.get("SNAPSHOT_POLL_INTERVAL_S", "30"))
+_BOT_STATE_MAX_AGE_S = float(os.environ.get("SNAPSHOT_BOT_STATE_MAX_AGE_S", "120"))
 
 
 # ---------------------------------------------------------------------------
@@ -130,54 +132,13 @@ def _read_daily_state(log_dir: Path) -> dict | None:
 
 def _compute_fill_stats(fills_path: Path) -> dict[str, Any]:
     """Summarize fills.csv into a compact dict."""
-    stats: dict[str, Any] = {
-        "total": 0, "buys": 0, "sells": 0,
-        "maker_total": 0, "taker_total": 0,
-        "buy_notional": 0.0, "sell_notional": 0.0,
-        "total_fees": 0.0, "total_realized_pnl": 0.0,
-        "last_ts": "", "last_side": "", "last_price": 0.0, "last_amount": 0.0,
-        "last_epoch": 0.0,
-        "first_epoch": 0.0,
-    }
+    stats = new_fill_stats()
     if not fills_path.exists():
         return stats
     try:
         with fills_path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                side = str(row.get("side", "")).upper()
-                price = _safe_float(row.get("price"))
-                amount = _safe_float(row.get("amount_base"))
-                fee = _safe_float(row.get("fee_quote", row.get("fee", 0)))
-                pnl = _safe_float(row.get("realized_pnl_quote"))
-                is_maker = str(row.get("is_maker", "")).lower() == "true"
-                ts_str = str(row.get("ts", ""))
-                notional = price * amount
-                stats["total"] += 1
-                if side == "BUY":
-                    stats["buys"] += 1
-                    stats["buy_notional"] += notional
-                elif side == "SELL":
-                    stats["sells"] += 1
-                    stats["sell_notional"] += notional
-                if is_maker:
-                    stats["maker_total"] += 1
-                else:
-                    stats["taker_total"] += 1
-                stats["total_fees"] += fee
-                stats["total_realized_pnl"] += pnl
-                # track first and last
-                try:
-                    epoch = datetime.fromisoformat(ts_str.replace("Z", "+00:00")).timestamp()
-                    if stats["first_epoch"] == 0.0:
-                        stats["first_epoch"] = epoch
-                    stats["last_epoch"] = epoch
-                    stats["last_ts"] = ts_str
-                    stats["last_side"] = side
-                    stats["last_price"] = price
-                    stats["last_amount"] = amount
-                except Exception:
-                    pass  # Justification: parse failure is expected for malformed fill timestamps — skip row fields
+            for row in csv.DictReader(f):
+                fold_fill_row(stats, row)
     except Exception as exc:
         logger.debug("fill_stats error %s: %s", fills_path, exc)
     return stats
@@ -221,9 +182,20 @@ def _completeness(minute: dict[str, str] | None) -> tuple[float, list[str]]:
 # Core snapshot builder
 # ---------------------------------------------------------------------------
 
-def build_snapshot(bot_name: str, bot_data_dir: Path) -> dict[str, Any]:
-    """Build a full canonical snapshot for one bot."""
-    now_epoch = _epoch_now()
+def _file_sources_from_bot_state(
+    bot_state: dict[str, Any],
+) -> tuple[dict[str, str] | None, dict[str, Any], list[dict], dict | None, dict]:
+    """(minute_row, fill_stats, open_orders, daily_state, portfolio) from a bot_state document."""
+    minute = bot_state.get("minute") or None
+    fill_stats = bot_state.get("fill_stats") or {}
+    open_orders = bot_state.get("open_orders") or []
+    return minute, fill_stats, open_orders, bot_state.get("daily_state") or None, bot_state.get("portfolio") or {}
+
+
+def _file_sources_from_logs(
+    bot_data_dir: Path,
+) -> tuple[dict[str, str] | None, dict[str, Any], list[dict], dict | None, dict]:
+    """Same tuple as :func:`_file_sources_from_bot_state`, read from the raw log files."""
     log_dirs = list_bot_log_dirs(bot_data_dir)
 
     minute_row: dict[str, str] | None = None
@@ -231,8 +203,6 @@ def build_snapshot(bot_name: str, bot_data_dir: Path) -> dict[str, Any]:
     open_orders: list[dict] = []
     daily_state: dict | None = None
     portfolio: dict = {}
-    minute_age_s = float("inf")
-    fill_age_s = float("inf")
     # Track which log_dir produced the freshest minute so that daily_state
     # and portfolio are pulled from the same active directory, preventing a
     # stale sub-directory (e.g. bot3_d from an old session) from overwriting
@@ -253,13 +223,10 @@ def build_snapshot(bot_name: str, bot_data_dir: Path) -> dict[str, Any]:
                 active_minute_epoch = candidate_epoch
                 active_log_dir = log_dir
                 minute_row = m
-                minute_age_s = _non_negative_age(now_epoch, candidate_epoch) if candidate_epoch > 0 else float("inf")
 
         fs = _compute_fill_stats(log_dir / "fills.csv")
         if fs.get("total", 0) > fills_stats.get("total", 0):
             fills_stats = fs
-            if fs["last_epoch"] > 0:
-                fill_age_s = _non_negative_age(now_epoch, fs["last_epoch"])
 
         oo = _read_open_orders(bot_data_dir / "logs" / "recovery" / "open_orders_latest.json")
         if oo:
@@ -274,6 +241,32 @@ def build_snapshot(bot_name: str, bot_data_dir: Path) -> dict[str, Any]:
         pf = _read_portfolio(active_log_dir / "paper_desk_v2.json")
         if pf:
             portfolio = pf
+    return minute_row, fills_stats, open_orders, daily_state, portfolio
+
+
+def build_snapshot(bot_name: str, bot_data_dir: Path, bot_state: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Build a full canonical snapshot for one bot.
+
+    *bot_state* is the bot's entry in the shared bot_state document; when
+    given, the log files are not read again.
+    """
+    now_epoch = _epoch_now()
+    if bot_state is not None:
+        minute_row, fills_stats, open_orders, daily_state, portfolio = _file_sources_from_bot_state(bot_state)
+    else:
+        minute_row, fills_stats, open_orders, daily_state, portfolio = _file_sources_from_logs(bot_data_dir)
+
+    minute_age_s = float("inf")
+    fill_age_s = float("inf")
+    if minute_row:
+        try:
+            minute_epoch = datetime.fromisoformat(str(minute_row.get("ts", "")).replace("Z", "+00:00")).timestamp()
+        except Exception:
+            minute_epoch = -1.0
+        if minute_epoch > 0:
+            minute_age_s = _non_negative_age(now_epoch, minute_epoch)
+    if _safe_float(fills_stats.get("last_epoch")) > 0:
+        fill_age_s = _non_negative_age(now_epoch, _safe_float(fills_stats.get("last_epoch")))
 
     completeness_score, missing_fields = _completeness(minute_row)
 
@@ -328,15 +321,27 @@ def _discover_bots() -> list[tuple[str, Path]]:
     return bots
 
 
+_bot_state_view: BotStateView | None = None
+
+
+def _bot_states() -> dict[str, dict[str, Any]]:
+    """Fresh per-bot documents from bot_state_service, or {} to read the raw files."""
+    global _bot_state_view
+    if _bot_state_view is None:
+        _bot_state_view = BotStateView(bot_state_path(_REPORTS_ROOT), max_age_s=_BOT_STATE_MAX_AGE_S)
+    return _bot_state_view.bots()
+
+
 def run_once() -> dict[str, Any]:
     bots = _discover_bots()
     results: dict[str, Any] = {}
     if not bots:
         logger.warning("No bot directories found under %s", _DATA_ROOT)
         return results
+    bot_states = _bot_states()
     for bot_name, bot_dir in bots:
         try:
-            snap = build_snapshot(bot_name, bot_dir)
+            snap = build_snapshot(bot_name, bot_dir, bot_states.get(bot_name))
             path = write_snapshot(snap)
             results[bot_name] = {
                 "ok": True,
@@ -0,0 +1,164 @@
+"""Background auto-flushing producer buffer on top of ``RedisStreamClient``.
+
+``BatchedStreamProducer.xadd`` only appends to an in-memory buffer; a
+daemon thread hands the buffer to ``RedisStreamClient.xadd_many`` once
+``max_batch`` messages are queued or the oldest one has waited
+``max_latency_ms``, so hot producers pay one pipelined round trip per
+batch instead of one per message.  The buffer is bounded: when Redis is
+slower than the producer, new messages are dropped and counted rather
+than growing memory without limit.
+
+Failure accounting is the underlying client's (``failure_count``,
+``health()``), extended with throughput and batch-size metrics.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+
+from services.hb_bridge.redis_client import RedisStreamClient
+
+logger = logging.getLogger(__name__)
+
+_RATE_WINDOW_S = 10.0
+
+
+class BatchedStreamProducer:
+    def __init__(
+        self,
+        client: RedisStreamClient,
+        *,
+        max_batch: int = 200,
+        max_latency_ms: int = 20,
+        max_buffered: int = 10_000,
+        autostart: bool = True,
+    ) -> None:
+        self._client = client
+        self._max_batch = max(1, int(max_batch))
+        self._max_latency_s = max(0.0, int(max_latency_ms) / 1000.0)
+        self._max_buffered = max(self._max_batch, int(max_buffered))
+        self._cond = threading.Condition()
+        # Held from popping a batch until it is published, so the flush thread
+        # and concurrent ``flush()`` callers cannot reorder batches.
+        self._send_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._buffer: deque[tuple[str, dict[str, object], float]] = deque()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._sent: deque[tuple[float, int]] = deque()
+        self._published_total = 0
+        self._failed_total = 0
+        self._dropped_total = 0
+        self._batches_total = 0
+        self._batch_size_max = 0
+        if autostart:
+            self.start()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="redis-batch-producer", daemon=True)
+        self._thread.start()
+
+    def xadd(self, stream: str, payload: dict[str, object]) -> bool:
+        """Queue *payload* for *stream*; False when the buffer is full and it was dropped."""
+        with self._cond:
+            if len(self._buffer) >= self._max_buffered:
+                self._dropped_total += 1
+                return False
+            self._buffer.append((stream, payload, time.monotonic()))
+            if len(self._buffer) >= self._max_batch:
+                self._cond.notify()
+        return True
+
+    def flush(self) -> int:
+        """Synchronously publish everything buffered; returns the number of messages sent."""
+        sent = 0
+        while (published := self._send_next()) is not None:
+            sent += published
+        return sent
+
+    def close(self, timeout_s: float = 2.0) -> None:
+        """Stop the flush thread and publish what is left."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout_s)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping:
+                    if len(self._buffer) >= self._max_batch:
+                        break
+                    if self._buffer:
+                        wait_s = self._buffer[0][2] + self._max_latency_s - time.monotonic()
+                        if wait_s <= 0:
+                            break
+                    else:
+                        wait_s = None
+                    self._cond.wait(wait_s)
+                if self._stopping:
+                    return
+            try:
+                self._send_next()
+            except Exception:
+                logger.exception("Batched Redis publish failed; batch lost")
+
+    def _send_next(self) -> int | None:
+        """Pop and publish the oldest batch; None when the buffer is empty."""
+        with self._send_lock:
+            with self._cond:
+                batch = [self._buffer.popleft() for _ in range(min(self._max_batch, len(self._buffer)))]
+            if not batch:
+                return None
+            return self._publish(batch)
+
+    def _publish(self, batch: list[tuple[str, dict[str, object], float]]) -> int:
+        results = self._client.xadd_many((stream, payload) for stream, payload, _ in batch)
+        ok = sum(1 for entry_id in results if entry_id is not None)
+        with self._stats_lock:
+            now = time.monotonic()
+            self._published_total += ok
+            self._failed_total += len(batch) - ok
+            self._batches_total += 1
+            self._batch_size_max = max(self._batch_size_max, len(batch))
+            self._sent.append((now, ok))
+            while self._sent and now - self._sent[0][0] > _RATE_WINDOW_S:
+                self._sent.popleft()
+        return ok
+
+    @property
+    def failure_count(self) -> int:
+        return self._client.failure_count
+
+    def metrics(self) -> dict[str, float | int]:
+        with self._stats_lock:
+            now = time.monotonic()
+            recent = sum(count for ts, count in self._sent if now - ts <= _RATE_WINDOW_S)
+            batches = self._batches_total
+            out: dict[str, float | int] = {
+                "published_total": self._published_total,
+                "failed_total": self._failed_total,
+                "batches_total": batches,
+                "batch_size_avg": round((self._published_total + self._failed_total) / batches, 2) if batches else 0.0,
+                "batch_size_max": self._batch_size_max,
+                "messages_per_s": round(recent / _RATE_WINDOW_S, 2),
+            }
+        with self._cond:
+            out["buffered"] = len(self._buffer)
+            out["dropped_total"] = self._dropped_total
+        return out
+
+    def health(self) -> dict:
+        """Client connection health plus producer throughput, for metrics export."""
+        return {**self._client.health(), "producer": self.metrics()}
+
+
+__all__ = ["BatchedStreamProducer"]
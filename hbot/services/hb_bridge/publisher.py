@@ -20,15 +20,26 @@ from platform_lib.contracts.stream_names import (
     MARKET_TRADE_STREAM,
     STREAM_RETENTION_MAXLEN,
 )
+from services.hb_bridge.batched_producer import BatchedStreamProducer
 from services.hb_bridge.redis_client import RedisStreamClient
 
 logger = logging.getLogger(__name__)
 
+# Returned instead of an entry id when the event was queued on a batching
+# producer; ``*`` is what Redis itself uses for "id assigned on insert".
+QUEUED_ENTRY_ID = "*"
+
 
 class HBEventPublisher:
-    def __init__(self, redis_client: RedisStreamClient, producer: str):
+    def __init__(
+        self,
+        redis_client: RedisStreamClient,
+        producer: str,
+        batcher: BatchedStreamProducer | None = None,
+    ):
         self._redis = redis_client
         self._producer = producer
+        self._batcher = batcher
 
     @property
     def available(self) -> bool:
@@ -44,6 +55,8 @@ class HBEventPublisher:
                 reason,
             )
             return None
+        if self._batcher is not None:
+            return QUEUED_ENTRY_ID if self._batcher.xadd(stream, payload) else None
         return self._redis.xadd(
             stream,
             payload,
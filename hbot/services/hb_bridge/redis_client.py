@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any, TypeVar
@@ -23,6 +23,9 @@ except Exception:  # pragma: no cover
 # Reconnect backoff: max 30s, exponential
 _RECONNECT_BASE_S = 1.0
 _RECONNECT_MAX_S = 30.0
+# Blocking XREADs run on their own connection; its socket timeout must outlast the longest block.
+_BLOCKING_READ_MAX_MS = 30_000
+_BLOCKING_READ_SOCKET_TIMEOUT_S = _BLOCKING_READ_MAX_MS / 1000.0 + 5.0
 
 
 class RedisStreamClient:
@@ -44,6 +47,7 @@ class RedisStreamClient:
         self._max_connections = max(1, max_connections)
         self._pool: object | None = None
         self._client: object | None = None
+        self._blocking_client: object | None = None
         self._last_reconnect_attempt = 0.0
         self._consecutive_failures: int = 0
         self._redis_down_since: float = 0.0
@@ -55,6 +59,9 @@ class RedisStreamClient:
         self._io_timeout_s: float = 1.0
         self._io_latency_samples: list[float] = []
         self._io_timeout_count: int = 0
+        self._batches_total: int = 0
+        self._batch_messages_total: int = 0
+        self._batch_size_max: int = 0
         if not self._enabled:
             self._logger.warning("Redis stream client disabled (enabled=%s redis=%s)", enabled, redis is not None)
             return
@@ -190,8 +197,55 @@ class RedisStreamClient:
             "io_latency_p50_ms": round(p50, 3),
             "io_latency_p99_ms": round(p99, 3),
             "io_timeout_count": self._io_timeout_count,
+            "batches_total": self._batches_total,
+            "batch_messages_total": self._batch_messages_total,
+            "batch_size_avg": round(self._batch_messages_total / self._batches_total, 2) if self._batches_total else 0.0,
+            "batch_size_max": self._batch_size_max,
         }
 
+    def _note_failure(self, op: str, exc: Exception) -> None:
+        self._consecutive_failures += 1
+        if self._consecutive_failures == 1:
+            self._redis_down_since = time.time()
+            self._logger.warning("Redis %s failed (first failure): %s", op, exc)
+        elif self._consecutive_failures >= 5:
+            duration = time.time() - self._redis_down_since
+            self._logger.error(
+                "Redis down for %.1fs (%d consecutive failures): %s",
+                duration,
+                self._consecutive_failures,
+                exc,
+            )
+
+    def _do_pipeline(self, commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]]) -> list[Any]:
+        pipe = self._client.pipeline(transaction=False)
+        for name, args, kwargs in commands:
+            getattr(pipe, name)(*args, **kwargs)
+        return pipe.execute(raise_on_error=False)
+
+    def _run_pipeline(self, op: str, commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]]) -> list[Any] | None:
+        """Send *commands* in one round trip; returns per-command replies (exceptions inline) or None."""
+        timeout = max(self._io_timeout_s, 0.001 * len(commands))
+        try:
+            replies = self._threaded_io(self._do_pipeline, commands, fallback=None, timeout_s=timeout)
+        except (RedisConnectionError, OSError) as e:
+            self._note_failure(op, e)
+            self._client = None
+            return None
+        except Exception as e:
+            self._note_failure(op, e)
+            return None
+        if replies is None:
+            # _threaded_io swallows errors and timeouts; a lost batch still counts as a failure.
+            self._note_failure(op, RuntimeError("pipeline returned no reply"))
+            return None
+        self._consecutive_failures = 0
+        self._redis_down_since = 0.0
+        self._batches_total += 1
+        self._batch_messages_total += len(commands)
+        self._batch_size_max = max(self._batch_size_max, len(commands))
+        return list(replies)
+
     def ping(self) -> bool:
         if not self.enabled:
             return self._ensure_connected()
@@ -272,6 +326,51 @@ class RedisStreamClient:
                 )
             return None
 
+    def xadd_many(
+        self,
+        entries: Iterable[tuple[str, dict[str, object]]],
+        maxlen: int | None = None,
+    ) -> list[str | None]:
+        """Publish ``(stream, payload)`` pairs in one pipelined round trip.
+
+        Returns the entry id per input, in order; ``None`` marks a payload
+        dropped by the identity preflight or rejected by Redis.  Without an
+        explicit *maxlen* each stream gets its ``STREAM_RETENTION_MAXLEN``.
+        """
+        items = list(entries)
+        results: list[str | None] = [None] * len(items)
+        if not items or (not self.enabled and not self._ensure_connected()):
+            return results
+        commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+        positions: list[int] = []
+        for idx, (stream, payload) in enumerate(items):
+            valid, reason = validate_event_identity(payload)
+            if not valid:
+                self._logger.warning(
+                    "Dropped producer event violating identity contract stream=%s event_type=%s reason=%s",
+                    stream,
+                    str(payload.get("event_type", "")),
+                    reason,
+                )
+                continue
+            kwargs: dict[str, Any] = {"name": stream, "fields": {"payload": json.dumps(payload)}}
+            effective_maxlen = maxlen if maxlen is not None else STREAM_RETENTION_MAXLEN.get(stream)
+            if effective_maxlen is not None:
+                kwargs.update({"maxlen": int(effective_maxlen), "approximate": True})
+            commands.append(("xadd", (), kwargs))
+            positions.append(idx)
+        if not commands:
+            return results
+        replies = self._run_pipeline("xadd_many", commands)
+        if replies is None:
+            return results
+        for idx, reply in zip(positions, replies, strict=False):
+            if isinstance(reply, Exception):
+                self._logger.warning("Redis xadd_many entry rejected stream=%s: %s", items[idx][0], reply)
+            else:
+                results[idx] = str(reply)
+        return results
+
     def xtrim(self, stream: str, maxlen: int, *, approximate: bool = True) -> int | None:
         if not self.enabled and not self._ensure_connected():
             return None
@@ -640,6 +739,19 @@ class RedisStreamClient:
                     e,
                 )
 
+    def ack_many_multi(self, group: str, ids_by_stream: Mapping[str, Iterable[str]]) -> None:
+        """Acknowledge entries on several streams of one consumer group in a single round trip."""
+        commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+        for stream, entry_ids in ids_by_stream.items():
+            ids = [str(entry_id) for entry_id in entry_ids if str(entry_id).strip()]
+            if ids:
+                commands.append(("xack", (stream, group, *ids), {}))
+        if not commands:
+            return
+        if not self.enabled and not self._ensure_connected():
+            return
+        self._run_pipeline("ack_many_multi", commands)
+
     def _do_xrevrange(self, stream: str, count: int) -> Any:
         return self._client.xrevrange(name=stream, max="+", min="-", count=count)
 
@@ -675,6 +787,83 @@ class RedisStreamClient:
                 )
             return None
 
+    def _blocking_reader(self) -> Any:
+        """Dedicated connection for blocking reads, outside the pool and the I/O executor.
+
+        A blocking XREAD parks its connection and thread for the whole block,
+        so it must not hold a pooled connection or one of the two executor
+        workers that ``xadd`` / ``ack`` rely on.
+        """
+        if self._blocking_client is None:
+            self._blocking_client = redis.Redis(
+                host=self._host,
+                port=self._port,
+                db=self._db,
+                password=self._password,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=_BLOCKING_READ_SOCKET_TIMEOUT_S,
+                socket_keepalive=True,
+                single_connection_client=True,
+            )
+        return self._blocking_client
+
+    def _reset_blocking_reader(self) -> None:
+        client, self._blocking_client = self._blocking_client, None
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def read_after(
+        self,
+        stream: str,
+        last_id: str = "$",
+        count: int = 100,
+        block_ms: int = 1000,
+    ) -> list[tuple[str, dict[str, object]]]:
+        """Block up to ``block_ms`` for entries newer than ``last_id`` (plain XREAD, no group).
+
+        Runs on the calling thread over a dedicated connection (see
+        ``_blocking_reader``); meant for a single long-lived subscriber thread.
+        """
+        if not self.enabled and not self._ensure_connected():
+            return []
+        try:
+            block = max(0, min(int(block_ms), _BLOCKING_READ_MAX_MS))
+            records = self._blocking_reader().xread(streams={stream: last_id}, count=count, block=block)
+            if records is None:
+                return []
+            self._consecutive_failures = 0
+            self._redis_down_since = 0.0
+        except Exception as e:
+            self._reset_blocking_reader()
+            self._consecutive_failures += 1
+            if self._consecutive_failures == 1:
+                self._redis_down_since = time.time()
+                self._logger.warning("Redis read_after failed (first failure): %s", e)
+            elif self._consecutive_failures >= 5:
+                duration = time.time() - self._redis_down_since
+                self._logger.error(
+                    "Redis down for %.1fs (%d consecutive failures): %s",
+                    duration,
+                    self._consecutive_failures,
+                    e,
+                )
+            return []
+
+        out: list[tuple[str, dict[str, object]]] = []
+        for _stream, entries in records:
+            for entry_id, data in entries:
+                payload_raw = data.get("payload")
+                try:
+                    payload = json.loads(payload_raw) if isinstance(payload_raw, str) else {}
+                except Exception:
+                    payload = {}
+                out.append((str(entry_id), payload))
+        return out
+
     def read_recent(self, stream: str, count: int = 20) -> list[tuple[str, dict[str, object]]]:
         """Fetch recent payloads in reverse order without consumer-group state changes."""
         if not self.enabled and not self._ensure_connected():
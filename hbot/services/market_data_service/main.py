@@ -43,6 +43,7 @@ def _ws_sslopt() -> dict:
 from platform_lib.logging.logging_config import configure_logging
 from platform_lib.core.models import RedisSettings
 from platform_lib.contracts.event_schemas import MarketDepthSnapshotEvent, MarketQuoteEvent, MarketTradeEvent
+from services.hb_bridge.batched_producer import BatchedStreamProducer
 from services.hb_bridge.publisher import HBEventPublisher
 from services.hb_bridge.redis_client import RedisStreamClient
 
@@ -540,6 +541,12 @@ class MarketDataServiceConfig:
         default_factory=lambda: Path(os.getenv("HB_REPORTS_ROOT", "/workspace/hbot/reports")).resolve() / "market_data_service"
     )
     status_max_sec: int = field(default_factory=lambda: int(os.getenv("MARKET_DATA_SERVICE_STATUS_MAX_SEC", "30")))
+    publish_batch_max: int = field(
+        default_factory=lambda: max(1, int(os.getenv("MARKET_DATA_SERVICE_PUBLISH_BATCH_MAX", "100")))
+    )
+    publish_batch_latency_ms: int = field(
+        default_factory=lambda: max(0, int(os.getenv("MARKET_DATA_SERVICE_PUBLISH_BATCH_LATENCY_MS", "5")))
+    )
 
 
 class _AdapterThread(threading.Thread):
@@ -788,7 +795,12 @@ def _build_adapter(subscription: MarketSubscription, cfg: MarketDataServiceConfi
     raise ValueError(f"unsupported connector for market_data_service: {subscription.connector_name}")
 
 
-def _write_status(cfg: MarketDataServiceConfig, adapters: Iterable[_AdapterThread], redis_available: bool) -> None:
+def _write_status(
+    cfg: MarketDataServiceConfig,
+    adapters: Iterable[_AdapterThread],
+    redis_available: bool,
+    batcher: BatchedStreamProducer | None = None,
+) -> None:
     cfg.status_dir.mkdir(parents=True, exist_ok=True)
     adapter_status = [adapter.status() for adapter in adapters]
     healthy_quotes = [
@@ -800,6 +812,8 @@ def _write_status(cfg: MarketDataServiceConfig, adapters: Iterable[_AdapterThrea
         "redis_available": redis_available,
         "subscriptions": adapter_status,
     }
+    if batcher is not None:
+        payload["producer"] = batcher.metrics()
     latest = cfg.status_dir / "latest.json"
     latest.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
@@ -830,14 +844,23 @@ def run() -> None:
     if not redis_client.enabled:
         raise RuntimeError("Redis stream client is disabled. Enable EXT_SIGNAL_RISK_ENABLED and Redis connectivity.")
 
-    publisher = HBEventPublisher(redis_client, "market_data_service")
+    # Quote/depth/trade events from every adapter share one pipelined flush
+    # instead of paying a Redis round trip per websocket message.
+    batcher = None
+    if cfg.publish_batch_max > 1:
+        batcher = BatchedStreamProducer(
+            redis_client,
+            max_batch=cfg.publish_batch_max,
+            max_latency_ms=cfg.publish_batch_latency_ms,
+        )
+    publisher = HBEventPublisher(redis_client, "market_data_service", batcher=batcher)
     adapters = [_build_adapter(subscription, cfg, publisher) for subscription in cfg.subscriptions]
     for adapter in adapters:
         adapter.start()
 
     try:
         while True:
-            _write_status(cfg, adapters, publisher.available)
+            _write_status(cfg, adapters, publisher.available, batcher)
             time.sleep(5.0)
     except KeyboardInterrupt:  # pragma: no cover
         logger.info("market_data_service stopping")
@@ -846,7 +869,9 @@ def run() -> None:
             adapter.stop()
         for adapter in adapters:
             adapter.join(timeout=3.0)
-        _write_status(cfg, adapters, publisher.available)
+        if batcher is not None:
+            batcher.close()
+        _write_status(cfg, adapters, publisher.available, batcher)
 
 
 def main() -> None:
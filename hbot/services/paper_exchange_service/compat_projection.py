@@ -225,3 +225,48 @@ def project_pair_snapshot(
         "pairs": pairs_data,
     }
     _write_json_atomic(path, payload)
+
+
+# ---------------------------------------------------------------------------
+# Shard merge (sharded desk_service: one snapshot file per worker)
+# ---------------------------------------------------------------------------
+
+def _merge_sections(paths: list[Path], sections: tuple[str, ...]) -> dict[str, dict[str, Any]]:
+    merged: dict[str, dict[str, Any]] = {name: {} for name in sections}
+    for shard_path in paths:
+        try:
+            data = json.loads(shard_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        for name in sections:
+            part = data.get(name)
+            if isinstance(part, dict):
+                merged[name].update(part)
+    return merged
+
+
+def merge_state_snapshots(paths: list[Path], path: Path) -> None:
+    """Combine per-shard state snapshots into the single legacy file."""
+    merged = _merge_sections(paths, ("orders", "positions"))
+    payload: dict[str, Any] = {
+        "ts_utc": _now_utc_iso(),
+        "orders_total": len(merged["orders"]),
+        "orders": merged["orders"],
+        "positions_total": len(merged["positions"]),
+        "positions": merged["positions"],
+        "funding_summary": {
+            "positions_with_exposure": len(merged["positions"]),
+            "funding_events_generated": 0,
+            "funding_debit_events": 0,
+            "funding_credit_events": 0,
+            "funding_paid_quote_total": 0.0,
+        },
+    }
+    _write_json_atomic(path, payload)
+
+
+def merge_pair_snapshots(paths: list[Path], path: Path) -> None:
+    """Combine per-shard pair snapshots into the single legacy file."""
+    project_pair_snapshot(_merge_sections(paths, ("pairs",))["pairs"], path)
@@ -18,7 +18,7 @@ import time
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from simulation.desk import DeskConfig, PaperDesk
 from simulation.portfolio import PortfolioConfig
@@ -62,7 +62,14 @@ from services.paper_exchange_service.instrument_registry import (
     InstrumentRegistry,
     make_instrument_id,
 )
-from services.paper_exchange_service.redis_feed import RedisMarketFeed
+from services.paper_exchange_service.redis_feed import (
+    RedisMarketFeed,
+    SharedBookCache,
+    build_book_snapshot,
+)
+
+if TYPE_CHECKING:
+    from services.paper_exchange_service.sharding import ShardWorkerControl
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +139,10 @@ class ServiceSettings:
     state_file_dir: str = "/workspace/hbot/data"
     redis_key_prefix: str = "paper_desk:svc"
     reset_state_on_startup: bool = False
+    # -- Sharding (see sharding.py); 1 keeps the single-process loop --
+    shard_count: int = 1
+    shard_plan_path: str = ""
+    shard_migration_timeout_ms: int = 30_000
 
 
 # ---------------------------------------------------------------------------
@@ -173,7 +184,12 @@ class TenantRouter:
         self._tenants: dict[str, TenantRuntime] = {}
         self._settings = settings
 
-    def get_or_create(self, instance_name: str) -> TenantRuntime:
+    def get_or_create(self, instance_name: str, *, restore_only: bool = False) -> TenantRuntime:
+        """Return the tenant, creating its desk on first use.
+
+        ``restore_only`` skips ``reset_state_on_startup`` for desks that are
+        being handed over from another shard rather than started fresh.
+        """
         iname = _normalize(instance_name)
         t = self._tenants.get(iname)
         if t is not None:
@@ -189,7 +205,7 @@ class TenantRouter:
             state_file_path=f"{s.state_file_dir}/{iname}/paper_desk_svc.json",
             redis_key=f"{s.redis_key_prefix}:{iname}",
             redis_url=os.getenv("REDIS_URL"),
-            reset_state_on_startup=s.reset_state_on_startup,
+            reset_state_on_startup=s.reset_state_on_startup and not restore_only,
         ))
         feed = RedisMarketFeed()
         t = TenantRuntime(
@@ -208,6 +224,10 @@ class TenantRouter:
     def all_tenants(self) -> list[TenantRuntime]:
         return list(self._tenants.values())
 
+    def pop(self, instance_name: str) -> TenantRuntime | None:
+        """Detach a tenant without closing its desk (the caller owns it afterwards)."""
+        return self._tenants.pop(_normalize(instance_name), None)
+
     def close_all(self) -> None:
         for t in self._tenants.values():
             try:
@@ -220,13 +240,33 @@ class TenantRouter:
 # Market data processing
 # ---------------------------------------------------------------------------
 
+_BOOK_CACHE = SharedBookCache()
+
+
+def _parse_levels(levels: Any) -> list[tuple[Decimal, Decimal]]:
+    out: list[tuple[Decimal, Decimal]] = []
+    if isinstance(levels, list):
+        for lvl in levels:
+            if isinstance(lvl, (list, tuple)) and len(lvl) >= 2:
+                p, s = Decimal(str(lvl[0])), Decimal(str(lvl[1]))
+                if p > _ZERO and s > _ZERO:
+                    out.append((p, s))
+    return out
+
+
 def _process_market_row(
     payload: dict[str, Any],
     router: TenantRouter,
     pairs_data: dict[str, dict[str, Any]],
     settings: ServiceSettings,
+    book_cache: SharedBookCache = _BOOK_CACHE,
 ) -> None:
-    """Parse a market_snapshot row, update feeds for all relevant tenants."""
+    """Parse a market_snapshot row, update feeds for all relevant tenants.
+
+    The row is converted into one immutable ``OrderBookSnapshot`` (or
+    found in *book_cache* by market sequence) and every target tenant's
+    feed references that same object.
+    """
     cms = parse_canonical_market_state(payload)
     if cms is None:
         return
@@ -243,40 +283,25 @@ def _process_market_row(
     if settings.allowed_connectors and _normalize(connector_name) not in settings.allowed_connectors:
         return
 
-    iid = make_instrument_id(connector_name, trading_pair)
-    best_bid = Decimal(str(getattr(cms, "best_bid", 0) or 0))
-    best_ask = Decimal(str(getattr(cms, "best_ask", 0) or 0))
-    best_bid_size = Decimal(str(getattr(cms, "best_bid_size", 1) or 1))
-    best_ask_size = Decimal(str(getattr(cms, "best_ask_size", 1) or 1))
     funding_rate = Decimal(str(getattr(cms, "funding_rate", 0) or 0))
     ts_ms = int(getattr(cms, "timestamp_ms", 0) or 0) or _now_ms()
-
-    bids: list[tuple[Decimal, Decimal]] = []
-    asks: list[tuple[Decimal, Decimal]] = []
-
-    bid_levels = getattr(cms, "bid_levels", None) or payload.get("bid_levels")
-    ask_levels = getattr(cms, "ask_levels", None) or payload.get("ask_levels")
-
-    if isinstance(bid_levels, list) and bid_levels:
-        for lvl in bid_levels:
-            if isinstance(lvl, (list, tuple)) and len(lvl) >= 2:
-                p, s = Decimal(str(lvl[0])), Decimal(str(lvl[1]))
-                if p > _ZERO and s > _ZERO:
-                    bids.append((p, s))
-    if not bids and best_bid > _ZERO:
-        bids.append((best_bid, best_bid_size))
-
-    if isinstance(ask_levels, list) and ask_levels:
-        for lvl in ask_levels:
-            if isinstance(lvl, (list, tuple)) and len(lvl) >= 2:
-                p, s = Decimal(str(lvl[0])), Decimal(str(lvl[1]))
-                if p > _ZERO and s > _ZERO:
-                    asks.append((p, s))
-    if not asks and best_ask > _ZERO:
-        asks.append((best_ask, best_ask_size))
-
-    if not bids and not asks:
-        return
+    cache_key = book_cache.key(connector_name, trading_pair, int(getattr(cms, "market_sequence", 0) or 0), ts_ms)
+    snap = book_cache.get(cache_key)
+    if snap is None:
+        bids = _parse_levels(getattr(cms, "bid_levels", None) or payload.get("bid_levels"))
+        asks = _parse_levels(getattr(cms, "ask_levels", None) or payload.get("ask_levels"))
+        if not bids:
+            best_bid = Decimal(str(getattr(cms, "best_bid", 0) or 0))
+            if best_bid > _ZERO:
+                bids.append((best_bid, Decimal(str(getattr(cms, "best_bid_size", 1) or 1))))
+        if not asks:
+            best_ask = Decimal(str(getattr(cms, "best_ask", 0) or 0))
+            if best_ask > _ZERO:
+                asks.append((best_ask, Decimal(str(getattr(cms, "best_ask_size", 1) or 1))))
+        snap = build_book_snapshot(make_instrument_id(connector_name, trading_pair), bids, asks, ts_ms)
+        if snap is None:
+            return
+        snap = book_cache.put(cache_key, snap)
 
     target_tenants: list[TenantRuntime] = []
     if instance_name:
@@ -287,8 +312,11 @@ def _process_market_row(
         target_tenants = router.all_tenants()
 
     for t in target_tenants:
-        t.feed.update_book(iid, bids, asks, ts_ms, funding_rate)
+        t.feed.set_book(snap, funding_rate)
 
+    best_bid_level = snap.best_bid
+    best_ask_level = snap.best_ask
+    mid = snap.mid_price
     ns_key = f"{instance_name or '*'}::{connector_name}::{trading_pair}"
     pairs_data[ns_key] = {
         "connector_name": connector_name,
@@ -296,11 +324,11 @@ def _process_market_row(
         "instance_name": instance_name,
         "timestamp_ms": ts_ms,
         "freshness_ts_ms": ts_ms,
-        "mid_price": float((bids[0][0] + asks[0][0]) / 2) if bids and asks else 0.0,
-        "best_bid": float(bids[0][0]) if bids else None,
-        "best_ask": float(asks[0][0]) if asks else None,
-        "best_bid_size": float(bids[0][1]) if bids else None,
-        "best_ask_size": float(asks[0][1]) if asks else None,
+        "mid_price": float(mid) if mid is not None else 0.0,
+        "best_bid": float(best_bid_level.price) if best_bid_level else None,
+        "best_ask": float(best_ask_level.price) if best_ask_level else None,
+        "best_bid_size": float(best_bid_level.size) if best_bid_level else None,
+        "best_ask_size": float(best_ask_level.size) if best_ask_level else None,
         "last_trade_price": None,
         "mark_price": None,
         "funding_rate": float(funding_rate),
@@ -309,8 +337,8 @@ def _process_market_row(
         "market_sequence": 0,
         "event_id": "",
         "source_event_type": "market_snapshot",
-        "bid_levels": [[float(p), float(s)] for p, s in bids],
-        "ask_levels": [[float(p), float(s)] for p, s in asks],
+        "bid_levels": [[float(lvl.price), float(lvl.size)] for lvl in snap.bids],
+        "ask_levels": [[float(lvl.price), float(lvl.size)] for lvl in snap.asks],
         "namespace_key": ns_key,
     }
 
@@ -540,8 +568,13 @@ def _handle_sync_state(
 # Main service loop
 # ---------------------------------------------------------------------------
 
-def run(settings: ServiceSettings) -> None:
-    """Main event loop: consume market data and commands, produce events."""
+def run(settings: ServiceSettings, *, shard: ShardWorkerControl | None = None) -> None:
+    """Main event loop: consume market data and commands, produce events.
+
+    When *shard* is given this loop is one worker of the sharded service:
+    it reads its shard's streams (already set in *settings*), applies
+    coordinator control messages every iteration and exits once asked to.
+    """
     root = Path(os.getenv("HB_ROOT", os.getcwd()))
     state_snapshot_path = Path(settings.state_snapshot_path)
     pair_snapshot_path = Path(settings.pair_snapshot_path)
@@ -580,10 +613,12 @@ def run(settings: ServiceSettings) -> None:
     )
 
     try:
-        while True:
+        while shard is None or not shard.stopping:
             loop_started = time.perf_counter()
             loop_count += 1
             now = _now_ms()
+            if shard is not None:
+                shard.poll(router)
 
             # -- Reclaim pending market entries --
             reclaimed_market_rows: list[tuple[str, dict[str, object]]] = []
@@ -628,6 +663,7 @@ def run(settings: ServiceSettings) -> None:
 
             # -- Tick all desks (market-driven fills) --
             now_ns = int(time.time() * 1_000_000_000)
+            fill_batch: list[tuple[str, dict[str, object]]] = []
             for tenant in router.all_tenants():
                 tick_events = tenant.desk.tick(now_ns)
                 for ev in tick_events:
@@ -642,12 +678,10 @@ def run(settings: ServiceSettings) -> None:
                         result_payload = fill_event.model_dump()
                         identity_ok, _ = validate_event_identity(result_payload)
                         if identity_ok:
-                            client.xadd(
-                                stream=settings.event_stream,
-                                payload=result_payload,
-                                maxlen=STREAM_RETENTION_MAXLEN.get(settings.event_stream),
-                            )
+                            fill_batch.append((settings.event_stream, result_payload))
                 tenant.last_tick_ms = _now_ms()
+            if fill_batch:
+                client.xadd_many(fill_batch)
 
             # -- Reclaim pending command entries --
             reclaimed_rows: list[tuple[str, dict[str, object]]] = []
@@ -669,7 +703,7 @@ def run(settings: ServiceSettings) -> None:
                     logger.info("desk_service reclaimed pending commands=%d", len(reclaimed_rows))
 
             if reclaimed_rows:
-                _process_command_batch(reclaimed_rows, router, client, settings, latency_tracker)
+                _process_command_batch(reclaimed_rows, router, client, settings, latency_tracker, shard=shard)
 
             # -- Read commands --
             command_rows = client.read_group(
@@ -680,7 +714,7 @@ def run(settings: ServiceSettings) -> None:
                 block_ms=1,
             )
             if command_rows:
-                _process_command_batch(command_rows, router, client, settings, latency_tracker)
+                _process_command_batch(command_rows, router, client, settings, latency_tracker, shard=shard)
 
             # -- Periodic persistence --
             now = _now_ms()
@@ -757,11 +791,18 @@ def _process_command_batch(
     client: RedisStreamClient,
     settings: ServiceSettings,
     latency_tracker: JsonLatencyTracker,
+    *,
+    shard: ShardWorkerControl | None = None,
 ) -> None:
     started = time.perf_counter()
     ack_ids = []
+    outgoing: list[tuple[str, dict[str, object]]] = []
 
     for entry_id, payload in rows:
+        if shard is not None and shard.is_control(payload):
+            shard.handle_command(payload, router)
+            ack_ids.append(str(entry_id))
+            continue
         result_event = _handle_command(payload, router, client, settings)
         if result_event is None:
             ack_ids.append(str(entry_id))
@@ -777,11 +818,7 @@ def _process_command_batch(
             ack_ids.append(str(entry_id))
             continue
 
-        client.xadd(
-            stream=settings.event_stream,
-            payload=result_payload,
-            maxlen=STREAM_RETENTION_MAXLEN.get(settings.event_stream),
-        )
+        outgoing.append((settings.event_stream, result_payload))
 
         command = str(payload.get("command", "")).strip().lower()
         if command in _PRIVILEGED_COMMANDS:
@@ -794,14 +831,12 @@ def _process_command_batch(
                 result_reason=result_event.reason,
                 command_metadata=payload.get("metadata") if isinstance(payload.get("metadata"), dict) else None,
             )
-            client.xadd(
-                stream=settings.audit_stream,
-                payload=audit.model_dump(),
-                maxlen=STREAM_RETENTION_MAXLEN.get(settings.audit_stream),
-            )
+            outgoing.append((settings.audit_stream, audit.model_dump()))
 
         ack_ids.append(str(entry_id))
 
+    if outgoing:
+        client.xadd_many(outgoing)
     if ack_ids:
         client.ack_many(settings.command_stream, settings.consumer_group, ack_ids)
 
@@ -981,6 +1016,20 @@ def _parse_args() -> ServiceSettings:
         "--reset-state-on-startup",
         default=os.getenv("PAPER_EXCHANGE_RESET_STATE_ON_STARTUP", "false"),
     )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=int(os.getenv("PAPER_EXCHANGE_SHARDS", "1")),
+    )
+    parser.add_argument(
+        "--shard-plan-path",
+        default=os.getenv("PAPER_EXCHANGE_SHARD_PLAN_PATH", ""),
+    )
+    parser.add_argument(
+        "--shard-migration-timeout-ms",
+        type=int,
+        default=int(os.getenv("PAPER_EXCHANGE_SHARD_MIGRATION_TIMEOUT_MS", "30000")),
+    )
 
     args = parser.parse_args()
     redis_enabled = str(args.redis_enabled).strip().lower() in {"1", "true", "yes", "on"}
@@ -1030,6 +1079,9 @@ def _parse_args() -> ServiceSettings:
         state_file_dir=str(args.state_file_dir).strip(),
         redis_key_prefix=str(args.redis_key_prefix).strip(),
         reset_state_on_startup=reset_state_on_startup,
+        shard_count=max(1, int(args.shards)),
+        shard_plan_path=str(args.shard_plan_path or "").strip(),
+        shard_migration_timeout_ms=max(1_000, int(args.shard_migration_timeout_ms)),
     )
 
 
@@ -1040,7 +1092,12 @@ def main() -> int:
     )
     settings = _parse_args()
     try:
-        run(settings)
+        if settings.shard_count > 1 or settings.shard_plan_path:
+            from services.paper_exchange_service.sharding import run_sharded
+
+            run_sharded(settings)
+        else:
+            run(settings)
     except KeyboardInterrupt:
         logger.info("paper_exchange_service (desk_service) interrupted")
     return 0
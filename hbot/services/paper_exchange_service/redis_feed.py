@@ -3,10 +3,19 @@
 Implements the ``MarketDataFeed`` protocol by holding the latest
 ``OrderBookSnapshot`` per instrument, updated by the service main loop
 when market data rows arrive from ``hb.market_data.v1``.
+
+Snapshots are immutable, so one instance built from a market row is
+shared by every tenant feed that receives it (``set_book`` stores the
+reference).  :class:`SharedBookCache` keeps recently built snapshots
+keyed by ``(connector, pair, market_sequence, timestamp_ms)`` so a row
+re-delivered on reclaim, or published by several producers, is not
+converted again.
 """
 from __future__ import annotations
 
+import threading
 import time
+from collections import OrderedDict
 from decimal import Decimal
 
 from simulation.types import (
@@ -18,6 +27,82 @@ from simulation.types import (
 
 _NS_PER_MS = 1_000_000
 
+BookKey = tuple[str, str, int, int]
+
+
+def build_book_snapshot(
+    instrument_id: InstrumentId,
+    bids: list[tuple[Decimal, Decimal]],
+    asks: list[tuple[Decimal, Decimal]],
+    timestamp_ms: int,
+) -> OrderBookSnapshot | None:
+    """Immutable snapshot of the positive levels, or None when both sides are empty."""
+    bid_levels = tuple(BookLevel(price=p, size=s) for p, s in bids if p > _ZERO and s > _ZERO)
+    ask_levels = tuple(BookLevel(price=p, size=s) for p, s in asks if p > _ZERO and s > _ZERO)
+    if not bid_levels and not ask_levels:
+        return None
+    return OrderBookSnapshot(
+        instrument_id=instrument_id,
+        bids=bid_levels,
+        asks=ask_levels,
+        timestamp_ns=int(timestamp_ms) * _NS_PER_MS,
+    )
+
+
+class SharedBookCache:
+    """Process-wide LRU of built ``OrderBookSnapshot`` objects.
+
+    Only rows carrying a ``market_sequence`` are cached; without one two
+    producers could publish different books under the same key.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[BookKey, OrderBookSnapshot] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(connector_name: str, trading_pair: str, market_sequence: int, timestamp_ms: int) -> BookKey | None:
+        if market_sequence <= 0:
+            return None
+        return (connector_name, trading_pair, int(market_sequence), int(timestamp_ms))
+
+    def get(self, key: BookKey | None) -> OrderBookSnapshot | None:
+        if key is None:
+            return None
+        with self._lock:
+            snap = self._entries.get(key)
+            if snap is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return snap
+
+    def put(self, key: BookKey | None, snapshot: OrderBookSnapshot) -> OrderBookSnapshot:
+        """Store *snapshot* under *key* and return the instance callers should share."""
+        if key is None:
+            return snapshot
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing
+            self._entries[key] = snapshot
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            entries = len(self._entries)
+        return {"entries": entries, "hits": self.hits, "misses": self.misses}
+
 
 class RedisMarketFeed:
     """Mutable feed that the service loop pushes data into.
@@ -38,18 +123,14 @@ class RedisMarketFeed:
         timestamp_ms: int,
         funding_rate: Decimal = _ZERO,
     ) -> None:
-        bid_levels = tuple(BookLevel(price=p, size=s) for p, s in bids if p > _ZERO and s > _ZERO)
-        ask_levels = tuple(BookLevel(price=p, size=s) for p, s in asks if p > _ZERO and s > _ZERO)
-        if not bid_levels and not ask_levels:
-            return
-        snap = OrderBookSnapshot(
-            instrument_id=instrument_id,
-            bids=bid_levels,
-            asks=ask_levels,
-            timestamp_ns=int(timestamp_ms) * _NS_PER_MS,
-        )
-        key = instrument_id.key
-        self._books[key] = snap
+        snap = build_book_snapshot(instrument_id, bids, asks, timestamp_ms)
+        if snap is not None:
+            self.set_book(snap, funding_rate)
+
+    def set_book(self, snapshot: OrderBookSnapshot, funding_rate: Decimal = _ZERO) -> None:
+        """Point this feed at a (possibly shared) immutable snapshot."""
+        key = snapshot.instrument_id.key
+        self._books[key] = snapshot
         if funding_rate != _ZERO:
             self._funding_rates[key] = funding_rate
 
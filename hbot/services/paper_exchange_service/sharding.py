@@ -0,0 +1,626 @@
+"""Sharded multi-process mode for the desk-based paper exchange service.
+
+With ``--shards N`` (``PAPER_EXCHANGE_SHARDS``) ``desk_service`` runs a
+coordinator plus N worker processes instead of one loop:
+
+- Tenants are assigned to shards by consistent hashing of the normalised
+  ``instance_name`` (:class:`ShardRing`), optionally overridden by pins in
+  the shard plan file.
+- The coordinator is the only consumer of the source command and market
+  streams.  It forwards each command to its tenant's shard stream
+  (``<stream>:shard:<i>``) and writes each market snapshot once per
+  shard that needs it: the owning shard when the tenant is known, every
+  shard otherwise.
+- Each worker is an ordinary :func:`desk_service.run` loop over its own
+  shard streams, with its own consumer and its own ``PaperDesk`` per
+  tenant.  Worker snapshot files are merged back into the legacy paths.
+
+Rebalancing (a changed shard count or pin in the plan file) moves tenants
+one at a time without dropping order state.  The coordinator parks the
+tenant's new commands and appends a release marker to the old shard's
+command stream, so it is handled after every command already forwarded.
+The old worker then exports the desk (portfolio, open / in-flight orders,
+reserved balances) and closes it.  The handoff goes to the new worker
+over the control pipe, and only once that worker confirms the adoption
+are the parked commands forwarded and acknowledged.  Market snapshots for
+a moving tenant are parked too (latest per pair): neither shard owns the
+desk while it is in transit, and a worker that does not know the tenant
+would apply the book to all of its other tenants.
+
+A migration that has not completed within ``shard_migration_timeout_ms``
+is aborted back to the source shard, which then re-adopts its own handoff
+before the parked rows are forwarded to it.  A respawned worker
+is re-sent the release marker or handoff it may have lost with its pipe.
+Copies of a desk reported by a shard that does not own the tenant are
+evicted (or handed back when the reporter is the owner).
+"""
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from platform_lib.contracts.stream_names import STREAM_RETENTION_MAXLEN
+from services.hb_bridge.redis_client import RedisStreamClient
+from services.paper_exchange_service.compat_projection import merge_pair_snapshots, merge_state_snapshots
+from services.paper_exchange_service.desk_service import ServiceSettings, TenantRouter, _normalize, _now_ms, run
+
+logger = logging.getLogger(__name__)
+
+SHARD_RELEASE_COMMAND = "_shard_release"
+_RETIRE_GRACE_S = 10.0
+
+
+def shard_stream(stream: str, shard: int) -> str:
+    return f"{stream}:shard:{int(shard)}"
+
+
+def _shard_path(path: str, shard: int) -> str:
+    p = Path(path)
+    return str(p.with_name(f"{p.stem}.shard{int(shard)}{p.suffix}"))
+
+
+def shard_settings(settings: ServiceSettings, shard: int) -> ServiceSettings:
+    """Worker settings: shard streams, a per-shard consumer and per-shard report files."""
+    return dataclasses.replace(
+        settings,
+        market_data_stream=shard_stream(settings.market_data_stream, shard),
+        command_stream=shard_stream(settings.command_stream, shard),
+        consumer_name=f"{settings.consumer_name}-shard{shard}",
+        state_snapshot_path=_shard_path(settings.state_snapshot_path, shard),
+        pair_snapshot_path=_shard_path(settings.pair_snapshot_path, shard),
+        latency_report_path=_shard_path(settings.latency_report_path, shard),
+        shard_count=1,
+        shard_plan_path="",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Consistent hashing
+# ---------------------------------------------------------------------------
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ShardRing:
+    """Consistent-hash ring; growing from N to N+1 shards moves ~1/(N+1) of tenants."""
+
+    def __init__(self, shard_count: int, *, vnodes: int = 64) -> None:
+        self.shard_count = max(1, int(shard_count))
+        points = sorted(
+            (_hash64(f"shard-{shard}#{replica}"), shard)
+            for shard in range(self.shard_count)
+            for replica in range(max(1, int(vnodes)))
+        )
+        self._hashes = [h for h, _ in points]
+        self._shards = [s for _, s in points]
+
+    def shard_for(self, instance_name: str) -> int:
+        idx = bisect.bisect(self._hashes, _hash64(_normalize(instance_name)))
+        return self._shards[idx % len(self._shards)]
+
+
+# ---------------------------------------------------------------------------
+# Tenant handoff
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class TenantHandoff:
+    """A tenant's desk in transit between shards (pickled over the control pipe)."""
+
+    instance_name: str
+    connector_name: str = ""
+    desk_state: dict[str, Any] = field(default_factory=dict)
+    processed_commands: int = 0
+    generated_fills: int = 0
+
+
+def release_tenant(router: TenantRouter, instance_name: str) -> TenantHandoff | None:
+    """Detach, export and close a tenant's desk; None when this shard never had it."""
+    tenant = router.pop(instance_name)
+    if tenant is None:
+        return None
+    handoff = TenantHandoff(
+        instance_name=tenant.instance_name,
+        connector_name=tenant.connector_name,
+        desk_state=tenant.desk.export_handoff(),
+        processed_commands=tenant.processed_commands,
+        generated_fills=tenant.generated_fills,
+    )
+    try:
+        tenant.desk.close()
+    except Exception as exc:
+        logger.warning("release_tenant: close failed for %s: %s", tenant.instance_name, exc)
+    return handoff
+
+
+def adopt_tenant(router: TenantRouter, handoff: TenantHandoff) -> None:
+    tenant = router.get_or_create(handoff.instance_name, restore_only=True)
+    tenant.desk.import_handoff(handoff.desk_state, tenant.feed)
+    tenant.connector_name = handoff.connector_name or tenant.connector_name
+    tenant.processed_commands += handoff.processed_commands
+    tenant.generated_fills += handoff.generated_fills
+
+
+class _Conn(Protocol):
+    def send(self, obj: Any) -> None: ...
+    def recv(self) -> Any: ...
+    def poll(self, timeout: float | None = ...) -> bool: ...
+
+
+class ShardWorkerControl:
+    """Worker side of the coordinator protocol, driven from ``desk_service.run``."""
+
+    def __init__(self, shard: int, conn: _Conn) -> None:
+        self.shard = int(shard)
+        self._conn = conn
+        self.stopping = False
+
+    @staticmethod
+    def is_control(payload: dict[str, Any]) -> bool:
+        return str(payload.get("command", "")) == SHARD_RELEASE_COMMAND
+
+    def handle_command(self, payload: dict[str, Any], router: TenantRouter) -> None:
+        instance_name = _normalize(str(payload.get("instance_name", "")))
+        handoff = release_tenant(router, instance_name)
+        logger.info("shard %d released tenant %s (had_desk=%s)", self.shard, instance_name, handoff is not None)
+        self._conn.send(("released", instance_name, handoff))
+
+    def poll(self, router: TenantRouter) -> None:
+        while self._conn.poll():
+            kind, body = self._conn.recv()
+            if kind == "adopt":
+                adopt_tenant(router, body)
+                logger.info("shard %d adopted tenant %s", self.shard, body.instance_name)
+                self._conn.send(("adopted", body.instance_name, None))
+            elif kind == "stop":
+                self.stopping = True
+
+
+def _shard_main(settings: ServiceSettings, shard: int, conn: _Conn) -> None:
+    logging.basicConfig(
+        level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
+        format=f"%(asctime)s %(levelname)s shard{shard} %(name)s %(message)s",
+    )
+    run(settings, shard=ShardWorkerControl(shard, conn))
+
+
+# ---------------------------------------------------------------------------
+# Coordinator
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Worker:
+    shard: int
+    conn: _Conn
+    process: Any = None
+
+    def alive(self) -> bool:
+        return self.process is None or bool(self.process.is_alive())
+
+
+@dataclass
+class _Migration:
+    source: int
+    target: int
+    deadline: float = 0.0
+    handoff: TenantHandoff | None = None
+    parked: list[tuple[str, dict[str, object]]] = field(default_factory=list)
+    market: dict[tuple[str, str], dict[str, object]] = field(default_factory=dict)
+
+
+WorkerSpawner = Callable[[ServiceSettings, int], _Worker]
+
+
+def _spawn_process(settings: ServiceSettings, shard: int) -> _Worker:
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe()
+    process = ctx.Process(
+        target=_shard_main,
+        args=(shard_settings(settings, shard), shard, child),
+        name=f"paper-exchange-shard{shard}",
+        daemon=False,
+    )
+    process.start()
+    return _Worker(shard=shard, conn=parent, process=process)
+
+
+class ShardCoordinator:
+    """Routes the source streams to shard streams and runs tenant migrations."""
+
+    def __init__(
+        self,
+        settings: ServiceSettings,
+        client: RedisStreamClient,
+        *,
+        spawn: WorkerSpawner = _spawn_process,
+    ) -> None:
+        self._settings = settings
+        self._client = client
+        self._spawn = spawn
+        self._ring = ShardRing(settings.shard_count)
+        self._pins: dict[str, int] = {}
+        self._workers: dict[int, _Worker] = {}
+        self._retiring: list[tuple[_Worker, float]] = []
+        self._owners: dict[str, int] = {}
+        self._migrations: dict[str, _Migration] = {}
+        self._plan_mtime_ns = 0
+        self.forwarded_market_rows = 0
+        self.forwarded_commands = 0
+        self.migrations_completed = 0
+        self.migrations_aborted = 0
+
+    # ── Topology ──────────────────────────────────────────────────────
+
+    @property
+    def shard_count(self) -> int:
+        return self._ring.shard_count
+
+    def owner_of(self, instance_name: str) -> int | None:
+        return self._owners.get(_normalize(instance_name))
+
+    def migrating(self) -> set[str]:
+        return set(self._migrations)
+
+    def _target(self, name: str) -> int:
+        pinned = self._pins.get(name)
+        if pinned is not None and 0 <= pinned < self.shard_count:
+            return pinned
+        return self._ring.shard_for(name)
+
+    def start(self) -> None:
+        self._ensure_workers()
+
+    def _ensure_workers(self) -> None:
+        for shard in range(self.shard_count):
+            if shard not in self._workers:
+                for stream in (self._settings.command_stream, self._settings.market_data_stream):
+                    self._client.create_group(shard_stream(stream, shard), self._settings.consumer_group, start_id="0")
+                self._workers[shard] = self._spawn(self._settings, shard)
+                logger.info("shard coordinator: started shard %d", shard)
+
+    def apply_plan(self, shard_count: int, pins: dict[str, int] | None = None) -> None:
+        """Adopt a new shard count / pin set and migrate every tenant whose shard changed."""
+        shard_count = max(1, int(shard_count))
+        if shard_count != self.shard_count:
+            logger.info("shard coordinator: resizing %d -> %d shards", self.shard_count, shard_count)
+            self._ring = ShardRing(shard_count)
+        self._pins = {_normalize(k): int(v) for k, v in (pins or {}).items()}
+        self._ensure_workers()
+        for name, owner in list(self._owners.items()):
+            target = self._target(name)
+            if owner != target and name not in self._migrations:
+                self._begin_migration(name, owner, target)
+
+    def reload_plan(self) -> None:
+        path = Path(self._settings.shard_plan_path) if self._settings.shard_plan_path else None
+        if path is None:
+            return
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns == self._plan_mtime_ns:
+            return
+        self._plan_mtime_ns = mtime_ns
+        try:
+            plan = json.loads(path.read_text(encoding="utf-8"))
+            pins = plan.get("pins") if isinstance(plan.get("pins"), dict) else {}
+            self.apply_plan(int(plan.get("shard_count", self.shard_count)), pins)
+        except Exception as exc:
+            logger.warning("shard coordinator: ignoring unreadable shard plan %s: %s", path, exc)
+
+    def _retire_drained(self) -> None:
+        """Stop workers above the shard count once no tenant lives or lands there."""
+        busy = set(self._owners.values())
+        for m in self._migrations.values():
+            busy.update((m.source, m.target))
+        for shard in [s for s in self._workers if s >= self.shard_count and s not in busy]:
+            worker = self._workers.pop(shard)
+            try:
+                worker.conn.send(("stop", None))
+            except Exception:
+                logger.debug("shard %d stop message failed", shard, exc_info=True)
+            self._retiring.append((worker, time.monotonic() + _RETIRE_GRACE_S))
+            logger.info("shard coordinator: retired shard %d", shard)
+
+    def _reap_retired(self) -> None:
+        """Join stopped workers without blocking; terminate those past the grace period."""
+        now = time.monotonic()
+        pending: list[tuple[_Worker, float]] = []
+        for worker, deadline in self._retiring:
+            process = worker.process
+            if process is None:
+                continue
+            process.join(0)
+            if not process.is_alive():
+                continue
+            if now >= deadline:
+                logger.warning("shard coordinator: retired shard %d did not exit; terminating", worker.shard)
+                process.terminate()
+                process.join(1.0)
+                continue
+            pending.append((worker, deadline))
+        self._retiring = pending
+
+    # ── Routing ───────────────────────────────────────────────────────
+
+    def _forward(self, stream: str, shard: int, payload: dict[str, object]) -> None:
+        self._client.xadd(
+            stream=shard_stream(stream, shard),
+            payload=payload,
+            maxlen=STREAM_RETENTION_MAXLEN.get(stream),
+        )
+
+    def route_command(self, entry_id: str, payload: dict[str, object]) -> bool:
+        """Forward one source command; False when it was parked behind a migration (ack later)."""
+        name = _normalize(str(payload.get("instance_name", "")))
+        migration = self._migrations.get(name)
+        if migration is not None:
+            migration.parked.append((entry_id, payload))
+            return False
+        owner = self._owners.get(name)
+        target = self._target(name)
+        if owner is None:
+            if name:
+                self._owners[name] = target
+            owner = target
+        elif owner != target:
+            self._begin_migration(name, owner, target)
+            self._migrations[name].parked.append((entry_id, payload))
+            return False
+        self._forward(self._settings.command_stream, owner, payload)
+        self.forwarded_commands += 1
+        return True
+
+    def route_market(self, payload: dict[str, object]) -> list[int]:
+        """Write one market snapshot to each shard that needs it; returns those shards.
+
+        Snapshots for a migrating tenant are held (latest per pair) until the
+        new shard has adopted the desk, so an empty list means parked.
+        """
+        name = _normalize(str(payload.get("instance_name", "")))
+        migration = self._migrations.get(name) if name else None
+        if migration is not None:
+            key = (str(payload.get("connector_name", "")), str(payload.get("trading_pair", "")))
+            migration.market.pop(key, None)
+            migration.market[key] = payload
+            return []
+        owner = self._owners.get(name) if name else None
+        shards = sorted(self._workers) if owner is None else [owner]
+        for shard in shards:
+            self._forward(self._settings.market_data_stream, shard, payload)
+        self.forwarded_market_rows += len(shards)
+        return shards
+
+    # ── Migration ─────────────────────────────────────────────────────
+
+    def _begin_migration(self, name: str, source: int, target: int) -> None:
+        logger.info("shard coordinator: moving tenant %s shard %d -> %d", name, source, target)
+        deadline = time.monotonic() + self._settings.shard_migration_timeout_ms / 1000.0
+        self._migrations[name] = _Migration(source=source, target=target, deadline=deadline)
+        self._send_release(name, source, target)
+
+    def _send_release(self, name: str, shard: int, target: int | None = None) -> None:
+        payload: dict[str, object] = {"command": SHARD_RELEASE_COMMAND, "instance_name": name}
+        if target is not None:
+            payload["target_shard"] = str(target)
+        self._forward(self._settings.command_stream, shard, payload)
+
+    def _send_adopt(self, shard: int, handoff: TenantHandoff) -> None:
+        worker = self._workers.get(shard)
+        if worker is None:
+            return
+        try:
+            worker.conn.send(("adopt", handoff))
+        except Exception:
+            # Dead pipe: restart_dead_workers re-sends the handoff to the new worker.
+            logger.warning("shard coordinator: adopt message to shard %d failed", shard, exc_info=True)
+
+    def poll_workers(self) -> None:
+        for shard, worker in list(self._workers.items()):
+            try:
+                while worker.conn.poll():
+                    kind, name, body = worker.conn.recv()
+                    self._on_worker_message(shard, kind, name, body)
+            except (EOFError, OSError):
+                logger.debug("shard %d control pipe closed", shard, exc_info=True)
+
+    def _on_worker_message(self, shard: int, kind: str, name: str, body: TenantHandoff | None) -> None:
+        migration = self._migrations.get(name)
+        if kind == "released":
+            if migration is not None and migration.source == shard and migration.handoff is None:
+                if body is None:
+                    self._finish_migration(name)
+                else:
+                    migration.handoff = body
+                    self._send_adopt(migration.target, body)
+            elif body is not None:
+                self._on_stray_handoff(shard, name, body)
+        elif kind == "adopted":
+            if migration is not None and migration.target == shard and migration.handoff is not None:
+                self._finish_migration(name)
+            elif self._owners.get(name) != shard:
+                # A late adoption after an abort: this copy is not the owner's.
+                logger.warning("shard coordinator: evicting stale copy of %s from shard %d", name, shard)
+                self._send_release(name, shard)
+
+    def _on_stray_handoff(self, shard: int, name: str, handoff: TenantHandoff) -> None:
+        """A desk released outside a live migration (e.g. after an abort)."""
+        if self._owners.get(name) == shard:
+            logger.warning("shard coordinator: late release of %s; shard %d keeps the tenant", name, shard)
+            self._send_adopt(shard, handoff)
+        else:
+            logger.warning("shard coordinator: dropping stale copy of %s released by shard %d", name, shard)
+
+    def _expire_migrations(self) -> None:
+        """Abort migrations past their deadline back to the source shard."""
+        now = time.monotonic()
+        for name, migration in list(self._migrations.items()):
+            if now < migration.deadline or migration.target == migration.source:
+                continue
+            logger.warning(
+                "shard coordinator: migration of %s shard %d -> %d timed out; returning it to shard %d",
+                name, migration.source, migration.target, migration.source,
+            )
+            self.migrations_aborted += 1
+            # The source now doubles as the target: a pending release is
+            # adopted straight back, an exported handoff is re-sent there.
+            migration.target = migration.source
+            migration.deadline = now + self._settings.shard_migration_timeout_ms / 1000.0
+            if migration.handoff is not None:
+                self._send_adopt(migration.source, migration.handoff)
+
+    def _finish_migration(self, name: str) -> None:
+        migration = self._migrations.pop(name)
+        owner = migration.target
+        self._owners[name] = owner
+        for payload in migration.market.values():
+            self._forward(self._settings.market_data_stream, owner, payload)
+        self.forwarded_market_rows += len(migration.market)
+        ack_ids: list[str] = []
+        for entry_id, payload in migration.parked:
+            self._forward(self._settings.command_stream, owner, payload)
+            ack_ids.append(str(entry_id))
+        self.forwarded_commands += len(ack_ids)
+        if ack_ids:
+            self._client.ack_many(self._settings.command_stream, self._settings.consumer_group, ack_ids)
+        if owner != migration.source:
+            self.migrations_completed += 1
+        logger.info("shard coordinator: tenant %s now on shard %d", name, owner)
+
+    # ── Loop ──────────────────────────────────────────────────────────
+
+    def step(self) -> None:
+        s = self._settings
+        self.poll_workers()
+        self._expire_migrations()
+
+        market_rows = self._client.read_group(
+            stream=s.market_data_stream,
+            group=s.consumer_group,
+            consumer=s.consumer_name,
+            count=s.read_count,
+            block_ms=min(max(1, s.read_block_ms), 10),
+        )
+        if market_rows:
+            for _, row_payload in market_rows:
+                self.route_market(row_payload)
+            self._client.ack_many(s.market_data_stream, s.consumer_group, [str(eid) for eid, _ in market_rows])
+
+        command_rows = self._client.read_group(
+            stream=s.command_stream,
+            group=s.consumer_group,
+            consumer=s.consumer_name,
+            count=s.read_count,
+            block_ms=1,
+        )
+        if command_rows:
+            ack_ids = [str(eid) for eid, row_payload in command_rows if self.route_command(str(eid), row_payload)]
+            if ack_ids:
+                self._client.ack_many(s.command_stream, s.consumer_group, ack_ids)
+
+        self._retire_drained()
+        self._reap_retired()
+
+    def restart_dead_workers(self) -> None:
+        """Respawn exited workers and replay migration messages lost with their pipe."""
+        for shard, worker in list(self._workers.items()):
+            if worker.alive():
+                continue
+            logger.warning("shard coordinator: shard %d exited; restarting", shard)
+            if worker.process is not None:
+                worker.process.join(0)
+            self._workers[shard] = self._spawn(self._settings, shard)
+            for name, migration in self._migrations.items():
+                if migration.handoff is None and migration.source == shard:
+                    self._send_release(name, shard, migration.target)
+                elif migration.handoff is not None and migration.target == shard:
+                    self._send_adopt(shard, migration.handoff)
+
+    def merge_snapshots(self, state_path: Path, pair_path: Path) -> None:
+        shards = sorted(self._workers)
+        merge_state_snapshots([Path(_shard_path(str(state_path), i)) for i in shards], state_path)
+        merge_pair_snapshots([Path(_shard_path(str(pair_path), i)) for i in shards], pair_path)
+
+    def stop(self, timeout_s: float = 10.0) -> None:
+        for worker in self._workers.values():
+            try:
+                worker.conn.send(("stop", None))
+            except Exception:
+                logger.debug("shard %d stop message failed", worker.shard, exc_info=True)
+        deadline = time.monotonic() + timeout_s
+        for worker in [*self._workers.values(), *(w for w, _ in self._retiring)]:
+            if worker.process is not None:
+                worker.process.join(max(0.0, deadline - time.monotonic()))
+                if worker.process.is_alive():
+                    worker.process.terminate()
+
+
+def run_sharded(settings: ServiceSettings) -> None:
+    """Coordinator entry point used by ``desk_service.main`` when sharding is on."""
+    root = Path(os.getenv("HB_ROOT", os.getcwd()))
+    state_path = Path(settings.state_snapshot_path)
+    pair_path = Path(settings.pair_snapshot_path)
+    if not state_path.is_absolute():
+        state_path = root / state_path
+    if not pair_path.is_absolute():
+        pair_path = root / pair_path
+
+    client = RedisStreamClient(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password or None,
+        enabled=settings.redis_enabled,
+    )
+    client.create_group(settings.market_data_stream, settings.consumer_group)
+    client.create_group(settings.command_stream, settings.consumer_group)
+
+    coordinator = ShardCoordinator(settings, client)
+    coordinator.start()
+    logger.info("desk_service coordinator starting: shards=%d", coordinator.shard_count)
+    last_flush_ms = 0
+    last_health_ms = 0
+    try:
+        while True:
+            coordinator.reload_plan()
+            coordinator.step()
+            now = _now_ms()
+            if now - last_flush_ms >= settings.pair_snapshot_flush_interval_ms:
+                try:
+                    coordinator.merge_snapshots(state_path, pair_path)
+                except Exception as exc:
+                    logger.warning("desk_service coordinator snapshot merge failed: %s", exc)
+                last_flush_ms = now
+            if now - last_health_ms >= settings.heartbeat_interval_ms:
+                coordinator.restart_dead_workers()
+                last_health_ms = now
+    except KeyboardInterrupt:
+        logger.info("desk_service coordinator interrupted")
+    finally:
+        coordinator.stop()
+
+
+__all__ = [
+    "SHARD_RELEASE_COMMAND",
+    "ShardCoordinator",
+    "ShardRing",
+    "ShardWorkerControl",
+    "TenantHandoff",
+    "adopt_tenant",
+    "release_tenant",
+    "run_sharded",
+    "shard_settings",
+    "shard_stream",
+]
@@ -75,6 +75,10 @@ class RealtimeApiConfig:
         default_factory=lambda: int(os.getenv("REALTIME_UI_API_DB_STATEMENT_TIMEOUT_MS", "1500"))
     )
     db_lock_timeout_ms: int = field(default_factory=lambda: int(os.getenv("REALTIME_UI_API_DB_LOCK_TIMEOUT_MS", "750")))
+    db_pool_size: int = field(default_factory=lambda: int(os.getenv("REALTIME_UI_API_DB_POOL_SIZE", "4")))
+    db_query_cache_ttl_s: float = field(
+        default_factory=lambda: float(os.getenv("REALTIME_UI_API_DB_QUERY_CACHE_TTL_S", "2"))
+    )
     sse_enabled: bool = field(
         default_factory=lambda: os.getenv("REALTIME_UI_API_SSE_ENABLED", "false").strip().lower() in {"1", "true", "yes"}
     )
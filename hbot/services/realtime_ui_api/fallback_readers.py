@@ -19,7 +19,9 @@ try:
 except Exception:
     ccxt = None  # type: ignore[assignment]
 
+from platform_lib.core.pg_pool import PgConnectionPool, TtlResultCache, shared_pool
 from platform_lib.logging.log_namespace import list_instance_log_files
+from platform_lib.market_data.bar_tail_cache import IncrementalBarCache
 from platform_lib.market_data.market_history_provider_impl import MarketHistoryProviderImpl, market_bars_to_candles
 from platform_lib.market_data.market_history_types import MarketBar, MarketBarKey
 from services.realtime_ui_api._helpers import (
@@ -53,30 +55,27 @@ class OpsDbReadModel:
         self._last_health_check_ms = 0
         self._last_health_ok = False
         self._rest_candle_cache: dict[tuple[str, str, int, int], tuple[int, list[dict[str, Any]]]] = {}
+        self._result_cache = TtlResultCache(max_entries=512)
+        self._bar_cache = IncrementalBarCache(ttl_s=cfg.db_query_cache_ttl_s)
 
     @property
     def enabled(self) -> bool:
         return self._enabled
 
-    def _connect(self):
+    def _pool(self) -> PgConnectionPool | None:
         if not self._enabled:
             return None
-        host = os.getenv("OPS_DB_HOST", "postgres")
-        port = int(os.getenv("OPS_DB_PORT", "5432"))
-        dbname = os.getenv("OPS_DB_NAME", "hbot_ops")
-        user = os.getenv("OPS_DB_USER", "hbot")
-        password = os.getenv("OPS_DB_PASSWORD", "hbot_dev_password")
         statement_timeout_ms = max(200, int(self._cfg.db_statement_timeout_ms))
         lock_timeout_ms = max(100, int(self._cfg.db_lock_timeout_ms))
-        options = f"-c statement_timeout={statement_timeout_ms} -c lock_timeout={lock_timeout_ms}"
-        return psycopg.connect(
-            host=host,
-            port=port,
-            dbname=dbname,
-            user=user,
-            password=password,
+        return shared_pool(
+            max_size=max(1, int(self._cfg.db_pool_size)),
+            host=os.getenv("OPS_DB_HOST", "postgres"),
+            port=int(os.getenv("OPS_DB_PORT", "5432")),
+            dbname=os.getenv("OPS_DB_NAME", "hbot_ops"),
+            user=os.getenv("OPS_DB_USER", "hbot"),
+            password=os.getenv("OPS_DB_PASSWORD", "hbot_dev_password"),
             connect_timeout=3,
-            options=options,
+            options=f"-c statement_timeout={statement_timeout_ms} -c lock_timeout={lock_timeout_ms}",
         )
 
     def available(self) -> bool:
@@ -87,14 +86,9 @@ class OpsDbReadModel:
             return self._last_health_ok
         ok = False
         try:
-            conn = self._connect()
-            if conn is not None:
-                try:
-                    with conn.cursor() as cur:
-                        cur.execute("SELECT 1")
-                        ok = bool(cur.fetchone())
-                finally:
-                    conn.close()
+            pool = self._pool()
+            if pool is not None:
+                ok = bool(pool.fetch_rows("SELECT 1"))
         except Exception:
             ok = False
         self._last_health_check_ms = now
@@ -105,26 +99,25 @@ class OpsDbReadModel:
         if not self._enabled:
             return []
         try:
-            conn = self._connect()
-            if conn is None:
+            pool = self._pool()
+            if pool is None:
                 return []
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(sql, params)
-                    rows = cur.fetchall()
-                    cols = [desc[0] for desc in cur.description or []]
-                out: list[dict[str, Any]] = []
-                for row in rows:
-                    if isinstance(row, dict):
-                        out.append(row)
-                    elif isinstance(row, tuple):
-                        out.append({cols[idx]: row[idx] for idx in range(min(len(cols), len(row)))})
-                return out
-            finally:
-                conn.close()
+            return pool.fetch_dicts(sql, params)
         except Exception:
             return []
 
+    def _cached_query(self, sql: str, params: dict[str, Any], ttl_s: float) -> list[dict[str, Any]]:
+        """``_query`` behind the per-query TTL result cache (empty results are not cached)."""
+        key = TtlResultCache.key(sql, params)
+        rows = self._result_cache.get_or_load(key, ttl_s, lambda: self._query(sql, params) or None)
+        return list(rows or [])
+
+    def _window_ttl_s(self, end_ms: int | None) -> float:
+        """Results for a window that closed before now cannot change, so they are kept longer."""
+        if end_ms is not None and int(end_ms) <= _now_ms():
+            return max(60.0, float(self._cfg.db_query_cache_ttl_s))
+        return float(self._cfg.db_query_cache_ttl_s)
+
     def _pair_candidates(self, trading_pair: str) -> list[str]:
         raw = str(trading_pair or "").strip().upper()
         if not raw:
@@ -172,7 +165,7 @@ class OpsDbReadModel:
             return []
         limit = max(1, int(limit))
         pair_candidates = self._pair_candidates(trading_pair)
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT EXTRACT(EPOCH FROM bucket_minute_utc) * 1000.0 AS bucket_ms,
                    open_price,
@@ -193,6 +186,7 @@ class OpsDbReadModel:
                 "lookback_hours": max(1, int(self._cfg.db_lookback_hours)),
                 "limit": limit,
             },
+            self._cfg.db_query_cache_ttl_s,
         )
         out: list[dict[str, Any]] = []
         for row in reversed(rows):
@@ -226,59 +220,71 @@ class OpsDbReadModel:
             return []
         limit = max(1, int(limit))
         pair_candidates = self._pair_candidates(key.trading_pair)
-        end_ts_utc = (
-            datetime.fromtimestamp(int(end_time_ms) / 1000.0, tz=UTC).isoformat()
-            if end_time_ms
-            else None
-        )
-        rows = self._query(
-            """
-            SELECT EXTRACT(EPOCH FROM bucket_minute_utc) * 1000.0 AS bucket_ms,
-                   open_price,
-                   high_price,
-                   low_price,
-                   close_price,
-                   bar_source
-            FROM market_bar_v2
-            WHERE (%(connector_name)s = '' OR connector_name = %(connector_name)s)
-              AND (%(pair_count)s = 0 OR trading_pair = ANY(%(pairs)s))
-              AND bar_source = %(bar_source)s
-              AND bar_interval_s = 60
-              AND (%(end_ts_utc)s IS NULL OR bucket_minute_utc <= %(end_ts_utc)s::timestamptz)
-              AND bucket_minute_utc >= NOW() - (%(lookback_hours)s::text || ' hours')::interval
-            ORDER BY bucket_minute_utc DESC
-            LIMIT %(limit)s
-            """,
-            {
-                "connector_name": str(key.connector_name or "").strip(),
-                "pairs": pair_candidates,
-                "pair_count": len(pair_candidates),
-                "bar_source": str(key.bar_source or "quote_mid"),
-                "end_ts_utc": end_ts_utc,
-                "lookback_hours": max(1, int(self._cfg.db_lookback_hours)),
-                "limit": max(limit, int(limit * max(1, int(bar_interval_s) // 60))),
-            },
+        connector_name = str(key.connector_name or "").strip()
+        bar_source = str(key.bar_source or "quote_mid")
+        lookback_hours = max(1, int(self._cfg.db_lookback_hours))
+
+        def _fetch(since_ms: int | None, end_ms: int | None, fetch_limit: int) -> list[MarketBar]:
+            rows = self._query(
+                """
+                SELECT EXTRACT(EPOCH FROM bucket_minute_utc) * 1000.0 AS bucket_ms,
+                       open_price,
+                       high_price,
+                       low_price,
+                       close_price,
+                       bar_source
+                FROM market_bar_v2
+                WHERE (%(connector_name)s = '' OR connector_name = %(connector_name)s)
+                  AND (%(pair_count)s = 0 OR trading_pair = ANY(%(pairs)s))
+                  AND bar_source = %(bar_source)s
+                  AND bar_interval_s = 60
+                  AND (%(end_ts_utc)s IS NULL OR bucket_minute_utc <= %(end_ts_utc)s::timestamptz)
+                  AND (%(since_ts_utc)s IS NULL OR bucket_minute_utc >= %(since_ts_utc)s::timestamptz)
+                  AND bucket_minute_utc >= NOW() - (%(lookback_hours)s::text || ' hours')::interval
+                ORDER BY bucket_minute_utc DESC
+                LIMIT %(limit)s
+                """,
+                {
+                    "connector_name": connector_name,
+                    "pairs": pair_candidates,
+                    "pair_count": len(pair_candidates),
+                    "bar_source": bar_source,
+                    "end_ts_utc": datetime.fromtimestamp(int(end_ms) / 1000.0, tz=UTC).isoformat() if end_ms else None,
+                    "since_ts_utc": (
+                        datetime.fromtimestamp(int(since_ms) / 1000.0, tz=UTC).isoformat() if since_ms is not None else None
+                    ),
+                    "lookback_hours": lookback_hours,
+                    "limit": max(1, int(fetch_limit)),
+                },
+            )
+            return _candle_dicts_to_market_bars(
+                [
+                    {
+                        "bucket_ms": row.get("bucket_ms"),
+                        "open": row.get("open_price"),
+                        "high": row.get("high_price"),
+                        "low": row.get("low_price"),
+                        "close": row.get("close_price"),
+                    }
+                    for row in reversed(rows)
+                ],
+                bar_interval_s=60,
+                bar_source=bar_source,
+            )
+
+        bars = self._bar_cache.get(
+            (connector_name, tuple(pair_candidates), bar_source, lookback_hours),
+            max(limit, int(limit * max(1, int(bar_interval_s) // 60))),
+            int(end_time_ms) if end_time_ms else None,
+            _fetch,
+            since_ms=_now_ms() - lookback_hours * 3_600_000,
         )
-        if not rows and str(key.bar_source or "quote_mid") == "quote_mid":
+        if not bars and bar_source == "quote_mid":
             return _candle_dicts_to_market_bars(
                 self._get_legacy_quote_candles(str(key.connector_name or ""), str(key.trading_pair or ""), bar_interval_s, limit),
                 bar_interval_s=max(60, int(bar_interval_s)),
                 bar_source="quote_mid",
             )
-        bars = _candle_dicts_to_market_bars(
-            [
-                {
-                    "bucket_ms": row.get("bucket_ms"),
-                    "open": row.get("open_price"),
-                    "high": row.get("high_price"),
-                    "low": row.get("low_price"),
-                    "close": row.get("close_price"),
-                }
-                for row in reversed(rows)
-            ],
-            bar_interval_s=60,
-            bar_source=str(key.bar_source or "quote_mid"),
-        )
         if int(bar_interval_s) <= 60:
             return bars[-limit:]
         provider = MarketHistoryProviderImpl(now_ms_reader=_now_ms)
@@ -291,7 +297,7 @@ class OpsDbReadModel:
         if not self.available() or not instance_name:
             return {}
         pair_candidates = self._pair_candidates(trading_pair)
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT trading_pair, quantity, avg_entry_price, unrealized_pnl_quote, side, source_ts_utc
             FROM bot_position_current
@@ -305,6 +311,7 @@ class OpsDbReadModel:
                 "pairs": pair_candidates,
                 "pair_count": len(pair_candidates),
             },
+            self._cfg.db_query_cache_ttl_s,
         )
         if not rows:
             return {}
@@ -376,7 +383,7 @@ class OpsDbReadModel:
             return []
         limit = max(1, int(limit))
         pair_candidates = self._pair_candidates(trading_pair)
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT ts_utc, side, price, amount_base, realized_pnl_quote, order_id, is_maker,
                    notional_quote, fee_quote
@@ -394,6 +401,7 @@ class OpsDbReadModel:
                 "lookback_hours": max(1, int(self._cfg.db_lookback_hours)),
                 "limit": limit,
             },
+            self._cfg.db_query_cache_ttl_s,
         )
         out: list[dict[str, Any]] = []
         for row in reversed(rows):
@@ -422,7 +430,7 @@ class OpsDbReadModel:
             return []
         day_key, start_ms, end_ms = _day_bounds_utc(day_key)
         pair_candidates = self._pair_candidates(trading_pair)
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT ts_utc, side, price, amount_base, realized_pnl_quote, order_id, is_maker,
                    notional_quote, fee_quote
@@ -442,6 +450,7 @@ class OpsDbReadModel:
                 "end_ts": datetime.fromtimestamp(end_ms / 1000, tz=UTC).isoformat(),
                 "limit": max(1, int(limit)),
             },
+            self._window_ttl_s(end_ms),
         )
         out: list[dict[str, Any]] = []
         for row in rows:
@@ -482,13 +491,14 @@ class OpsDbReadModel:
         pair_candidates = self._pair_candidates(trading_pair)
         start_ts = None
         end_ts = None
+        end_ms: int | None = None
         if str(start_day or "").strip():
             _, start_ms, _ = _day_bounds_utc(start_day)
             start_ts = datetime.fromtimestamp(start_ms / 1000, tz=UTC).isoformat()
         if str(end_day or "").strip():
             _, _, end_ms = _day_bounds_utc(end_day)
             end_ts = datetime.fromtimestamp(end_ms / 1000, tz=UTC).isoformat()
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT ts_utc, side, price, amount_base, realized_pnl_quote, order_id, is_maker,
                    notional_quote, fee_quote
@@ -508,6 +518,7 @@ class OpsDbReadModel:
                 "end_ts": end_ts,
                 "limit": max(1, int(limit)),
             },
+            self._window_ttl_s(end_ms),
         )
         out: list[dict[str, Any]] = []
         for row in rows:
@@ -539,7 +550,7 @@ class OpsDbReadModel:
         if not self.available() or not instance_name:
             return 0
         pair_candidates = self._pair_candidates(trading_pair)
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT COUNT(*) AS fill_count
             FROM fills
@@ -553,6 +564,7 @@ class OpsDbReadModel:
                 "pair_count": len(pair_candidates),
                 "lookback_hours": max(1, int(self._cfg.db_lookback_hours)),
             },
+            self._cfg.db_query_cache_ttl_s,
         )
         if not rows:
             return 0
@@ -565,7 +577,7 @@ class OpsDbReadModel:
         if not self.available() or not instance_name:
             return {**_summarize_fill_activity([], fills_total=0), "realized_pnl_total_quote": 0.0}
         pair_candidates = self._pair_candidates(trading_pair)
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT
                 COUNT(*) FILTER (
@@ -642,6 +654,7 @@ class OpsDbReadModel:
                 "pair_count": len(pair_candidates),
                 "lookback_hours": max(1, int(self._cfg.db_lookback_hours)),
             },
+            self._cfg.db_query_cache_ttl_s,
         )
         if not rows:
             return {**_summarize_fill_activity([], fills_total=0), "realized_pnl_total_quote": 0.0}
@@ -659,7 +672,7 @@ class OpsDbReadModel:
             return []
         limit = max(1, int(limit))
         pair_candidates = self._pair_candidates(trading_pair)
-        rows = self._query(
+        rows = self._cached_query(
             """
             SELECT order_id, side, order_type, amount_base, price, state, updated_ts_utc
             FROM paper_exchange_open_order_current
@@ -674,6 +687,7 @@ class OpsDbReadModel:
                 "pair_count": len(pair_candidates),
                 "limit": limit,
             },
+            self._cfg.db_query_cache_ttl_s,
         )
         out: list[dict[str, Any]] = []
         for row in rows:
@@ -0,0 +1,176 @@
+"""Asyncio fan-out hub for WebSocket / SSE subscribers.
+
+``RealtimeState.process`` runs on the stream-consumer thread and hands each
+event to :meth:`FanoutHub.publish`.  The hub serialises the event once per
+wire format (WebSocket text frame, SSE message) with orjson on that thread,
+then schedules delivery on the event loop, where every matching
+subscriber's ``asyncio.Queue`` receives the same :class:`Frame` object.
+
+Subscribers are indexed by their ``(instance_name, controller_id,
+normalised trading_pair)`` selection; an empty field is a wildcard on
+either side, so an event with a complete key is routed with at most eight
+dict lookups instead of a scan over every connection.  Queues are bounded
+and drop the oldest frame when full, so a slow client loses history rather
+than stalling the publisher.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from services.realtime_ui_api._helpers import _normalize_pair
+
+logger = logging.getLogger(__name__)
+
+SelectionKey = tuple[str, str, str]
+
+KIND_WS = "ws"
+KIND_SSE = "sse"
+
+
+def selection_key(instance_name: Any, controller_id: Any, trading_pair: Any) -> SelectionKey:
+    return (
+        str(instance_name or "").strip(),
+        str(controller_id or "").strip(),
+        _normalize_pair(trading_pair),
+    )
+
+
+@dataclass(frozen=True)
+class Frame:
+    """One published event, pre-serialised for each wire format that had subscribers."""
+
+    event: dict[str, Any]
+    key: SelectionKey
+    ws_text: str = ""
+    sse_text: str = ""
+
+
+class Subscription:
+    """A connection's bounded frame queue (drop-oldest on overflow)."""
+
+    __slots__ = ("dropped", "key", "kind", "queue")
+
+    def __init__(self, key: SelectionKey, kind: str, maxsize: int) -> None:
+        self.key = key
+        self.kind = kind
+        self.queue: asyncio.Queue[Frame] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    async def get(self, timeout: float) -> Frame | None:
+        """Next frame, or None when nothing arrived within *timeout* seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+
+class FanoutHub:
+    def __init__(self, *, queue_size: int = 200) -> None:
+        self._queue_size = max(1, int(queue_size))
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._by_key: dict[SelectionKey, set[Subscription]] = {}
+        self._count_lock = threading.Lock()
+        self._kind_counts: dict[str, int] = {KIND_WS: 0, KIND_SSE: 0}
+        self._frames_published = 0
+        self._frames_delivered = 0
+        self._drops = 0
+
+    # ── Subscriber side (event loop) ──────────────────────────────────
+
+    def subscribe(
+        self,
+        instance_name: str = "",
+        controller_id: str = "",
+        trading_pair: str = "",
+        *,
+        kind: str = KIND_WS,
+    ) -> Subscription:
+        """Register a subscriber; must be called from the event loop that will consume it."""
+        self._loop = asyncio.get_running_loop()
+        sub = Subscription(selection_key(instance_name, controller_id, trading_pair), kind, self._queue_size)
+        self._by_key.setdefault(sub.key, set()).add(sub)
+        with self._count_lock:
+            self._kind_counts[kind] = self._kind_counts.get(kind, 0) + 1
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        bucket = self._by_key.get(sub.key)
+        if bucket is None or sub not in bucket:
+            return
+        bucket.discard(sub)
+        if not bucket:
+            del self._by_key[sub.key]
+        with self._count_lock:
+            self._kind_counts[sub.kind] -= 1
+
+    # ── Publisher side (any thread) ───────────────────────────────────
+
+    def publish(self, event: dict[str, Any], key: SelectionKey) -> None:
+        """Serialise *event* once per needed format and fan it out on the loop."""
+        loop = self._loop
+        with self._count_lock:
+            ws_subs = self._kind_counts.get(KIND_WS, 0)
+            sse_subs = self._kind_counts.get(KIND_SSE, 0)
+        if loop is None or loop.is_closed() or (ws_subs == 0 and sse_subs == 0):
+            return
+        ws_text = orjson.dumps({"type": "event", **event}, option=orjson.OPT_NON_STR_KEYS).decode() if ws_subs else ""
+        sse_text = ""
+        if sse_subs:
+            sse_text = "event: update\ndata: " + orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS).decode() + "\n\n"
+        frame = Frame(event=event, key=(key[0], key[1], _normalize_pair(key[2])), ws_text=ws_text, sse_text=sse_text)
+        try:
+            loop.call_soon_threadsafe(self._dispatch, frame)
+        except RuntimeError:
+            logger.debug("Fan-out loop closed; dropping frame")
+
+    def _matching(self, key: SelectionKey) -> list[Subscription]:
+        if all(key):
+            buckets = (
+                self._by_key.get(candidate)
+                for candidate in itertools.product(*((field, "") for field in key))
+            )
+            return [sub for bucket in buckets if bucket for sub in bucket]
+        # Wildcard event (missing a field): match every subscriber on the known fields.
+        out: list[Subscription] = []
+        for sub_key, bucket in self._by_key.items():
+            if all(not ev or not sub or ev == sub for ev, sub in zip(key, sub_key, strict=True)):
+                out.extend(bucket)
+        return out
+
+    def _dispatch(self, frame: Frame) -> None:
+        self._frames_published += 1
+        for sub in self._matching(frame.key):
+            if not (frame.ws_text if sub.kind == KIND_WS else frame.sse_text):
+                continue  # subscribed after the frame was serialised
+            queue = sub.queue
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                sub.dropped += 1
+                self._drops += 1
+            queue.put_nowait(frame)
+            self._frames_delivered += 1
+
+    def metrics(self) -> dict[str, int]:
+        with self._count_lock:
+            counts = dict(self._kind_counts)
+        return {
+            "subscribers": sum(counts.values()),
+            "ws_subscribers": counts.get(KIND_WS, 0),
+            "sse_subscribers": counts.get(KIND_SSE, 0),
+            "frames_published": self._frames_published,
+            "frames_delivered": self._frames_delivered,
+            "subscriber_drops": self._drops,
+        }
+
+
+__all__ = ["KIND_SSE", "KIND_WS", "FanoutHub", "Frame", "Subscription", "selection_key"]
@@ -68,6 +68,7 @@ from services.realtime_ui_api.fallback_readers import (
     DeskSnapshotFallback,
     OpsDbReadModel,
 )
+from services.realtime_ui_api.fanout import KIND_SSE, KIND_WS
 from services.realtime_ui_api.state import RealtimeState
 from services.realtime_ui_api.stream_consumer import StreamWorker
 
@@ -1244,7 +1245,7 @@ def create_app(
 
         await websocket.accept()
 
-        q = state.register_subscriber(instance_name, controller_id, resolved_pair or trading_pair)
+        sub = state.hub.subscribe(instance_name, controller_id, resolved_pair or trading_pair, kind=KIND_WS)
         try:
             # Send initial snapshot.
             snapshot_payload = await _get_loop().run_in_executor(
@@ -1284,19 +1285,14 @@ def create_app(
             last_snapshot_ms = _now_ms()
 
             while True:
-                # Bridge blocking queue.get() to async via executor.
-                try:
-                    raw = await asyncio.wait_for(
-                        _get_loop().run_in_executor(None, partial(q.get, timeout=2.0)),
-                        timeout=6.0,
-                    )
-                    evt = json.loads(raw) if isinstance(raw, str) else {}
-                    event_key = evt.get("key")
-                    if not _stream_key_matches(event_key, instance_name, controller_id, effective_pair or trading_pair):
-                        continue
-                    await websocket.send_text(_json_str({"type": "event", **evt}))
-                except (TimeoutError, queue.Empty):
+                frame = await sub.get(timeout=2.0)
+                if frame is None:
                     await websocket.send_text(_json_str({"type": "keepalive", "ts_ms": _now_ms()}))
+                elif not _stream_key_matches(frame.event.get("key"), instance_name, controller_id, effective_pair or trading_pair):
+                    continue
+                else:
+                    # Pre-serialised once by the hub and shared by every matching client.
+                    await websocket.send_text(frame.ws_text)
 
                 now_ms = _now_ms()
                 if now_ms - last_snapshot_ms >= 60_000:
@@ -1329,7 +1325,7 @@ def create_app(
         except (BrokenPipeError, ConnectionResetError, OSError):
             pass
         finally:
-            state.unregister_subscriber(q)
+            state.hub.unsubscribe(sub)
 
     # ── SSE stream handler ──────────────────────────────────────────────
 
@@ -1341,7 +1337,7 @@ def create_app(
             return _json_response({"status": "not_found", "path": "/api/v1/stream"}, 404)
 
         instance_name, controller_id, trading_pair = _params(request)
-        q = state.register_subscriber(instance_name, controller_id, trading_pair)
+        sub = state.hub.subscribe(instance_name, controller_id, trading_pair, kind=KIND_SSE)
 
         from starlette.responses import StreamingResponse
 
@@ -1349,18 +1345,12 @@ def create_app(
             try:
                 yield "event: ready\ndata: {\"status\":\"ok\"}\n\n"
                 while True:
-                    try:
-                        payload = await asyncio.wait_for(
-                            _get_loop().run_in_executor(None, partial(q.get, timeout=10.0)),
-                            timeout=16.0,
-                        )
-                        yield f"event: update\ndata: {payload}\n\n"
-                    except (TimeoutError, queue.Empty):
-                        yield ": keepalive\n\n"
+                    frame = await sub.get(timeout=10.0)
+                    yield frame.sse_text if frame is not None else ": keepalive\n\n"
             except (BrokenPipeError, ConnectionResetError, asyncio.CancelledError):
                 pass
             finally:
-                state.unregister_subscriber(q)
+                state.hub.unsubscribe(sub)
 
         return StreamingResponse(
             _event_generator(),
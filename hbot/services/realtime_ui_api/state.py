@@ -1,8 +1,10 @@
 """Realtime in-memory state container for the UI API.
 
 Holds market snapshots, depth data, fills, paper events, positions, and
-bot telemetry snapshots received from Redis streams.  Manages pub/sub
-for SSE/WebSocket subscribers.
+bot telemetry snapshots received from Redis streams.  Publishes every
+update to the asyncio fan-out hub used by the SSE/WebSocket handlers
+(``self.hub``); the thread-queue ``register_subscriber`` API is kept for
+synchronous consumers.
 """
 from __future__ import annotations
 
@@ -29,6 +31,7 @@ from services.realtime_ui_api._helpers import (
     _stream_ms,
     _to_float,
 )
+from services.realtime_ui_api.fanout import FanoutHub
 
 # Re-export for backward compatibility
 __all__ = ["RealtimeState"]
@@ -72,6 +75,7 @@ class RealtimeState:
         self._subscribers: list[tuple[queue.Queue[str], tuple[str, str, str]]] = []
         self._publish_seq = 0
         self._subscriber_drop_count = 0
+        self.hub = FanoutHub(queue_size=200)
 
     @staticmethod
     def _selection_dict(key: tuple[str, str, str]) -> dict[str, str]:
@@ -113,10 +117,13 @@ class RealtimeState:
         return not (sub_pair and ev_pair and _normalize_pair(sub_pair) != _normalize_pair(ev_pair))
 
     def _notify(self, event: dict[str, Any]) -> None:
-        payload = _safe_json(event)
         event_key = self._selection_from_event(event)
+        self.hub.publish(event, event_key)
         with self._lock:
             subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+        payload = _safe_json(event)
         for q, subscriber_key in subscribers:
             if not self._subscriber_matches(subscriber_key, event_key):
                 continue
@@ -623,6 +630,7 @@ class RealtimeState:
         return _candles_from_points(points, timeframe_s=timeframe_s, limit=limit)
 
     def metrics(self) -> dict[str, Any]:
+        hub = self.hub.metrics()
         with self._lock:
             return {
                 "market_keys": len(self._market),
@@ -631,6 +639,8 @@ class RealtimeState:
                 "market_depth_keys": len(self._market_depth),
                 "fills_keys": len(self._fills),
                 "paper_event_keys": len(self._paper_events),
-                "subscribers": len(self._subscribers),
-                "subscriber_drops": int(self._subscriber_drop_count or 0),
+                "subscribers": len(self._subscribers) + hub["subscribers"],
+                "subscriber_drops": int(self._subscriber_drop_count or 0) + hub["subscriber_drops"],
+                "frames_published": hub["frames_published"],
+                "frames_delivered": hub["frames_delivered"],
             }
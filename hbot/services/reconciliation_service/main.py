@@ -12,7 +12,12 @@ from pathlib import Path
 from urllib.request import Request, urlopen
 
 from platform_lib.core.activity_scope import active_bots_from_minute_logs
-from platform_lib.core.event_store_reader import count_bot_fill_events, load_bot_snapshot_windows
+from platform_lib.core.event_index import open_event_index
+from platform_lib.core.event_store_reader import (
+    FILL_EVENT_TYPES,
+    count_bot_fill_events,
+    load_bot_snapshot_windows,
+)
 from platform_lib.logging.log_namespace import iter_bot_log_files
 from platform_lib.core.utils import safe_bool as _safe_bool
 from platform_lib.core.utils import safe_float as _safe_float
@@ -25,22 +30,7 @@ logger = logging.getLogger(__name__)
 
 def _count_event_fills(path: Path, bot: str) -> int:
     if path.exists():
-        count = 0
-        try:
-            for raw in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-                line = raw.strip()
-                if not line:
-                    continue
-                event = json.loads(line)
-                event_type = str(event.get("event_type", "")).strip().lower()
-                if event_type not in {"order_filled", "bot_fill"}:
-                    continue
-                if str(event.get("instance_name", "")).strip() != str(bot).strip():
-                    continue
-                count += 1
-        except Exception:
-            return count
-        return count
+        return open_event_index(path).count(event_types=FILL_EVENT_TYPES, instance_name=str(bot).strip())
     return count_bot_fill_events(path.parent, bot, day_utc=path.stem.replace("events_", ""))
 
 
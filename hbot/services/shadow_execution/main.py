@@ -9,6 +9,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from platform_lib.core.activity_scope import active_bots_from_minute_logs
+from platform_lib.core.bot_state import BotStateView, bot_state_path
 from platform_lib.logging.log_namespace import iter_bot_log_files
 from platform_lib.core.utils import (
     safe_bool as _safe_bool,
@@ -63,8 +64,43 @@ def _read_latest_csv_row(path: Path) -> dict[str, str] | None:
     return latest
 
 
-def _load_controller_market_rows(data_root: Path) -> dict[str, dict[str, object]]:
+def _controller_market_row(minute_path: object, latest: dict[str, str]) -> dict[str, object]:
+    return {
+        "minute_path": str(minute_path),
+        "ts": str(latest.get("ts", "")),
+        "connector_name": str(latest.get("connector_name", latest.get("exchange", ""))),
+        "trading_pair": str(latest.get("trading_pair", "")),
+        "mid": _safe_float(latest.get("mid"), 0.0),
+        "best_bid": _safe_float(latest.get("best_bid"), 0.0),
+        "best_ask": _safe_float(latest.get("best_ask"), 0.0),
+        "spread_pct": _safe_float(latest.get("spread_pct"), 0.0),
+        "state": str(latest.get("state", "")),
+    }
+
+
+def _fill_row(fills_path: object, latest: dict[str, str]) -> dict[str, object]:
+    return {
+        "fills_path": str(fills_path),
+        "ts": str(latest.get("ts", latest.get("timestamp", ""))),
+        "side": str(latest.get("side", "")),
+        "price": _safe_float(latest.get("price"), 0.0),
+        "mid_ref": _safe_float(latest.get("mid_ref"), 0.0),
+        "fee_quote": _safe_float(latest.get("fee_quote"), 0.0),
+        "is_maker": str(latest.get("is_maker", "")),
+    }
+
+
+def _load_controller_market_rows(
+    data_root: Path,
+    bot_states: dict[str, dict[str, object]] | None = None,
+) -> dict[str, dict[str, object]]:
     rows: dict[str, dict[str, object]] = {}
+    if bot_states:
+        for bot, state in bot_states.items():
+            latest = state.get("minute")
+            if isinstance(latest, dict) and latest:
+                rows[bot] = _controller_market_row(state.get("minute_path", ""), latest)
+        return rows
     for minute_file in iter_bot_log_files(data_root, "minute.csv"):
         try:
             bot = minute_file.parts[-5]
@@ -73,22 +109,21 @@ def _load_controller_market_rows(data_root: Path) -> dict[str, dict[str, object]
         latest = _read_latest_csv_row(minute_file)
         if not latest:
             continue
-        rows[bot] = {
-            "minute_path": str(minute_file),
-            "ts": str(latest.get("ts", "")),
-            "connector_name": str(latest.get("connector_name", latest.get("exchange", ""))),
-            "trading_pair": str(latest.get("trading_pair", "")),
-            "mid": _safe_float(latest.get("mid"), 0.0),
-            "best_bid": _safe_float(latest.get("best_bid"), 0.0),
-            "best_ask": _safe_float(latest.get("best_ask"), 0.0),
-            "spread_pct": _safe_float(latest.get("spread_pct"), 0.0),
-            "state": str(latest.get("state", "")),
-        }
+        rows[bot] = _controller_market_row(minute_file, latest)
     return rows
 
 
-def _load_latest_fill_rows(data_root: Path) -> dict[str, dict[str, object]]:
+def _load_latest_fill_rows(
+    data_root: Path,
+    bot_states: dict[str, dict[str, object]] | None = None,
+) -> dict[str, dict[str, object]]:
     rows: dict[str, dict[str, object]] = {}
+    if bot_states:
+        for bot, state in bot_states.items():
+            latest = state.get("last_fill")
+            if isinstance(latest, dict) and latest:
+                rows[bot] = _fill_row(state.get("fills_path", ""), latest)
+        return rows
     for fills_file in iter_bot_log_files(data_root, "fills.csv"):
         try:
             bot = fills_file.parts[-5]
@@ -97,15 +132,7 @@ def _load_latest_fill_rows(data_root: Path) -> dict[str, dict[str, object]]:
         latest = _read_latest_csv_row(fills_file)
         if not latest:
             continue
-        rows[bot] = {
-            "fills_path": str(fills_file),
-            "ts": str(latest.get("ts", latest.get("timestamp", ""))),
-            "side": str(latest.get("side", "")),
-            "price": _safe_float(latest.get("price"), 0.0),
-            "mid_ref": _safe_float(latest.get("mid_ref"), 0.0),
-            "fee_quote": _safe_float(latest.get("fee_quote"), 0.0),
-            "is_maker": str(latest.get("is_maker", "")),
-        }
+        rows[bot] = _fill_row(fills_file, latest)
     return rows
 
 
@@ -424,9 +451,10 @@ def _build_drift_audit(
     data_root: Path,
     event_path: Path,
     pair_snapshot_path: Path,
+    bot_states: dict[str, dict[str, object]] | None = None,
 ) -> dict[str, object]:
-    controller_rows = _load_controller_market_rows(data_root)
-    latest_fill_rows = _load_latest_fill_rows(data_root)
+    controller_rows = _load_controller_market_rows(data_root, bot_states)
+    latest_fill_rows = _load_latest_fill_rows(data_root, bot_states)
     stream_rows = _load_latest_stream_market_rows(event_path)
     pair_rows = _load_paper_service_pair_rows(pair_snapshot_path)
     reconciliation_findings = reconciliation.get("findings", [])
@@ -525,6 +553,8 @@ def run(once: bool = False) -> None:
         )
     )
 
+    bot_state_view = BotStateView(bot_state_path(root / "reports"))
+
     while True:
         cfg = _load_thresholds(thresholds_path)
         today = _today()
@@ -672,6 +702,7 @@ def run(once: bool = False) -> None:
             data_root=data_root,
             event_path=event_path,
             pair_snapshot_path=pair_snapshot_path,
+            bot_states=bot_state_view.bots(),
         )
 
         day_dir = reports_root / today
@@ -561,6 +561,9 @@ class PaperDesk:
         data = self._state_store.load()
         if data is None:
             return
+        self._apply_snapshot(data)
+
+    def _apply_snapshot(self, data: dict[str, Any]) -> None:
         try:
             if "portfolio" in data:
                 self._portfolio.restore_from_snapshot(data["portfolio"])
@@ -643,6 +646,38 @@ class PaperDesk:
         """Backward-compatible alias for legacy EPP integrations."""
         return cls.from_controller_config(cfg)
 
+    # -- Handoff ------------------------------------------------------------
+
+    def export_handoff(self) -> dict[str, Any]:
+        """State needed to continue this desk in another process.
+
+        On top of :meth:`snapshot` (which is also force-persisted here) this
+        carries the instrument specs, every engine's open / in-flight /
+        parked orders and the balances those orders reserve, none of which
+        the state store keeps.
+        """
+        snap = self.snapshot()
+        self._state_store.save(snap, time.time(), force=True)
+        return {
+            "snapshot": snap,
+            "reserved": self._portfolio.reserved_balances(),
+            "specs": list(self._specs.values()),
+            "engines": {key: engine.export_order_state() for key, engine in self._engines.items()},
+        }
+
+    def import_handoff(self, handoff: dict[str, Any], data_feed: Any) -> None:
+        """Resume from :meth:`export_handoff`, registering missing instruments on *data_feed*."""
+        self._apply_snapshot(handoff.get("snapshot") or {})
+        for spec in handoff.get("specs", []):
+            if spec.instrument_id.key not in self._engines:
+                self.register_instrument(spec, data_feed)
+        for key, state in (handoff.get("engines") or {}).items():
+            engine = self._engines.get(key)
+            if engine is not None:
+                engine.import_order_state(state)
+        for asset, amount in (handoff.get("reserved") or {}).items():
+            self._portfolio.reserve(asset, Decimal(str(amount)))
+
     def close(self) -> None:
         """Flush pending I/O and release resources. Call on clean shutdown."""
         self._state_store.close()
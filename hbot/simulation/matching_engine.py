@@ -14,6 +14,7 @@ import os
 import uuid as _uuid_mod
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any
 
 from simulation.fee_models import FeeModel
 from simulation.fill_models import FillModel
@@ -194,6 +195,28 @@ class OrderMatchingEngine:
     def get_order(self, order_id: str) -> PaperOrder | None:
         return self._orders.get(order_id)
 
+    def export_order_state(self) -> dict[str, Any]:
+        """Live order state (resting, in-flight, parked) for moving this engine to another process."""
+        return {
+            "orders": list(self._orders.values()),
+            "inflight": list(self._inflight),
+            "order_sides": dict(self._order_sides),
+            "pending_cancel_ids": sorted(self._pending_cancel_ids),
+            "parked_contingent": dict(self._parked_contingent),
+            "contingent_children": {k: list(v) for k, v in self._contingent_children.items()},
+            "last_fill_ns": dict(self._last_fill_ns),
+        }
+
+    def import_order_state(self, state: dict[str, Any]) -> None:
+        """Adopt state produced by :meth:`export_order_state`; replaces any local orders."""
+        self._orders = {order.order_id: order for order in state.get("orders", [])}
+        self._inflight = [tuple(item) for item in state.get("inflight", [])]
+        self._order_sides = dict(state.get("order_sides", {}))
+        self._pending_cancel_ids = set(state.get("pending_cancel_ids", []))
+        self._parked_contingent = dict(state.get("parked_contingent", {}))
+        self._contingent_children = {k: list(v) for k, v in state.get("contingent_children", {}).items()}
+        self._last_fill_ns = dict(state.get("last_fill_ns", {}))
+
     def get_order_side(self, order_id: str) -> str | None:
         """Return the side ('buy'/'sell') of an order, even after it was filled and removed."""
         return self._order_sides.get(order_id)
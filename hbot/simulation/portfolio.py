@@ -32,6 +32,7 @@ from simulation.accounting import (
 from simulation.accounting import (
     unrealized_pnl as _unrealized_pnl,
 )
+from simulation.exceptions import PortfolioError
 from simulation.risk_engine import (
     LiquidationAction,
     MarginLevel,
@@ -87,6 +88,8 @@ class PortfolioConfig:
     margin_ratio_warn_pct: Decimal = Decimal("0.20")
     margin_ratio_critical_pct: Decimal = Decimal("0.10")
     margin_model_type: str = "leveraged"  # "leveraged"|"standard"
+    # Debug: cross-check incremental equity/margin aggregates against a full recompute.
+    reconcile_aggregates: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -142,6 +145,9 @@ class MultiAssetLedger:
     def to_dict(self) -> dict[str, str]:
         return {k: str(v) for k, v in self._balances.items()}
 
+    def reserved_to_dict(self) -> dict[str, str]:
+        return {k: str(v) for k, v in self._reserved.items() if v > _ZERO}
+
     @classmethod
     def from_dict(cls, d: dict[str, str]) -> MultiAssetLedger:
         return cls({k: Decimal(v) for k, v in d.items()})
@@ -263,6 +269,16 @@ class PaperPortfolio:
         self._spec_by_key: dict[str, InstrumentSpec] = {}
         self._leverage_by_key: dict[str, int] = {}
         self._position_margin_reserved: dict[str, Decimal] = {}  # key -> reserved quote
+        self._margin_reserved_total: Decimal = _ZERO
+        # Incremental position aggregates.  Settlement, funding and restore
+        # queue the touched keys; equity_quote() folds them in lazily and
+        # mark_to_market() only revisits keys whose mark or position changed.
+        self._dirty: set[str] = set()
+        self._mtm_pending: set[str] = set()
+        self._open_keys: set[str] = set()  # quantity != 0
+        self._unrealized_by_key: dict[str, Decimal] = {}  # non-spot open positions
+        self._unrealized_total: Decimal = _ZERO
+        self._last_mark: dict[str, Decimal] = {}
         self._peak_equity: Decimal = _ZERO
         self._daily_open_equity: Decimal | None = None
         self._daily_open_day_key: str | None = None
@@ -389,6 +405,10 @@ class PaperPortfolio:
     def release(self, asset: str, amount: Decimal) -> None:
         self._ledger.release(asset, amount)
 
+    def reserved_balances(self) -> dict[str, str]:
+        """Amounts currently reserved by open orders (not part of :meth:`snapshot`)."""
+        return self._ledger.reserved_to_dict()
+
     def balance(self, asset: str) -> Decimal:
         return self._ledger.total(asset)
 
@@ -405,7 +425,32 @@ class PaperPortfolio:
         For perp positions, includes unrealized PnL (from mark_prices when
         available, otherwise from stored pos.unrealized_pnl so that
         settle_fill/apply_funding peak-equity tracking sees full equity).
+
+        Without ``mark_prices`` this is O(1) over the running aggregates;
+        with them only open positions that have a mark are repriced.
         """
+        self._sync_aggregates()
+        equity = self._ledger.total(quote_asset) + self._unrealized_total
+        if mark_prices:
+            open_keys = self._open_keys
+            keys = open_keys if len(open_keys) <= len(mark_prices) else open_keys.intersection(mark_prices)
+            for key in keys:
+                price = mark_prices.get(key)
+                if not price or price <= _ZERO:
+                    continue
+                pos = self._positions[key]
+                if pos.instrument_id.instrument_type == "spot":
+                    equity += pos.abs_quantity * price
+                else:
+                    equity += _unrealized_pnl(pos.quantity, pos.avg_entry_price, price) - self._unrealized_by_key[key]
+        if self._config.reconcile_aggregates:
+            expected = self._equity_quote_full(mark_prices, quote_asset)
+            if abs(equity - expected) > _EPS:
+                raise PortfolioError(f"incremental equity {equity} != recomputed {expected}")
+        return equity
+
+    def _equity_quote_full(self, mark_prices: dict[str, Decimal] | None, quote_asset: str) -> Decimal:
+        """Reference full recompute of :meth:`equity_quote` (reconciliation only)."""
         equity = self._ledger.total(quote_asset)
         for pos in self._positions.values():
             if pos.quantity == _ZERO:
@@ -421,6 +466,28 @@ class PaperPortfolio:
                     equity += pos.unrealized_pnl
         return equity
 
+    def _touch(self, key: str) -> None:
+        self._dirty.add(key)
+        self._mtm_pending.add(key)
+
+    def _sync_aggregates(self) -> None:
+        """Fold queued position changes into the open-key set and unrealized total."""
+        if not self._dirty:
+            return
+        for key in self._dirty:
+            old = self._unrealized_by_key.pop(key, None)
+            if old is not None:
+                self._unrealized_total -= old
+            pos = self._positions.get(key)
+            if pos is None or pos.quantity == _ZERO:
+                self._open_keys.discard(key)
+                continue
+            self._open_keys.add(key)
+            if pos.instrument_id.instrument_type != "spot":
+                self._unrealized_by_key[key] = pos.unrealized_pnl
+                self._unrealized_total += pos.unrealized_pnl
+        self._dirty.clear()
+
     # -- Positions ---------------------------------------------------------
 
     def get_position(
@@ -493,9 +560,25 @@ class PaperPortfolio:
         return out
 
     def mark_to_market(self, prices: dict[str, Decimal], now_ns: int | None = None) -> None:
-        """Update unrealized PnL on all positions, and refresh maintenance margin reserves."""
-        for key, pos in self._positions.items():
+        """Update unrealized PnL and maintenance margin reserves.
+
+        Only positions whose mark moved since the previous call, or that were
+        settled/funded/restored since, are revisited; the rest are unchanged.
+        """
+        keys = self._mtm_pending
+        self._mtm_pending = set()
+        positions = self._positions
+        last_mark = self._last_mark
+        for key, price in prices.items():
+            if key in positions and price is not None and price > _ZERO and last_mark.get(key) != price:
+                keys.add(key)
+        for key in keys:
+            pos = positions.get(key)
+            if pos is None:
+                continue
             price = prices.get(key)
+            if price is not None and price > _ZERO:
+                last_mark[key] = price
             pos.ensure_leg_consistency()
             PaperPortfolio._collapse_oneway_legs(pos)
             if pos.quantity == _ZERO and pos.gross_quantity <= _ZERO:
@@ -504,24 +587,32 @@ class PaperPortfolio:
                 pos.short_unrealized_pnl = _ZERO
                 continue
             if price is None or price <= _ZERO:
+                self._mtm_pending.add(key)  # revisit once this instrument has a mark
                 continue
             pos.long_unrealized_pnl = _unrealized_pnl(pos.long_quantity, pos.long_avg_entry_price, price)
             pos.short_unrealized_pnl = _unrealized_pnl(-pos.short_quantity, pos.short_avg_entry_price, price)
             pos.sync_derived_fields()
-        self._refresh_position_margin_reserves(prices)
+        self._dirty.update(keys)
+        self._refresh_position_margin_reserves(prices, keys)
         eq = self.equity_quote(prices)
         if eq > self._peak_equity:
             self._peak_equity = eq
         self._refresh_daily_open_baseline(eq, now_ns=now_ns)
 
-    def _refresh_position_margin_reserves(self, prices: dict[str, Decimal]) -> None:
+    def _refresh_position_margin_reserves(
+        self, prices: dict[str, Decimal], keys: set[str] | None = None
+    ) -> None:
         """Reserve/release maintenance margin for perp positions (Nautilus-style).
 
         Order reserves are handled by the matching engine. This reserve bucket
         models locked *position* margin so available quote balance is realistic
-        while positions are open.
+        while positions are open.  ``keys`` limits the refresh to those
+        positions (default: all).
         """
-        for key, pos in self._positions.items():
+        for key in self._positions if keys is None else keys:
+            pos = self._positions.get(key)
+            if pos is None:
+                continue
             pos.ensure_leg_consistency()
             if not pos.instrument_id.is_perp or pos.gross_quantity == _ZERO:
                 self._set_position_margin_reserved(key, _ZERO, pos.instrument_id.quote_asset)
@@ -547,6 +638,7 @@ class PaperPortfolio:
             self._ledger.reserve(quote_asset, target - current)
         else:
             self._ledger.release(quote_asset, current - target)
+        self._margin_reserved_total += target - current
         if target <= _ZERO:
             self._position_margin_reserved.pop(key, None)
         else:
@@ -554,7 +646,11 @@ class PaperPortfolio:
 
     def maintenance_margin_quote(self) -> Decimal:
         """Total maintenance margin reserved across all perps (quote currency)."""
-        return sum(self._position_margin_reserved.values(), _ZERO)
+        if self._config.reconcile_aggregates:
+            expected = sum(self._position_margin_reserved.values(), _ZERO)
+            if abs(self._margin_reserved_total - expected) > _EPS:
+                raise PortfolioError(f"incremental margin {self._margin_reserved_total} != recomputed {expected}")
+        return self._margin_reserved_total
 
     def margin_ratio(self, prices: dict[str, Decimal] | None = None) -> Decimal:
         """Equity / maintenance_margin (higher is safer)."""
@@ -598,6 +694,7 @@ class PaperPortfolio:
                     pos.long_funding_paid = _ZERO
                     pos.short_funding_paid = _ZERO
             pos.sync_derived_fields()
+            self._touch(instrument_id.key)
         if charge >= _ZERO:
             self._ledger.debit(instrument_id.quote_asset, charge)
         else:
@@ -797,17 +894,18 @@ class PaperPortfolio:
             spec, leverage, realized_pnl, is_closing,
         )
 
+        self._positions[instrument_id.key] = pos
+        self._touch(instrument_id.key)
+
         # Update peak equity tracking
         eq = self.equity_quote()
         if eq > self._peak_equity:
             self._peak_equity = eq
         self._refresh_daily_open_baseline(eq, now_ns=now_ns)
 
-        self._positions[instrument_id.key] = pos
-
         # Refresh maintenance margin reserve using fill price as a best-effort mark.
         try:
-            self._refresh_position_margin_reserves({instrument_id.key: price})
+            self._refresh_position_margin_reserves({instrument_id.key: price}, {instrument_id.key})
         except Exception as exc:
             logger.warning("margin_reserve_refresh failed after fill: %s", exc, exc_info=True)
 
@@ -860,8 +958,10 @@ class PaperPortfolio:
 
     def net_exposure_quote(self, prices: dict[str, Decimal]) -> Decimal:
         """Net signed exposure across all instruments in quote."""
+        self._sync_aggregates()
         exposure = _ZERO
-        for key, pos in self._positions.items():
+        for key in self._open_keys:
+            pos = self._positions[key]
             price = prices.get(key, pos.avg_entry_price)
             exposure += pos.quantity * price
         return exposure
@@ -892,9 +992,8 @@ class PaperPortfolio:
         mm = self.maintenance_margin_quote()
         # Build position snapshot for the risk engine.
         positions = {
-            key: (pos.quantity, pos.instrument_id)
-            for key, pos in self._positions.items()
-            if pos.quantity != _ZERO
+            key: (self._positions[key].quantity, self._positions[key].instrument_id)
+            for key in self._open_keys
         }
         level, actions = self._risk_engine.evaluate(eq, mm, positions)
         self._last_margin_level = level
@@ -935,6 +1034,7 @@ class PaperPortfolio:
                     venue, pair, itype = key.split(":", 2)
                     iid = InstrumentId(venue=venue, trading_pair=pair, instrument_type=itype)
                     self._positions[key] = PaperPosition.from_dict(pd, iid)
+                    self._touch(key)
                 except Exception as exc:
                     logger.warning("Could not restore position %s: %s", key, exc, exc_info=True)
         if "leverage_by_key" in data and isinstance(data["leverage_by_key"], dict):
@@ -945,6 +1045,7 @@ class PaperPortfolio:
         if "position_margin_reserved" in data and isinstance(data["position_margin_reserved"], dict):
             try:
                 self._position_margin_reserved = {k: Decimal(str(v)) for k, v in data["position_margin_reserved"].items()}
+                self._margin_reserved_total = sum(self._position_margin_reserved.values(), _ZERO)
                 # Apply reserves into ledger so available() reflects lock after restart.
                 for key, amt in self._position_margin_reserved.items():
                     if amt > _ZERO:
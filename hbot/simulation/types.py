@@ -551,13 +551,13 @@ class PaperPosition:
 # Order book
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookLevel:
     price: Decimal
     size: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderBookSnapshot:
     instrument_id: InstrumentId
     bids: tuple[BookLevel, ...]   # best (highest) first
@@ -0,0 +1,159 @@
+"""Parity tests: FastICTState (float) against ICTState (Decimal)."""
+from __future__ import annotations
+
+import csv
+import math
+from dataclasses import fields
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from controllers.common.ict import FastICTState, ICTConfig, ICTState
+from controllers.common.ict.fast import _FloatSwing
+from controllers.common.ict.swing import SwingDetector
+from tests.controllers.ict.conftest import make_downtrend, make_range, make_uptrend, swing_series
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+_EVENT_LISTS = (
+    "swings",
+    "all_fvgs",
+    "active_fvgs",
+    "structure_events",
+    "all_obs",
+    "active_obs",
+    "all_liquidity",
+    "active_liquidity",
+    "displacement_events",
+    "all_vis",
+    "active_vis",
+    "all_breakers",
+)
+
+
+def _btc_fixture() -> list[tuple[Decimal, Decimal, Decimal, Decimal, Decimal]]:
+    with open(FIXTURES / "btc_2000_1m.csv") as f:
+        return [
+            (Decimal(r["open"]), Decimal(r["high"]), Decimal(r["low"]), Decimal(r["close"]), Decimal(r["volume"]))
+            for r in csv.DictReader(f)
+        ]
+
+
+def _volatile_series(n: int) -> list[tuple[Decimal, Decimal, Decimal, Decimal, Decimal]]:
+    rng = np.random.default_rng(11)
+    close = 100.0 + np.cumsum(rng.normal(0, 0.8, n))
+    candles = []
+    for i in range(n):
+        o = Decimal(f"{close[i - 1] if i else close[0]:.2f}")
+        c = Decimal(f"{close[i]:.2f}")
+        h = max(o, c) + Decimal(f"{abs(rng.normal(0, 0.4)):.2f}")
+        lo = min(o, c) - Decimal(f"{abs(rng.normal(0, 0.4)):.2f}")
+        candles.append((o, h, lo, c, Decimal("100")))
+    return candles
+
+
+def _run_both(candles, cfg: ICTConfig) -> tuple[ICTState, FastICTState]:
+    ref, fast = ICTState(cfg), FastICTState(cfg)
+    for o, h, lo, c, v in candles:
+        ref.add_bar(o, h, lo, c, v)
+        fast.add_bar(float(o), float(h), float(lo), float(c), float(v))
+    return ref, fast
+
+
+def _assert_event_equal(ref_event, fast_event) -> None:
+    assert type(ref_event) is type(fast_event)
+    for f in fields(ref_event):
+        a, b = getattr(ref_event, f.name), getattr(fast_event, f.name)
+        if isinstance(a, Decimal):
+            assert math.isclose(float(a), b, rel_tol=1e-9, abs_tol=1e-9), (f.name, a, b)
+        else:
+            assert a == b, (f.name, ref_event, fast_event)
+
+
+def _assert_parity(ref: ICTState, fast: FastICTState) -> None:
+    assert fast.bar_count == ref.bar_count
+    assert fast.trend == ref.trend
+    for name in _EVENT_LISTS:
+        ref_events, fast_events = getattr(ref, name), getattr(fast, name)
+        assert len(fast_events) == len(ref_events), name
+        for a, b in zip(ref_events, fast_events, strict=True):
+            _assert_event_equal(a, b)
+    assert math.isclose(float(ref.equilibrium), fast.equilibrium, rel_tol=1e-12)
+    assert math.isclose(float(ref.ote_top), fast.ote_top, rel_tol=1e-12)
+    assert math.isclose(float(ref.ote_bottom), fast.ote_bottom, rel_tol=1e-12)
+    assert ref.fib_levels.keys() == fast.fib_levels.keys()
+
+
+_SERIES = {
+    "btc_fixture": _btc_fixture,
+    "volatile": lambda: _volatile_series(3_000),
+    "swings": lambda: swing_series() * 5,
+    "trend_flip": lambda: make_uptrend(60) + make_downtrend(60, start="160") + make_range(60),
+}
+
+
+class TestFastParity:
+    @pytest.mark.parametrize("series", sorted(_SERIES))
+    @pytest.mark.parametrize("swing_length", [2, 10, 20])
+    def test_matches_decimal_pipeline(self, series, swing_length):
+        cfg = ICTConfig(swing_length=swing_length)
+        ref, fast = _run_both(_SERIES[series](), cfg)
+        _assert_parity(ref, fast)
+
+    @pytest.mark.parametrize("swing_length", [1, 2, 3, 5])
+    def test_swing_tie_break_matches_on_tick_prices(self, swing_length):
+        # Outside bars on a 0.1 grid: pivot margins tie exactly in Decimal
+        # but not after float subtraction.
+        for seed in range(40):
+            rng = np.random.default_rng(seed)
+            ref, fast = SwingDetector(swing_length), _FloatSwing(swing_length)
+            ref_events, fast_events = [], []
+            mid = 1000
+            for _ in range(300):
+                mid += int(rng.integers(-3, 4))
+                half = int(rng.integers(1, 4))
+                high = Decimal(mid + half) / 10
+                low = Decimal(mid - half) / 10
+                ref_events.append(ref.add_bar(high, high, low, low))
+                fast_events.append(fast.add_bar(float(high), float(low)))
+            assert [(e.index, e.direction, float(e.level)) if e else None for e in ref_events] == [
+                (e.index, e.direction, e.level) if e else None for e in fast_events
+            ], seed
+
+    def test_zone_for_price_matches(self):
+        candles = _btc_fixture()
+        ref, fast = _run_both(candles, ICTConfig())
+        for o, _, _, c, _ in candles[-200:]:
+            assert fast.zone_for_price(c) == ref.zone_for_price(c)
+            assert fast.in_ote_zone(o) == ref.in_ote_zone(o)
+
+
+class TestFastBatch:
+    def test_add_bars_array_matches_loop(self):
+        candles = _btc_fixture()
+        arr = np.array([[float(x) for x in row] for row in candles])
+        looped, batched = FastICTState(), FastICTState()
+        for row in arr.tolist():
+            looped.add_bar(*row)
+        batched.add_bars(arr)
+        for name in _EVENT_LISTS:
+            assert getattr(batched, name) == getattr(looped, name), name
+
+    def test_add_bars_accepts_ohlc_rows(self):
+        candles = [(float(o), float(h), float(lo), float(c)) for o, h, lo, c, _ in swing_series()]
+        state = FastICTState(ICTConfig(swing_length=2))
+        state.add_bars(candles)
+        assert state.bar_count == len(candles)
+        assert state.swings
+
+    def test_reset_replays_identically(self):
+        arr = np.array([[float(x) for x in row] for row in _volatile_series(500)])
+        state = FastICTState()
+        state.add_bars(arr)
+        first = state.all_obs, state.swings, state.all_liquidity
+        state.reset()
+        assert state.bar_count == 0
+        state.add_bars(arr)
+        assert (state.all_obs, state.swings, state.all_liquidity) == first
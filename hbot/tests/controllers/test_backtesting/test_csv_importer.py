@@ -5,10 +5,14 @@ from decimal import Decimal
 from pathlib import Path
 
 from controllers.backtesting.csv_importer import (
+    BINANCE_AGGTRADE_COLUMNS,
     CsvImportResult,
     import_csv,
     import_csv_safe,
+    stream_csv_to_parquet,
+    stream_import_and_register,
 )
+from controllers.backtesting.data_store import load_candles, load_trades
 
 
 def _write_csv(tmp_path: Path, name: str, content: str) -> Path:
@@ -100,3 +104,81 @@ timestamp,open,high,low,close,volume
     def test_csv_import_result_not_ok_when_empty(self):
         result = CsvImportResult()
         assert not result.ok
+
+
+class TestStreamCsvToParquet:
+    def test_candles_match_row_import(self, tmp_path):
+        lines = ["timestamp,open,high,low,close,volume"]
+        for i in range(250):
+            ts = 1700000000000 + i * 60_000
+            lines.append(f"{ts},{50000 + i},{50050 + i},{49950 + i},{50020 + i},{100 + i}")
+        lines.append(lines[-1])  # duplicate bar is dropped
+        path = _write_csv(tmp_path, "big.csv", "\n".join(lines))
+        out = tmp_path / "candles.parquet"
+
+        result = stream_csv_to_parquet(path, out, block_size=1024, row_group_size=64)
+
+        assert result.ok
+        assert result.rows_written == 250
+        assert result.rows_dropped == 1
+        assert result.start_ms == 1700000000000
+        assert load_candles(out) == import_csv(path, "bitget", "BTC-USDT", "1m")
+
+        import pyarrow.parquet as pq
+        assert pq.ParquetFile(out).metadata.num_row_groups == 4
+
+    def test_iso_timestamps_and_bad_rows(self, tmp_path):
+        csv_content = """\
+date,open,high,low,close
+2024-01-01 00:00:00,100,101,99,100.5
+2024-01-01 00:01:00,,101,99,100.5
+2024-01-01 00:02:00,100,101,99,100.5
+"""
+        path = _write_csv(tmp_path, "iso.csv", csv_content)
+        result = stream_csv_to_parquet(path, tmp_path / "iso.parquet")
+        assert result.ok
+        assert result.rows_written == 2
+        assert result.rows_dropped == 1
+        candles = load_candles(tmp_path / "iso.parquet")
+        assert candles[0].timestamp_ms == 1704067200000
+        assert candles[0].volume == Decimal("0")
+
+    def test_headerless_binance_aggtrades(self, tmp_path):
+        csv_content = """\
+1,42000.5,0.010,10,11,1704067200000123,true,true
+2,42001.0,0.020,12,12,1704067200500000,false,true
+3,42000.0,0.005,13,14,1704067201000000,true,true
+"""
+        path = _write_csv(tmp_path, "BTCUSDT-aggTrades.csv", csv_content)
+        out = tmp_path / "trades.parquet"
+        result = stream_csv_to_parquet(path, out, kind="trades", column_names=BINANCE_AGGTRADE_COLUMNS)
+
+        assert result.ok
+        trades = load_trades(out)
+        assert [t.timestamp_ms for t in trades] == [1704067200000, 1704067200500, 1704067201000]
+        assert [t.side for t in trades] == ["sell", "buy", "sell"]
+        assert trades[1].trade_id == "2"
+        assert trades[1].size == Decimal("0.02")
+
+    def test_missing_trade_columns_returns_errors(self, tmp_path):
+        path = _write_csv(tmp_path, "bad.csv", "timestamp,side\n1700000000000,buy")
+        result = stream_csv_to_parquet(path, tmp_path / "bad.parquet", kind="trades")
+        assert not result.ok
+        assert any("price" in e for e in result.errors)
+        assert not (tmp_path / "bad.parquet").exists()
+
+    def test_register_in_catalog(self, tmp_path):
+        from controllers.backtesting.data_catalog import DataCatalog
+
+        csv_content = """\
+timestamp,open,high,low,close,volume
+1700000000000,50000,50050,49950,50020,100
+1700000060000,50020,50080,49980,50050,120
+"""
+        path = _write_csv(tmp_path, "reg.csv", csv_content)
+        result = stream_import_and_register(path, "binance", "BTC/USDT", "1m", catalog_dir=str(tmp_path))
+        assert result.ok
+        entry = DataCatalog(base_dir=tmp_path).find("binance", "BTC-USDT", "1m")
+        assert entry is not None
+        assert entry["row_count"] == 2
+        assert entry["end_ms"] == 1700000060000
@@ -14,6 +14,7 @@ from controllers.backtesting.data_store import (
     load_candles,
     load_long_short_ratio,
     resolve_data_path,
+    resolve_dataset_dir,
 )
 
 BASE_MS = 1_700_000_000_000
@@ -159,3 +160,27 @@ class TestRegisterMethods:
         entry = catalog.find("bitget", "BTC-USDT", "index_5m")
         assert entry is not None
         assert entry["row_count"] == 2
+
+    def test_register_candles_partitioned(self, downloader, mock_exchange, tmp_path):
+        from controllers.backtesting.data_catalog import DataCatalog
+
+        mock_exchange.fetch_ohlcv.side_effect = [_make_ohlcv_batch(BASE_MS, count=4), []]
+        downloader.download_and_register_candles(
+            "BTC/USDT:USDT", "1m", BASE_MS, BASE_MS + 240_000,
+            base_dir=tmp_path, pair="BTC-USDT", partitioned=True,
+        )
+        mock_exchange.fetch_ohlcv.side_effect = [_make_ohlcv_batch(BASE_MS + 180_000, count=3), []]
+        rows = downloader.download_and_register_candles(
+            "BTC/USDT:USDT", "1m", BASE_MS, BASE_MS + 420_000,
+            base_dir=tmp_path, pair="BTC-USDT", partitioned=True,
+        )
+        assert len(rows) == 3
+
+        ds = resolve_dataset_dir("bitget", "BTC-USDT", "1m", tmp_path)
+        assert not resolve_data_path("bitget", "BTC-USDT", "1m", tmp_path).exists()
+        assert len(load_candles(ds)) == 6
+        catalog = DataCatalog(base_dir=tmp_path)
+        entry = catalog.find("bitget", "BTC-USDT", "1m")
+        assert entry is not None
+        assert entry["row_count"] == 6
+        assert catalog.verify_entry(entry) == []
@@ -1,6 +1,7 @@
 """Tests for data store — Parquet round-trip, validation, path resolution."""
 from __future__ import annotations
 
+import dataclasses
 from decimal import Decimal
 
 import pytest
@@ -9,6 +10,11 @@ pandas = pytest.importorskip("pandas", reason="pandas required for data store te
 pytest.importorskip("pyarrow", reason="pyarrow required for data store tests")
 
 from controllers.backtesting.data_store import (
+    CandleArrays,
+    append_candles_partitioned,
+    append_trades_partitioned,
+    is_partitioned_dataset,
+    load_candle_arrays,
     load_candles,
     load_candles_df,
     load_candles_window,
@@ -17,7 +23,13 @@ from controllers.backtesting.data_store import (
     load_long_short_ratio,
     load_trades,
     load_trades_window,
+    partition_existing_file,
+    partition_summary,
+    partitions_for_window,
+    read_manifest,
     resolve_data_path,
+    resolve_dataset_dir,
+    save_candle_arrays,
     save_candles,
     save_funding_rates,
     save_long_short_ratio,
@@ -447,6 +459,70 @@ class TestFilteredCandleLoader:
             assert a.open == b.open
 
 
+class TestCandleArrays:
+    def test_lazy_rows_match_list_load(self, large_candles, tmp_path):
+        path = tmp_path / "candles.parquet"
+        save_candles(large_candles, path)
+
+        arrays = load_candle_arrays(path)
+        assert isinstance(arrays, CandleArrays)
+        assert len(arrays) == len(large_candles)
+        assert arrays[0] == large_candles[0]
+        assert arrays[-1] == large_candles[-1]
+        assert list(arrays) == load_candles(path)
+
+    def test_window_and_slice(self, large_candles, tmp_path):
+        path = tmp_path / "candles.parquet"
+        save_candles(large_candles, path)
+
+        start_ms = large_candles[50].timestamp_ms
+        end_ms = large_candles[99].timestamp_ms
+        arrays = load_candle_arrays(path, start_ms=start_ms, end_ms=end_ms, memory_map=False)
+        assert arrays.to_rows() == load_candles_window(path, start_ms=start_ms, end_ms=end_ms)
+
+        head = arrays[:10]
+        assert isinstance(head, CandleArrays)
+        assert len(head) == 10
+        assert head[9] == arrays[9]
+        with pytest.raises(IndexError):
+            arrays[len(arrays)]
+
+    def test_save_arrays_round_trip(self, large_candles, tmp_path):
+        arrays = CandleArrays.from_rows(large_candles)
+        path = tmp_path / "arrays.parquet"
+        save_candle_arrays(arrays, path)
+
+        loaded = load_candle_arrays(path)
+        assert loaded.timestamp_ms.dtype == "int64"
+        assert (loaded.close == arrays.close).all()
+        assert loaded.to_frame().columns.tolist() == [
+            "timestamp_ms", "open", "high", "low", "close", "volume",
+        ]
+
+    def test_unsorted_file_loads_chronologically(self, large_candles, tmp_path):
+        path = tmp_path / "candles.parquet"
+        save_candles(list(reversed(large_candles)), path)
+        arrays = load_candle_arrays(path)
+        assert arrays.timestamp_ms.tolist() == sorted(c.timestamp_ms for c in large_candles)
+
+    def test_validate_matches_row_path(self):
+        rows = [
+            CandleRow(timestamp_ms=0, open=Decimal("100"), high=Decimal("101"),
+                      low=Decimal("99"), close=Decimal("100"), volume=Decimal("10")),
+            CandleRow(timestamp_ms=0, open=Decimal("100"), high=Decimal("101"),
+                      low=Decimal("99"), close=Decimal("100"), volume=Decimal("10")),
+            CandleRow(timestamp_ms=600_000, open=Decimal("105"), high=Decimal("103"),
+                      low=Decimal("99"), close=Decimal("101"), volume=Decimal("0")),
+            CandleRow(timestamp_ms=660_000, open=Decimal("100"), high=Decimal("130"),
+                      low=Decimal("100"), close=Decimal("125"), volume=Decimal("10")),
+            CandleRow(timestamp_ms=720_000, open=Decimal("100"), high=Decimal("101"),
+                      low=Decimal("99"), close=Decimal("101"), volume=Decimal("10")),
+        ]
+        expected = validate_candles(rows)
+        assert len(expected) >= 5
+        assert validate_candles(CandleArrays.from_rows(rows)) == expected
+
+
 class TestFilteredTradeLoader:
     def test_window_filters_correctly(self, trades, tmp_path):
         path = tmp_path / "trades.parquet"
@@ -489,6 +565,122 @@ class TestFilteredFundingLoader:
         assert ts_list == sorted(ts_list)
 
 
+# ---------------------------------------------------------------------------
+# Time-partitioned datasets
+# ---------------------------------------------------------------------------
+
+_DAY_MS = 86_400_000
+
+
+@pytest.fixture
+def multi_month_candles() -> list[CandleRow]:
+    """Hourly candles spanning three calendar months (Nov 2023 - Jan 2024)."""
+    base_ms = 1_698_796_800_000  # 2023-11-01T00:00:00Z
+    return [
+        CandleRow(
+            timestamp_ms=base_ms + i * 3_600_000,
+            open=Decimal("100") + Decimal(i) / 10,
+            high=Decimal("101") + Decimal(i) / 10,
+            low=Decimal("99") + Decimal(i) / 10,
+            close=Decimal("100.5") + Decimal(i) / 10,
+            volume=Decimal("5"),
+        )
+        for i in range(24 * 80)
+    ]
+
+
+class TestPartitionedDataset:
+    def test_append_writes_monthly_partitions(self, multi_month_candles, tmp_path):
+        ds = tmp_path / "parts"
+        touched = append_candles_partitioned(multi_month_candles, ds)
+
+        assert touched == ["2023-11", "2023-12", "2024-01"]
+        assert is_partitioned_dataset(ds)
+        manifest = read_manifest(ds)
+        assert manifest["kind"] == "candles"
+        assert sum(p["row_count"] for p in manifest["partitions"]) == len(multi_month_candles)
+        summary = partition_summary(ds)
+        assert summary["start_ms"] == multi_month_candles[0].timestamp_ms
+        assert summary["end_ms"] == multi_month_candles[-1].timestamp_ms
+
+    def test_window_prunes_and_matches_single_file(self, multi_month_candles, tmp_path):
+        ds = tmp_path / "parts"
+        single = tmp_path / "data.parquet"
+        append_candles_partitioned(multi_month_candles, ds)
+        save_candles(multi_month_candles, single)
+
+        start_ms = multi_month_candles[24 * 35].timestamp_ms  # early December
+        end_ms = start_ms + 3 * _DAY_MS
+        assert [p.name for p in partitions_for_window(ds, start_ms, end_ms)] == ["2023-12.parquet"]
+
+        from_parts = load_candles_window(ds, start_ms=start_ms, end_ms=end_ms)
+        from_file = load_candles_window(single, start_ms=start_ms, end_ms=end_ms)
+        assert from_parts == from_file
+        assert load_candle_arrays(ds).to_rows() == load_candles(single)
+
+    def test_incremental_append_rewrites_only_touched_partition(self, multi_month_candles, tmp_path):
+        ds = tmp_path / "parts"
+        append_candles_partitioned(multi_month_candles[:-24], ds)
+        nov = ds / "2023-11.parquet"
+        nov_mtime = nov.stat().st_mtime_ns
+
+        # Overlapping tail: last day re-sent with a revised close plus one new day.
+        revised = [dataclasses.replace(c, close=Decimal("101")) for c in multi_month_candles[-48:]]
+        touched = append_candles_partitioned(revised, ds)
+
+        assert touched == ["2024-01"]
+        assert nov.stat().st_mtime_ns == nov_mtime
+        loaded = load_candles(ds)
+        assert len(loaded) == len(multi_month_candles)
+        assert [c.timestamp_ms for c in loaded] == [c.timestamp_ms for c in multi_month_candles]
+        assert all(c.close == Decimal("101") for c in loaded[-48:])
+
+    def test_trades_daily_partitions_dedupe(self, trades, tmp_path):
+        ds = tmp_path / "trades"
+        append_trades_partitioned(trades, ds)
+        append_trades_partitioned(trades[5:], ds)
+
+        assert len(read_manifest(ds)["partitions"]) == 1
+        loaded = load_trades_window(ds)
+        assert [t.trade_id for t in loaded] == [t.trade_id for t in trades]
+        assert loaded[3].price == trades[3].price
+
+    def test_migrate_existing_file(self, multi_month_candles, tmp_path):
+        single = tmp_path / "data.parquet"
+        save_candles(multi_month_candles, single)
+        ds = resolve_dataset_dir("bitget", "BTC/USDT", "1h", tmp_path)
+
+        partition_existing_file(single, ds, kind="candles")
+
+        assert ds == tmp_path / "bitget" / "BTC-USDT" / "1h" / "parts"
+        assert load_candles(ds) == load_candles(single)
+        # The manifest is invisible to plain pandas directory reads.
+        assert len(pandas.read_parquet(ds)) == len(multi_month_candles)
+
+    def test_granularity_mismatch_raises(self, multi_month_candles, tmp_path):
+        ds = tmp_path / "parts"
+        append_candles_partitioned(multi_month_candles[:10], ds)
+        with pytest.raises(ValueError, match="cannot append"):
+            append_candles_partitioned(multi_month_candles[10:20], ds, granularity="day")
+
+    def test_catalog_verifies_partitioned_entry(self, multi_month_candles, tmp_path):
+        from controllers.backtesting.data_catalog import DataCatalog
+
+        ds = resolve_dataset_dir("bitget", "BTC-USDT", "1h", tmp_path)
+        append_candles_partitioned(multi_month_candles, ds)
+        summary = partition_summary(ds)
+        catalog = DataCatalog(tmp_path)
+        catalog.register("bitget", "BTC-USDT", "1h", file_path=str(ds), **summary)
+
+        entry = catalog.find("bitget", "BTC-USDT", "1h")
+        assert entry is not None and entry["sha256"]
+        assert catalog.verify_entry(entry) == []
+        assert catalog.reconcile_disk()["orphans"] == []
+
+        (ds / "2023-12.parquet").unlink()
+        assert any("missing" in w for w in catalog.verify_entry(entry))
+
+
 # ---------------------------------------------------------------------------
 # Catalog range-aware selection (task 4.3)
 # ---------------------------------------------------------------------------
@@ -38,6 +38,28 @@ def _generate_candles(n: int = 200, base_price: Decimal = Decimal("50000")) -> l
     return candles
 
 
+def _random_walk_candles(n: int, seed: int = 3) -> list[CandleRow]:
+    """Minute candles from a seeded random walk, volatile enough to cross resting quotes."""
+    import random
+
+    rng = random.Random(seed)
+    base_ms = 1_700_000_000_000
+    candles = []
+    price = 50_000.0
+    for i in range(n):
+        o = price
+        price += rng.gauss(0, 150)
+        h = max(o, price) + abs(rng.gauss(0, 30))
+        lo = min(o, price) - abs(rng.gauss(0, 30))
+        candles.append(CandleRow(
+            timestamp_ms=base_ms + i * 60_000,
+            open=Decimal(f"{o:.2f}"), high=Decimal(f"{h:.2f}"),
+            low=Decimal(f"{lo:.2f}"), close=Decimal(f"{price:.2f}"),
+            volume=Decimal("100"),
+        ))
+    return candles
+
+
 def _make_mock_strategy():
     """Mock strategy returning a simple execution plan."""
     from controllers.runtime.execution_context import RuntimeExecutionPlan
@@ -327,3 +349,72 @@ class TestDateRangeFiltering:
         filtered = BacktestHarness._filter_by_date_range(candles, start_str, "")
         assert len(filtered) <= 100
         assert all(c.timestamp_ms >= start_ts - 86_400_000 for c in filtered)
+
+
+class TestRunVariants:
+    def _run_variants(self, base: BacktestConfig, variants: list[BacktestConfig], candles):
+        from controllers.backtesting.harness import BacktestHarness
+
+        with patch.object(BacktestHarness, "_load_candles", return_value=candles) as load:
+            results = BacktestHarness(base).run_variants(variants)
+        assert load.call_count == 1
+        return results
+
+    def test_variants_match_independent_runs(self):
+        from dataclasses import replace
+
+        candles = _generate_candles(400)
+        base = BacktestConfig(warmup_bars=60, step_interval_s=60, seed=42)
+        variants = [
+            replace(base, fill_model_preset=preset)
+            for preset in ("optimistic", "balanced", "pessimistic")
+        ]
+        shared = self._run_variants(base, variants, candles)
+
+        assert len(shared) == len(variants)
+        for variant, result in zip(variants, shared, strict=True):
+            solo = _run_harness(variant, candles)
+            assert result.total_ticks == solo.total_ticks
+            assert result.order_count == solo.order_count
+            assert result.fill_count == solo.fill_count
+            assert [e.equity for e in result.equity_curve] == [e.equity for e in solo.equity_curve]
+            assert result.terminal_position_base == solo.terminal_position_base
+
+    def test_variant_seed_only_drives_desk(self):
+        from dataclasses import replace
+
+        from controllers.backtesting.harness import _VariantRun
+
+        candles = _random_walk_candles(300)
+        base = BacktestConfig(warmup_bars=60, step_interval_s=60, seed=42)
+        inputs: dict[int, list] = {7: [], 42: []}
+        step = _VariantRun.step
+
+        def _recording_step(run, now_ns, feed, raw_candle):
+            step(run, now_ns, feed, raw_candle)
+            inputs[run.config.seed].append((now_ns, raw_candle, run.mid_price))
+
+        with patch.object(_VariantRun, "step", _recording_step):
+            results = self._run_variants(base, [replace(base, seed=7), base], candles)
+        assert results[0].config["seed"] == 7
+        assert results[1].config["seed"] == 42
+
+        # Both strategies see the same feed: candles and synthesised mids ...
+        assert inputs[7] and inputs[7] == inputs[42]
+        # ... while each desk's fill model draws from its own seed.
+        fills = [[(f.timestamp_ns, f.side, f.fill_price, f.fill_quantity) for f in r.fills] for r in results]
+        assert fills[0] != fills[1]
+
+    def test_mismatched_window_raises(self):
+        from dataclasses import replace
+
+        from controllers.backtesting.harness import BacktestHarness
+
+        base = BacktestConfig(warmup_bars=60)
+        with pytest.raises(ValueError, match="data window"):
+            BacktestHarness(base).run_variants([replace(base, warmup_bars=30)])
+
+    def test_empty_variants(self):
+        from controllers.backtesting.harness import BacktestHarness
+
+        assert BacktestHarness(BacktestConfig()).run_variants([]) == []
@@ -447,3 +447,144 @@ class TestHydrateNested:
         assert cfg.entry_rules.signals[0].params == {"fast": 8, "slow": 21}
         assert cfg.exit_rules.signals[0].invert is True
         cfg.validate()
+
+
+# ---------------------------------------------------------------------------
+# Precomputed signals
+# ---------------------------------------------------------------------------
+
+class TestPrecomputedSignals:
+    @staticmethod
+    def _candles(n: int) -> list:
+        import math
+        return [
+            _make_candle(ts_ms=1_000_000 * 60_000 + i * 60_000, price=100 + 3 * math.sin(i / 9) + 0.01 * i)
+            for i in range(n)
+        ]
+
+    @staticmethod
+    def _config(precompute: bool) -> TaCompositeConfig:
+        return _entry_config(
+            entry_rules=RuleConfig(mode="any", signals=[
+                SignalConfig(signal_type="ema_cross", params={"fast": 5, "slow": 15}),
+                SignalConfig(signal_type="macd_cross", params={}),
+            ]),
+            exit_rules=RuleConfig(mode="any", signals=[
+                SignalConfig(signal_type="rsi_zone", params={"period": 14}, invert=True),
+            ]),
+            max_hold_minutes=60,
+            cooldown_s=0,
+            precompute_signals=precompute,
+        )
+
+    def _run(self, candles: list, precompute: bool, warmup_bars: int = 40) -> tuple:
+        desk = _make_desk()
+        adapter = TaCompositeAdapter(
+            desk=desk,
+            instrument_id="BTC-USDT",
+            instrument_spec=_FakeInstrumentSpec(),
+            config=self._config(precompute),
+        )
+        adapter.set_all_candles(candles)
+        adapter.warmup(candles[:warmup_bars])
+        position = Decimal("0")
+        actions = []
+        for c in candles[warmup_bars:]:
+            result = adapter.tick(
+                now_s=c.timestamp_ms / 1000,
+                mid=c.close,
+                book=None,
+                equity_quote=Decimal("10000"),
+                position_base=position,
+                candle=c,
+            )
+            actions.append(result)
+            if result and result.get("reason") == "signal_entry":
+                position = Decimal("1") if result["side"] == "buy" else Decimal("-1")
+            elif result and result.get("side") == "exit":
+                position = Decimal("0")
+        return adapter, actions, desk.submit_order.call_args_list
+
+    def test_precomputed_matches_live_evaluation(self):
+        candles = self._candles(400)
+        fast, fast_actions, fast_orders = self._run(candles, precompute=True)
+        live, live_actions, live_orders = self._run(candles, precompute=False)
+
+        assert fast.uses_precomputed_signals
+        assert not live.uses_precomputed_signals
+        assert fast_actions == live_actions
+        assert fast_orders == live_orders
+        assert any(a and a.get("reason") == "signal_entry" for a in fast_actions)
+        assert any(a and a.get("reason") == "signal_exit" for a in fast_actions)
+
+    def test_masked_intra_bar_candles_do_not_advance_series(self):
+        from controllers.backtesting.types import VisibleCandleRow
+
+        steps_per_bar = 4
+        candles = self._candles(400)
+        runs = []
+        for precompute in (True, False):
+            desk = _make_desk()
+            adapter = TaCompositeAdapter(
+                desk=desk,
+                instrument_id="BTC-USDT",
+                instrument_spec=_FakeInstrumentSpec(),
+                config=self._config(precompute),
+            )
+            adapter.set_all_candles(candles)
+            adapter.warmup(candles[:40])
+            position = Decimal("0")
+            actions = []
+            for c in candles[40:]:
+                for step in range(steps_per_bar):
+                    result = adapter.tick(
+                        now_s=c.timestamp_ms / 1000 + step,
+                        mid=c.open,
+                        book=None,
+                        equity_quote=Decimal("10000"),
+                        position_base=position,
+                        candle=VisibleCandleRow(c, step_index=step, max_step=steps_per_bar - 1),
+                    )
+                    actions.append(result)
+                    if result and result.get("reason") == "signal_entry":
+                        position = Decimal("1") if result["side"] == "buy" else Decimal("-1")
+                    elif result and result.get("side") == "exit":
+                        position = Decimal("0")
+            runs.append((actions, desk.submit_order.call_args_list))
+
+        (fast_actions, fast_orders), (live_actions, live_orders) = runs
+        assert fast_actions == live_actions
+        assert fast_orders == live_orders
+
+    def test_skipped_bar_falls_back_to_live(self):
+        candles = self._candles(120)
+        adapter = TaCompositeAdapter(
+            desk=_make_desk(),
+            instrument_id="BTC-USDT",
+            instrument_spec=_FakeInstrumentSpec(),
+            config=self._config(True),
+        )
+        adapter.set_all_candles(candles)
+        adapter.warmup(candles[:40])
+        assert adapter.uses_precomputed_signals
+        adapter.tick(
+            now_s=candles[41].timestamp_ms / 1000,
+            mid=candles[41].close,
+            book=None,
+            equity_quote=Decimal("10000"),
+            position_base=Decimal("0"),
+            candle=candles[41],
+        )
+        assert not adapter.uses_precomputed_signals
+
+    def test_gapped_history_is_not_precomputed(self):
+        candles = self._candles(120)
+        del candles[60]
+        adapter = TaCompositeAdapter(
+            desk=_make_desk(),
+            instrument_id="BTC-USDT",
+            instrument_spec=_FakeInstrumentSpec(),
+            config=self._config(True),
+        )
+        adapter.set_all_candles(candles)
+        assert not adapter.uses_precomputed_signals
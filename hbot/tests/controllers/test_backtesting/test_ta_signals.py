@@ -293,3 +293,60 @@ class TestRegistry:
     def test_warmup_bars_stoch_rsi(self):
         wb = warmup_bars_for_signal("stoch_rsi_cross", {})
         assert wb > 30
+
+
+# ---------------------------------------------------------------------------
+# Precomputed series parity
+# ---------------------------------------------------------------------------
+
+def _random_walk_bars(n: int, seed: int = 7) -> list[MinuteBar]:
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.4, n) + np.sin(np.arange(n) / 25) * 0.3)
+    bars = []
+    for i, c in enumerate(close):
+        o = close[i - 1] if i else c
+        h = max(o, c) + abs(rng.normal(0, 0.2))
+        lo = min(o, c) - abs(rng.normal(0, 0.2))
+        bars.append(MinuteBar(
+            ts_minute=60_000 + i * 60,
+            open=Decimal(str(round(o, 2))),
+            high=Decimal(str(round(h, 2))),
+            low=Decimal(str(round(lo, 2))),
+            close=Decimal(str(round(c, 2))),
+        ))
+    return bars
+
+
+class TestSignalSeriesParity:
+    @pytest.mark.parametrize(("signal_type", "params"), [
+        ("ema_cross", {"fast": 5, "slow": 15}),
+        ("rsi_zone", {"period": 14, "overbought": 60.0, "oversold": 40.0}),
+        ("macd_cross", {}),
+        ("macd_histogram", {"threshold": 0.05}),
+        ("bb_breakout", {"period": 20, "stddev_mult": 1.5}),
+        ("bb_squeeze", {"squeeze_threshold": 0.05}),
+        ("stoch_rsi_cross", {"overbought": 70.0, "oversold": 30.0}),
+        ("ict_structure", {"lookback": 10}),
+    ])
+    def test_series_matches_incremental_path(self, signal_type, params):
+        from controllers.backtesting.ta_signal_series import OhlcArrays, compute_signal_series
+
+        bars = _random_walk_bars(400)
+        series = compute_signal_series(signal_type, OhlcArrays.from_candles(bars), params)
+        buf = PriceBuffer()
+        fired = 0
+        for i, bar in enumerate(bars):
+            buf.append_bar(bar)
+            live = SIGNAL_REGISTRY[signal_type](buf, **params)
+            got = series.at(i)
+            assert got.direction == live.direction, (i, live, got)
+            assert got.strength == pytest.approx(live.strength, abs=1e-9), (i, live, got)
+            fired += live.strength > 0
+        assert fired > 0
+
+    def test_every_signal_has_a_series(self):
+        from controllers.backtesting.ta_signal_series import SERIES_REGISTRY
+
+        assert set(SERIES_REGISTRY) == set(SIGNAL_REGISTRY)
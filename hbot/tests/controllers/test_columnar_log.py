@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from controllers.columnar_log import ColumnarSegmentWriter, iter_columnar_rows, read_columnar_range
+from controllers.epp_logging import CsvSplitLogger
+
+FIELDS = ["ts", "side", "price", "note"]
+
+
+def _ts(hour: int, minute: int) -> str:
+    return f"2026-03-10T{hour:02d}:{minute:02d}:00+00:00"
+
+
+def test_segments_rotate_hourly_and_carry_ts_range_in_name(tmp_path):
+    writer = ColumnarSegmentWriter(tmp_path / "columnar", "fills", row_group_rows=2)
+    for hour in (10, 11):
+        for minute in (0, 20, 40):
+            writer.write({"ts": _ts(hour, minute), "side": "buy", "price": Decimal("1.5"), "note": None}, FIELDS)
+    writer.close()
+
+    segments = sorted(p.name for p in (tmp_path / "columnar" / "fills").iterdir())
+    assert len(segments) == 2
+    assert all(name.endswith(".parquet") for name in segments)
+    meta = pq.ParquetFile(tmp_path / "columnar" / "fills" / segments[0]).metadata
+    assert meta.num_row_groups == 2  # 3 rows at row_group_rows=2
+    stats = meta.row_group(0).column(0).statistics
+    assert stats.has_min_max
+
+
+def test_range_read_prunes_and_filters_by_ts(tmp_path):
+    writer = ColumnarSegmentWriter(tmp_path / "columnar", "minute", row_group_rows=4)
+    for hour in (9, 10, 11):
+        for minute in range(0, 60, 5):
+            writer.write({"ts": _ts(hour, minute), "side": "", "price": str(hour * 100 + minute), "note": "x"}, FIELDS)
+    writer.close()
+
+    table = read_columnar_range(tmp_path, "minute", start=_ts(10, 30), end=_ts(11, 10), columns=["price"])
+    assert table.column_names == ["ts", "price"]
+    assert table["price"].to_pylist() == ["1030", "1035", "1040", "1045", "1050", "1055", "1100", "1105"]
+
+    rows = list(iter_columnar_rows(tmp_path, "minute", start=_ts(11, 55)))
+    assert rows == [{"ts": "2026-03-10T11:55:00+00:00", "side": "", "price": "1155", "note": "x"}]
+    assert read_columnar_range(tmp_path, "minute", start=_ts(12, 0)).num_rows == 0
+
+
+def test_open_segment_is_invisible_until_closed(tmp_path):
+    writer = ColumnarSegmentWriter(tmp_path / "columnar", "fills", row_group_rows=1)
+    writer.write({"ts": _ts(10, 0), "side": "sell", "price": "2", "note": ""}, FIELDS)
+    assert read_columnar_range(tmp_path, "fills").num_rows == 0
+    writer.close()
+    assert read_columnar_range(tmp_path, "fills").num_rows == 1
+
+
+def test_csv_split_logger_mirrors_minute_and_fills(tmp_path):
+    lgr = CsvSplitLogger(str(tmp_path), "test_bot", "a", namespace="test", flush_rows=1, columnar=True)
+    lgr.log_fill({"ts": _ts(12, 0), "side": "buy", "price": Decimal("50000"), "order_id": "o1", "is_maker": True})
+    lgr.log_minute({"bot_variant": "a", "state": "running", "mid": Decimal("50000.5")}, ts=_ts(12, 1))
+    lgr.close_all()
+
+    fills = list(iter_columnar_rows(lgr.log_dir, "fills"))
+    assert len(fills) == 1
+    assert fills[0]["price"] == "50000"
+    assert fills[0]["is_maker"] == "True"
+    assert fills[0]["fee_quote"] == ""
+    assert set(fills[0]) == set(CsvSplitLogger.FILL_FIELDS)
+    minute = list(iter_columnar_rows(lgr.log_dir, "minute", columns=["state", "mid"]))
+    assert minute == [{"ts": _ts(12, 1), "state": "running", "mid": "50000.5"}]
@@ -0,0 +1,94 @@
+"""Tests for the startup mixin's bar disk cache: restart seeding and what gets persisted."""
+from __future__ import annotations
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pandas as pd
+
+from tests.controllers.test_epp_v2_4_core import _install_hb_stubs
+
+_install_hb_stubs()
+
+from controllers.price_buffer import PriceBuffer
+from controllers.runtime.kernel.startup_mixin import StartupMixin
+from platform_lib.market_data.bar_disk_cache import DiskBarCache
+from platform_lib.market_data.market_history_types import MarketBarKey
+
+_NOW_S = 1_800_000_000 // 60 * 60 + 30  # mid-minute
+_KEY = MarketBarKey("bitget_perpetual", "BTC-USDT", "exchange_ohlcv")
+
+
+def _frame(n: int, end_ms: int) -> pd.DataFrame:
+    rows = [
+        (end_ms - (n - 1 - i) * 60_000, 100 + i, 101 + i, 99 + i, 100.5 + i)
+        for i in range(n)
+    ]
+    return pd.DataFrame(rows, columns=["timestamp_ms", "open", "high", "low", "close"])
+
+
+class _Ctrl(StartupMixin):
+    def __init__(self, cache: DiskBarCache, parquet_df: pd.DataFrame | None = None):
+        self.config = SimpleNamespace(connector_name="bitget_perpetual", trading_pair="BTC-USDT")
+        self._price_buffer = PriceBuffer()
+        self._bar_disk_cache = cache
+        self._history_seed_attempted = False
+        self._history_seed_status = "disabled"
+        self._history_seed_reason = ""
+        self._history_seed_source = ""
+        self._history_seed_bars = 0
+        self._history_seed_latency_ms = 0.0
+        self._parquet_df = parquet_df
+        self.remote_calls = 0
+
+    def _required_seed_bars(self) -> int:
+        return 30
+
+    def _try_seed_from_parquet(self, now: float) -> bool:
+        self.remote_calls += 1
+        if self._parquet_df is None:
+            return False
+        return self._validate_and_seed(self._parquet_df, int(now * 1000), source_label="parquet")
+
+    def _try_seed_from_rest(self, now: float) -> bool:
+        self.remote_calls += 1
+        return False
+
+    def _fetch_bridge_bars(self, exchange_id, trading_pair, since_ms, until_ms):
+        self.remote_calls += 1
+        return None
+
+
+def test_restart_seeds_from_cache_written_by_first_seed(tmp_path) -> None:
+    cache = DiskBarCache(tmp_path)
+    last_closed_ms = (_NOW_S // 60 - 1) * 60_000
+
+    first = _Ctrl(cache, parquet_df=_frame(30, last_closed_ms))
+    first._maybe_seed_price_buffer(_NOW_S)
+    assert first.seed_ok()
+    assert first._history_seed_source == "parquet"
+    assert cache.tail_ms(_KEY) == last_closed_ms
+
+    second = _Ctrl(cache)
+    second._maybe_seed_price_buffer(_NOW_S)
+    assert second.seed_ok()
+    assert second._history_seed_source == "disk_cache"
+    assert second.remote_calls == 0
+    assert [b.close for b in second._price_buffer.bars_1m] == [b.close for b in first._price_buffer.bars_1m]
+
+
+def test_only_closed_exchange_bars_are_persisted(tmp_path) -> None:
+    cache = DiskBarCache(tmp_path)
+    open_minute_ms = _NOW_S // 60 * 60_000
+    # The exchange frame ends with the still-forming candle of the current minute.
+    ctrl = _Ctrl(cache, parquet_df=_frame(30, open_minute_ms))
+    ctrl._maybe_seed_price_buffer(_NOW_S)
+    assert ctrl.seed_ok()
+    assert cache.tail_ms(_KEY) == open_minute_ms - 60_000
+
+    # Live samples build PriceBuffer bars; none of them reach the exchange_ohlcv file.
+    ctrl._price_buffer.add_sample(_NOW_S + 1, Decimal("200"))
+    ctrl._price_buffer.add_sample(_NOW_S + 61, Decimal("201"))
+    ctrl._price_buffer.add_sample(_NOW_S + 121, Decimal("202"))
+    assert cache.tail_ms(_KEY) == open_minute_ms - 60_000
+    assert [b.close for b in cache.read(_KEY, 2)] == [Decimal("127.5"), Decimal("128.5")]
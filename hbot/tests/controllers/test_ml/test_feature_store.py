@@ -0,0 +1,141 @@
+"""Tests for the content-addressed research dataset cache."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow", reason="pyarrow required for feature store tests")
+
+from controllers.backtesting.data_catalog import DataCatalog
+from controllers.backtesting.data_store import (
+    CandleArrays,
+    append_partitioned,
+    partition_summary,
+    resolve_data_path,
+    resolve_dataset_dir,
+    save_candle_arrays,
+)
+from controllers.ml.feature_store import FeatureStore
+from controllers.ml.research import assemble_dataset, build_dataset, load_dataset_inputs
+
+_BASE_TS = 1_700_000_000_000
+
+
+def _candles(n: int, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 50000.0 + np.cumsum(rng.normal(0, 20, n))
+    return pd.DataFrame({
+        "timestamp_ms": _BASE_TS + np.arange(n, dtype=np.int64) * 60_000,
+        "open": close + rng.normal(0, 5, n),
+        "high": close + np.abs(rng.normal(0, 15, n)),
+        "low": close - np.abs(rng.normal(0, 15, n)),
+        "close": close,
+        "volume": np.abs(rng.normal(100, 20, n)),
+    })
+
+
+def _write_1m(catalog_dir, df: pd.DataFrame) -> None:
+    path = resolve_data_path("bitget", "BTC-USDT", "1m", catalog_dir)
+    save_candle_arrays(CandleArrays(**{c: df[c].to_numpy() for c in df.columns}), path)
+    DataCatalog(catalog_dir).register(
+        "bitget", "BTC-USDT", "1m",
+        start_ms=int(df["timestamp_ms"].iloc[0]),
+        end_ms=int(df["timestamp_ms"].iloc[-1]),
+        row_count=len(df),
+        file_path=str(path),
+        file_size_bytes=path.stat().st_size,
+    )
+
+
+def _append_1m_partitioned(catalog_dir, df: pd.DataFrame) -> None:
+    dataset_dir = resolve_dataset_dir("bitget", "BTC-USDT", "1m", catalog_dir)
+    append_partitioned(df, dataset_dir, kind="candles", granularity="day")
+    summary = partition_summary(dataset_dir)
+    DataCatalog(catalog_dir).register(
+        "bitget", "BTC-USDT", "1m",
+        start_ms=summary["start_ms"],
+        end_ms=summary["end_ms"],
+        row_count=summary["row_count"],
+        file_path=str(dataset_dir),
+        file_size_bytes=summary["file_size_bytes"],
+    )
+
+
+class TestFeatureStore:
+    def test_second_call_is_a_hit(self, tmp_path):
+        catalog_dir, cache_dir = tmp_path / "hist", tmp_path / "cache"
+        _write_1m(catalog_dir, _candles(3_000))
+
+        store = FeatureStore(cache_dir)
+        first = store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+        assert store.last_outcome == "built"
+        second = store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+        assert store.last_outcome == "hit"
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_changed_input_misses(self, tmp_path):
+        catalog_dir, cache_dir = tmp_path / "hist", tmp_path / "cache"
+        candles = _candles(3_000)
+        _write_1m(catalog_dir, candles)
+        store = FeatureStore(cache_dir)
+        store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+
+        revised = candles.copy()
+        revised.loc[10, "close"] += 1.0
+        _write_1m(catalog_dir, revised)
+        store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+        assert store.last_outcome == "built"
+
+    def test_appended_candles_recompute_tail_only(self, tmp_path):
+        catalog_dir, cache_dir = tmp_path / "hist", tmp_path / "cache"
+        full = _candles(24_000)
+        _write_1m(catalog_dir, full.iloc[:23_000])
+        store = FeatureStore(cache_dir)
+        store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+
+        _write_1m(catalog_dir, full)
+        extended = store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+        assert store.last_outcome == "extended"
+
+        rebuilt = build_dataset(load_dataset_inputs("bitget", "BTC-USDT", catalog_dir))
+        assert len(extended) == len(rebuilt) == len(full)
+        pd.testing.assert_frame_equal(extended, rebuilt, check_dtype=False, rtol=1e-9)
+
+    def test_partitioned_inputs_are_loaded_and_fingerprinted(self, tmp_path):
+        catalog_dir, cache_dir = tmp_path / "hist", tmp_path / "cache"
+        full = _candles(4_000)
+        _write_1m(catalog_dir, full.iloc[:1_000])  # stale single file left behind
+        _append_1m_partitioned(catalog_dir, full.iloc[:3_000])
+
+        inputs = load_dataset_inputs("bitget", "BTC-USDT", catalog_dir)
+        pd.testing.assert_frame_equal(inputs["1m"], full.iloc[:3_000].reset_index(drop=True))
+
+        store = FeatureStore(cache_dir)
+        store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+        assert store.last_outcome == "built"
+        _append_1m_partitioned(catalog_dir, full.iloc[3_000:])
+        rebuilt = store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+        assert store.last_outcome != "hit"  # the new manifest changes the fingerprint
+        assert len(rebuilt) == len(full)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        catalog_dir, cache_dir = tmp_path / "hist", tmp_path / "cache"
+        store = FeatureStore(cache_dir, max_bytes=1)
+        _write_1m(catalog_dir, _candles(2_000, seed=1))
+        store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+        _write_1m(catalog_dir, _candles(2_000, seed=2))
+        store.get_or_build("bitget", "BTC-USDT", catalog_dir)
+
+        # Only the entry just written survives a budget it alone exceeds.
+        assert len(list(cache_dir.glob("*/*/*.parquet"))) == 1
+        assert len(list(cache_dir.glob("*/*/*.json"))) == 1
+
+    def test_assemble_dataset_uses_cache_dir(self, tmp_path):
+        catalog_dir, cache_dir = tmp_path / "hist", tmp_path / "cache"
+        _write_1m(catalog_dir, _candles(2_000))
+
+        cached = assemble_dataset("bitget", "BTC-USDT", catalog_dir, cache_dir=cache_dir)
+        direct = assemble_dataset("bitget", "BTC-USDT", catalog_dir)
+        assert list(cache_dir.glob("bitget/BTC-USDT/*.parquet"))
+        pd.testing.assert_frame_equal(cached, direct, check_dtype=False)
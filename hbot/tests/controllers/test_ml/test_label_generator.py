@@ -1,6 +1,8 @@
 """Tests for the ML label generator."""
 from __future__ import annotations
 
+import time
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -113,6 +115,87 @@ class TestBuckets:
         assert valid.max() <= 3
 
 
+def _reference_percentile_buckets(values: np.ndarray, window: int, percentiles) -> np.ndarray:
+    """Per-bar np.percentile reference for the rolling bucket helpers."""
+    out = np.full((len(values), len(percentiles)), np.nan)
+    for i in range(window, len(values)):
+        lookback = values[i - window:i]
+        lookback = lookback[~np.isnan(lookback)]
+        if len(lookback) >= 10:
+            out[i] = np.percentile(lookback, percentiles)
+    return out
+
+
+class TestSlidingWindowParity:
+    """The sliding-window helpers must match naive per-bar slicing exactly."""
+
+    def test_forward_extremes_and_vol_match_slices(self, random_candles):
+        h = 15
+        result = compute_labels(random_candles, horizons=[h], bucket_window=200)
+        close = random_candles["close"].to_numpy()
+        high = random_candles["high"].to_numpy()
+        low = random_candles["low"].to_numpy()
+        log_ret = np.log(close[1:] / close[:-1])
+        for i in range(len(close) - h):
+            fut_high = np.max(high[i + 1:i + 1 + h])
+            fut_low = np.min(low[i + 1:i + 1 + h])
+            assert result["fwd_mfe_long_15m"].iloc[i] == max((fut_high - close[i]) / close[i], 0)
+            assert result["fwd_mae_short_15m"].iloc[i] == max((fut_high - close[i]) / close[i], 0)
+            assert result["fwd_mae_long_15m"].iloc[i] == max((close[i] - fut_low) / close[i], 0)
+            assert result["fwd_vol_15m"].iloc[i] == np.std(log_ret[i:i + h])
+
+    def test_buckets_match_per_bar_percentiles(self, random_candles):
+        df = random_candles.copy()
+        df.loc[300:340, "close"] = np.round(df.loc[300:340, "close"], -2)  # ties
+        result = compute_labels(df, horizons=[5], bucket_window=200)
+
+        ret = result["fwd_return_5m"].to_numpy()
+        thresholds = _reference_percentile_buckets(ret, 200, [20, 40, 60, 80])
+        expected = np.full(len(ret), np.nan)
+        for i in range(len(ret)):
+            if not np.isnan(ret[i]) and not np.isnan(thresholds[i, 0]):
+                expected[i] = np.searchsorted(thresholds[i], ret[i])
+        np.testing.assert_array_equal(result["fwd_return_bucket_5m"].to_numpy(), expected)
+
+        vol = result["fwd_vol_5m"].to_numpy()
+        thresholds = _reference_percentile_buckets(vol, 200, [25, 75, 95])
+        expected = np.full(len(vol), np.nan)
+        for i in range(len(vol)):
+            if not np.isnan(vol[i]) and not np.isnan(thresholds[i, 0]):
+                expected[i] = int(np.searchsorted(thresholds[i], vol[i], side="left"))
+        np.testing.assert_array_equal(result["fwd_vol_bucket_5m"].to_numpy(), expected)
+
+
+class TestLabelPerformance:
+    def test_100k_bars_benchmark(self):
+        """compute_labels on 100K bars (~70 days of 1m) with the default
+        1440-bar bucket window and three horizons.
+
+        The per-bar slicing implementation took minutes at this size; the
+        sliding-window version needs about 2-3 s of CPU.  Timed with process
+        CPU time so cores shared with other xdist workers do not count.
+        Regression guard, not a latency SLA.
+        """
+        rng = np.random.default_rng(7)
+        n = 100_000
+        close = 50000.0 + np.cumsum(rng.normal(0, 20, n))
+        df = pd.DataFrame({
+            "timestamp_ms": 1_700_000_000_000 + np.arange(n, dtype=np.int64) * 60_000,
+            "open": close,
+            "high": close + np.abs(rng.normal(0, 10, n)),
+            "low": close - np.abs(rng.normal(0, 10, n)),
+            "close": close,
+            "volume": np.full(n, 100.0),
+        })
+
+        start = time.process_time()
+        result = compute_labels(df)
+        elapsed = time.process_time() - start
+
+        assert len(result) == n
+        assert elapsed < 10.0, f"Labelled 100K bars in {elapsed:.2f}s CPU (limit: 10s)"
+
+
 class TestNoStrategyDependency:
     def test_no_strategy_imports(self):
         import controllers.ml.label_generator as lg
@@ -230,6 +230,30 @@ class TestHyperparameterTuning:
         assert result["best_score"] > 0.0
 
 
+class TestParallelCV:
+    def test_parallel_folds_match_serial(self, synthetic_dataset):
+        serial = purged_walk_forward_cv(synthetic_dataset, "regime", n_windows=3, threads_per_worker=1)
+        parallel = purged_walk_forward_cv(
+            synthetic_dataset, "regime", n_windows=3, n_jobs=3, threads_per_worker=1,
+        )
+        assert [r["window"] for r in parallel] == [r["window"] for r in serial]
+        for a, b in zip(serial, parallel, strict=True):
+            assert a["metric_value"] == b["metric_value"]
+            assert a["train_rows"] == b["train_rows"]
+            assert a["purged_count"] == b["purged_count"]
+            assert b["model"] is not None
+
+    def test_parallel_tuning(self, synthetic_dataset):
+        pytest.importorskip("optuna", reason="optuna required")
+        kwargs = {"n_windows": 3, "n_trials": 2, "seed": 7, "n_jobs": 2, "threads_per_worker": 1}
+        r1 = run_hyperparameter_tuning(synthetic_dataset, "regime", **kwargs)
+        r2 = run_hyperparameter_tuning(synthetic_dataset, "regime", **kwargs)
+        assert r1["n_trials"] == 2
+        assert r1["best_params"] == r2["best_params"]
+        for key, (lo, hi) in _SEARCH_SPACES["regime"].items():
+            assert lo <= r1["best_params"][key] <= hi
+
+
 class TestFeatureImportanceTracking:
     def test_summary_keys(self, synthetic_dataset):
         results = purged_walk_forward_cv(synthetic_dataset, "regime", n_windows=3)
@@ -7,6 +7,7 @@ Tests the critical accounting rules:
 - V6 position flip test vector.
 - Available balance clamped to zero.
 """
+import random
 from datetime import UTC, datetime
 from decimal import Decimal
 
@@ -15,7 +16,7 @@ from simulation.portfolio import (
     PaperPortfolio,
     PortfolioConfig,
 )
-from simulation.types import _ZERO, OrderSide, PositionAction
+from simulation.types import _ZERO, InstrumentId, OrderSide, PositionAction
 from tests.controllers.test_paper_engine_v2.conftest import (
     BTC_PERP,
     BTC_SPOT,
@@ -462,3 +463,66 @@ class TestOneWayPositionMode:
         assert net_pos.quantity == Decimal("0.5")
         assert long_view.quantity == net_pos.quantity
         assert short_view.quantity == net_pos.quantity
+
+
+class TestIncrementalAggregates:
+    """Running equity/margin aggregates must match a full recompute at every step."""
+
+    PERPS = [
+        InstrumentId(venue="bitget", trading_pair=f"{base}-USDT", instrument_type="perp")
+        for base in ("BTC", "ETH", "SOL", "XRP")
+    ]
+
+    def test_random_session_reconciles(self):
+        rng = random.Random(11)
+        p = PaperPortfolio({"USDT": Decimal("100000"), "BTC": Decimal("5")}, PortfolioConfig(reconcile_aggregates=True))
+        instruments = [*self.PERPS, BTC_SPOT]
+        marks = {iid.key: Decimal("100") for iid in instruments}
+        for step in range(400):
+            iid = rng.choice(instruments)
+            action = rng.random()
+            if action < 0.35:
+                hedge = iid == self.PERPS[0]
+                settle(
+                    p, iid, rng.choice(["buy", "sell"]), str(rng.choice([1, 2, 3])), str(marks[iid.key]),
+                    fee="0.01", leverage=rng.choice([1, 5, 10]),
+                    position_action=rng.choice(list(PositionAction)) if hedge else PositionAction.AUTO,
+                    position_mode="HEDGE" if hedge else "ONEWAY",
+                )
+            elif action < 0.45 and iid.is_perp:
+                p.apply_funding(iid, Decimal(str(rng.uniform(-0.5, 0.5))).quantize(Decimal("0.0001")), now_ns=step)
+            else:
+                for key in marks:
+                    if rng.random() < 0.3:
+                        marks[key] = max(Decimal("1"), marks[key] + Decimal(rng.randint(-3, 3)))
+                partial = {k: v for k, v in marks.items() if rng.random() < 0.8}
+                p.mark_to_market(partial)
+            p.equity_quote()
+            p.equity_quote(marks)
+            p.maintenance_margin_quote()
+            p.net_exposure_quote(marks)
+
+        restored = PaperPortfolio({"USDT": Decimal("0")}, PortfolioConfig(reconcile_aggregates=True))
+        restored.restore_from_snapshot(p.snapshot())
+        assert restored.equity_quote() == p.equity_quote()
+        assert restored.maintenance_margin_quote() == p.maintenance_margin_quote()
+        assert restored.net_exposure_quote(marks) == p.net_exposure_quote(marks)
+
+    def test_unchanged_marks_skip_position_walk(self, monkeypatch):
+        p = make_portfolio(usdt=Decimal("10000"))
+        for iid in self.PERPS:
+            settle(p, iid, "buy", "1", "100", leverage=10)
+        marks = {iid.key: Decimal("101") for iid in self.PERPS}
+        p.mark_to_market(marks)
+
+        visited: list[str] = []
+        original = PaperPortfolio._collapse_oneway_legs
+        monkeypatch.setattr(
+            PaperPortfolio, "_collapse_oneway_legs",
+            staticmethod(lambda pos: (visited.append(pos.instrument_id.key), original(pos))),
+        )
+        p.mark_to_market(marks)
+        assert visited == []
+        p.mark_to_market({**marks, self.PERPS[1].key: Decimal("99")})
+        assert visited == [self.PERPS[1].key]
+        assert p.equity_quote() == Decimal("10000") + 3 * Decimal("1") - Decimal("1")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import csv
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from controllers.analytics.performance_metrics import max_drawdown, sharpe_ratio, sortino_ratio
+from controllers.analytics.rolling_aggregates import RollingAggregates, parse_window
+
+_T0 = datetime(2026, 3, 1, tzinfo=UTC)
+_MINUTE_FIELDS = ["ts", "state", "equity_quote"]
+_FILL_FIELDS = ["ts", "side", "price", "mid_ref", "notional_quote", "fee_quote", "realized_pnl_quote", "is_maker"]
+
+
+def _equity_curve(minutes: int, seed: int = 7) -> list[tuple[str, Decimal]]:
+    rng = random.Random(seed)
+    equity = Decimal("1000")
+    out = []
+    for i in range(minutes):
+        equity *= Decimal(str(1 + rng.gauss(0.00002, 0.0008)))
+        equity = equity.quantize(Decimal("0.0001"))
+        out.append(((_T0 + timedelta(minutes=i)).isoformat(), equity))
+    return out
+
+
+def _fill(minute: int, side: str, price: str, mid: str, maker: bool = True) -> dict[str, str]:
+    return {
+        "ts": (_T0 + timedelta(minutes=minute, seconds=30)).isoformat(),
+        "side": side,
+        "price": price,
+        "mid_ref": mid,
+        "notional_quote": "100",
+        "fee_quote": "0.02",
+        "realized_pnl_quote": "0.05",
+        "is_maker": str(maker),
+    }
+
+
+def test_parse_window():
+    assert parse_window("15m") == 900
+    assert parse_window("24h") == 86400
+    assert parse_window("7d") == 7 * 86400
+
+
+def test_windows_match_full_recompute():
+    curve = _equity_curve(3 * 24 * 60)
+    agg = RollingAggregates(bucket_s=900)
+    for ts, equity in curve:
+        agg.add_equity(ts, equity)
+
+    now = curve[-1][0]
+    for spec, minutes in (("1h", 60), ("24h", 24 * 60), ("3d", 3 * 24 * 60)):
+        summary = agg.window(parse_window(spec), now=now)
+        # now sits at the end of a bucket, so the window covers whole buckets.
+        expected = curve[-minutes:]
+        prices = [equity for _, equity in expected]
+        stamps = [ts for ts, _ in expected]
+        assert summary.samples == len(expected)
+        assert summary.max_drawdown_pct == max_drawdown(prices)
+        assert float(summary.sharpe) == pytest.approx(float(sharpe_ratio(prices, timestamps=stamps)), rel=1e-6)
+        assert float(summary.sortino) == pytest.approx(float(sortino_ratio(prices, timestamps=stamps)), rel=1e-6)
+    assert agg.max_drawdown_pct == max_drawdown([equity for _, equity in curve])
+    assert set(agg.daily()) == {"2026-03-01", "2026-03-02", "2026-03-03"}
+
+
+def test_incremental_csv_ingest_persists_and_matches_single_pass(tmp_path):
+    curve = _equity_curve(240)
+    minute_csv = tmp_path / "minute.csv"
+    fills_csv = tmp_path / "fills.csv"
+    state = tmp_path / "rolling_aggregates.json"
+    fills = [_fill(10, "buy", "99.9", "100"), _fill(130, "sell", "100.2", "100", maker=False)]
+
+    with minute_csv.open("w", newline="", encoding="utf-8") as fp:
+        w = csv.DictWriter(fp, fieldnames=_MINUTE_FIELDS)
+        w.writeheader()
+        for ts, equity in curve[:120]:
+            w.writerow({"ts": ts, "state": "running", "equity_quote": equity})
+        fp.write(f"{curve[120][0]},running,")  # torn tail row, no newline yet
+    with fills_csv.open("w", newline="", encoding="utf-8") as fp:
+        w = csv.DictWriter(fp, fieldnames=_FILL_FIELDS)
+        w.writeheader()
+        w.writerow(fills[0])
+
+    agg = RollingAggregates.load(state)
+    assert agg.ingest_csv(minute_csv, "minute") == 120
+    assert agg.ingest_csv(fills_csv, "fills") == 1
+    agg.save(state)
+
+    with minute_csv.open("a", newline="", encoding="utf-8") as fp:
+        fp.write(f"{curve[120][1]}\n")
+        w = csv.DictWriter(fp, fieldnames=_MINUTE_FIELDS)
+        for ts, equity in curve[121:]:
+            w.writerow({"ts": ts, "state": "running", "equity_quote": equity})
+    with fills_csv.open("a", newline="", encoding="utf-8") as fp:
+        csv.DictWriter(fp, fieldnames=_FILL_FIELDS).writerow(fills[1])
+
+    resumed = RollingAggregates.load(state)
+    assert resumed.ingest_csv(minute_csv, "minute") == 120
+    assert resumed.ingest_csv(fills_csv, "fills") == 1
+    assert resumed.ingest_csv(minute_csv, "minute") == 0
+
+    single = RollingAggregates()
+    for ts, equity in curve:
+        single.add_equity(ts, equity)
+    for row in fills:
+        single.add_fill(row)
+
+    got = resumed.window(parse_window("24h")).to_dict()
+    assert got == single.window(parse_window("24h")).to_dict()
+    assert got["samples"] == 240
+    assert got["fills"] == 2
+    assert got["maker"] == 1
+    assert got["fees_quote"] == "0.04"
+    assert Decimal(got["avg_edge_vs_mid_bps"]) == Decimal("15")
+
+
+def test_out_of_order_equity_is_skipped():
+    agg = RollingAggregates()
+    assert agg.add_equity("2026-03-01T00:01:00+00:00", "100")
+    assert not agg.add_equity("2026-03-01T00:00:00+00:00", "90")
+    assert agg.skipped_rows == 1
+    assert agg.window(3600).samples == 1
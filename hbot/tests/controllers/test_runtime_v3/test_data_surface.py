@@ -9,7 +9,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from controllers.runtime.v3.data_surface import KernelDataSurface
-from controllers.runtime.v3.types import MarketSnapshot
+from controllers.runtime.v3.types import IndicatorSpec, MarketSnapshot
 
 _ZERO = Decimal("0")
 
@@ -204,6 +204,66 @@ class TestSnapshotCaching:
         assert snap1 is not snap2
 
 
+class TestLazyIndicators:
+    @staticmethod
+    def _counting_kernel():
+        calls: list[tuple[str, int]] = []
+        k = _make_mock_kernel()
+        pb = k._price_buffer
+        pb.bar_count = 100
+
+        def _counted(name, value):
+            def _fn(p):
+                calls.append((name, p))
+                return value if p in (14, 20) else None
+            return _fn
+
+        pb.ema = _counted("ema", Decimal("64800"))
+        pb.atr = _counted("atr", Decimal("350"))
+        pb.rsi = _counted("rsi", Decimal("55"))
+        pb.adx = _counted("adx", Decimal("28"))
+        return k, calls
+
+    def test_nothing_computed_until_read(self):
+        k, calls = self._counting_kernel()
+        snap = KernelDataSurface(k).snapshot()
+        assert calls == []
+        assert snap.indicators.atr.get(14) == Decimal("350")
+        assert calls == [("atr", 14)]
+
+    def test_memoised_across_ticks_within_a_bar(self):
+        k, calls = self._counting_kernel()
+        surface = KernelDataSurface(k)
+        for tick in range(5):
+            k._tick_count = tick
+            assert surface.snapshot().indicators.ema[20] == Decimal("64800")
+        assert calls == [("ema", 20)]
+
+        k._price_buffer.bar_count = 101
+        k._tick_count = 99
+        surface.snapshot().indicators.ema.get(20)
+        assert calls == [("ema", 20), ("ema", 20)]
+
+    def test_declared_periods_are_the_keys(self):
+        k, _ = self._counting_kernel()
+        spec = IndicatorSpec(ema=(20, 50), atr=(14,))
+        snap = KernelDataSurface(k, spec).snapshot()
+        # 50 is declared but still warming up, so it is missing.
+        assert dict(snap.indicators.ema) == {20: Decimal("64800")}
+        assert snap.indicators.atr == {14: Decimal("350")}
+        assert snap.indicators.rsi == {}
+        # Undeclared periods are still served on demand.
+        assert snap.indicators.rsi.get(14) == Decimal("55")
+        assert 50 not in snap.indicators.ema
+
+    def test_registry_declarations_cover_adapter_reads(self):
+        from controllers.runtime.v3.strategy_registry import STRATEGY_REGISTRY
+
+        for name, entry in STRATEGY_REGISTRY.items():
+            if entry.execution_family == "directional":
+                assert 14 in entry.indicators.atr, name
+
+
 class TestSnapshotImmutability:
     def test_snapshot_is_frozen(self):
         k = _make_mock_kernel()
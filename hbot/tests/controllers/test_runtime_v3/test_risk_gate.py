@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import queue
+import time
 from decimal import Decimal
 
 import pytest
@@ -9,6 +11,11 @@ import pytest
 from controllers.runtime.v3.risk.bot_gate import BotRiskConfig, BotRiskGate
 from controllers.runtime.v3.risk.desk_risk_gate import DeskRiskGate
 from controllers.runtime.v3.risk.portfolio_gate import PortfolioRiskGate
+from controllers.runtime.v3.risk.portfolio_subscription import (
+    PortfolioRiskSubscription,
+    get_portfolio_risk_subscription,
+    stop_all_subscriptions,
+)
 from controllers.runtime.v3.risk.signal_gate import SignalRiskConfig, SignalRiskGate
 from controllers.runtime.v3.signals import SignalLevel, TradingSignal
 from controllers.runtime.v3.types import EquitySnapshot, MarketSnapshot, PositionSnapshot
@@ -70,6 +77,141 @@ class TestPortfolioRiskGate:
         assert d.approved is True
 
 
+class _FakeStreamClient:
+    """In-memory stand-in for RedisStreamClient's read_latest / ping / read_after."""
+
+    def __init__(self, latest=None, *, down_for=0):
+        self._latest = latest
+        self._pending: queue.Queue = queue.Queue()
+        self._seq = 0
+        self._down_for = down_for
+        self.reads = 0
+        self.seed_attempts = 0
+        self.after_ids: list[str] = []
+
+    def publish(self, payload):
+        self._seq += 1
+        self._pending.put((f"{self._seq}-0", payload))
+
+    def read_latest(self, stream):
+        self.reads += 1
+        self.seed_attempts += 1
+        return None if self.seed_attempts <= self._down_for else self._latest
+
+    def ping(self):
+        return self.seed_attempts > self._down_for
+
+    def read_after(self, stream, last_id, count=100, block_ms=1000):
+        self.reads += 1
+        self.after_ids.append(last_id)
+        try:
+            return [self._pending.get(timeout=block_ms / 1000.0)]
+        except queue.Empty:
+            return []
+
+
+def _kill_switch(scope=(), ts_ms=None):
+    return {
+        "event_type": "portfolio_risk_snapshot",
+        "portfolio_action": "kill_switch",
+        "timestamp_ms": int(time.time() * 1000) if ts_ms is None else ts_ms,
+        "risk_scope_bots": list(scope),
+    }
+
+
+def _wait_for(predicate, timeout_s=2.0):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestPortfolioRiskSubscription:
+    def test_breach_pushes_to_gate_without_io(self):
+        client = _FakeStreamClient()
+        sub = PortfolioRiskSubscription(client, "risk", block_ms=50)
+        sub.start()
+        try:
+            gate = PortfolioRiskGate(subscription=sub, instance_name="bot1")
+            assert gate.evaluate(_signal(), _snap()).approved is True
+
+            client.publish({"portfolio_action": "allow", "timestamp_ms": int(time.time() * 1000)})
+            client.publish(_kill_switch())
+            assert _wait_for(lambda: sub.breach is not None)
+
+            reads = client.reads
+            d = gate.evaluate(_signal(), _snap())
+            assert d.approved is False
+            assert d.reason == "portfolio_breach"
+            assert d.metadata["reaction_latency_ms"] >= 0
+            assert gate.evaluate(_signal(), _snap()).reason == "portfolio_hard_stop_latched"
+            assert client.reads - reads <= 1  # only the background thread reads
+            stats = sub.stats()
+            assert stats["events_seen"] == 2
+            assert stats["breach_count"] == 1
+        finally:
+            sub.stop()
+
+    def test_breach_outside_scope_is_ignored(self):
+        sub = PortfolioRiskSubscription(_FakeStreamClient(), "risk")
+        sub.on_entry("1-0", _kill_switch(scope=["bot4"]))
+        assert PortfolioRiskGate(subscription=sub, instance_name="bot1").evaluate(_signal(), _snap()).approved
+        assert not PortfolioRiskGate(subscription=sub, instance_name="bot4").evaluate(_signal(), _snap()).approved
+
+    def test_reset_acknowledges_seen_breach(self):
+        sub = PortfolioRiskSubscription(_FakeStreamClient(), "risk")
+        gate = PortfolioRiskGate(subscription=sub)
+        sub.on_entry("1-0", _kill_switch())
+        assert gate.evaluate(_signal(), _snap()).approved is False
+        gate.reset()
+        assert gate.evaluate(_signal(), _snap()).approved is True
+        sub.on_entry("2-0", {"action": "emergency_stop", "reason": "manual"})
+        d = gate.evaluate(_signal(), _snap())
+        assert d.approved is False
+        assert d.metadata["breach_detail"] == "manual"
+
+    def test_seed_latches_recent_breach_only(self):
+        fresh = PortfolioRiskSubscription(_FakeStreamClient(latest=("5-0", _kill_switch())), "risk")
+        fresh._seed_from_latest()
+        assert fresh.breach is not None
+        assert fresh._last_id == "5-0"
+
+        stale_ts = int((time.time() - 3600) * 1000)
+        stale = PortfolioRiskSubscription(_FakeStreamClient(latest=("5-0", _kill_switch(ts_ms=stale_ts))), "risk")
+        stale._seed_from_latest()
+        assert stale.breach is None
+        assert stale._last_id == "5-0"
+
+    def test_empty_stream_is_tailed_from_start(self):
+        sub = PortfolioRiskSubscription(_FakeStreamClient(), "risk")
+        assert sub._seed_from_latest() is True
+        assert sub._last_id == "0-0"
+
+    def test_seed_is_retried_while_redis_is_down(self):
+        client = _FakeStreamClient(latest=("7-0", {"portfolio_action": "allow"}), down_for=2)
+        sub = PortfolioRiskSubscription(client, "risk", block_ms=50, idle_backoff_s=0.01)
+        sub.start()
+        try:
+            assert _wait_for(lambda: client.after_ids)
+        finally:
+            sub.stop()
+        assert client.seed_attempts == 3
+        assert client.after_ids[0] == "7-0"
+
+    def test_shared_per_client(self):
+        client = _FakeStreamClient()
+        try:
+            a = PortfolioRiskGate(redis_client=client)
+            b = PortfolioRiskGate(redis_client=client)
+            assert a._subscription is b._subscription
+            assert a._subscription is get_portfolio_risk_subscription(client)
+            assert a._subscription.running
+        finally:
+            stop_all_subscriptions()
+
+
 # ── Bot gate ─────────────────────────────────────────────────────────
 
 
@@ -72,10 +72,8 @@ def _snapshot_defaults() -> dict:
     }
 
 
-def test_build_tick_output_defaults_missing_adaptive_keys():
-    emitter = TickEmitter(csv_logger=MagicMock())
-    snapshot = _snapshot_defaults()
-    spread_state = SpreadEdgeState(
+def _spread_state() -> SpreadEdgeState:
+    return SpreadEdgeState(
         band_pct=Decimal("0.001"),
         spread_pct=Decimal("0.002"),
         net_edge=Decimal("0.0005"),
@@ -96,7 +94,10 @@ def test_build_tick_output_defaults_missing_adaptive_keys():
             alpha_skew=Decimal("0"),
         ),
     )
-    market = MarketConditions(
+
+
+def _market() -> MarketConditions:
+    return MarketConditions(
         is_high_vol=False,
         bid_p=Decimal("100"),
         ask_p=Decimal("101"),
@@ -109,14 +110,16 @@ def test_build_tick_output_defaults_missing_adaptive_keys():
         side_spread_floor=Decimal("0"),
     )
 
-    out = emitter.build_tick_output(
-        mid=Decimal("100.5"),
+
+def _build(emitter: TickEmitter, snapshot: dict, mid: Decimal = Decimal("100.5")) -> dict:
+    return emitter.build_tick_output(
+        mid=mid,
         regime_name="neutral_low_vol",
         target_base_pct=Decimal("0.5"),
         base_pct=Decimal("0.5"),
         state=GuardState.RUNNING,
-        spread_state=spread_state,
-        market=market,
+        spread_state=_spread_state(),
+        market=_market(),
         equity_quote=Decimal("1000"),
         base_bal=Decimal("0"),
         quote_bal=Decimal("1000"),
@@ -127,6 +130,12 @@ def test_build_tick_output_defaults_missing_adaptive_keys():
         projected_total_quote=Decimal("1000"),
         snapshot=snapshot,
     )
+
+
+def test_build_tick_output_defaults_missing_adaptive_keys():
+    emitter = TickEmitter(csv_logger=MagicMock())
+    snapshot = _snapshot_defaults()
+    out = _build(emitter, snapshot)
     assert out["adaptive_effective_min_edge_pct"] == Decimal("0")
     assert out["adaptive_fill_age_s"] == Decimal("0")
     assert out["adaptive_market_floor_pct"] == Decimal("0")
@@ -135,6 +144,20 @@ def test_build_tick_output_defaults_missing_adaptive_keys():
     assert out["spread_competitiveness_cap_active"] is False
 
 
+def test_build_tick_output_refreshes_one_dict_in_place():
+    emitter = TickEmitter(csv_logger=MagicMock())
+    first = _build(emitter, _snapshot_defaults())
+    first["bot7_extension_key"] = "x"
+    snapshot = _snapshot_defaults()
+    snapshot["fills_count_today"] = 3
+    second = _build(emitter, snapshot, mid=Decimal("101"))
+
+    assert second is first
+    assert second["mid"] == Decimal("101")
+    assert second["fills_count_today"] == 3
+    assert second["bot7_extension_key"] == "x"
+
+
 def test_log_minute_returns_row_once_per_minute():
     csv_logger = MagicMock()
     emitter = TickEmitter(csv_logger=csv_logger)
@@ -149,6 +172,7 @@ def test_log_minute_returns_row_once_per_minute():
             "cancel_per_min": 0,
             "orders_active": 0,
             "tick_duration_ms": 0.0,
+            "pnl_governor_deficit_ratio": Decimal("0.25"),
         }
     )
     pd = {
@@ -194,6 +218,7 @@ def test_log_minute_returns_row_once_per_minute():
     assert row["projected_total_quote"] == "0"
     assert row["history_seed_status"] == "disabled"
     assert row["history_seed_bars"] == "0"
+    assert row["pnl_governor_deficit_ratio"] == "0.25"  # read from the snapshot record, not pd
     assert skipped is None
     emitter.stop()
     csv_logger.log_minute.assert_called_once()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from operator import attrgetter
+from types import SimpleNamespace
+
+import pytest
+
+from controllers.telemetry_mixin import _TICK_SCHEMA, _sanitize_floats
+from controllers.tick_record import TICK_FIELDS, TickRecord, TickSchema
+from scripts.release.run_tick_benchmark import _bench_emit_allocations
+
+
+def test_telemetry_schema_covers_every_tick_field() -> None:
+    planned = {TICK_FIELDS[idx] for idx, _ in _TICK_SCHEMA._plan}
+    # Filled in after refresh by _build_tick_snapshot / _emit_tick_output.
+    assert set(TICK_FIELDS) - planned == {
+        "runtime_family",
+        "kelly_order_quote",
+        "tick_duration_ms",
+        "order_book_stale",
+        "cancel_per_min",
+        "orders_active",
+    }
+
+
+def test_schema_rejects_unknown_fields() -> None:
+    with pytest.raises(ValueError, match="not_a_tick_field"):
+        TickSchema({"not_a_tick_field": attrgetter("x")})
+
+
+def test_record_behaves_like_a_mapping() -> None:
+    schema = TickSchema({"spread_floor_pct": attrgetter("spread"), "bot_mode": attrgetter("mode"), "variant": None})
+    record = TickRecord().refresh(SimpleNamespace(spread=Decimal("0.002"), mode="paper"), schema)
+
+    assert record["spread_floor_pct"] == Decimal("0.002")
+    assert "variant" not in record
+    assert record.get("variant", "n/a") == "n/a"
+    with pytest.raises(KeyError):
+        record["variant"]
+
+    record["variant"] = "a"
+    record["custom_extension_key"] = 1
+    assert len(record) == 4
+    assert record.to_dict() == {
+        "spread_floor_pct": Decimal("0.002"),
+        "bot_mode": "paper",
+        "variant": "a",
+        "custom_extension_key": 1,
+    }
+    del record["bot_mode"]
+    assert "bot_mode" not in record
+
+
+def test_refresh_reuses_record_and_clears_previous_tick() -> None:
+    schema = TickSchema({"spread_floor_pct": attrgetter("spread")})
+    record = TickRecord()
+    first = record.refresh(SimpleNamespace(spread=1), schema)
+    record["variant"] = "a"
+    record["extra"] = True
+
+    second = record.refresh(SimpleNamespace(spread=2), schema)
+
+    assert first is second
+    assert second.to_dict() == {"spread_floor_pct": 2}
+
+
+def test_sanitize_floats_returns_clean_payload_unchanged() -> None:
+    payload = {"a": 1.0, "nested": {"b": [2.0, "x"]}}
+    assert _sanitize_floats(payload) is payload
+
+    dirty = {"a": 1.0, "nested": {"b": [float("nan"), "x"]}, "c": {"d": 3.0}}
+    clean = _sanitize_floats(dirty)
+    assert clean == {"a": 1.0, "nested": {"b": [0.0, "x"]}, "c": {"d": 3.0}}
+    assert clean["c"] is dirty["c"]
+    assert dirty["nested"]["b"][0] != dirty["nested"]["b"][0]  # input left untouched
+
+
+def test_emit_path_reuses_record_and_output_dict() -> None:
+    result = _bench_emit_allocations(50)
+    assert result["fields"] == len(TICK_FIELDS)
+    assert result["processed_dict_reused"] is True
+    assert result["reused_bytes_per_tick"] < result["fresh_bytes_per_tick"]
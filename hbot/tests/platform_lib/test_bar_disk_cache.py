@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from platform_lib.market_data.bar_disk_cache import DiskBarCache
+from platform_lib.market_data.market_history_types import MarketBar, MarketBarKey
+
+_KEY = MarketBarKey("bitget_perpetual", "BTC-USDT", "quote_mid")
+
+
+def _bar(bucket_ms: int, close: str, *, closed: bool = True) -> MarketBar:
+    return MarketBar(
+        bucket_start_ms=bucket_ms,
+        bar_interval_s=60,
+        open=Decimal("100"),
+        high=Decimal("110.25"),
+        low=Decimal("99.125"),
+        close=Decimal(close),
+        volume_base=Decimal("1.5") if bucket_ms % 120_000 == 0 else None,
+        is_closed=closed,
+    )
+
+
+def test_append_only_extends_tail_and_reads_by_end_bucket(tmp_path) -> None:
+    cache = DiskBarCache(tmp_path)
+    assert cache.read(_KEY, 10) == []
+
+    assert cache.append(_KEY, [_bar(ms, "100.1") for ms in range(60_000, 300_001, 60_000)]) == 5
+    assert cache.append(_KEY, [_bar(120_000, "1"), _bar(300_000, "105.75"), _bar(360_000, "0", closed=False)]) == 0
+
+    bars = cache.read(_KEY, 3)
+    assert [bar.bucket_start_ms for bar in bars] == [180_000, 240_000, 300_000]
+    assert bars[-1].close == Decimal("105.75")  # tail bucket replaced in place
+    assert bars[0].volume_base is None and bars[1].volume_base == Decimal("1.5")
+    assert [bar.bucket_start_ms for bar in cache.read(_KEY, 2, end_ms=200_000)] == [120_000, 180_000]
+    assert cache.read(_KEY, 2, end_ms=30_000) == []
+
+
+def test_repeated_bucket_in_one_append_is_written_once(tmp_path) -> None:
+    cache = DiskBarCache(tmp_path)
+    assert cache.append(_KEY, [_bar(60_000, "100")]) == 1
+    assert cache.append(_KEY, [_bar(120_000, "101"), _bar(180_000, "102"), _bar(120_000, "103")]) == 2
+    bars = cache.read(_KEY, 10)
+    assert [bar.bucket_start_ms for bar in bars] == [60_000, 120_000, 180_000]
+    assert bars[1].close == Decimal("103")
+
+
+def test_file_is_compacted_to_max_bars(tmp_path) -> None:
+    cache = DiskBarCache(tmp_path, max_bars=4)
+    cache.append(_KEY, [_bar(ms * 60_000, "100") for ms in range(1, 10)])
+    assert cache.path_for(_KEY).stat().st_size == 4 * 56
+    assert [bar.bucket_start_ms // 60_000 for bar in cache.read(_KEY, 10)] == [6, 7, 8, 9]
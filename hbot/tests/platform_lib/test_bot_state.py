@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from platform_lib.core.bot_state import BotStateMaterializer, BotStateView, CsvTail
+
+_MINUTE_HEADER = "ts,state,equity_quote,mid"
+_FILLS_HEADER = "ts,side,price,amount_base,fee_quote,realized_pnl_quote,is_maker"
+
+
+def _append(path: Path, text: str) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(text)
+
+
+def _bot_dir(data_root: Path, bot: str = "bot1", session: str = "bot1_a") -> Path:
+    log_dir = data_root / bot / "logs" / "epp_v24" / session
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+def test_csv_tail_reads_only_appended_rows(tmp_path: Path) -> None:
+    path = tmp_path / "fills.csv"
+    _append(path, f"{_FILLS_HEADER}\n2026-03-06T21:00:00+00:00,BUY,100,1,0.1,0,True\n")
+    tail = CsvTail(path)
+    assert [r["side"] for r in tail.poll()] == ["BUY"]
+    assert tail.poll() == []
+
+    _append(path, "2026-03-06T21:01:00+00:00,SELL,101,1,0.1,1,False\n2026-03-06T21:02:00+00:00,SE")
+    assert [r["side"] for r in tail.poll()] == ["SELL"]
+    assert tail.rows == 2 and tail.last_row is not None and tail.last_row["price"] == "101"
+
+    _append(path, "LL,102,1,0.1,1,False")
+    assert tail.poll() == []
+    assert tail.rows == 2 and tail.last_row["price"] == "101"  # half-written row is never exposed
+
+    _append(path, "\n")
+    assert [r["price"] for r in tail.poll()] == ["102"]
+    assert tail.last_row["price"] == "102"
+
+    generation = tail.generation
+    path.write_text(f"{_FILLS_HEADER}\n2026-03-06T22:00:00+00:00,BUY,90,1,0,0,True\n", encoding="utf-8")
+    assert [r["price"] for r in tail.poll()] == ["90"]
+    assert tail.generation != generation and tail.rows == 1
+
+
+def test_materializer_publishes_incremental_bot_documents(tmp_path: Path) -> None:
+    data_root = tmp_path / "data"
+    old_dir = _bot_dir(data_root, session="bot1_old")
+    log_dir = _bot_dir(data_root)
+    (data_root / "bot1" / "logs" / "recovery").mkdir(parents=True)
+    _append(old_dir / "minute.csv", f"{_MINUTE_HEADER}\n2026-03-05T10:00:00+00:00,running,900,1\n")
+    (old_dir / "daily_state.json").write_text(json.dumps({"equity_open": 1}), encoding="utf-8")
+    _append(log_dir / "minute.csv", f"{_MINUTE_HEADER}\n2026-03-06T21:00:00+00:00,running,1000,100\n")
+    _append(log_dir / "fills.csv", f"{_FILLS_HEADER}\n2026-03-06T21:00:10+00:00,BUY,100,2,0.1,0.5,True\n")
+    (log_dir / "daily_state_20260306.json").write_text(json.dumps({"equity_open": 990}), encoding="utf-8")
+    (log_dir / "paper_desk_v2.json").write_text(json.dumps({"positions": {}}), encoding="utf-8")
+    (data_root / "bot1" / "logs" / "recovery" / "open_orders_latest.json").write_text(
+        json.dumps({"orders": [{"id": "o1"}]}), encoding="utf-8",
+    )
+    out_path = tmp_path / "reports" / "bot_state" / "latest.json"
+    materializer = BotStateMaterializer(data_root, out_path)
+
+    assert materializer.run_once() is True
+    view = BotStateView(out_path)
+    doc = view.get("bot1")
+    assert doc is not None
+    assert doc["log_dir"] == str(log_dir)
+    assert doc["minute"]["equity_quote"] == "1000"
+    assert doc["daily_state"] == {"equity_open": 990}
+    assert doc["open_orders"] == [{"id": "o1"}]
+    assert doc["fill_stats"]["total"] == 1 and doc["fill_stats"]["buy_notional"] == 200.0
+
+    assert materializer.run_once() is False  # nothing changed, heartbeat not due
+
+    _append(log_dir / "fills.csv", "2026-03-06T21:00:20+00:00,SELL,101,1,0.1,1,False\n")
+    assert materializer.run_once() is True
+    stats = view.get("bot1")["fill_stats"]
+    assert (stats["total"], stats["sells"], stats["total_realized_pnl"]) == (2, 1, 1.5)
+
+
+def test_view_ignores_stale_or_foreign_documents(tmp_path: Path) -> None:
+    path = tmp_path / "latest.json"
+    assert BotStateView(path).bots() == {}
+
+    path.write_text(json.dumps({"schema_version": 1, "generated_epoch": time.time(), "bots": {"b": {}}}))
+    view = BotStateView(path, max_age_s=60)
+    assert view.get("b") == {}
+
+    path.write_text(json.dumps({"schema_version": 1, "generated_epoch": time.time() - 600, "bots": {"b": {}}}))
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    assert view.get("b") is None
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from platform_lib.core.event_index import EventFileIndex, index_path_for
+from platform_lib.core.event_store_reader import count_bot_fill_events, load_bot_snapshot_windows
+
+
+def _event(minute: int, event_type: str, bot: str, **payload) -> dict[str, object]:
+    return {
+        "event_id": f"{bot}-{event_type}-{minute}",
+        "event_type": event_type,
+        "instance_name": bot,
+        "ts_utc": f"2026-03-01T10:{minute:02d}:05Z",
+        "payload": payload,
+    }
+
+
+def _append(path: Path, rows: list[dict[str, object]], *, terminate: bool = True) -> None:
+    text = "\n".join(json.dumps(r) for r in rows)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(text + ("\n" if terminate else ""))
+
+
+def _rows(n: int) -> list[dict[str, object]]:
+    types = ["bot_minute_snapshot", "order_filled", "bot_fill", "strategy_signal"]
+    return [_event(i % 60, types[i % 4], f"bot{i % 3 + 1}", seq=i) for i in range(n)]
+
+
+def test_counts_and_scans_match_full_read(tmp_path: Path) -> None:
+    path = tmp_path / "events_20260301.jsonl"
+    rows = _rows(400)
+    _append(path, rows)
+
+    index = EventFileIndex(path)
+    fills = {"order_filled", "bot_fill"}
+    expected = [r for r in rows if r["event_type"] in fills and r["instance_name"] == "bot2"]
+    assert index.count(event_types=fills, instance_name="bot2") == len(expected)
+    assert list(index.scan(event_types=fills, instance_name="bot2")) == expected
+    assert list(index.scan(event_types=fills, instance_name="bot2", reverse=True)) == expected[::-1]
+
+    in_range = [r for r in rows if "2026-03-01T10:10" <= str(r["ts_utc"])[:16] <= "2026-03-01T10:19"]
+    assert list(index.scan(start_minute="2026-03-01T10:10", end_minute="2026-03-01T10:19")) == in_range
+
+
+def test_refresh_is_incremental_and_persisted(tmp_path: Path) -> None:
+    path = tmp_path / "events_20260301.jsonl"
+    _append(path, _rows(50))
+    index = EventFileIndex(path)
+    assert index.count() == 50
+    first_end = index.indexed_bytes
+
+    # Partial trailing line is visible to queries but not indexed.
+    _append(path, [_event(1, "bot_fill", "bot1")], terminate=False)
+    assert index.count(event_types={"bot_fill"}, instance_name="bot1") == 1 + sum(
+        1 for r in _rows(50) if r["event_type"] == "bot_fill" and r["instance_name"] == "bot1"
+    )
+    assert index.indexed_bytes == first_end
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("\n")
+    _append(path, _rows(10))
+    assert index.count() == 61
+
+    reloaded = EventFileIndex(path)
+    reloaded.refresh()
+    assert reloaded.indexed_bytes == index.indexed_bytes
+    assert sorted(reloaded.keys()) == sorted(index.keys())
+    assert reloaded.count() == 61
+
+
+def test_duplicate_sidecar_appends_are_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "events_20260301.jsonl"
+    _append(path, _rows(20))
+    EventFileIndex(path).refresh()
+    _append(path, _rows(5))
+    # Two processes racing to extend the same sidecar.
+    EventFileIndex(path).refresh()
+    EventFileIndex(path).refresh()
+    assert EventFileIndex(path).count() == 25
+
+
+def test_replaced_file_triggers_rebuild(tmp_path: Path) -> None:
+    path = tmp_path / "events_20260301.jsonl"
+    _append(path, _rows(30))
+    EventFileIndex(path).refresh()
+
+    path.write_text("", encoding="utf-8")
+    _append(path, [_event(5, "bot_fill", "bot9")] * 40)
+    index = EventFileIndex(path)
+    assert index.count() == 40
+    assert index.count(instance_name="bot9") == 40
+    assert index_path_for(path).read_text(encoding="utf-8").count("\n") == 41
+
+
+def test_reader_helpers_use_index(tmp_path: Path) -> None:
+    path = tmp_path / "events_20260301.jsonl"
+    _append(path, [
+        _event(1, "bot_minute_snapshot", "bot1", equity_quote=100),
+        _event(2, "order_filled", "bot1"),
+        _event(2, "BOT_FILL", "bot1"),
+        _event(3, "bot_minute_snapshot", "bot1", equity_quote=101),
+        _event(3, "bot_fill", "bot2"),
+    ])
+    assert count_bot_fill_events(tmp_path, "bot1") == 2
+    assert count_bot_fill_events(tmp_path, "bot1", day_utc="2026-03-02") == 0
+    windows = load_bot_snapshot_windows(tmp_path, max_snapshots_per_bot=2)
+    assert [w["equity_quote"] for w in windows["bot1"]] == [101, 100]
+    assert index_path_for(path).exists()
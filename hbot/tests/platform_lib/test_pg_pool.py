@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+from platform_lib.core.pg_pool import PgConnectionPool, PoolTimeoutError, TtlResultCache
+
+
+class _FakeCursor:
+    def __init__(self, conn: _FakeConnection) -> None:
+        self._conn = conn
+        self.description = [("x",)]
+
+    def __enter__(self) -> _FakeCursor:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        return None
+
+    def execute(self, sql: str, params=None, prepare: bool | None = None) -> None:
+        if self._conn.fail_next:
+            self._conn.fail_next = False
+            self._conn.broken = True
+            raise RuntimeError("connection lost")
+        self._conn.executed.append((sql, prepare))
+
+    def fetchall(self) -> list[tuple[int]]:
+        return [(1,)]
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+        self.broken = False
+        self.fail_next = False
+        self.executed: list[tuple[str, bool | None]] = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_pool_reuses_connections_and_discards_broken_ones() -> None:
+    made: list[_FakeConnection] = []
+
+    def _connect() -> _FakeConnection:
+        made.append(_FakeConnection())
+        return made[-1]
+
+    pool = PgConnectionPool(_connect, max_size=2, acquire_timeout_s=0.05)
+    assert pool.fetch_dicts("SELECT 1 AS x") == [{"x": 1}]
+    assert pool.fetch_rows("SELECT 1 AS x") == [(1,)]
+    assert len(made) == 1
+    assert made[0].executed == [("SELECT 1 AS x", True), ("SELECT 1 AS x", True)]
+
+    made[0].fail_next = True
+    with pytest.raises(RuntimeError):
+        pool.fetch_rows("SELECT 1 AS x")
+    assert made[0].closed
+    assert pool.fetch_rows("SELECT 1 AS x") == [(1,)]
+    assert len(made) == 2
+    assert pool.metrics()["open"] == 1
+
+
+def test_pool_bounds_concurrent_checkouts() -> None:
+    pool = PgConnectionPool(_FakeConnection, max_size=1, acquire_timeout_s=0.05)
+    with pool.connection(), pytest.raises(PoolTimeoutError), pool.connection():
+        pass
+    with pool.connection() as conn:
+        assert isinstance(conn, _FakeConnection)
+
+
+def test_ttl_result_cache_expires_and_skips_none() -> None:
+    now = [0.0]
+    cache = TtlResultCache(clock=lambda: now[0])
+    calls: list[int] = []
+
+    def _load() -> list[int]:
+        calls.append(1)
+        return [len(calls)]
+
+    key = TtlResultCache.key("SELECT 1", {"pairs": ["BTC-USDT"], "limit": 5})
+    assert key == TtlResultCache.key("SELECT 1", {"limit": 5, "pairs": ["BTC-USDT"]})
+    assert cache.get_or_load(key, 2.0, _load) == [1]
+    now[0] = 1.0
+    assert cache.get_or_load(key, 2.0, _load) == [1]
+    now[0] = 3.0
+    assert cache.get_or_load(key, 2.0, _load) == [2]
+
+    assert cache.get_or_load("empty", 2.0, lambda: None) is None
+    assert cache.get_or_load("empty", 2.0, lambda: [9]) == [9]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts.release.promotion_gate_dag import GateCache, GateExecutor, GateSpec
+
+
+def test_dag_runs_independent_gates_concurrently_and_respects_deps() -> None:
+    events: list[str] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _independent(name: str) -> tuple[int, str]:
+        barrier.wait()  # deadlocks unless both independent gates run at the same time
+        with lock:
+            events.append(name)
+        return 0, name
+
+    def _downstream() -> tuple[int, str]:
+        with lock:
+            events.append("c")
+        return 1, "c failed"
+
+    gates = GateExecutor(
+        [
+            GateSpec("c", _downstream, deps=("a", "b", "disabled")),
+            GateSpec("a", _independent, ("a",)),
+            GateSpec("b", _independent, ("b",)),
+        ]
+    )
+    results = gates.run_all(max_workers=2)
+
+    assert sorted(events[:2]) == ["a", "b"]
+    assert events[2] == "c"
+    assert gates.result("c") == (1, "c failed")
+    assert results["a"].rc == 0
+    assert gates.summary()["mode"] == "dag"
+
+
+def test_sequential_mode_runs_lazily_in_call_order() -> None:
+    calls: list[str] = []
+
+    def _gate(name: str) -> tuple[int, str]:
+        calls.append(name)
+        return 0, name
+
+    gates = GateExecutor([GateSpec("a", _gate, ("a",)), GateSpec("b", _gate, ("b",), deps=("a",))])
+    assert calls == []
+    assert gates.result("b") == (0, "b")
+    assert calls == ["a", "b"]
+    gates.result("a")
+    assert calls == ["a", "b"]
+
+
+def test_cycle_is_rejected() -> None:
+    noop = lambda: (0, "")  # noqa: E731
+    with pytest.raises(ValueError, match="cycle"):
+        GateExecutor([GateSpec("a", noop, deps=("b",)), GateSpec("b", noop, deps=("a",))])
+
+
+def test_runner_exception_becomes_rc2() -> None:
+    def _boom() -> tuple[int, str]:
+        raise RuntimeError("boom")
+
+    gates = GateExecutor([GateSpec("a", _boom)])
+    gates.run_all(max_workers=1)
+    assert gates.result("a") == (2, "boom")
+
+
+def test_cache_skips_unchanged_gates_and_restores_evidence(tmp_path: Path) -> None:
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "policy.json").write_text('{"v": 1}', encoding="utf-8")
+    evidence = tmp_path / "reports" / "latest.json"
+    calls: list[float] = []
+
+    def _check(root: Path) -> tuple[int, str]:
+        calls.append(time.time())
+        evidence.parent.mkdir(parents=True, exist_ok=True)
+        evidence.write_text(f'{{"status": "pass", "run": {len(calls)}}}', encoding="utf-8")
+        return 0, "ok"
+
+    def _run() -> tuple[int, str]:
+        spec = GateSpec("policy", _check, (tmp_path,), inputs=("config",), outputs=("reports/latest.json",))
+        gates = GateExecutor([spec], cache=GateCache(tmp_path, tmp_path / "cache"))
+        gates.run_all(max_workers=1)
+        return gates.result("policy")
+
+    assert _run() == (0, "ok")
+    first = evidence.read_text(encoding="utf-8")
+
+    evidence.write_text("clobbered", encoding="utf-8")
+    rc, msg = _run()
+    assert rc == 0 and msg.startswith("[cached")
+    assert len(calls) == 1
+    assert evidence.read_text(encoding="utf-8") == first
+
+    (tmp_path / "config" / "policy.json").write_text('{"v": 2}', encoding="utf-8")
+    assert _run() == (0, "ok")
+    assert len(calls) == 2
+
+
+def test_failing_gate_is_never_cached(tmp_path: Path) -> None:
+    (tmp_path / "input.txt").write_text("x", encoding="utf-8")
+    calls: list[int] = []
+
+    def _fail() -> tuple[int, str]:
+        calls.append(1)
+        return 1, "nope"
+
+    for _ in range(2):
+        spec = GateSpec("lint", _fail, inputs=("input.txt",))
+        gates = GateExecutor([spec], cache=GateCache(tmp_path, tmp_path / "cache"))
+        gates.run_all(max_workers=1)
+        assert gates.result("lint") == (1, "nope")
+    assert len(calls) == 2
+
+
+def test_deferred_gate_waits_for_its_call_site_and_dependencies() -> None:
+    calls: list[str] = []
+
+    def _gate(name: str) -> tuple[int, str]:
+        calls.append(name)
+        return 0, name
+
+    gates = GateExecutor(
+        [
+            GateSpec("a", _gate, ("a",)),
+            GateSpec("scan", _gate, ("scan",), deps=("a", "b"), deferred=True),
+            GateSpec("b", _gate, ("b",)),
+        ]
+    )
+    gates.run_all(max_workers=2)
+    assert sorted(calls) == ["a", "b"]
+    calls.append("inline step")
+    assert gates.result("scan") == (0, "scan")
+    assert calls[-2:] == ["inline step", "scan"]
+
+
+def test_gate_cannot_depend_on_deferred_gate() -> None:
+    noop = lambda: (0, "")  # noqa: E731
+    with pytest.raises(ValueError, match="deferred"):
+        GateExecutor([GateSpec("a", noop, deferred=True), GateSpec("b", noop, deps=("a",))])
+
+
+def test_fingerprint_change_invalidates_cache(tmp_path: Path) -> None:
+    (tmp_path / "input.txt").write_text("x", encoding="utf-8")
+    calls: list[int] = []
+    image = {"id": "sha256:aaa"}
+
+    def _ok() -> tuple[int, str]:
+        calls.append(1)
+        return 0, "ok"
+
+    def _run() -> None:
+        spec = GateSpec("tests", _ok, inputs=("input.txt",), fingerprint=lambda: dict(image))
+        gates = GateExecutor([spec], cache=GateCache(tmp_path, tmp_path / "cache"))
+        gates.run_all(max_workers=1)
+
+    _run()
+    _run()
+    assert len(calls) == 1
+    image["id"] = "sha256:bbb"
+    _run()
+    assert len(calls) == 2
@@ -13,6 +13,7 @@ def test_benchmark_produces_artifact(tmp_path: Path) -> None:
     assert report["total"]["p99_ms"] > 0
     artifact = tmp_path / "reports" / "verification" / "tick_benchmark_latest.json"
     assert artifact.exists()
+    assert report["emit_allocations"]["bytes_saved_per_tick"] > 0
     for key in ("snapshot_build", "spread_compute", "json_serialize", "csv_format", "total"):
         assert key in report
         assert report[key]["samples"] == 50
@@ -491,3 +491,78 @@ def test_default_fills_summary_is_reused_across_snapshot_reads(tmp_path) -> None
     assert snapshot.minute_rows_total == 1.0
     assert exporter.fills_scan_calls == 1
     assert exporter.minute_scan_calls == 1
+
+
+def test_fills_summary_folds_only_appended_complete_rows(tmp_path) -> None:
+    minute_file = tmp_path / "bot1" / "logs" / "epp_v24" / "bot1_a" / "minute.csv"
+    fills_file = minute_file.parent / "fills.csv"
+    _write_minute_csv(minute_file, include_net=True)
+    header = "ts,side,notional_quote,fee_quote,price,amount_base,realized_pnl_quote,is_maker,mid_ref,expected_spread_pct,adverse_drift_30s"
+    rows = [
+        "2026-02-27T22:00:00+00:00,buy,100,0.1,100,1,1.0,true,100,0.001,0.0",
+        "2026-02-27T22:01:00+00:00,sell,101,0.1,101,1,-0.5,false,101.2,0.001,0.0002",
+        "2026-02-27T22:02:00+00:00,sell,102,0.1,102,1,2.0,true,101.9,0.0,0.0",
+    ]
+    fills_file.write_text(header + "\n" + rows[0] + "\n", encoding="utf-8")
+
+    exporter = BotMetricsExporter(data_root=tmp_path)
+    assert exporter._scan_fills_file(fills_file).row_count == 1
+
+    with fills_file.open("a", encoding="utf-8") as fp:
+        fp.write(rows[1] + "\n" + rows[2][:20])  # writer is mid-append on the last row
+    partial = exporter._scan_fills_file(fills_file)
+    assert partial.row_count == 2
+    assert partial.fill_stats.last_fill_side == "sell"
+    assert partial.fill_stats.total_realized_pnl == 0.5
+
+    with fills_file.open("a", encoding="utf-8") as fp:
+        fp.write(rows[2][20:] + "\n")
+    incremental = exporter._scan_fills_file(fills_file)
+    fresh = BotMetricsExporter(data_root=tmp_path)._scan_fills_file(fills_file)
+    assert incremental == fresh
+    assert incremental.row_count == 3
+    assert incremental.fill_stats.trade_median_win_quote == 1.5
+    assert [f["pnl"] for f in incremental.recent_fills] == [2.0, -0.5, 1.0]
+
+
+def test_folds_are_evicted_for_removed_or_idle_files(tmp_path, monkeypatch) -> None:
+    import shutil
+
+    from services import bot_metrics_exporter as bme
+
+    kept = tmp_path / "bot1" / "logs" / "epp_v24" / "bot1_a" / "minute.csv"
+    removed = tmp_path / "bot2" / "logs" / "epp_v24" / "bot2_a" / "minute.csv"
+    for minute_file in (kept, removed):
+        _write_minute_csv(minute_file, include_net=True)
+        (minute_file.parent / "fills.csv").write_text(
+            "ts,side,notional_quote,fee_quote,price,amount_base,realized_pnl_quote\n"
+            "2026-02-27T22:00:00+00:00,buy,100,0.1,100,1,1.0\n",
+            encoding="utf-8",
+        )
+
+    exporter = BotMetricsExporter(data_root=tmp_path)
+    assert len(exporter.collect()) == 2
+    assert set(exporter._minute_folds) == {kept, removed}
+
+    shutil.rmtree(tmp_path / "bot2")
+    assert len(exporter.collect()) == 1
+    assert set(exporter._minute_folds) == {kept}
+    assert set(exporter._fills_folds) == {kept.parent / "fills.csv"}
+    assert all(str(tmp_path / "bot2") not in path for _, path in exporter._file_result_cache)
+
+    monkeypatch.setattr(bme, "_FOLD_IDLE_S", -1.0)
+    exporter._prune_folds()
+    assert exporter._minute_folds == {}
+    assert exporter._fills_folds == {}
+
+
+def test_minute_fold_drops_day_buckets_past_the_month_window(tmp_path) -> None:
+    from services.bot_metrics_exporter import _DAY_PNL_KEEP_DAYS, _MinuteFold
+
+    fold = _MinuteFold(tmp_path / "minute.csv")
+    for day in range(1, 91):
+        ts = datetime(2026, 1, 1, tzinfo=UTC).timestamp() + day * 86_400
+        fold._fold({"ts": datetime.fromtimestamp(ts, UTC).isoformat(), "realized_pnl_today_quote": "1"})
+    assert len(fold.day_pnl) == _DAY_PNL_KEEP_DAYS + 1
+    history = fold.history(fold.last_dt)
+    assert history.realized_pnl_month_quote == 31.0
@@ -37,3 +37,34 @@ def test_build_snapshot_clamps_future_minute_and_fill_ages(tmp_path: Path, monke
 
     assert snapshot["minute_age_s"] == 0.0
     assert snapshot["fill_age_s"] == 0.0
+
+
+def test_build_snapshot_from_bot_state_matches_file_scan(tmp_path: Path, monkeypatch) -> None:
+    from platform_lib.core.bot_state import BotStateMaterializer, BotStateView
+
+    data_root = tmp_path / "data"
+    reports_root = tmp_path / "reports"
+    log_dir = data_root / "bot1" / "logs" / "epp_v24" / "bot1_a"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    (log_dir / "minute.csv").write_text(
+        "ts,state,regime,equity_quote\n2026-03-06T20:59:05+00:00,running,up,1000\n", encoding="utf-8",
+    )
+    (log_dir / "fills.csv").write_text(
+        "ts,side,price,amount_base,fee_quote,realized_pnl_quote,is_maker\n"
+        "2026-03-06T20:58:10+00:00,BUY,68000,0.001,0.01,0.02,True\n"
+        "2026-03-06T20:58:40+00:00,SELL,68010,0.001,0.01,0.03,False\n",
+        encoding="utf-8",
+    )
+    (log_dir / "daily_state.json").write_text('{"equity_open": 990}', encoding="utf-8")
+    monkeypatch.setattr(snapshot_service, "_REPORTS_ROOT", reports_root)
+    monkeypatch.setattr(snapshot_service, "_epoch_now", lambda: 1_772_830_800.0)
+
+    out_path = reports_root / "bot_state" / "latest.json"
+    BotStateMaterializer(data_root, out_path).run_once()
+    bot_state = BotStateView(out_path).get("bot1")
+
+    from_files = snapshot_service.build_snapshot("bot1", data_root / "bot1")
+    from_state = snapshot_service.build_snapshot("bot1", data_root / "bot1", bot_state)
+
+    for key in ("minute", "fill_stats", "daily_state", "open_orders", "portfolio", "minute_age_s", "fill_age_s"):
+        assert from_state[key] == from_files[key], key
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from platform_lib.contracts.event_schemas import AuditEvent, BotFillEvent, MarketQuoteEvent
-from services.hb_bridge.publisher import HBEventPublisher
+from services.hb_bridge.publisher import QUEUED_ENTRY_ID, HBEventPublisher
 
 
 class _FakeRedisClient:
@@ -95,3 +95,27 @@ def test_publish_audit_drops_payload_when_identity_missing() -> None:
 
     assert result is None
     assert redis.calls == []
+
+
+def test_publish_queues_on_batching_producer() -> None:
+    redis = _FakeRedisClient()
+    queued: list[tuple[str, dict]] = []
+
+    class _Batcher:
+        def xadd(self, stream: str, payload: dict) -> bool:
+            queued.append((stream, payload))
+            return len(queued) < 2
+
+    publisher = HBEventPublisher(redis_client=redis, producer="hb_test", batcher=_Batcher())  # type: ignore[arg-type]
+    event = MarketQuoteEvent(
+        producer="",
+        connector_name="bitget_perpetual",
+        trading_pair="BTC-USDT",
+        best_bid=9_999.0,
+        best_ask=10_001.0,
+    )
+
+    assert publisher.publish_market_quote(event) == QUEUED_ENTRY_ID
+    assert publisher.publish_market_quote(event) is None  # buffer full, dropped
+    assert redis.calls == []
+    assert queued[0][1]["producer"] == "hb_test"
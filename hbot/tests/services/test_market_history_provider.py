@@ -195,3 +195,99 @@ def test_seed_price_buffer_empty_is_noop() -> None:
 
     assert len(buffer.bars) == 0
     assert status.status == "empty"
+
+
+def test_db_reader_extends_cached_tail_incrementally(monkeypatch) -> None:
+    from platform_lib.market_data.bar_tail_cache import IncrementalBarCache
+
+    clock = [0.0]
+    stored = [_bar(ms, "100", "101", "99", "100") for ms in range(60_000, 600_001, 60_000)]
+    calls: list[tuple[int | None, int | None, int]] = []
+    provider = MarketHistoryProviderImpl(db_bar_cache=IncrementalBarCache(ttl_s=5.0, clock=lambda: clock[0]))
+
+    def _fetch(_key, _pairs, since_ms, end_ms, limit):
+        calls.append((since_ms, end_ms, limit))
+        rows = [bar for bar in stored if (since_ms is None or bar.bucket_start_ms >= since_ms)]
+        rows = [bar for bar in rows if end_ms is None or bar.bucket_start_ms <= end_ms]
+        return rows[-limit:]
+
+    monkeypatch.setattr(provider, "_fetch_db_bars", _fetch)
+    key = MarketBarKey("bitget_perpetual", "BTC-USDT", "quote_mid")
+
+    first = provider._read_bars_from_db(key, 60, 5, 600_000, True)
+    assert [bar.bucket_start_ms for bar in first] == [360_000, 420_000, 480_000, 540_000, 600_000]
+    assert calls == [(None, 600_000, 5)]
+
+    assert provider._read_bars_from_db(key, 60, 5, 600_000, True) == first
+    assert len(calls) == 1  # served from cache within the TTL
+
+    stored.append(_bar(660_000, "100", "103", "99", "102"))
+    clock[0] = 6.0
+    bars = provider._read_bars_from_db(key, 60, 5, 660_000, True)
+    assert calls[-1][0] == 600_000  # only the tail onwards was fetched
+    assert [bar.bucket_start_ms for bar in bars] == [420_000, 480_000, 540_000, 600_000, 660_000]
+
+    assert [bar.bucket_start_ms for bar in provider._read_bars_from_db(key, 60, 3, 540_000, True)] == [
+        420_000, 480_000, 540_000,
+    ]
+    assert len(calls) == 2
+
+
+def test_bar_cache_drops_cached_bars_older_than_since_ms() -> None:
+    from platform_lib.market_data.bar_tail_cache import IncrementalBarCache
+
+    clock = [0.0]
+    stored = [_bar(ms, "100", "101", "99", "100") for ms in range(60_000, 600_001, 60_000)]
+    calls: list[int] = []
+
+    def _fetch(since_ms, end_ms, limit):
+        # Mimics the SQL lookback predicate: nothing before 300_000 exists.
+        calls.append(limit)
+        rows = [bar for bar in stored if bar.bucket_start_ms >= 300_000]
+        rows = [bar for bar in rows if since_ms is None or bar.bucket_start_ms >= since_ms]
+        return rows[-limit:]
+
+    cache = IncrementalBarCache(ttl_s=5.0, clock=lambda: clock[0])
+    assert len(cache.get("k", 8, None, _fetch, since_ms=300_000)) == 6
+    assert len(cache.get("k", 8, None, _fetch, since_ms=300_000)) == 6
+    assert calls == [8]  # a short full fetch is the whole answer; no refetch
+
+    # The lookback window slides on; older cached bars are no longer returned.
+    clock[0] = 6.0
+    bars = cache.get("k", 8, None, _fetch, since_ms=420_000)
+    assert [bar.bucket_start_ms for bar in bars] == [420_000, 480_000, 540_000, 600_000]
+    assert len(calls) == 2  # one incremental tail fetch
+
+
+def test_seed_price_buffer_reads_disk_cache_and_fetches_only_delta(tmp_path) -> None:
+    from platform_lib.market_data.bar_disk_cache import DiskBarCache
+
+    stored = [_bar(ms, "100", "101", "99", "100.5") for ms in range(60_000, 600_001, 60_000)]
+    calls: list[int] = []
+
+    def _db(_key, _interval, limit, end_ms, _closed):
+        calls.append(limit)
+        return [bar for bar in stored if bar.bucket_start_ms <= end_ms][-limit:]
+
+    key = MarketBarKey("bitget_perpetual", "BTC-USDT", "quote_mid")
+    cache = DiskBarCache(tmp_path)
+    provider = MarketHistoryProviderImpl(db_reader=_db, disk_cache=cache)
+
+    status = provider.seed_price_buffer(PriceBuffer(), key, bars_needed=5, now_ms=660_000)
+    assert calls == [5]
+    assert status.status == "fresh"
+    assert cache.tail_ms(key) == 600_000
+
+    # A second bot starting in the same minute is served from disk alone.
+    restarted = MarketHistoryProviderImpl(db_reader=_db, disk_cache=DiskBarCache(tmp_path))
+    buffer = PriceBuffer()
+    status = restarted.seed_price_buffer(buffer, key, bars_needed=5, now_ms=660_000)
+    assert calls == [5]
+    assert status.source_used == "disk_cache"
+    assert [bar.close for bar in buffer.bars][-1] == Decimal("100.5")
+
+    stored.extend(_bar(ms, "100", "104", "99", "103") for ms in (660_000, 720_000))
+    status = restarted.seed_price_buffer(PriceBuffer(), key, bars_needed=5, now_ms=780_000)
+    assert calls == [5, 3]  # the cached tail plus the two bars closed since
+    assert status.source_used == "disk_cache+db_v2"
+    assert [bar.bucket_start_ms for bar in cache.read(key, 3)] == [600_000, 660_000, 720_000]
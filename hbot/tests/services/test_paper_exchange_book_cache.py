@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from services.paper_exchange_service.desk_service import (
+    ServiceSettings,
+    TenantRouter,
+    _process_market_row,
+)
+from services.paper_exchange_service.redis_feed import SharedBookCache
+from simulation.types import InstrumentId
+
+
+def _row(sequence: int, bid: float = 100.0) -> dict[str, object]:
+    return {
+        "event_type": "market_depth_snapshot",
+        "event_id": f"md-{sequence}",
+        "producer": "market_data_service",
+        "instance_name": "",
+        "connector_name": "bitget_perpetual",
+        "trading_pair": "BTC-USDT",
+        "timestamp_ms": 1_700_000_000_000,
+        "market_sequence": sequence,
+        "bids": [{"price": bid, "size": 2.0}, {"price": bid - 1, "size": 3.0}],
+        "asks": [{"price": bid + 1, "size": 1.5}],
+    }
+
+
+def test_market_row_shares_one_snapshot_across_tenants(tmp_path: Path) -> None:
+    settings = ServiceSettings(state_file_dir=str(tmp_path))
+    router = TenantRouter(settings)
+    tenants = [router.get_or_create(f"bot{i}") for i in range(3)]
+    cache = SharedBookCache()
+    pairs_data: dict[str, dict[str, object]] = {}
+
+    _process_market_row(_row(7), router, pairs_data, settings, cache)
+    iid = InstrumentId(venue="bitget", trading_pair="BTC-USDT", instrument_type="perp")
+    books = [t.feed.get_book(iid) for t in tenants]
+    assert books[0] is not None
+    assert all(book is books[0] for book in books)
+    assert pairs_data["*::bitget_perpetual::BTC-USDT"]["mid_price"] == 100.5
+
+    # A re-delivered row with the same sequence reuses the cached snapshot.
+    _process_market_row(_row(7, bid=200.0), router, pairs_data, settings, cache)
+    assert tenants[1].feed.get_book(iid) is books[0]
+    assert cache.metrics()["hits"] == 1
+
+    _process_market_row(_row(8, bid=200.0), router, pairs_data, settings, cache)
+    assert tenants[2].feed.get_mid_price(iid) == 200.5
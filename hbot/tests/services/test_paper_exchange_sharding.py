@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from collections import Counter
+from multiprocessing import Pipe
+from pathlib import Path
+
+from services.paper_exchange_service.desk_service import (
+    ServiceSettings,
+    TenantRouter,
+    _handle_command,
+)
+from services.paper_exchange_service.sharding import (
+    ShardCoordinator,
+    ShardRing,
+    ShardWorkerControl,
+    _Worker,
+    shard_stream,
+)
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.streams: dict[str, list[dict[str, object]]] = {}
+        self.acked: list[str] = []
+
+    def create_group(self, *_args, **_kwargs) -> None:
+        return None
+
+    def xadd(self, stream: str, payload: dict[str, object], maxlen: int | None = None) -> str:
+        self.streams.setdefault(stream, []).append(payload)
+        return f"{len(self.streams[stream])}-0"
+
+    def ack_many(self, _stream: str, _group: str, entry_ids: list[str]) -> None:
+        self.acked.extend(entry_ids)
+
+    def read_group(self, **_kwargs) -> list[tuple[str, dict[str, object]]]:
+        return []
+
+    def drain(self, stream: str) -> list[dict[str, object]]:
+        return self.streams.pop(stream, [])
+
+
+class _FakeProcess:
+    def __init__(self) -> None:
+        self.running = True
+        self.joins = 0
+        self.terminated = False
+
+    def is_alive(self) -> bool:
+        return self.running
+
+    def join(self, _timeout: float | None = None) -> None:
+        self.joins += 1
+
+    def terminate(self) -> None:
+        self.terminated = True
+        self.running = False
+
+
+class _Cluster:
+    """Coordinator plus in-process workers; a respawn starts with an empty router."""
+
+    def __init__(self, settings: ServiceSettings, client: _FakeClient) -> None:
+        self.settings = settings
+        self.client = client
+        self.routers: dict[int, TenantRouter] = {}
+        self.controls: dict[int, ShardWorkerControl] = {}
+        self.processes: dict[int, _FakeProcess] = {}
+        self.coordinator = ShardCoordinator(settings, client, spawn=self._spawn)
+        self.coordinator.start()
+
+    def _spawn(self, _settings: ServiceSettings, shard: int) -> _Worker:
+        parent, child = Pipe()
+        self.routers[shard] = TenantRouter(self.settings)
+        self.controls[shard] = ShardWorkerControl(shard, child)
+        self.processes[shard] = _FakeProcess()
+        return _Worker(shard=shard, conn=parent, process=self.processes[shard])
+
+    def run_worker(self, shard: int) -> None:
+        """One iteration of a worker loop: control pipe, then its command stream."""
+        self.controls[shard].poll(self.routers[shard])
+        for payload in self.client.drain(shard_stream(self.settings.command_stream, shard)):
+            if self.controls[shard].is_control(payload):
+                self.controls[shard].handle_command(payload, self.routers[shard])
+            else:
+                _handle_command(payload, self.routers[shard], self.client, self.settings)
+
+    def expire_migrations(self) -> None:
+        for migration in self.coordinator._migrations.values():
+            migration.deadline = 0.0
+
+
+def _submit(instance_name: str, price: float = 50_000.0) -> dict[str, object]:
+    return {
+        "command": "submit_order",
+        "instance_name": instance_name,
+        "connector_name": "bitget_perpetual",
+        "trading_pair": "BTC-USDT",
+        "side": "buy",
+        "order_type": "limit",
+        "amount_base": 0.001,
+        "price": price,
+        "event_id": f"cmd-{instance_name}-{price}",
+    }
+
+
+def test_ring_is_stable_and_moves_few_tenants_on_resize() -> None:
+    names = [f"bot{i}" for i in range(400)]
+    ring4 = ShardRing(4)
+    assert [ring4.shard_for(n) for n in names] == [ShardRing(4).shard_for(n.upper()) for n in names]
+    assert min(Counter(ring4.shard_for(n) for n in names).values()) > 40
+
+    ring5 = ShardRing(5)
+    moved = [n for n in names if ring4.shard_for(n) != ring5.shard_for(n)]
+    assert all(ring5.shard_for(n) == 4 for n in moved)
+    assert len(moved) < len(names) // 3
+
+
+def test_rebalance_hands_open_orders_to_new_shard(tmp_path: Path) -> None:
+    settings = ServiceSettings(state_file_dir=str(tmp_path), shard_count=1)
+    client = _FakeClient()
+    cluster = _Cluster(settings, client)
+    coordinator, routers, _run_worker = cluster.coordinator, cluster.routers, cluster.run_worker
+    assert coordinator.route_command("1-0", _submit("bot1")) is True
+    _run_worker(0)
+    desk = routers[0].get("bot1").desk
+    assert len(desk.export_handoff()["engines"]["bitget:BTC-USDT:perp"]["orders"]) == 1
+    reserved_before = desk.portfolio.reserved_balances()
+    assert reserved_before
+
+    coordinator.apply_plan(2, pins={"bot1": 1})
+    assert coordinator.migrating() == {"bot1"}
+    assert coordinator.route_command("2-0", _submit("bot1", 49_000.0)) is False  # parked
+    market_stream = settings.market_data_stream
+    for mid in (50_000.0, 50_010.0):
+        row = {"instance_name": "bot1", "connector_name": "bitget_perpetual", "trading_pair": "BTC-USDT", "mid": mid}
+        assert coordinator.route_market(row) == []  # parked: neither shard owns the desk yet
+    assert not client.streams.get(shard_stream(market_stream, 0))
+    assert not client.streams.get(shard_stream(market_stream, 1))
+
+    _run_worker(0)                # handles the release marker
+    assert routers[0].get("bot1") is None
+    coordinator.poll_workers()    # forwards the handoff to shard 1
+    _run_worker(1)                # adopts
+    coordinator.poll_workers()    # releases the parked command
+    assert coordinator.owner_of("bot1") == 1
+    assert coordinator.migrating() == set()
+    assert "2-0" in client.acked
+    assert [row["mid"] for row in client.drain(shard_stream(market_stream, 1))] == [50_010.0]
+    assert not client.streams.get(shard_stream(market_stream, 0))
+
+    adopted = routers[1].get("bot1")
+    assert adopted is not None
+    assert adopted.desk.portfolio.reserved_balances() == reserved_before
+    _run_worker(1)
+    orders = adopted.desk.export_handoff()["engines"]["bitget:BTC-USDT:perp"]["orders"]
+    assert sorted(float(o.price) for o in orders) == [49_000.0, 50_000.0]
+
+
+def _start_migration(tmp_path: Path) -> tuple[_Cluster, ShardCoordinator]:
+    """bot1 on shard 0 with one resting order, moving to shard 1 with one parked command."""
+    client = _FakeClient()
+    cluster = _Cluster(ServiceSettings(state_file_dir=str(tmp_path), shard_count=1), client)
+    coordinator = cluster.coordinator
+    coordinator.route_command("1-0", _submit("bot1"))
+    cluster.run_worker(0)
+    coordinator.apply_plan(2, pins={"bot1": 1})
+    assert coordinator.route_command("2-0", _submit("bot1", 49_000.0)) is False
+    cluster.run_worker(0)         # releases
+    coordinator.step()            # handoff -> shard 1
+    return cluster, coordinator
+
+
+def test_timed_out_migration_returns_tenant_to_source(tmp_path: Path) -> None:
+    cluster, coordinator = _start_migration(tmp_path)
+    cluster.expire_migrations()   # shard 1 never confirms
+    coordinator.step()
+    cluster.run_worker(0)         # re-adopts its own handoff
+    coordinator.step()
+    assert coordinator.migrating() == set()
+    assert coordinator.owner_of("bot1") == 0
+    assert coordinator.migrations_aborted == 1
+    assert "2-0" in cluster.client.acked
+    cluster.run_worker(0)         # the parked command lands on the source
+    orders = cluster.routers[0].get("bot1").desk.export_handoff()["engines"]["bitget:BTC-USDT:perp"]["orders"]
+    assert sorted(float(o.price) for o in orders) == [49_000.0, 50_000.0]
+
+    cluster.run_worker(1)         # the late adoption on shard 1 ...
+    coordinator.step()            # ... is evicted again
+    cluster.run_worker(1)
+    coordinator.step()
+    assert cluster.routers[1].get("bot1") is None
+    assert cluster.routers[0].get("bot1") is not None
+
+
+def test_respawned_target_is_resent_the_handoff(tmp_path: Path) -> None:
+    cluster, coordinator = _start_migration(tmp_path)
+    cluster.processes[1].running = False   # dies before reading the adopt message
+    coordinator.restart_dead_workers()
+    cluster.run_worker(1)
+    coordinator.step()
+    assert coordinator.owner_of("bot1") == 1
+    assert cluster.routers[1].get("bot1") is not None
+    assert "2-0" in cluster.client.acked
+
+
+def test_respawned_source_is_resent_the_release(tmp_path: Path) -> None:
+    client = _FakeClient()
+    cluster = _Cluster(ServiceSettings(state_file_dir=str(tmp_path), shard_count=1), client)
+    coordinator = cluster.coordinator
+    coordinator.route_command("1-0", _submit("bot1"))
+    cluster.run_worker(0)
+    coordinator.apply_plan(2, pins={"bot1": 1})
+    release_stream = shard_stream(cluster.settings.command_stream, 0)
+    assert client.drain(release_stream)    # marker lost with the dead worker
+    cluster.processes[0].running = False
+    coordinator.restart_dead_workers()
+    assert [p["command"] for p in client.streams[release_stream]] == ["_shard_release"]
+    cluster.run_worker(0)         # the fresh worker never loaded bot1
+    coordinator.step()
+    assert coordinator.migrating() == set()
+    assert coordinator.owner_of("bot1") == 1
+
+
+def test_retired_worker_is_joined(tmp_path: Path) -> None:
+    cluster = _Cluster(ServiceSettings(state_file_dir=str(tmp_path), shard_count=2), _FakeClient())
+    coordinator = cluster.coordinator
+    coordinator.apply_plan(1)
+    coordinator.step()
+    retired = cluster.processes[1]
+    assert retired.joins == 1 and not retired.terminated
+    retired.running = False
+    coordinator.step()
+    assert retired.joins == 2
+    coordinator.step()
+    assert retired.joins == 2     # reaped, no longer tracked
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 
 import services.realtime_ui_api.main as realtime_ui_main
@@ -184,6 +185,64 @@ def test_realtime_state_metrics_track_subscriber_drops() -> None:
     assert metrics["subscriber_drops"] >= 1
 
 
+def _market_snapshot(instance: str, controller: str, pair: str, mid: float) -> dict[str, object]:
+    return {
+        "event_type": "market_snapshot",
+        "instance_name": instance,
+        "controller_id": controller,
+        "connector_name": "bitget_perpetual",
+        "trading_pair": pair,
+        "mid_price": mid,
+    }
+
+
+def test_fanout_hub_routes_shared_frames_by_selection() -> None:
+    import asyncio
+
+    async def _run() -> None:
+        state = RealtimeState(RealtimeApiConfig())
+        bot1 = state.hub.subscribe("bot1", "", "BTC-USDT", kind="ws")
+        bot1_other = state.hub.subscribe("bot1", "", "BTC/USDT", kind="ws")
+        everything = state.hub.subscribe(kind="sse")
+        bot2 = state.hub.subscribe("bot2", "", "", kind="ws")
+
+        state.process(MARKET_DATA_STREAM, "1000-0", _market_snapshot("bot1", "ctrl-a", "BTC-USDT", 100.0))
+        await asyncio.sleep(0)
+
+        first = await bot1.get(timeout=1.0)
+        second = await bot1_other.get(timeout=1.0)
+        sse = await everything.get(timeout=1.0)
+        assert first is not None and first is second is sse
+        assert json.loads(first.ws_text)["type"] == "event"
+        assert json.loads(first.ws_text)["key"]["instance_name"] == "bot1"
+        assert sse.sse_text.startswith("event: update\ndata: {")
+        assert bot2.queue.empty()
+
+        state.hub.unsubscribe(bot2)
+        assert state.metrics()["subscribers"] == 3
+
+    asyncio.run(_run())
+
+
+def test_fanout_hub_drops_oldest_frame_when_queue_full() -> None:
+    import asyncio
+
+    from services.realtime_ui_api.fanout import FanoutHub
+
+    async def _run() -> None:
+        hub = FanoutHub(queue_size=3)
+        sub = hub.subscribe("bot1", "ctrl-a", "BTC-USDT")
+        for idx in range(5):
+            hub.publish({"seq": idx}, ("bot1", "ctrl-a", "BTC-USDT"))
+        await asyncio.sleep(0)
+        seqs = [json.loads((await sub.get(timeout=1.0)).ws_text)["seq"] for _ in range(3)]
+        assert seqs == [2, 3, 4]
+        assert sub.dropped == 2 and hub.metrics()["subscriber_drops"] == 2
+        assert await sub.get(timeout=0.01) is None
+
+    asyncio.run(_run())
+
+
 def test_build_instance_status_rows_merges_stream_and_artifacts(tmp_path: Path, monkeypatch) -> None:
     reports_root = tmp_path / "reports"
     data_root = tmp_path / "data"
@@ -1680,26 +1739,27 @@ def test_realtime_api_config_normalizes_history_ui_mode(monkeypatch) -> None:
 def test_ops_db_read_model_get_market_bars_rolls_up_v2(monkeypatch) -> None:
     reader = OpsDbReadModel(RealtimeApiConfig())
     monkeypatch.setattr(reader, "available", lambda: True)
+    bucket_ms = (int(time.time()) // 120 - 2) * 120_000  # inside the lookback window
     monkeypatch.setattr(
         reader,
         "_query",
-        lambda _sql, _params: [
-            {
-                "bucket_ms": 60_000.0,
-                "open_price": 100.0,
-                "high_price": 101.0,
-                "low_price": 99.0,
-                "close_price": 100.5,
-                "bar_source": "quote_mid",
-            },
+        lambda _sql, _params: [  # newest first, as ORDER BY ... DESC returns them
             {
-                "bucket_ms": 90_000.0,
+                "bucket_ms": float(bucket_ms + 60_000),
                 "open_price": 100.5,
                 "high_price": 102.0,
                 "low_price": 100.0,
                 "close_price": 101.5,
                 "bar_source": "quote_mid",
             },
+            {
+                "bucket_ms": float(bucket_ms),
+                "open_price": 100.0,
+                "high_price": 101.0,
+                "low_price": 99.0,
+                "close_price": 100.5,
+                "bar_source": "quote_mid",
+            },
         ],
     )
     bars = reader.get_market_bars(
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from services.hb_bridge.batched_producer import BatchedStreamProducer
+from services.hb_bridge.redis_client import RedisStreamClient
+
+
+class _FakePipeline:
+    def __init__(self, owner: _FakeRedis) -> None:
+        self._owner = owner
+        self._queued: list[tuple[str, tuple, dict]] = []
+
+    def xadd(self, **kwargs):
+        self._queued.append(("xadd", (), kwargs))
+
+    def xack(self, *args):
+        self._queued.append(("xack", args, {}))
+
+    def execute(self, raise_on_error: bool = True):
+        self._owner.round_trips += 1
+        replies = []
+        for name, args, kwargs in self._queued:
+            self._owner.calls.append((name, args, kwargs))
+            if name == "xadd" and kwargs["name"] == "bad.stream":
+                replies.append(RuntimeError("WRONGTYPE"))
+            else:
+                replies.append(f"{len(self._owner.calls)}-0" if name == "xadd" else len(args) - 2)
+        return replies
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple, dict]] = []
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+def _make_client(fake: _FakeRedis) -> RedisStreamClient:
+    client = RedisStreamClient.__new__(RedisStreamClient)
+    client._logger = logging.getLogger(__name__)  # type: ignore[attr-defined]
+    client._enabled = True  # type: ignore[attr-defined]
+    client._client = fake  # type: ignore[attr-defined]
+    client._connected_since = time.time()  # type: ignore[attr-defined]
+    client._reconnect_attempts_total = 0  # type: ignore[attr-defined]
+    client._reconnect_successes_total = 0  # type: ignore[attr-defined]
+    client._connection_errors_total = 0  # type: ignore[attr-defined]
+    client._consecutive_failures = 0  # type: ignore[attr-defined]
+    client._redis_down_since = 0.0  # type: ignore[attr-defined]
+    client._executor = ThreadPoolExecutor(max_workers=2)  # type: ignore[attr-defined]
+    client._io_timeout_s = 1.0  # type: ignore[attr-defined]
+    client._io_latency_samples = []  # type: ignore[attr-defined]
+    client._io_timeout_count = 0  # type: ignore[attr-defined]
+    client._batches_total = 0  # type: ignore[attr-defined]
+    client._batch_messages_total = 0  # type: ignore[attr-defined]
+    client._batch_size_max = 0  # type: ignore[attr-defined]
+    return client
+
+
+def _event(i: int) -> dict[str, object]:
+    return {"event_type": "paper_exchange_heartbeat", "instance_name": "desk", "seq": i}
+
+
+def test_xadd_many_pipelines_and_reports_per_entry_results() -> None:
+    fake = _FakeRedis()
+    client = _make_client(fake)
+
+    results = client.xadd_many([
+        ("hb.paper_exchange.event.v1", _event(1)),
+        ("hb.execution_intent.v1", {"event_type": "execution_intent", "instance_name": "bot1", "controller_id": ""}),
+        ("bad.stream", _event(2)),
+        ("hb.paper_exchange.event.v1", _event(3)),
+    ])
+
+    assert fake.round_trips == 1
+    assert results[0] is not None and results[3] is not None
+    assert results[1] is None  # identity preflight drop, never sent
+    assert results[2] is None  # rejected by Redis
+    assert len(fake.calls) == 3
+    assert client.failure_count == 0
+    assert client.health()["batch_size_max"] == 3
+
+    client.ack_many_multi("grp", {"s1": ["1-0", "2-0"], "s2": ["3-0"], "s3": []})
+    assert fake.round_trips == 2
+    assert [call[1] for call in fake.calls[-2:]] == [("s1", "grp", "1-0", "2-0"), ("s2", "grp", "3-0")]
+
+
+def test_batched_producer_flushes_on_size_and_latency() -> None:
+    fake = _FakeRedis()
+    producer = BatchedStreamProducer(_make_client(fake), max_batch=5, max_latency_ms=20, max_buffered=8)
+    try:
+        for i in range(5):
+            assert producer.xadd("hb.paper_exchange.event.v1", _event(i))
+        producer.xadd("hb.paper_exchange.event.v1", _event(99))
+        deadline = time.monotonic() + 2.0
+        while producer.metrics()["published_total"] < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        metrics = producer.metrics()
+        assert metrics["published_total"] == 6
+        assert metrics["batch_size_max"] == 5
+        assert fake.round_trips == 2
+    finally:
+        producer.close()
+
+    stopped = BatchedStreamProducer(_make_client(_FakeRedis()), max_batch=5, max_buffered=8, autostart=False)
+    accepted = [stopped.xadd("hb.paper_exchange.event.v1", _event(i)) for i in range(10)]
+    assert accepted.count(False) == 2
+    assert stopped.flush() == 8
+    assert stopped.health()["producer"]["dropped_total"] == 2
+
+
+def test_concurrent_flushes_publish_batches_in_buffer_order() -> None:
+    published: list[int] = []
+    first_call = threading.Event()
+
+    class _SlowClient:
+        failure_count = 0
+
+        def xadd_many(self, entries):
+            batch = [payload["seq"] for _, payload in entries]
+            if not first_call.is_set():
+                first_call.set()
+                time.sleep(0.05)  # let the other flusher pop the next batch meanwhile
+            published.extend(batch)
+            return ["1-0"] * len(batch)
+
+    producer = BatchedStreamProducer(_SlowClient(), max_batch=5, max_buffered=50, autostart=False)  # type: ignore[arg-type]
+    for i in range(20):
+        producer.xadd("hb.paper_exchange.event.v1", _event(i))
+    workers = [threading.Thread(target=producer.flush) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=5)
+
+    assert published == list(range(20))
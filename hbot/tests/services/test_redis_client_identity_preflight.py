@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 
 from services.hb_bridge.redis_client import RedisStreamClient
 
@@ -14,6 +15,11 @@ class _FakeRedis:
         self.calls.append(kwargs)
         return "1-0"
 
+    def xread(self, **kwargs):
+        self.calls.append(kwargs)
+        self.read_threads = [*getattr(self, "read_threads", []), threading.current_thread()]
+        return [("hb.portfolio_risk.v1", [("7-0", {"payload": json.dumps({"portfolio_action": "kill_switch"})})])]
+
 
 def _make_client(fake: _FakeRedis) -> RedisStreamClient:
     from concurrent.futures import ThreadPoolExecutor
@@ -26,6 +32,7 @@ def _make_client(fake: _FakeRedis) -> RedisStreamClient:
     client._db = 0  # type: ignore[attr-defined]
     client._password = None  # type: ignore[attr-defined]
     client._client = fake  # type: ignore[attr-defined]
+    client._blocking_client = fake  # type: ignore[attr-defined]
     client._last_reconnect_attempt = 0.0  # type: ignore[attr-defined]
     client._consecutive_failures = 0  # type: ignore[attr-defined]
     client._redis_down_since = 0.0  # type: ignore[attr-defined]
@@ -75,3 +82,28 @@ def test_xadd_allows_valid_strategy_signal_identity() -> None:
     decoded_payload = json.loads(encoded_payload)
     assert decoded_payload["event_type"] == "strategy_signal"
     assert decoded_payload["instance_name"] == "bot1"
+
+
+def test_read_after_decodes_entries_after_id() -> None:
+    fake = _FakeRedis()
+    client = _make_client(fake)
+
+    rows = client.read_after("hb.portfolio_risk.v1", "6-0", count=5, block_ms=10)
+
+    assert rows == [("7-0", {"portfolio_action": "kill_switch"})]
+    assert fake.calls == [{"streams": {"hb.portfolio_risk.v1": "6-0"}, "count": 5, "block": 10}]
+
+
+def test_read_after_blocks_on_caller_thread_not_io_executor() -> None:
+    fake = _FakeRedis()
+    client = _make_client(fake)
+    pooled = _FakeRedis()
+    client._client = pooled  # type: ignore[attr-defined]
+    client._executor.shutdown()  # type: ignore[attr-defined]
+
+    rows = client.read_after("hb.portfolio_risk.v1", "6-0", block_ms=60_000)
+
+    assert rows == [("7-0", {"portfolio_action": "kill_switch"})]
+    assert fake.read_threads == [threading.current_thread()]
+    assert fake.calls[0]["block"] == 30_000
+    assert pooled.calls == []